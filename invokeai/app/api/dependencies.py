@@ -44,6 +44,7 @@ from invokeai.app.services.model_relationships.model_relationships_default impor
 from invokeai.app.services.names.names_default import SimpleNameService
 from invokeai.app.services.object_serializer.object_serializer_disk import ObjectSerializerDisk
 from invokeai.app.services.object_serializer.object_serializer_forward_cache import ObjectSerializerForwardCache
+from invokeai.app.services.preprocessor_cache.preprocessor_cache_memory import MemoryPreprocessorCache
 from invokeai.app.services.session_processor.session_processor_default import (
     DefaultSessionProcessor,
     DefaultSessionRunner,
@@ -149,6 +150,7 @@ class ApiDependencies:
         board_video_records = SqliteBoardVideoRecordStorage(db=db)
         gallery = SqliteGalleryService(db=db)
         invocation_cache = MemoryInvocationCache(max_cache_size=config.node_cache_size)
+        preprocessor_cache = MemoryPreprocessorCache(max_cache_size_mb=config.preprocessor_cache_mb)
         tensors = ObjectSerializerForwardCache(
             ObjectSerializerDisk[torch.Tensor](
                 output_folder / "tensors",
@@ -224,6 +226,7 @@ class ApiDependencies:
             image_records=image_records,
             images=images,
             invocation_cache=invocation_cache,
+            preprocessor_cache=preprocessor_cache,
             logger=logger,
             model_images=model_images_service,
             model_manager=model_manager,
@@ -2,7 +2,7 @@ import asyncio
 from collections.abc import Callable
 from typing import Any, Optional, TypeVar
 
-from fastapi import Body, HTTPException, Path, Query
+from fastapi import Body, HTTPException, Path, Query, Response
 from fastapi.routing import APIRouter
 from pydantic import BaseModel
 
@@ -22,6 +22,7 @@ from invokeai.app.services.session_queue.session_queue_common import (
     EnqueueBatchResult,
     ItemIdsResult,
     PruneResult,
+    RawSessionQueueItem,
     RetryItemsResult,
     SessionQueueCountsByDestination,
     SessionQueueItem,
@@ -88,7 +89,7 @@ _REDACTIONS: dict[str, Callable[[], Any]] = {
     "session": lambda: GraphExecutionState(id="redacted", graph=Graph()),
 }
 
-AnyQueueItem = TypeVar("AnyQueueItem", SessionQueueItem, SessionQueueItemSummary)
+AnyQueueItem = TypeVar("AnyQueueItem", SessionQueueItem, RawSessionQueueItem, SessionQueueItemSummary)
 
 
 def sanitize_queue_item_for_user(queue_item: AnyQueueItem, current_user_id: str, is_admin: bool) -> AnyQueueItem:
@@ -117,6 +118,12 @@ def sanitize_queue_item_for_user(queue_item: AnyQueueItem, current_user_id: str,
     return queue_item.model_copy(update=updates)
 
 
+def _raw_queue_item_response(content: str) -> Response:
+    """Wraps JSON built from raw queue items in a response. The routes that return one skip FastAPI's validation of
+    the response against the queue item model, which would parse every session just to serialize it again."""
+    return Response(content=content, media_type="application/json")
+
+
 @session_queue_router.post(
     "/{queue_id}/enqueue_batch",
     operation_id="enqueue_batch",
@@ -147,20 +154,24 @@ async def enqueue_batch(
     responses={
         200: {"model": list[SessionQueueItem]},
     },
+    response_model=list[SessionQueueItem],
 )
 def list_all_queue_items(
     current_user: CurrentUserOrDefault,
     queue_id: str = Path(description="The queue id to perform this operation on"),
     destination: Optional[str] = Query(default=None, description="The destination of queue items to fetch"),
-) -> list[SessionQueueItem]:
+) -> Response:
     """Gets all queue items"""
     try:
-        items = ApiDependencies.invoker.services.session_queue.list_all_queue_items(
+        items = ApiDependencies.invoker.services.session_queue.list_all_raw_queue_items(
             queue_id=queue_id,
             destination=destination,
         )
         # Sanitize items for non-admin users
-        return [sanitize_queue_item_for_user(item, current_user.user_id, current_user.is_admin) for item in items]
+        sanitized_items = [
+            sanitize_queue_item_for_user(item, current_user.user_id, current_user.is_admin) for item in items
+        ]
+        return _raw_queue_item_response("[" + ",".join(item.model_dump_json() for item in sanitized_items) + "]")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Unexpected error while listing all queue items: {e}")
 
@@ -197,6 +208,7 @@ def get_queue_item_ids(
     "/{queue_id}/items_by_ids",
     operation_id="get_queue_items_by_item_ids",
     responses={200: {"model": list[SessionQueueItem]}},
+    response_model=list[SessionQueueItem],
 )
 def get_queue_items_by_item_ids(
     current_user: CurrentUserOrDefault,
@@ -206,7 +218,7 @@ def get_queue_items_by_item_ids(
         max_length=MAX_QUEUE_ITEM_IDS_PER_REQUEST,
         description="Object containing list of queue item ids to fetch queue items for",
     ),
-) -> list[SessionQueueItem]:
+) -> Response:
     """Gets queue items for the specified queue item ids. Maintains order of item ids.
 
     Bound the legacy full-item endpoint as well as the summary endpoint: callers can otherwise
@@ -217,10 +229,10 @@ def get_queue_items_by_item_ids(
         session_queue_service = ApiDependencies.invoker.services.session_queue
 
         # Fetch queue items preserving the order of requested item ids
-        queue_items: list[SessionQueueItem] = []
+        queue_items: list[RawSessionQueueItem] = []
         for item_id in item_ids:
             try:
-                queue_item = session_queue_service.get_queue_item(item_id=item_id)
+                queue_item = session_queue_service.get_raw_queue_item(item_id=item_id)
                 if queue_item.queue_id != queue_id:  # Auth protection for items from other queues
                     continue
                 # Sanitize item for non-admin users
@@ -230,7 +242,7 @@ def get_queue_items_by_item_ids(
                 # Skip missing queue items - they may have been deleted between item id fetch and queue item fetch
                 continue
 
-        return queue_items
+        return _raw_queue_item_response("[" + ",".join(item.model_dump_json() for item in queue_items) + "]")
     except Exception:
         raise HTTPException(status_code=500, detail="Failed to get queue items")
 
@@ -559,20 +571,22 @@ def get_batch_status(
     responses={
         200: {"model": SessionQueueItem},
     },
+    response_model=SessionQueueItem,
     response_model_exclude_none=True,
 )
 def get_queue_item(
     current_user: CurrentUserOrDefault,
     queue_id: str = Path(description="The queue id to perform this operation on"),
     item_id: int = Path(description="The queue item to get"),
-) -> SessionQueueItem:
+) -> Response:
     """Gets a queue item"""
     try:
-        queue_item = ApiDependencies.invoker.services.session_queue.get_queue_item(item_id=item_id)
+        queue_item = ApiDependencies.invoker.services.session_queue.get_raw_queue_item(item_id=item_id)
         if queue_item.queue_id != queue_id:
             raise HTTPException(status_code=404, detail=f"Queue item with id {item_id} not found in queue {queue_id}")
         # Sanitize item for non-admin users
-        return sanitize_queue_item_for_user(queue_item, current_user.user_id, current_user.is_admin)
+        sanitized_item = sanitize_queue_item_for_user(queue_item, current_user.user_id, current_user.is_admin)
+        return _raw_queue_item_response(sanitized_item.model_dump_json(exclude_none=True))
     except SessionQueueItemNotFoundError:
         raise HTTPException(status_code=404, detail=f"Queue item with id {item_id} not found in queue {queue_id}")
     except Exception as e:
@@ -1,4 +1,5 @@
 import cv2
+from PIL import Image
 
 from invokeai.app.invocations.baseinvocation import BaseInvocation, invocation
 from invokeai.app.invocations.fields import ImageField, InputField, WithBoard, WithMetadata
@@ -27,8 +28,11 @@ class CannyEdgeDetectionInvocation(BaseInvocation, WithMetadata, WithBoard):
 
     def invoke(self, context: InvocationContext) -> ImageOutput:
         image = context.images.get_pil(self.image.image_name, "RGB")
-        np_img = pil_to_cv2(image)
-        edge_map = cv2.Canny(np_img, self.low_threshold, self.high_threshold)
-        edge_map_pil = cv2_to_pil(edge_map)
+
+        def detect(image: Image.Image) -> Image.Image:
+            edge_map = cv2.Canny(pil_to_cv2(image), self.low_threshold, self.high_threshold)
+            return cv2_to_pil(edge_map)
+
+        edge_map_pil = context.images.run_cached_processor(image, detect)
         image_dto = context.images.save(image=edge_map_pil)
         return ImageOutput.build(image_dto)
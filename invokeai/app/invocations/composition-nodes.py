@@ -15,19 +15,15 @@ from torchvision.transforms.functional import to_pil_image as pil_image_from_ten
 
 from invokeai.app.invocations.primitives import ImageOutput
 from invokeai.backend.image_util.color_conversion import (
-    hsl_from_srgb,
     linear_srgb_from_oklab,
     linear_srgb_from_oklch,
     linear_srgb_from_srgb,
-    okhsl_from_srgb,
-    okhsv_from_srgb,
-    oklab_from_linear_srgb,
     oklab_from_oklch,
-    oklch_from_oklab,
     srgb_from_hsl,
     srgb_from_okhsl,
     srgb_from_okhsv,
 )
+from invokeai.backend.image_util.color_pipeline import ColorImage
 from invokeai.backend.image_util.composition import (
     CIELAB_TO_UPLAB_ICC_PATH,
     MAX_FLOAT,
@@ -38,6 +34,7 @@ from invokeai.backend.image_util.composition import (
     tensor_from_pil_image,
 )
 from invokeai.backend.stable_diffusion.diffusers_pipeline import image_resized_to_grid_as_tensor
+from invokeai.backend.util.devices import TorchDevice
 from invokeai.invocation_api import (
     BaseInvocation,
     ImageField,
@@ -145,15 +142,17 @@ class InvokeAdjustImageHuePlusInvocation(BaseInvocation, WithMetadata, WithBoard
             image_out = pil_image_from_tensor(hsv_tensor, mode="HSV").convert("RGB")
 
         elif space == "okhsl":
-            rgb_tensor = image_resized_to_grid_as_tensor(image_in.convert("RGB"), normalize=False, multiple_of=1)
-            hsl_tensor = okhsl_from_srgb(rgb_tensor, steps=(3 if self.ok_high_precision else 1))
+            hsl_tensor = ColorImage.from_pil(image_in, TorchDevice.choose_torch_device()).okhsl(
+                steps=(3 if self.ok_high_precision else 1)
+            )
             hsl_tensor[0, :, :] = torch.remainder(torch.add(hsl_tensor[0, :, :], self.degrees), 360.0)
             rgb_tensor = srgb_from_okhsl(hsl_tensor, alpha=0.0)
             image_out = pil_image_from_tensor(rgb_tensor, mode="RGB")
 
         elif space == "okhsv":
-            rgb_tensor = image_resized_to_grid_as_tensor(image_in.convert("RGB"), normalize=False, multiple_of=1)
-            hsv_tensor = okhsv_from_srgb(rgb_tensor, steps=(3 if self.ok_high_precision else 1))
+            hsv_tensor = ColorImage.from_pil(image_in, TorchDevice.choose_torch_device()).okhsv(
+                steps=(3 if self.ok_high_precision else 1)
+            )
             hsv_tensor[0, :, :] = torch.remainder(torch.add(hsv_tensor[0, :, :], self.degrees), 360.0)
             rgb_tensor = srgb_from_okhsv(hsv_tensor, alpha=0.0)
             image_out = pil_image_from_tensor(rgb_tensor, mode="RGB")
@@ -199,10 +198,7 @@ class InvokeAdjustImageHuePlusInvocation(BaseInvocation, WithMetadata, WithBoard
             image_out = ImageCms.applyTransform(image_out, rgb_transform)
 
         elif space == "oklch":
-            rgb_tensor = image_resized_to_grid_as_tensor(image_in.convert("RGB"), normalize=False, multiple_of=1)
-
-            linear_srgb_tensor = linear_srgb_from_srgb(rgb_tensor)
-            oklch_tensor = oklch_from_oklab(oklab_from_linear_srgb(linear_srgb_tensor))
+            oklch_tensor = ColorImage.from_pil(image_in, TorchDevice.choose_torch_device()).oklch()
             oklch_tensor[2, :, :] = torch.remainder(torch.add(oklch_tensor[2, :, :], self.degrees), 360.0)
             linear_srgb_tensor = linear_srgb_from_oklch(oklch_tensor)
 
@@ -539,6 +535,10 @@ class InvokeImageBlendInvocation(BaseInvocation, WithMetadata, WithBoard):
             if not (image_lower.mode == "RGB"):
                 image_lower = image_lower.convert("RGB")
 
+        device = TorchDevice.choose_torch_device()
+        color_upper = ColorImage.from_pil(image_upper, device)
+        color_lower = ColorImage.from_pil(image_lower, device)
+
         image_lab_upper, image_lab_lower = None, None
         upper_lab_tensor, lower_lab_tensor = None, None
         upper_lch_tensor, lower_lch_tensor = None, None
@@ -554,14 +554,14 @@ class InvokeImageBlendInvocation(BaseInvocation, WithMetadata, WithBoard):
                     tensor_from_pil_image(image_lab_upper.getchannel("A"), normalize=True)[0, :, :],
                     tensor_from_pil_image(image_lab_upper.getchannel("B"), normalize=True)[0, :, :],
                 ]
-            )
+            ).to(device=device)
             lower_lab_tensor = torch.stack(
                 [
                     tensor_from_pil_image(image_lab_lower.getchannel("L"), normalize=False)[0, :, :],
                     tensor_from_pil_image(image_lab_lower.getchannel("A"), normalize=True)[0, :, :],
                     tensor_from_pil_image(image_lab_lower.getchannel("B"), normalize=True)[0, :, :],
                 ]
-            )
+            ).to(device=device)
             upper_lch_tensor = torch.stack(
                 [
                     upper_lab_tensor[0, :, :],
@@ -596,57 +596,57 @@ class InvokeImageBlendInvocation(BaseInvocation, WithMetadata, WithBoard):
                     tensor_from_pil_image(image_hsv_upper.getchannel("S"), normalize=False)[0, :, :],
                     tensor_from_pil_image(image_hsv_upper.getchannel("V"), normalize=False)[0, :, :],
                 ]
-            )
+            ).to(device=device)
             lower_hsv_tensor = torch.stack(
                 [
                     tensor_from_pil_image(image_hsv_lower.getchannel("H"), normalize=False)[0, :, :] * 360.0,
                     tensor_from_pil_image(image_hsv_lower.getchannel("S"), normalize=False)[0, :, :],
                     tensor_from_pil_image(image_hsv_lower.getchannel("V"), normalize=False)[0, :, :],
                 ]
-            )
+            ).to(device=device)
 
-        upper_rgb_tensor = tensor_from_pil_image(image_upper, normalize=False)
-        lower_rgb_tensor = tensor_from_pil_image(image_lower, normalize=False)
+        upper_rgb_tensor = color_upper.srgb()
+        lower_rgb_tensor = color_lower.srgb()
 
         alpha_upper_tensor, alpha_lower_tensor = None, None
         if alpha_upper is None:
-            alpha_upper_tensor = torch.ones(upper_rgb_tensor[0, :, :].shape)
+            alpha_upper_tensor = torch.ones_like(upper_rgb_tensor[0, :, :])
         else:
-            alpha_upper_tensor = tensor_from_pil_image(alpha_upper, normalize=False)[0, :, :]
+            alpha_upper_tensor = tensor_from_pil_image(alpha_upper, normalize=False)[0, :, :].to(device=device)
         if alpha_lower is None:
-            alpha_lower_tensor = torch.ones(lower_rgb_tensor[0, :, :].shape)
+            alpha_lower_tensor = torch.ones_like(lower_rgb_tensor[0, :, :])
         else:
-            alpha_lower_tensor = tensor_from_pil_image(alpha_lower, normalize=False)[0, :, :]
+            alpha_lower_tensor = tensor_from_pil_image(alpha_lower, normalize=False)[0, :, :].to(device=device)
 
         mask_tensor = None
         if mask_image is not None:
-            mask_tensor = tensor_from_pil_image(mask_image.convert("L"), normalize=False)[0, :, :]
+            mask_tensor = tensor_from_pil_image(mask_image.convert("L"), normalize=False)[0, :, :].to(device=device)
 
         upper_hsl_tensor, lower_hsl_tensor = None, None
         if "hsl" in required:
-            upper_hsl_tensor = hsl_from_srgb(upper_rgb_tensor)
-            lower_hsl_tensor = hsl_from_srgb(lower_rgb_tensor)
+            upper_hsl_tensor = color_upper.hsl()
+            lower_hsl_tensor = color_lower.hsl()
 
         upper_okhsl_tensor, lower_okhsl_tensor = None, None
         if "okhsl" in required:
-            upper_okhsl_tensor = okhsl_from_srgb(upper_rgb_tensor, steps=(3 if self.high_precision else 1))
-            lower_okhsl_tensor = okhsl_from_srgb(lower_rgb_tensor, steps=(3 if self.high_precision else 1))
+            upper_okhsl_tensor = color_upper.okhsl(steps=(3 if self.high_precision else 1))
+            lower_okhsl_tensor = color_lower.okhsl(steps=(3 if self.high_precision else 1))
 
         upper_okhsv_tensor, lower_okhsv_tensor = None, None
         if "okhsv" in required:
-            upper_okhsv_tensor = okhsv_from_srgb(upper_rgb_tensor, steps=(3 if self.high_precision else 1))
-            lower_okhsv_tensor = okhsv_from_srgb(lower_rgb_tensor, steps=(3 if self.high_precision else 1))
+            upper_okhsv_tensor = color_upper.okhsv(steps=(3 if self.high_precision else 1))
+            lower_okhsv_tensor = color_lower.okhsv(steps=(3 if self.high_precision else 1))
 
-        upper_rgb_l_tensor = linear_srgb_from_srgb(upper_rgb_tensor)
-        lower_rgb_l_tensor = linear_srgb_from_srgb(lower_rgb_tensor)
+        upper_rgb_l_tensor = color_upper.linear_srgb()
+        lower_rgb_l_tensor = color_lower.linear_srgb()
 
         upper_oklab_tensor, lower_oklab_tensor = None, None
         upper_oklch_tensor, lower_oklch_tensor = None, None
         if "oklch" in required:
-            upper_oklab_tensor = oklab_from_linear_srgb(upper_rgb_l_tensor)
-            lower_oklab_tensor = oklab_from_linear_srgb(lower_rgb_l_tensor)
-            upper_oklch_tensor = oklch_from_oklab(upper_oklab_tensor)
-            lower_oklch_tensor = oklch_from_oklab(lower_oklab_tensor)
+            upper_oklab_tensor = color_upper.oklab()
+            lower_oklab_tensor = color_lower.oklab()
+            upper_oklch_tensor = color_upper.oklch()
+            lower_oklch_tensor = color_lower.oklch()
 
         return (
             upper_rgb_l_tensor,
@@ -716,7 +716,7 @@ class InvokeImageBlendInvocation(BaseInvocation, WithMetadata, WithBoard):
                         mode="HSV",
                     ).convert("RGB"),
                     normalize=False,
-                )
+                ).to(device=t.device)
             ),
             "Okhsl": lambda t: linear_srgb_from_srgb(
                 srgb_from_okhsl(t, alpha=self.adaptive_gamut, steps=(3 if self.high_precision else 1))
@@ -743,7 +743,7 @@ class InvokeImageBlendInvocation(BaseInvocation, WithMetadata, WithBoard):
                         "rgb",
                     ),
                     normalize=False,
-                )
+                ).to(device=t.device)
             ),
         }[color_space]
 
@@ -996,7 +996,7 @@ class InvokeImageBlendInvocation(BaseInvocation, WithMetadata, WithBoard):
                         torch.mul(
                             torch.min(
                                 torch.div(torch.add(torch.mul(lower_space_tensor, -1.0), 1.0), upper_space_tensor),
-                                torch.ones(lower_space_tensor.shape),
+                                torch.ones_like(lower_space_tensor),
                             ),
                             -1.0,
                         ),
@@ -1,10 +1,12 @@
 import onnxruntime as ort
+from PIL import Image
 
 from invokeai.app.invocations.baseinvocation import BaseInvocation, invocation
 from invokeai.app.invocations.fields import ImageField, InputField, WithBoard, WithMetadata
-from invokeai.app.invocations.primitives import ImageOutput
+from invokeai.app.invocations.primitives import ImageCollectionOutput, ImageOutput
 from invokeai.app.services.shared.invocation_context import InvocationContext
 from invokeai.backend.image_util.dw_openpose import DWOpenposeDetector
+from invokeai.backend.image_util.util import run_in_batches_by_size
 
 
 @invocation(
@@ -25,6 +27,54 @@ class DWOpenposeDetectionInvocation(BaseInvocation, WithMetadata, WithBoard):
     def invoke(self, context: InvocationContext) -> ImageOutput:
         image = context.images.get_pil(self.image.image_name, "RGB")
 
+        def detect(image: Image.Image) -> Image.Image:
+            onnx_det_path = context.models.download_and_cache_model(DWOpenposeDetector.get_model_url_det())
+            onnx_pose_path = context.models.download_and_cache_model(DWOpenposeDetector.get_model_url_pose())
+
+            loaded_session_det = context.models.load_local_model(
+                onnx_det_path, DWOpenposeDetector.create_onnx_inference_session
+            )
+            loaded_session_pose = context.models.load_local_model(
+                onnx_pose_path, DWOpenposeDetector.create_onnx_inference_session
+            )
+
+            with loaded_session_det as session_det, loaded_session_pose as session_pose:
+                assert isinstance(session_det, ort.InferenceSession)
+                assert isinstance(session_pose, ort.InferenceSession)
+                detector = DWOpenposeDetector(session_det=session_det, session_pose=session_pose)
+                return detector.run(
+                    image,
+                    draw_face=self.draw_face,
+                    draw_hands=self.draw_hands,
+                    draw_body=self.draw_body,
+                )
+
+        detected_image = context.images.run_cached_processor(image, detect)
+        image_dto = context.images.save(image=detected_image)
+
+        return ImageOutput.build(image_dto)
+
+
+@invocation(
+    "dw_openpose_detection_collection",
+    title="DW Openpose Detection (Collection)",
+    tags=["controlnet", "dwpose", "openpose", "collection"],
+    category="controlnet_preprocessors",
+    version="1.0.0",
+)
+class DWOpenposeDetectionCollectionInvocation(BaseInvocation, WithMetadata, WithBoard):
+    """Generates openpose poses from a collection of images using DWPose. The models are loaded once and, if they
+    support it, the images are run through them in batches. Images of different sizes are run in separate batches."""
+
+    images: list[ImageField] = InputField(description="The images to process", min_length=1)
+    draw_body: bool = InputField(default=True)
+    draw_face: bool = InputField(default=False)
+    draw_hands: bool = InputField(default=False)
+    batch_size: int = InputField(default=4, ge=1, description="The number of images to run through the models at once")
+
+    def invoke(self, context: InvocationContext) -> ImageCollectionOutput:
+        images = [context.images.get_pil(image.image_name, "RGB") for image in self.images]
+
         onnx_det_path = context.models.download_and_cache_model(DWOpenposeDetector.get_model_url_det())
         onnx_pose_path = context.models.download_and_cache_model(DWOpenposeDetector.get_model_url_pose())
 
@@ -39,12 +89,16 @@ class DWOpenposeDetectionInvocation(BaseInvocation, WithMetadata, WithBoard):
             assert isinstance(session_det, ort.InferenceSession)
             assert isinstance(session_pose, ort.InferenceSession)
             detector = DWOpenposeDetector(session_det=session_det, session_pose=session_pose)
-            detected_image = detector.run(
-                image,
-                draw_face=self.draw_face,
-                draw_hands=self.draw_hands,
-                draw_body=self.draw_body,
+            detected_images = run_in_batches_by_size(
+                images,
+                self.batch_size,
+                lambda batch: detector.run_batch(
+                    batch, draw_face=self.draw_face, draw_hands=self.draw_hands, draw_body=self.draw_body
+                ),
+                context.util.is_canceled,
             )
-        image_dto = context.images.save(image=detected_image)
 
-        return ImageOutput.build(image_dto)
+        image_dtos = [context.images.save(image=detected_image) for detected_image in detected_images]
+        return ImageCollectionOutput(
+            collection=[ImageField(image_name=image_dto.image_name) for image_dto in image_dtos]
+        )
@@ -17,6 +17,11 @@ from invokeai.app.invocations.primitives import ImageOutput
 from invokeai.app.services.shared.invocation_context import InvocationContext
 from invokeai.backend.flux.modules.autoencoder import AutoEncoder
 from invokeai.backend.model_manager.load.load_base import LoadedModel
+from invokeai.backend.stable_diffusion.vae_tiling import (
+    plan_vae_tile_size,
+    run_vae_tiled,
+    vae_working_memory_budget,
+)
 from invokeai.backend.util.devices import TorchDevice
 from invokeai.backend.util.vae_working_memory import estimate_vae_working_memory_flux
 
@@ -40,13 +45,31 @@ class FluxVaeDecodeInvocation(BaseInvocation, WithMetadata, WithBoard):
         input=Input.Connection,
     )
 
-    def _vae_decode(self, vae_info: LoadedModel, latents: torch.Tensor) -> Image.Image:
+    def _vae_decode(self, vae_info: LoadedModel, latents: torch.Tensor, force_tiling: bool = False) -> Image.Image:
         assert isinstance(vae_info.model, (AutoEncoder, AutoencoderKL))
 
-        # Only estimate working memory for BFL AutoEncoder (diffusers VAE handles this internally)
-        if isinstance(vae_info.model, AutoEncoder):
-            estimated_working_memory = estimate_vae_working_memory_flux(
-                operation="decode", image_tensor=latents, vae=vae_info.model
+        def estimate_working_memory(latent_height: int, latent_width: int) -> int:
+            assert isinstance(vae_info.model, (AutoEncoder, AutoencoderKL))
+            return estimate_vae_working_memory_flux(
+                operation="decode",
+                image_tensor=torch.empty((*latents.shape[:-2], latent_height, latent_width), device="meta"),
+                vae=vae_info.model,
+            )
+
+        # Decode in tiles if a full decode would not fit in the compute device's memory.
+        tile_size = plan_vae_tile_size(
+            input_height=latents.shape[-2],
+            input_width=latents.shape[-1],
+            estimate_working_memory=estimate_working_memory,
+            working_memory_budget=vae_working_memory_budget(vae_info.compute_device),
+            force_tiling=force_tiling,
+        )
+
+        # Only estimate working memory for BFL AutoEncoder (diffusers VAE handles this internally), or for the tiles of a
+        # tiled decode.
+        if isinstance(vae_info.model, AutoEncoder) or tile_size is not None:
+            estimated_working_memory = estimate_working_memory(
+                tile_size or latents.shape[-2], tile_size or latents.shape[-1]
             )
         else:
             estimated_working_memory = 0
@@ -61,7 +84,7 @@ class FluxVaeDecodeInvocation(BaseInvocation, WithMetadata, WithBoard):
 
             if isinstance(vae, AutoEncoder):
                 # BFL AutoEncoder returns tensor directly
-                img = vae.decode(latents)
+                decode = vae.decode
             else:
                 # Diffusers AutoencoderKL returns DecoderOutput with .sample attribute
                 # Scale latents for diffusers VAE (FLUX uses shift_factor and scale_factor).
@@ -75,7 +98,15 @@ class FluxVaeDecodeInvocation(BaseInvocation, WithMetadata, WithBoard):
                 if shift_factor is not None:
                     latents = latents + shift_factor
 
-                img = vae.decode(latents, return_dict=False)[0]
+                vae.disable_tiling()
+
+                def decode(x: torch.Tensor) -> torch.Tensor:
+                    return vae.decode(x, return_dict=False)[0]
+
+            if tile_size is None:
+                img = decode(latents)
+            else:
+                img = run_vae_tiled(latents, decode, tile_size=tile_size, overlap=max(tile_size // 4, 8))
 
         img = img.clamp(-1, 1)
         img = rearrange(img[0], "c h w -> h w c")  # noqa: F821
@@ -87,7 +118,9 @@ class FluxVaeDecodeInvocation(BaseInvocation, WithMetadata, WithBoard):
         latents = context.tensors.load(self.latents.latents_name)
         vae_info = context.models.load(self.vae.vae)
         context.util.signal_progress("Running VAE")
-        image = self._vae_decode(vae_info=vae_info, latents=latents)
+        image = self._vae_decode(
+            vae_info=vae_info, latents=latents, force_tiling=context.config.get().force_tiled_decode
+        )
 
         TorchDevice.empty_cache()
         image_dto = context.images.save(image=image)
@@ -1,17 +1,19 @@
 from pathlib import Path
 from typing import Literal
 
+import numpy as np
 import torch
 from PIL import Image
 from transformers import pipeline
 from transformers.pipelines import ZeroShotObjectDetectionPipeline
 
 from invokeai.app.invocations.baseinvocation import BaseInvocation, invocation
-from invokeai.app.invocations.fields import BoundingBoxField, ImageField, InputField
-from invokeai.app.invocations.primitives import BoundingBoxCollectionOutput
+from invokeai.app.invocations.fields import BoundingBoxField, ImageField, InputField, WithBoard, WithMetadata
+from invokeai.app.invocations.primitives import BoundingBoxCollectionOutput, ImageCollectionOutput
 from invokeai.app.services.shared.invocation_context import InvocationContext
 from invokeai.backend.image_util.grounding_dino.detection_result import DetectionResult
 from invokeai.backend.image_util.grounding_dino.grounding_dino_pipeline import GroundingDinoPipeline
+from invokeai.backend.image_util.util import run_in_batches_by_size
 
 GroundingDinoModelKey = Literal["grounding-dino-tiny", "grounding-dino-base"]
 GROUNDING_DINO_MODEL_IDS: dict[GroundingDinoModelKey, str] = {
@@ -20,6 +22,12 @@ GROUNDING_DINO_MODEL_IDS: dict[GroundingDinoModelKey, str] = {
 }
 
 
+def _to_grounding_dino_labels(labels: list[str]) -> list[str]:
+    # TODO(ryand): I copied this "."-handling logic from the transformers example code. Test it and see if it
+    # actually makes a difference.
+    return [label if label.endswith(".") else label + "." for label in labels]
+
+
 @invocation(
     "grounding_dino",
     title="Grounding DINO (Text Prompt Object Detection)",
@@ -89,12 +97,65 @@ class GroundingDinoInvocation(BaseInvocation):
         threshold: float = 0.3,
     ) -> list[DetectionResult]:
         """Use Grounding DINO to detect bounding boxes for a set of labels in an image."""
-        # TODO(ryand): I copied this "."-handling logic from the transformers example code. Test it and see if it
-        # actually makes a difference.
-        labels = [label if label.endswith(".") else label + "." for label in labels]
+        labels = _to_grounding_dino_labels(labels)
 
         with context.models.load_remote_model(
             source=GROUNDING_DINO_MODEL_IDS[self.model], loader=GroundingDinoInvocation._load_grounding_dino
         ) as detector:
             assert isinstance(detector, GroundingDinoPipeline)
             return detector.detect(image=image, candidate_labels=labels, threshold=threshold)
+
+
+@invocation(
+    "grounding_dino_collection",
+    title="Grounding DINO (Collection)",
+    tags=["prompt", "object detection", "collection"],
+    category="segmentation",
+    version="1.0.0",
+)
+class GroundingDinoCollectionInvocation(BaseInvocation, WithMetadata, WithBoard):
+    """Runs a Grounding DINO model on a collection of images. Outputs a mask image for each image, in which the
+    bounding boxes of the objects detected from the text prompt are white. The model is loaded once and the images are
+    run through it in batches. Images of different sizes are run in separate batches."""
+
+    model: GroundingDinoModelKey = InputField(description="The Grounding DINO model to use.")
+    prompt: str = InputField(description="The prompt describing the object to segment.")
+    images: list[ImageField] = InputField(description="The images to segment.", min_length=1)
+    detection_threshold: float = InputField(
+        description="The detection threshold for the Grounding DINO model. All detected bounding boxes with scores above this threshold will be returned.",
+        ge=0.0,
+        le=1.0,
+        default=0.3,
+    )
+    batch_size: int = InputField(default=4, ge=1, description="The number of images to run through the model at once")
+
+    @torch.no_grad()
+    def invoke(self, context: InvocationContext) -> ImageCollectionOutput:
+        # The model expects 3-channel RGB images.
+        images = [context.images.get_pil(image.image_name, mode="RGB") for image in self.images]
+        labels = _to_grounding_dino_labels([self.prompt])
+
+        with context.models.load_remote_model(
+            source=GROUNDING_DINO_MODEL_IDS[self.model], loader=GroundingDinoInvocation._load_grounding_dino
+        ) as detector:
+            assert isinstance(detector, GroundingDinoPipeline)
+            all_detections = run_in_batches_by_size(
+                images,
+                self.batch_size,
+                lambda batch: detector.detect_batch(
+                    images=batch, candidate_labels=labels, threshold=self.detection_threshold
+                ),
+                context.util.is_canceled,
+            )
+
+        image_dtos = []
+        for image, detections in zip(images, all_detections, strict=True):
+            mask = np.zeros((image.height, image.width), dtype=np.uint8)
+            for detection in detections:
+                # Boxes may extend slightly past the image, and negative indices would wrap around.
+                box = detection.box
+                mask[max(box.ymin, 0) : max(box.ymax, 0), max(box.xmin, 0) : max(box.xmax, 0)] = 255
+            image_dtos.append(context.images.save(image=Image.fromarray(mask, mode="L")))
+        return ImageCollectionOutput(
+            collection=[ImageField(image_name=image_dto.image_name) for image_dto in image_dtos]
+        )
@@ -1,5 +1,7 @@
 from builtins import bool
 
+from PIL import Image
+
 from invokeai.app.invocations.baseinvocation import BaseInvocation, invocation
 from invokeai.app.invocations.fields import FieldDescriptions, ImageField, InputField, WithBoard, WithMetadata
 from invokeai.app.invocations.primitives import ImageOutput
@@ -22,12 +24,15 @@ class HEDEdgeDetectionInvocation(BaseInvocation, WithMetadata, WithBoard):
 
     def invoke(self, context: InvocationContext) -> ImageOutput:
         image = context.images.get_pil(self.image.image_name, "RGB")
-        loaded_model = context.models.load_remote_model(HEDEdgeDetector.get_model_url(), HEDEdgeDetector.load_model)
 
-        with loaded_model as model:
-            assert isinstance(model, ControlNetHED_Apache2)
-            hed_processor = HEDEdgeDetector(model)
-            edge_map = hed_processor.run(image=image, scribble=self.scribble)
+        def detect(image: Image.Image) -> Image.Image:
+            loaded_model = context.models.load_remote_model(HEDEdgeDetector.get_model_url(), HEDEdgeDetector.load_model)
+
+            with loaded_model as model:
+                assert isinstance(model, ControlNetHED_Apache2)
+                hed_processor = HEDEdgeDetector(model)
+                return hed_processor.run(image=image, scribble=self.scribble)
 
+        edge_map = context.images.run_cached_processor(image, detect)
         image_dto = context.images.save(image=edge_map)
         return ImageOutput.build(image_dto)
@@ -20,9 +20,9 @@ logger = InvokeAILogger.get_logger()
 
 
 def get_infill_methods():
-    methods = Literal["tile", "color", "lama", "cv2"]  # TODO: add mosaic back
+    methods = Literal["tile", "color", "lama", "cv2", "mosaic"]
     if PatchMatch.patchmatch_available():
-        methods = Literal["patchmatch", "tile", "color", "lama", "cv2"]  # TODO: add mosaic back
+        methods = Literal["patchmatch", "tile", "color", "lama", "cv2", "mosaic"]
     return methods
 
 
@@ -151,15 +151,15 @@ class CV2InfillInvocation(InfillImageProcessorInvocation):
         return cv2_inpaint(image)
 
 
-# @invocation(
-#     "infill_mosaic", title="Mosaic Infill", tags=["image", "inpaint", "outpaint"], category="inpaint", version="1.0.0"
-# )
+@invocation(
+    "infill_mosaic", title="Mosaic Infill", tags=["image", "inpaint", "outpaint"], category="inpaint", version="1.1.0"
+)
 class MosaicInfillInvocation(InfillImageProcessorInvocation):
     """Infills transparent areas of an image with a mosaic pattern drawing colors from the rest of the image"""
 
     image: ImageField = InputField(description="The image to infill")
-    tile_width: int = InputField(default=64, description="Width of the tile")
-    tile_height: int = InputField(default=64, description="Height of the tile")
+    tile_width: int = InputField(default=64, ge=1, description="Width of the tile")
+    tile_height: int = InputField(default=64, ge=1, description="Height of the tile")
     min_color: ColorField = InputField(
         default=ColorField(r=0, g=0, b=0, a=255),
         description="The min threshold for color",
@@ -168,6 +168,18 @@ class MosaicInfillInvocation(InfillImageProcessorInvocation):
         default=ColorField(r=255, g=255, b=255, a=255),
         description="The max threshold for color",
     )
+    seed: int = InputField(
+        default=0,
+        ge=0,
+        le=SEED_MAX,
+        description="The seed to use for the mosaic colors (omit for random)",
+    )
 
     def infill(self, image: Image.Image):
-        return infill_mosaic(image, (self.tile_width, self.tile_height), self.min_color.tuple(), self.max_color.tuple())
+        return infill_mosaic(
+            image,
+            (self.tile_width, self.tile_height),
+            self.min_color.tuple(),
+            self.max_color.tuple(),
+            seed=self.seed,
+        )
@@ -1,5 +1,7 @@
 from builtins import bool
 
+from PIL import Image
+
 from invokeai.app.invocations.baseinvocation import BaseInvocation, invocation
 from invokeai.app.invocations.fields import ImageField, InputField, WithBoard, WithMetadata
 from invokeai.app.invocations.primitives import ImageOutput
@@ -22,13 +24,16 @@ class LineartEdgeDetectionInvocation(BaseInvocation, WithMetadata, WithBoard):
 
     def invoke(self, context: InvocationContext) -> ImageOutput:
         image = context.images.get_pil(self.image.image_name, "RGB")
-        model_url = LineartEdgeDetector.get_model_url(self.coarse)
-        loaded_model = context.models.load_remote_model(model_url, LineartEdgeDetector.load_model)
 
-        with loaded_model as model:
-            assert isinstance(model, Generator)
-            detector = LineartEdgeDetector(model)
-            edge_map = detector.run(image=image)
+        def detect(image: Image.Image) -> Image.Image:
+            model_url = LineartEdgeDetector.get_model_url(self.coarse)
+            loaded_model = context.models.load_remote_model(model_url, LineartEdgeDetector.load_model)
+
+            with loaded_model as model:
+                assert isinstance(model, Generator)
+                detector = LineartEdgeDetector(model)
+                return detector.run(image=image)
 
+        edge_map = context.images.run_cached_processor(image, detect)
         image_dto = context.images.save(image=edge_map)
         return ImageOutput.build(image_dto)
@@ -1,3 +1,5 @@
+from PIL import Image
+
 from invokeai.app.invocations.baseinvocation import BaseInvocation, invocation
 from invokeai.app.invocations.fields import ImageField, InputField, WithBoard, WithMetadata
 from invokeai.app.invocations.primitives import ImageOutput
@@ -19,13 +21,16 @@ class LineartAnimeEdgeDetectionInvocation(BaseInvocation, WithMetadata, WithBoar
 
     def invoke(self, context: InvocationContext) -> ImageOutput:
         image = context.images.get_pil(self.image.image_name, "RGB")
-        model_url = LineartAnimeEdgeDetector.get_model_url()
-        loaded_model = context.models.load_remote_model(model_url, LineartAnimeEdgeDetector.load_model)
 
-        with loaded_model as model:
-            assert isinstance(model, UnetGenerator)
-            detector = LineartAnimeEdgeDetector(model)
-            edge_map = detector.run(image=image)
+        def detect(image: Image.Image) -> Image.Image:
+            model_url = LineartAnimeEdgeDetector.get_model_url()
+            loaded_model = context.models.load_remote_model(model_url, LineartAnimeEdgeDetector.load_model)
+
+            with loaded_model as model:
+                assert isinstance(model, UnetGenerator)
+                detector = LineartAnimeEdgeDetector(model)
+                return detector.run(image=image)
 
+        edge_map = context.images.run_cached_processor(image, detect)
         image_dto = context.images.save(image=edge_map)
         return ImageOutput.build(image_dto)
@@ -1,3 +1,5 @@
+from PIL import Image
+
 from invokeai.app.invocations.baseinvocation import BaseInvocation, invocation
 from invokeai.app.invocations.fields import ImageField, InputField, WithBoard, WithMetadata
 from invokeai.app.invocations.primitives import ImageOutput
@@ -28,12 +30,15 @@ class MLSDDetectionInvocation(BaseInvocation, WithMetadata, WithBoard):
 
     def invoke(self, context: InvocationContext) -> ImageOutput:
         image = context.images.get_pil(self.image.image_name, "RGB")
-        loaded_model = context.models.load_remote_model(MLSDDetector.get_model_url(), MLSDDetector.load_model)
 
-        with loaded_model as model:
-            assert isinstance(model, MobileV2_MLSD_Large)
-            detector = MLSDDetector(model)
-            edge_map = detector.run(image, self.score_threshold, self.distance_threshold)
+        def detect(image: Image.Image) -> Image.Image:
+            loaded_model = context.models.load_remote_model(MLSDDetector.get_model_url(), MLSDDetector.load_model)
+
+            with loaded_model as model:
+                assert isinstance(model, MobileV2_MLSD_Large)
+                detector = MLSDDetector(model)
+                return detector.run(image, self.score_threshold, self.distance_threshold)
 
+        edge_map = context.images.run_cached_processor(image, detect)
         image_dto = context.images.save(image=edge_map)
         return ImageOutput.build(image_dto)
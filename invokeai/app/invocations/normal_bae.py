@@ -1,3 +1,5 @@
+from PIL import Image
+
 from invokeai.app.invocations.baseinvocation import BaseInvocation, invocation
 from invokeai.app.invocations.fields import ImageField, InputField, WithBoard, WithMetadata
 from invokeai.app.invocations.primitives import ImageOutput
@@ -20,12 +22,17 @@ class NormalMapInvocation(BaseInvocation, WithMetadata, WithBoard):
 
     def invoke(self, context: InvocationContext) -> ImageOutput:
         image = context.images.get_pil(self.image.image_name, "RGB")
-        loaded_model = context.models.load_remote_model(NormalMapDetector.get_model_url(), NormalMapDetector.load_model)
 
-        with loaded_model as model:
-            assert isinstance(model, NNET)
-            detector = NormalMapDetector(model)
-            normal_map = detector.run(image=image)
+        def detect(image: Image.Image) -> Image.Image:
+            loaded_model = context.models.load_remote_model(
+                NormalMapDetector.get_model_url(), NormalMapDetector.load_model
+            )
+
+            with loaded_model as model:
+                assert isinstance(model, NNET)
+                detector = NormalMapDetector(model)
+                return detector.run(image=image)
 
+        normal_map = context.images.run_cached_processor(image, detect)
         image_dto = context.images.save(image=normal_map)
         return ImageOutput.build(image_dto)
@@ -1,3 +1,5 @@
+from PIL import Image
+
 from invokeai.app.invocations.baseinvocation import BaseInvocation, invocation
 from invokeai.app.invocations.fields import FieldDescriptions, ImageField, InputField, WithBoard, WithMetadata
 from invokeai.app.invocations.primitives import ImageOutput
@@ -22,12 +24,15 @@ class PiDiNetEdgeDetectionInvocation(BaseInvocation, WithMetadata, WithBoard):
 
     def invoke(self, context: InvocationContext) -> ImageOutput:
         image = context.images.get_pil(self.image.image_name, "RGB")
-        loaded_model = context.models.load_remote_model(PIDINetDetector.get_model_url(), PIDINetDetector.load_model)
 
-        with loaded_model as model:
-            assert isinstance(model, PiDiNet)
-            detector = PIDINetDetector(model)
-            edge_map = detector.run(image=image, quantize_edges=self.quantize_edges, scribble=self.scribble)
+        def detect(image: Image.Image) -> Image.Image:
+            loaded_model = context.models.load_remote_model(PIDINetDetector.get_model_url(), PIDINetDetector.load_model)
+
+            with loaded_model as model:
+                assert isinstance(model, PiDiNet)
+                detector = PIDINetDetector(model)
+                return detector.run(image=image, quantize_edges=self.quantize_edges, scribble=self.scribble)
 
+        edge_map = context.images.run_cached_processor(image, detect)
         image_dto = context.images.save(image=edge_map)
         return ImageOutput.build(image_dto)
@@ -12,13 +12,21 @@ from transformers.models.sam2 import Sam2Model
 from transformers.models.sam2.processing_sam2 import Sam2Processor
 
 from invokeai.app.invocations.baseinvocation import BaseInvocation, invocation
-from invokeai.app.invocations.fields import BoundingBoxField, ImageField, InputField, TensorField
-from invokeai.app.invocations.primitives import MaskOutput
+from invokeai.app.invocations.fields import (
+    BoundingBoxField,
+    ImageField,
+    InputField,
+    TensorField,
+    WithBoard,
+    WithMetadata,
+)
+from invokeai.app.invocations.primitives import ImageCollectionOutput, MaskOutput
 from invokeai.app.services.shared.invocation_context import InvocationContext
 from invokeai.backend.image_util.segment_anything.mask_refinement import mask_to_polygon, polygon_to_mask
 from invokeai.backend.image_util.segment_anything.segment_anything_2_pipeline import SegmentAnything2Pipeline
 from invokeai.backend.image_util.segment_anything.segment_anything_pipeline import SegmentAnythingPipeline
 from invokeai.backend.image_util.segment_anything.shared import SAMInput, SAMPoint
+from invokeai.backend.image_util.util import run_in_batches_by_size
 
 SegmentAnythingModelKey = Literal[
     "segment-anything-base",
@@ -47,6 +55,20 @@ class SAMPointsField(BaseModel):
         return [[point.x, point.y, point.label.value] for point in self.points]
 
 
+def _build_sam_inputs(
+    bounding_boxes: list[BoundingBoxField] | None, point_lists: list[SAMPointsField] | None
+) -> list[SAMInput]:
+    inputs: list[SAMInput] = []
+    for bbox_field, point_field in zip_longest(bounding_boxes or [], point_lists or [], fillvalue=None):
+        inputs.append(
+            SAMInput(
+                bounding_box=bbox_field,
+                points=point_field.points if point_field else None,
+            )
+        )
+    return inputs
+
+
 @invocation(
     "segment_anything",
     title="Segment Anything",
@@ -98,7 +120,7 @@ class SegmentAnythingInvocation(BaseInvocation):
             combined_mask = torch.zeros(image_pil.size[::-1], dtype=torch.bool)
         else:
             masks = self._segment(context=context, image=image_pil)
-            masks = self._filter_masks(masks=masks, bounding_boxes=self.bounding_boxes)
+            masks = self._filter_masks(masks=masks, bounding_boxes=self.bounding_boxes, mask_filter=self.mask_filter)
 
             # masks contains bool values, so we merge them via max-reduce.
             combined_mask, _ = torch.stack(masks).max(dim=0)
@@ -131,14 +153,7 @@ class SegmentAnythingInvocation(BaseInvocation):
         """Use Segment Anything (SAM or SAM2) to generate masks given an image + a set of bounding boxes."""
 
         source = SEGMENT_ANYTHING_MODEL_IDS[self.model]
-        inputs: list[SAMInput] = []
-        for bbox_field, point_field in zip_longest(self.bounding_boxes or [], self.point_lists or [], fillvalue=None):
-            inputs.append(
-                SAMInput(
-                    bounding_box=bbox_field,
-                    points=point_field.points if point_field else None,
-                )
-            )
+        inputs = _build_sam_inputs(self.bounding_boxes, self.point_lists)
 
         if "sam2" in source:
             loader = SegmentAnythingInvocation._load_sam_2_model
@@ -157,7 +172,8 @@ class SegmentAnythingInvocation(BaseInvocation):
 
         return masks
 
-    def _process_masks(self, masks: torch.Tensor) -> list[torch.Tensor]:
+    @staticmethod
+    def _process_masks(masks: torch.Tensor) -> list[torch.Tensor]:
         """Convert the tensor output from the Segment Anything model from a tensor of shape
         [num_masks, channels, height, width] to a list of tensors of shape [height, width].
         """
@@ -167,7 +183,8 @@ class SegmentAnythingInvocation(BaseInvocation):
         # Split the first dimension into a list of masks.
         return list(masks.cpu().unbind(dim=0))
 
-    def _apply_polygon_refinement(self, masks: list[torch.Tensor]) -> list[torch.Tensor]:
+    @staticmethod
+    def _apply_polygon_refinement(masks: list[torch.Tensor]) -> list[torch.Tensor]:
         """Apply polygon refinement to the masks.
 
         Convert each mask to a polygon, then back to a mask. This has the following effect:
@@ -192,17 +209,20 @@ class SegmentAnythingInvocation(BaseInvocation):
 
         return masks
 
+    @staticmethod
     def _filter_masks(
-        self, masks: list[torch.Tensor], bounding_boxes: list[BoundingBoxField] | None
+        masks: list[torch.Tensor],
+        bounding_boxes: list[BoundingBoxField] | None,
+        mask_filter: Literal["all", "largest", "highest_box_score"],
     ) -> list[torch.Tensor]:
         """Filter the detected masks based on the specified mask filter."""
 
-        if self.mask_filter == "all":
+        if mask_filter == "all":
             return masks
-        elif self.mask_filter == "largest":
+        elif mask_filter == "largest":
             # Find the largest mask.
             return [max(masks, key=lambda x: float(x.sum()))]
-        elif self.mask_filter == "highest_box_score":
+        elif mask_filter == "highest_box_score":
             assert bounding_boxes is not None, (
                 "Bounding boxes must be provided to use the 'highest_box_score' mask filter."
             )
@@ -214,4 +234,96 @@ class SegmentAnythingInvocation(BaseInvocation):
             max_score_idx = max(range(len(bounding_boxes)), key=lambda i: bounding_boxes[i].score or -1.0)
             return [masks[max_score_idx]]
         else:
-            raise ValueError(f"Invalid mask filter: {self.mask_filter}")
+            raise ValueError(f"Invalid mask filter: {mask_filter}")
+
+
+@invocation(
+    "segment_anything_collection",
+    title="Segment Anything (Collection)",
+    tags=["prompt", "segmentation", "sam", "sam2", "collection"],
+    category="segmentation",
+    version="1.0.0",
+)
+class SegmentAnythingCollectionInvocation(BaseInvocation, WithMetadata, WithBoard):
+    """Runs a Segment Anything Model (SAM or SAM2) on a collection of images, prompting it with the same bounding boxes
+    and points for every image, e.g. the frames of a shot with a static camera. Outputs a mask image for each image.
+    The model is loaded once and its image encoder runs on batches of images. Images of different sizes are run in
+    separate batches."""
+
+    model: SegmentAnythingModelKey = InputField(description="The Segment Anything model to use (SAM or SAM2).")
+    images: list[ImageField] = InputField(description="The images to segment.", min_length=1)
+    bounding_boxes: list[BoundingBoxField] | None = InputField(
+        default=None, description="The bounding boxes to prompt the model with."
+    )
+    point_lists: list[SAMPointsField] | None = InputField(
+        default=None,
+        description="The list of point lists to prompt the model with. Each list of points represents a single object.",
+    )
+    apply_polygon_refinement: bool = InputField(
+        description="Whether to apply polygon refinement to the masks. This will smooth the edges of the masks slightly and ensure that each mask consists of a single closed polygon (before merging).",
+        default=True,
+    )
+    mask_filter: Literal["all", "largest", "highest_box_score"] = InputField(
+        description="The filtering to apply to the detected masks before merging them into a final output.",
+        default="all",
+    )
+    batch_size: int = InputField(default=4, ge=1, description="The number of images to run through the model at once")
+
+    @model_validator(mode="after")
+    def validate_points_and_boxes_len(self):
+        if self.point_lists is not None and self.bounding_boxes is not None:
+            if len(self.point_lists) != len(self.bounding_boxes):
+                raise ValueError("If both point_lists and bounding_boxes are provided, they must have the same length.")
+        return self
+
+    @torch.no_grad()
+    def invoke(self, context: InvocationContext) -> ImageCollectionOutput:
+        # The models expect 3-channel RGB images.
+        images = [context.images.get_pil(image.image_name, mode="RGB") for image in self.images]
+
+        if (not self.bounding_boxes or len(self.bounding_boxes) == 0) and (
+            not self.point_lists or len(self.point_lists) == 0
+        ):
+            combined_masks = [torch.zeros(image.size[::-1], dtype=torch.bool) for image in images]
+        else:
+            combined_masks = []
+            for masks in self._segment(context=context, images=images):
+                masks = SegmentAnythingInvocation._filter_masks(
+                    masks=masks, bounding_boxes=self.bounding_boxes, mask_filter=self.mask_filter
+                )
+                # masks contains bool values, so we merge them via max-reduce.
+                combined_mask, _ = torch.stack(masks).max(dim=0)
+                combined_masks.append(combined_mask)
+
+        image_dtos = [
+            context.images.save(image=Image.fromarray(combined_mask.numpy().astype(np.uint8) * 255, mode="L"))
+            for combined_mask in combined_masks
+        ]
+        return ImageCollectionOutput(
+            collection=[ImageField(image_name=image_dto.image_name) for image_dto in image_dtos]
+        )
+
+    def _segment(self, context: InvocationContext, images: list[Image.Image]) -> list[list[torch.Tensor]]:
+        """Use Segment Anything (SAM or SAM2) to generate masks for each image, given a set of bounding boxes and
+        points."""
+
+        source = SEGMENT_ANYTHING_MODEL_IDS[self.model]
+        inputs = _build_sam_inputs(self.bounding_boxes, self.point_lists)
+
+        if "sam2" in source:
+            loader = SegmentAnythingInvocation._load_sam_2_model
+        else:
+            loader = SegmentAnythingInvocation._load_sam_model
+        with context.models.load_remote_model(source=source, loader=loader) as pipeline:
+            assert isinstance(pipeline, (SegmentAnythingPipeline, SegmentAnything2Pipeline))
+            all_masks = run_in_batches_by_size(
+                images, self.batch_size, lambda batch: pipeline.segment_batch(batch, inputs), context.util.is_canceled
+            )
+
+        processed_masks: list[list[torch.Tensor]] = []
+        for masks in all_masks:
+            masks = SegmentAnythingInvocation._process_masks(masks)
+            if self.apply_polygon_refinement:
+                masks = SegmentAnythingInvocation._apply_polygon_refinement(masks)
+            processed_masks.append(masks)
+        return processed_masks
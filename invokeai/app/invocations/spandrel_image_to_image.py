@@ -3,7 +3,6 @@ from typing import Callable
 
 import torch
 from PIL import Image
-from tqdm import tqdm
 
 from invokeai.app.invocations.baseinvocation import BaseInvocation, invocation
 from invokeai.app.invocations.fields import (
@@ -15,10 +14,10 @@ from invokeai.app.invocations.fields import (
 )
 from invokeai.app.invocations.model import ModelIdentifierField
 from invokeai.app.invocations.primitives import ImageOutput
-from invokeai.app.services.session_processor.session_processor_common import CanceledException
 from invokeai.app.services.shared.invocation_context import InvocationContext
 from invokeai.backend.model_manager.taxonomy import ModelType
 from invokeai.backend.spandrel_image_to_image_model import SpandrelImageToImageModel
+from invokeai.backend.tiles.batched_tiles import calc_tile_batch_size, run_tiles_batched
 from invokeai.backend.tiles.tiles import calc_tiles_min_overlap
 from invokeai.backend.tiles.utils import TBLR, Tile
 from invokeai.backend.util.devices import TorchDevice
@@ -55,6 +54,21 @@ class SpandrelImageToImageInvocation(BaseInvocation, WithMetadata, WithBoard):
             ),
         )
 
+    def get_tile_batch_size(self, context: InvocationContext, spandrel_model: SpandrelImageToImageModel) -> int:
+        """Get the number of tiles to upscale at once, limited by `upscale_tile_batch_size` and by the working memory
+        that the model cache keeps available (`device_working_mem_gb`)."""
+        if self.tile_size <= 0:
+            return 1
+        config = context.config.get()
+        return calc_tile_batch_size(
+            tile_height=self.tile_size,
+            tile_width=self.tile_size,
+            scale=spandrel_model.scale,
+            element_size=spandrel_model.dtype.itemsize,
+            working_memory_budget=int(config.device_working_mem_gb * 2**30),
+            max_batch_size=config.upscale_tile_batch_size,
+        )
+
     @classmethod
     def upscale_image(
         cls,
@@ -63,6 +77,7 @@ class SpandrelImageToImageInvocation(BaseInvocation, WithMetadata, WithBoard):
         spandrel_model: SpandrelImageToImageModel,
         is_canceled: Callable[[], bool],
         step_callback: Callable[[int, int], None],
+        tile_batch_size: int = 1,
     ) -> Image.Image:
         # Compute the image tiles.
         if tile_size > 0:
@@ -99,22 +114,11 @@ class SpandrelImageToImageInvocation(BaseInvocation, WithMetadata, WithBoard):
             (image.height * scale, image.width * scale, channels), dtype=torch.uint8, device=torch.device("cpu")
         )
 
-        device = TorchDevice.choose_torch_device()
-
-        # Run the model on each tile.
-        pbar = tqdm(list(zip(tiles, scaled_tiles, strict=True)), desc="Upscaling Tiles")
-
-        # Update progress, starting with 0.
-        step_callback(0, pbar.total)
-
-        for tile, scaled_tile in pbar:
-            # Exit early if the invocation has been canceled.
-            if is_canceled():
-                raise CanceledException
-
-            # Crop the current tile from the input image and convert it on demand. Converting the
-            # whole image up front would keep a float32 copy of it in memory for the entire loop,
-            # even though only one tile is ever used at a time.
+        def get_input_tile(tile_index: int) -> torch.Tensor:
+            # Crop the tile from the input image and convert it on demand. Converting the whole image up front would
+            # keep a float32 copy of it in memory for the entire loop, even though only one batch is ever used at a
+            # time.
+            tile = tiles[tile_index]
             if (
                 tile.coords.top == 0
                 and tile.coords.bottom == image.height
@@ -124,34 +128,48 @@ class SpandrelImageToImageInvocation(BaseInvocation, WithMetadata, WithBoard):
                 input_image = image
             else:
                 input_image = image.crop((tile.coords.left, tile.coords.top, tile.coords.right, tile.coords.bottom))
-            input_tile = SpandrelImageToImageModel.pil_to_tensor(input_image).to(
-                device=device, dtype=spandrel_model.dtype
-            )
-
-            # Run the model on the tile.
-            output_tile = spandrel_model.run(input_tile)
-
-            # Convert the output tile into the output tensor's format.
             # (N, C, H, W) -> (C, H, W)
-            output_tile = output_tile.squeeze(0)
-            # (C, H, W) -> (H, W, C)
-            output_tile = output_tile.permute(1, 2, 0)
-            output_tile = output_tile.clamp(0, 1)
-            output_tile = (output_tile * 255).to(dtype=torch.uint8, device=torch.device("cpu"))
-
-            # Merge the output tile into the output tensor.
-            # We only keep half of the overlap on the top and left side of the tile. We do this in case there are
-            # edge artifacts. We don't bother with any 'blending' in the current implementation - for most upscalers
-            # it seems unnecessary, but we may find a need in the future.
-            top_overlap = scaled_tile.overlap.top // 2
-            left_overlap = scaled_tile.overlap.left // 2
-            output_tensor[
-                scaled_tile.coords.top + top_overlap : scaled_tile.coords.bottom,
-                scaled_tile.coords.left + left_overlap : scaled_tile.coords.right,
-                :,
-            ] = output_tile[top_overlap:, left_overlap:, :]
-
-            step_callback(pbar.n + 1, pbar.total)
+            return SpandrelImageToImageModel.pil_to_tensor(input_image).squeeze(0)
+
+        def put_output_tiles(tile_indices: list[int], output_tiles: torch.Tensor) -> None:
+            # Convert the output tiles into the output tensor's format.
+            # (N, C, H, W) -> (N, H, W, C)
+            output_tiles = output_tiles.permute(0, 2, 3, 1)
+            output_tiles = output_tiles.clamp(0, 1)
+            output_tiles = (output_tiles * 255).to(dtype=torch.uint8, device=torch.device("cpu"))
+
+            # Merge the output tiles into the output tensor.
+            # We only keep half of the overlap on each side of the tile. We do this in case there are edge artifacts.
+            # We don't bother with any 'blending' in the current implementation - for most upscalers it seems
+            # unnecessary, but we may find a need in the future. Each tile writes a disjoint region, so the order in
+            # which the batches are merged does not matter.
+            for tile_index, output_tile in zip(tile_indices, output_tiles, strict=True):
+                scaled_tile = scaled_tiles[tile_index]
+                top_overlap = scaled_tile.overlap.top // 2
+                left_overlap = scaled_tile.overlap.left // 2
+                bottom_overlap = scaled_tile.overlap.bottom - scaled_tile.overlap.bottom // 2
+                right_overlap = scaled_tile.overlap.right - scaled_tile.overlap.right // 2
+                tile_height, tile_width, _ = output_tile.shape
+                output_tensor[
+                    scaled_tile.coords.top + top_overlap : scaled_tile.coords.bottom - bottom_overlap,
+                    scaled_tile.coords.left + left_overlap : scaled_tile.coords.right - right_overlap,
+                    :,
+                ] = output_tile[
+                    top_overlap : tile_height - bottom_overlap, left_overlap : tile_width - right_overlap, :
+                ]
+
+        # Run the model on batches of tiles.
+        run_tiles_batched(
+            tile_sizes=[(tile.coords.bottom - tile.coords.top, tile.coords.right - tile.coords.left) for tile in tiles],
+            get_input_tile=get_input_tile,
+            run_model=spandrel_model.run,
+            put_output_tiles=put_output_tiles,
+            device=TorchDevice.choose_torch_device(),
+            dtype=spandrel_model.dtype,
+            batch_size=tile_batch_size,
+            is_canceled=is_canceled,
+            step_callback=step_callback,
+        )
 
         # Convert the output tensor to a PIL image. `output_tensor` is already uint8, so `.numpy()`
         # is a zero-copy view; casting it to uint8 again here would copy the whole image for nothing.
@@ -177,7 +195,12 @@ class SpandrelImageToImageInvocation(BaseInvocation, WithMetadata, WithBoard):
 
             # Upscale the image
             pil_image = self.upscale_image(
-                image, self.tile_size, spandrel_model, context.util.is_canceled, step_callback
+                image,
+                self.tile_size,
+                spandrel_model,
+                context.util.is_canceled,
+                step_callback,
+                tile_batch_size=self.get_tile_batch_size(context, spandrel_model),
             )
 
         image_dto = context.images.save(image=pil_image)
@@ -226,6 +249,7 @@ class SpandrelImageToImageAutoscaleInvocation(SpandrelImageToImageInvocation):
         with context.models.load(self.image_to_image_model) as spandrel_model:
             assert isinstance(spandrel_model, SpandrelImageToImageModel)
 
+            tile_batch_size = self.get_tile_batch_size(context, spandrel_model)
             iteration = 1
             context.util.signal_progress(self._get_progress_message(iteration))
 
@@ -236,6 +260,7 @@ class SpandrelImageToImageAutoscaleInvocation(SpandrelImageToImageInvocation):
                 spandrel_model,
                 context.util.is_canceled,
                 functools.partial(step_callback, iteration),
+                tile_batch_size=tile_batch_size,
             )
 
             # Some models don't upscale the image, but we have no way to know this in advance. We'll check if the model
@@ -254,6 +279,7 @@ class SpandrelImageToImageAutoscaleInvocation(SpandrelImageToImageInvocation):
                         spandrel_model,
                         context.util.is_canceled,
                         functools.partial(step_callback, iteration),
+                        tile_batch_size=tile_batch_size,
                     )
 
                     # Sanity check to prevent excessive or infinite loops. All known upscaling models are at least 2x.
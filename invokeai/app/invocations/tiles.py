@@ -13,12 +13,11 @@ from invokeai.app.invocations.baseinvocation import (
 from invokeai.app.invocations.fields import ImageField, Input, InputField, OutputField, WithBoard, WithMetadata
 from invokeai.app.invocations.primitives import ImageOutput
 from invokeai.app.services.shared.invocation_context import InvocationContext
+from invokeai.backend.tiles.streaming_merge import merge_tiles_streaming
 from invokeai.backend.tiles.tiles import (
     calc_tiles_even_split,
     calc_tiles_min_overlap,
     calc_tiles_with_overlap,
-    merge_tiles_with_linear_blending,
-    merge_tiles_with_seam_blending,
 )
 from invokeai.backend.tiles.utils import Tile
 
@@ -252,30 +251,20 @@ class MergeTilesToImageInvocation(BaseInvocation, WithMetadata, WithBoard):
             height = max(height, tile.coords.bottom)
             width = max(width, tile.coords.right)
 
-        # Get all tile images for processing.
-        # TODO(ryand): It pains me that we spend time PNG decoding each tile from disk when they almost certainly
-        # existed in memory at an earlier point in the graph.
-        tile_np_images: list[np.ndarray] = []
-        for image in images:
-            pil_image = context.images.get_pil(image.image_name)
-            pil_image = pil_image.convert("RGB")
-            tile_np_images.append(np.array(pil_image))
-
-        # Prepare the output image buffer.
-        # Check the first tile to determine how many image channels are expected in the output.
-        channels = tile_np_images[0].shape[-1]
-        dtype = tile_np_images[0].dtype
-        np_image = np.zeros(shape=(height, width, channels), dtype=dtype)
-        if self.blend_mode == "Linear":
-            merge_tiles_with_linear_blending(
-                dst_image=np_image, tiles=tiles, tile_images=tile_np_images, blend_amount=self.blend_amount
-            )
-        elif self.blend_mode == "Seam":
-            merge_tiles_with_seam_blending(
-                dst_image=np_image, tiles=tiles, tile_images=tile_np_images, blend_amount=self.blend_amount
-            )
-        else:
-            raise ValueError(f"Unsupported blend mode: '{self.blend_mode}'.")
+        def get_tile_image(tile_index: int) -> np.ndarray:
+            pil_image = context.images.get_pil(images[tile_index].image_name)
+            return np.array(pil_image.convert("RGB"))
+
+        # Tile images are loaded one row of tiles at a time while merging, rather than all up front, to bound memory
+        # use for very large outputs.
+        np_image = np.zeros(shape=(height, width, 3), dtype=np.uint8)
+        merge_tiles_streaming(
+            dst_image=np_image,
+            tiles=tiles,
+            get_tile_image=get_tile_image,
+            blend_mode=self.blend_mode,
+            blend_amount=self.blend_amount,
+        )
 
         # Convert into a PIL image and save
         pil_image = Image.fromarray(np_image)
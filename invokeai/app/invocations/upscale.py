@@ -12,6 +12,7 @@ from invokeai.app.invocations.primitives import ImageOutput
 from invokeai.app.services.shared.invocation_context import InvocationContext
 from invokeai.backend.image_util.basicsr.rrdbnet_arch import RRDBNet
 from invokeai.backend.image_util.realesrgan.realesrgan import RealESRGAN
+from invokeai.backend.tiles.batched_tiles import calc_tile_batch_size
 
 # TODO: Populate this from disk?
 # TODO: Use model manager to load?
@@ -93,6 +94,18 @@ class ESRGANInvocation(BaseInvocation, WithMetadata, WithBoard):
             source=ESRGAN_MODEL_URLS[self.model_name],
         )
 
+        # Batch equal-sized tiles, as long as their estimated working memory fits in the working memory that the model
+        # cache keeps available. Each tile is padded by RealESRGAN's default `tile_pad` of 10px on each side.
+        config = context.config.get()
+        tile_batch_size = calc_tile_batch_size(
+            tile_height=self.tile_size + 20,
+            tile_width=self.tile_size + 20,
+            scale=netscale,
+            element_size=4,
+            working_memory_budget=int(config.device_working_mem_gb * 2**30),
+            max_batch_size=config.upscale_tile_batch_size,
+        )
+
         with loadnet as loadnet_model:
             upscaler = RealESRGAN(
                 scale=netscale,
@@ -100,6 +113,7 @@ class ESRGANInvocation(BaseInvocation, WithMetadata, WithBoard):
                 model=rrdbnet_model,
                 half=False,
                 tile=self.tile_size,
+                tile_batch_size=tile_batch_size,
             )
 
             # prepare image - Real-ESRGAN uses cv2 internally, and cv2 uses BGR vs RGB for PIL
@@ -31,7 +31,9 @@ ATTENTION_SLICE_SIZE = Literal["auto", "balanced", "max", 1, 2, 3, 4, 5, 6, 7, 8
 LOG_FORMAT = Literal["plain", "color", "syslog", "legacy"]
 LOG_LEVEL = Literal["debug", "info", "warning", "error", "critical"]
 SESSION_QUEUE_MODE = Literal["FIFO", "round_robin"]
+MODEL_CACHE_EVICTION_POLICY = Literal["lru", "cost_aware"]
 IMAGE_SUBFOLDER_STRATEGY = Literal["flat", "date", "type", "hash"]
+IMAGE_CATEGORY = Literal["general", "mask", "control", "user", "other"]
 CONFIG_SCHEMA_VERSION = "4.0.3"
 # Path prefixes owned by real routes/mounts. A `base_url` starting with one of these would collide
 # with routing and silently brick the server, so it is rejected during validation.
@@ -80,7 +82,7 @@ class InvokeAIAppConfig(BaseSettings):
         log_tokenization: Enable logging of parsed prompt tokens.
         patchmatch: Enable patchmatch inpaint code.
         models_dir: Path to the models directory.
-        convert_cache_dir: Path to the converted models cache directory (DEPRECATED, but do not delete because it is needed for migration from previous versions).
+        convert_cache_dir: Path to the converted models cache directory. Used when `converted_model_cache_gb` is non-zero.
         download_cache_dir: Path to the directory that contains dynamically downloaded models.
         legacy_conf_dir: Path to directory of legacy checkpoint config files.
         db_dir: Path to InvokeAI databases directory.
@@ -105,6 +107,11 @@ class InvokeAIAppConfig(BaseSettings):
         model_cache_keep_alive_min: How long to keep models in cache after last use, in minutes. A value of 0 (the default) means models are kept in cache indefinitely. If no model generations occur within the timeout period, the model cache is cleared using the same logic as the 'Clear Model Cache' button.
         device_working_mem_gb: The amount of working memory to keep available on the compute device (in GB). Has no effect if running on CPU. If you are experiencing OOM errors, try increasing this value.
         enable_partial_loading: Enable partial loading of models. This enables models to run with reduced VRAM requirements (at the cost of slower speed) by streaming the model from RAM to VRAM as its used. In some edge cases, partial loading can cause models to run more slowly if they were previously being fully loaded into VRAM.
+        gguf_dequantize_cache_gb: The amount of memory (in GB) per device to use for caching dequantized GGUF weights. Dequantizing GGUF weights on every step is slow, particularly on CPU. With a non-zero budget, the dequantized copies of the most frequently used weights are kept between steps. This memory is used on top of the model cache and should be considered part of the device working memory. 0 (the default) disables the cache.
+        converted_model_cache_gb: The maximum amount of disk space (in GB) to use for storing converted single-file checkpoints. Single-file FLUX, FLUX.2, Z-Image and Krea-2 checkpoints are converted (key renaming, FP8 dequantization and dtype casting) every time they are loaded. With a non-zero limit, the converted weights are stored in `convert_cache_dir` so that later loads can skip the conversion. 0 (the default) disables the store.
+        model_prefetch_lookahead: The number of pending queue items whose models are loaded into free model cache RAM while the current item runs, so that the next item does not have to wait for them to be read from disk. Only RAM that is not used by cached models is used, so prefetching never evicts a model. A prefetch holds the model load lock while it reads from disk, which can briefly delay model loads of the running item. Has no effect when multiple `generation_devices` are configured. 0 (the default) disables prefetching.
+        model_cache_eviction_policy: Which unlocked models the model cache drops first when it needs RAM. `lru` drops the least recently used models. `cost_aware` weighs how often each model is used and how long it took to load against the RAM it takes up (GreedyDual-Size), so that models that are slow to load and often used are kept over models that are quick to reload.<br>Valid values: `lru`, `cost_aware`
+        model_cache_trace_file: If set, model cache operations (requests, loads, VRAM moves and evictions, with sizes and timestamps) are appended to this file, as JSON lines. The trace can be replayed with `scripts/replay_model_cache_trace.py` to see how other `max_cache_ram_gb`, `max_cache_vram_gb` and `device_working_mem_gb` settings would have performed. Relative paths are relative to the root dir.
         keep_ram_copy_of_weights: Whether to keep a full RAM copy of a model's weights when the model is loaded in VRAM. Keeping a RAM copy increases average RAM usage, but speeds up model switching and LoRA patching (assuming there is sufficient RAM). Set this to False if RAM pressure is consistently high.
         ram: DEPRECATED: This setting is no longer used. It has been replaced by `max_cache_ram_gb`, but most users will not need to use this config since automatic cache size limits should work well in most cases. This config setting will be removed once the new model cache behavior is stable.
         vram: DEPRECATED: This setting is no longer used. It has been replaced by `max_cache_vram_gb`, but most users will not need to use this config since automatic cache size limits should work well in most cases. This config setting will be removed once the new model cache behavior is stable.
@@ -115,10 +122,14 @@ class InvokeAIAppConfig(BaseSettings):
         sequential_guidance: Whether to calculate guidance in serial instead of in parallel, lowering memory requirements.
         wan_memory_optimization: Enable experimental Wan memory optimizations at the cost of slower generation.
         pid_memory_optimization: Enable experimental PiD decode memory optimizations. Roughly halves the peak activation memory of a PiD decode; in exchange the decoded image changes slightly, because neither the chunked pixel pathway nor the float32 sampler intermediates are bit-exact with the default path.
+        upscale_tile_batch_size: The maximum number of tiles that the spandrel Image-to-Image and RealESRGAN upscaling nodes run through the model at once. Tiles of the same size are batched as long as their estimated working memory fits in `device_working_mem_gb`. Set to 1 to upscale one tile at a time.
         attention_type: Attention type.<br>Valid values: `auto`, `normal`, `xformers`, `sliced`, `torch-sdp`
         attention_slice_size: Slice size, valid when attention_type=="sliced".<br>Valid values: `auto`, `balanced`, `max`, `1`, `2`, `3`, `4`, `5`, `6`, `7`, `8`
         force_tiled_decode: Whether to enable tiled VAE decode (reduces memory consumption with some performance penalty).
         pil_compress_level: The compress_level setting of PIL.Image.save(), used for PNG encoding. All settings are lossless. 0 = no compression, 1 = fastest with slightly larger filesize, 9 = slowest with smallest filesize. 1 is typically the best setting.
+        png_compress_threads: The number of threads used to compress large PNG images (4 megapixels or more). The image is split into bands of rows that are compressed concurrently, which makes the file slightly larger than a single-threaded encode. 0 picks a thread count from the number of CPU cores, up to 8. Set to 1 to encode with PIL on a single thread.
+        deferred_intermediate_images_mb: RAM for intermediate images whose files have not been written yet, in MB. Intermediate images are kept in memory, so that the next node can use them without a PNG round trip, and are written to disk when this is exceeded, when their file is requested, or when their session ends. Set to 0 to write every image right away.
+        raw_intermediate_image_categories: Categories of intermediate images to store in an uncompressed raw format instead of PNG, e.g. `[general, mask, control]` for the intermediate outputs of nodes, or `[other]` for rasterized canvas layers. Raw files are much faster to write and read than PNG files, but several times larger. A raw image is converted to PNG when its file is requested, e.g. to display or download it. Images that are not intermediates are always stored as PNG.
         max_queue_size: Maximum number of items in the session queue.
         session_queue_mode: Session queue mode. Use 'FIFO' for traditional first-in-first-out, or 'round_robin' to serve each user's jobs in turn. In single-user mode, FIFO is always used regardless of this setting.<br>Valid values: `FIFO`, `round_robin`
         clear_queue_on_startup: Empties session queue on startup. If true, disables `max_queue_history`.
@@ -126,6 +137,7 @@ class InvokeAIAppConfig(BaseSettings):
         allow_nodes: List of nodes to allow. Omit to allow all.
         deny_nodes: List of nodes to deny. Omit to deny none.
         node_cache_size: How many cached nodes to keep in memory.
+        preprocessor_cache_mb: The amount of memory (in MB) to use for caching the outputs of control image preprocessors, such as edge, depth and pose detectors. Outputs are reused when a preprocessor runs again on identical pixels with identical settings, even if the pixels are saved as a new image. Set to 0 to disable.
         hashing_algorithm: Model hashing algorthim for model installs. 'blake3_multi' is best for SSDs. 'blake3_single' is best for spinning disk HDDs. 'random' disables hashing, instead assigning a UUID to models. Useful when using a memory db to reduce model installation time, or if you don't care about storing stable hashes for models. Alternatively, any other hashlib algorithm is accepted, though these are not nearly as performant as blake3.<br>Valid values: `blake3_multi`, `blake3_single`, `random`, `md5`, `sha1`, `sha224`, `sha256`, `sha384`, `sha512`, `blake2b`, `blake2s`, `sha3_224`, `sha3_256`, `sha3_384`, `sha3_512`, `shake_128`, `shake_256`
         remote_api_tokens: List of regular expression and token pairs used when downloading models from URLs. The download URL is tested against the regex, and if it matches, the token is provided in as a Bearer token.
         scan_models_on_startup: Scan the models directory on startup, registering orphaned models. This is typically only used in conjunction with `use_memory_db` for testing purposes.
@@ -177,7 +189,7 @@ class InvokeAIAppConfig(BaseSettings):
 
     # PATHS
     models_dir:                    Path = Field(default=Path("models"),     description="Path to the models directory.")
-    convert_cache_dir:             Path = Field(default=Path("models/.convert_cache"), description="Path to the converted models cache directory (DEPRECATED, but do not delete because it is needed for migration from previous versions).")
+    convert_cache_dir:             Path = Field(default=Path("models/.convert_cache"), description="Path to the converted models cache directory. Used when `converted_model_cache_gb` is non-zero.")
     download_cache_dir:            Path = Field(default=Path("models/.download_cache"), description="Path to the directory that contains dynamically downloaded models.")
     legacy_conf_dir:               Path = Field(default=Path("configs"), description="Path to directory of legacy checkpoint config files.")
     db_dir:                        Path = Field(default=Path("databases"),  description="Path to InvokeAI databases directory.")
@@ -209,6 +221,11 @@ class InvokeAIAppConfig(BaseSettings):
     model_cache_keep_alive_min:   float = Field(default=0, ge=0,            description="How long to keep models in cache after last use, in minutes. A value of 0 (the default) means models are kept in cache indefinitely. If no model generations occur within the timeout period, the model cache is cleared using the same logic as the 'Clear Model Cache' button.")
     device_working_mem_gb:        float = Field(default=3,                  description="The amount of working memory to keep available on the compute device (in GB). Has no effect if running on CPU. If you are experiencing OOM errors, try increasing this value.")
     enable_partial_loading:        bool = Field(default=True,               description="Enable partial loading of models. This enables models to run with reduced VRAM requirements (at the cost of slower speed) by streaming the model from RAM to VRAM as its used. In some edge cases, partial loading can cause models to run more slowly if they were previously being fully loaded into VRAM.")
+    gguf_dequantize_cache_gb:     float = Field(default=0, ge=0,            description="The amount of memory (in GB) per device to use for caching dequantized GGUF weights. Dequantizing GGUF weights on every step is slow, particularly on CPU. With a non-zero budget, the dequantized copies of the most frequently used weights are kept between steps. This memory is used on top of the model cache and should be considered part of the device working memory. 0 (the default) disables the cache.")
+    converted_model_cache_gb:     float = Field(default=0, ge=0,            description="The maximum amount of disk space (in GB) to use for storing converted single-file checkpoints. Single-file FLUX, FLUX.2, Z-Image and Krea-2 checkpoints are converted (key renaming, FP8 dequantization and dtype casting) every time they are loaded. With a non-zero limit, the converted weights are stored in `convert_cache_dir` so that later loads can skip the conversion. 0 (the default) disables the store.")
+    model_prefetch_lookahead:       int = Field(default=0, ge=0,            description="The number of pending queue items whose models are loaded into free model cache RAM while the current item runs, so that the next item does not have to wait for them to be read from disk. Only RAM that is not used by cached models is used, so prefetching never evicts a model. A prefetch holds the model load lock while it reads from disk, which can briefly delay model loads of the running item. Has no effect when multiple `generation_devices` are configured. 0 (the default) disables prefetching.")
+    model_cache_eviction_policy: MODEL_CACHE_EVICTION_POLICY = Field(default="lru",       description="Which unlocked models the model cache drops first when it needs RAM. `lru` drops the least recently used models. `cost_aware` weighs how often each model is used and how long it took to load against the RAM it takes up (GreedyDual-Size), so that models that are slow to load and often used are kept over models that are quick to reload.")
+    model_cache_trace_file: Optional[Path] = Field(default=None,             description="If set, model cache operations (requests, loads, VRAM moves and evictions, with sizes and timestamps) are appended to this file, as JSON lines. The trace can be replayed with `scripts/replay_model_cache_trace.py` to see how other `max_cache_ram_gb`, `max_cache_vram_gb` and `device_working_mem_gb` settings would have performed. Relative paths are relative to the root dir.")
     keep_ram_copy_of_weights:      bool = Field(default=True,               description="Whether to keep a full RAM copy of a model's weights when the model is loaded in VRAM. Keeping a RAM copy increases average RAM usage, but speeds up model switching and LoRA patching (assuming there is sufficient RAM). Set this to False if RAM pressure is consistently high.")
     # Deprecated CACHE configs
     ram:                Optional[float] = Field(default=None, gt=0,         description="DEPRECATED: This setting is no longer used. It has been replaced by `max_cache_ram_gb`, but most users will not need to use this config since automatic cache size limits should work well in most cases. This config setting will be removed once the new model cache behavior is stable.")
@@ -228,10 +245,14 @@ class InvokeAIAppConfig(BaseSettings):
     sequential_guidance:           bool = Field(default=False,              description="Whether to calculate guidance in serial instead of in parallel, lowering memory requirements.")
     wan_memory_optimization:       bool = Field(default=False,              description="Enable experimental Wan memory optimizations at the cost of slower generation.")
     pid_memory_optimization:       bool = Field(default=False,              description="Enable experimental PiD decode memory optimizations. Roughly halves the peak activation memory of a PiD decode; in exchange the decoded image changes slightly, because neither the chunked pixel pathway nor the float32 sampler intermediates are bit-exact with the default path.")
+    upscale_tile_batch_size:        int = Field(default=4, ge=1,            description="The maximum number of tiles that the spandrel Image-to-Image and RealESRGAN upscaling nodes run through the model at once. Tiles of the same size are batched as long as their estimated working memory fits in `device_working_mem_gb`. Set to 1 to upscale one tile at a time.")
     attention_type:      ATTENTION_TYPE = Field(default="auto",             description="Attention type.")
     attention_slice_size: ATTENTION_SLICE_SIZE = Field(default="auto",      description='Slice size, valid when attention_type=="sliced".')
     force_tiled_decode:            bool = Field(default=False,              description="Whether to enable tiled VAE decode (reduces memory consumption with some performance penalty).")
     pil_compress_level:             int = Field(default=1,                  description="The compress_level setting of PIL.Image.save(), used for PNG encoding. All settings are lossless. 0 = no compression, 1 = fastest with slightly larger filesize, 9 = slowest with smallest filesize. 1 is typically the best setting.")
+    png_compress_threads:           int = Field(default=0, ge=0,            description="The number of threads used to compress large PNG images (4 megapixels or more). The image is split into bands of rows that are compressed concurrently, which makes the file slightly larger than a single-threaded encode. 0 picks a thread count from the number of CPU cores, up to 8. Set to 1 to encode with PIL on a single thread.")
+    deferred_intermediate_images_mb: int = Field(default=512, ge=0,         description="RAM for intermediate images whose files have not been written yet, in MB. Intermediate images are kept in memory, so that the next node can use them without a PNG round trip, and are written to disk when this is exceeded, when their file is requested, or when their session ends. Set to 0 to write every image right away.")
+    raw_intermediate_image_categories: list[IMAGE_CATEGORY] = Field(default=[], description="Categories of intermediate images to store in an uncompressed raw format instead of PNG, e.g. `[general, mask, control]` for the intermediate outputs of nodes, or `[other]` for rasterized canvas layers. Raw files are much faster to write and read than PNG files, but several times larger. A raw image is converted to PNG when its file is requested, e.g. to display or download it. Images that are not intermediates are always stored as PNG.")
     max_queue_size:                 int = Field(default=10000, gt=0,        description="Maximum number of items in the session queue.")
     session_queue_mode: SESSION_QUEUE_MODE = Field(default="round_robin",   description="Session queue mode. Use 'FIFO' for strict first-in-first-out, or 'round_robin' to serve each user's jobs in turn. In round-robin mode, priority orders each user's own jobs, but the user rotation takes precedence: one user's high-priority job does not preempt another user's turn. In single-user mode, jobs are served in submission order either way — except that on multi-GPU systems the default 'round_robin' allows same-priority jobs to be reordered slightly so a freed GPU prefers jobs whose models it already has loaded. Set 'FIFO' to disable that reordering and enforce strict submission order.")
     clear_queue_on_startup:        bool = Field(default=False,              description="Empties session queue on startup. If true, disables `max_queue_history`.")
@@ -241,6 +262,7 @@ class InvokeAIAppConfig(BaseSettings):
     allow_nodes:    Optional[list[str]] = Field(default=None,               description="List of nodes to allow. Omit to allow all.")
     deny_nodes:     Optional[list[str]] = Field(default=None,               description="List of nodes to deny. Omit to deny none.")
     node_cache_size:                int = Field(default=512,                description="How many cached nodes to keep in memory.")
+    preprocessor_cache_mb:        float = Field(default=256, ge=0,          description="The amount of memory (in MB) to use for caching the outputs of control image preprocessors, such as edge, depth and pose detectors. Outputs are reused when a preprocessor runs again on identical pixels with identical settings, even if the pixels are saved as a new image. Set to 0 to disable.")
 
     # MODEL INSTALL
     hashing_algorithm: HASHING_ALGORITHMS = Field(default="blake3_single",  description="Model hashing algorthim for model installs. 'blake3_multi' is best for SSDs. 'blake3_single' is best for spinning disk HDDs. 'random' disables hashing, instead assigning a UUID to models. Useful when using a memory db to reduce model installation time, or if you don't care about storing stable hashes for models. Alternatively, any other hashlib algorithm is accepted, though these are not nearly as performant as blake3.")
@@ -461,6 +483,11 @@ class InvokeAIAppConfig(BaseSettings):
         """Path to the graph profiles directory, resolved to an absolute path.."""
         return self._resolve(self.profiles_dir)
 
+    @property
+    def model_cache_trace_path(self) -> Optional[Path]:
+        """Path to the model cache trace file, resolved to an absolute path, or None if tracing is disabled."""
+        return self._resolve(self.model_cache_trace_file) if self.model_cache_trace_file else None
+
     @staticmethod
     def find_root() -> Path:
         """Choose the runtime root directory when not specified on command line or init file."""
@@ -52,8 +52,21 @@ class ImageFileStorageBase(ABC):
         graph: Optional[str] = None,
         thumbnail_size: int = 256,
         image_subfolder: str = "",
+        defer_write: bool = False,
+        raw: bool = False,
     ) -> None:
-        """Saves an image and a 256x256 WEBP thumbnail. Returns a tuple of the image name, thumbnail name, and created timestamp."""
+        """Saves an image and a 256x256 WEBP thumbnail. Returns a tuple of the image name, thumbnail name, and created timestamp.
+
+        If `defer_write` is set, the image may be kept in memory, and its files written only when they are needed (see
+        `flush_deferred()`). get() returns the image in the meantime, and get_path() writes it first.
+
+        If `raw` is set, the image may be written in an uncompressed raw format, without a thumbnail, instead of as a
+        PNG. get() reads the raw file, and get_path() converts it to a PNG and a thumbnail first."""
+        pass
+
+    @abstractmethod
+    def flush_deferred(self) -> None:
+        """Writes the files of all images whose writes were deferred."""
         pass
 
     @abstractmethod
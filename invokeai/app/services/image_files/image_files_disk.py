@@ -3,9 +3,11 @@ import io
 import json
 import os
 import shutil
+import struct
 import tempfile
 import threading
 import zlib
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
 from queue import Queue
@@ -21,6 +23,11 @@ from invokeai.app.services.image_files.image_files_common import (
     ImageFileSaveException,
 )
 from invokeai.app.services.invoker import Invoker
+from invokeai.app.util.png_writer import (
+    can_write_png_in_parallel,
+    get_png_compress_thread_count,
+    write_png_in_parallel,
+)
 from invokeai.app.util.thumbnails import get_thumbnail_name, make_thumbnail
 from invokeai.backend.util.logging import InvokeAILogger
 
@@ -28,12 +35,37 @@ _PNG_RLE_MIN_PIXELS = 512 * 512
 _PNG_RLE_SAMPLE_TILE = 32
 _PNG_RLE_MIN_RAW_SIZE_PERCENT = 30
 _PNG_RLE_MAX_SAMPLE_SIZE_PERCENT = 102
+# Images with at least this many pixels are compressed on several threads, if png_compress_threads allows it.
+_PNG_PARALLEL_MIN_PIXELS = 2048 * 2048
+# Raw image files start with this, followed by the length of a JSON header (u32, little-endian), the header and the
+# pixels as returned by Image.tobytes().
+_RAW_IMAGE_MAGIC = b"INVOKEAI-RAW-1\n"
+_RAW_IMAGE_SUFFIX = ".raw"
+# Modes that are stored raw. Other modes, e.g. palette images, are always stored as PNG.
+_RAW_IMAGE_MODES = {"1", "L", "LA", "I", "I;16", "RGB", "RGBA"}
+
+
+@dataclass
+class _DeferredWrite:
+    """An intermediate image whose files have not been written yet."""
+
+    image: PILImageType
+    image_name: str
+    metadata: Optional[str]
+    workflow: Optional[str]
+    graph: Optional[str]
+    thumbnail_size: int
+    image_subfolder: str
+    size_bytes: int
+    raw: bool
 
 
 @dataclass
 class _StagedDelete:
     directory: Path
     files: list[tuple[Path, Path]]
+    # The deferred write of an image that was deleted before its files were written.
+    deferred: Optional[_DeferredWrite] = None
 
 
 def _get_png_size(image: PILImageType, compress_type: Optional[int] = None) -> int:
@@ -45,6 +77,31 @@ def _get_png_size(image: PILImageType, compress_type: Optional[int] = None) -> i
     return output.tell()
 
 
+def _write_raw_image(path: Path, image: PILImageType, info: dict[str, str], thumbnail_size: int) -> None:
+    header = json.dumps({"mode": image.mode, "size": image.size, "info": info, "thumbnail_size": thumbnail_size})
+    header_bytes = header.encode("utf-8")
+    with open(path, "wb") as file:
+        file.write(_RAW_IMAGE_MAGIC)
+        file.write(struct.pack("<I", len(header_bytes)))
+        file.write(header_bytes)
+        file.write(image.tobytes())
+
+
+def _read_raw_image(path: Path) -> tuple[PILImageType, int]:
+    """Reads an image written by `_write_raw_image()`. Returns the image, with its metadata in `image.info`, and the
+    size of its thumbnail."""
+    with open(path, "rb") as file:
+        data = file.read()
+    if not data.startswith(_RAW_IMAGE_MAGIC):
+        raise ValueError(f"Not a raw image file: {path}")
+    header_start = len(_RAW_IMAGE_MAGIC) + 4
+    (header_length,) = struct.unpack_from("<I", data, len(_RAW_IMAGE_MAGIC))
+    header = json.loads(data[header_start : header_start + header_length])
+    image = Image.frombytes(header["mode"], tuple(header["size"]), memoryview(data)[header_start + header_length :])
+    image.info = header["info"]
+    return image, header["thumbnail_size"]
+
+
 def _should_use_png_rle(image: PILImageType) -> bool:
     if image.mode not in {"RGB", "RGBA"} or image.width * image.height < _PNG_RLE_MIN_PIXELS:
         return False
@@ -81,6 +138,12 @@ class DiskImageFileStorage(ImageFileStorageBase):
         # Guards the cache structures (__cache / __cache_ids), which are read and mutated from
         # multiple session-processor worker threads in multi-GPU parallel mode.
         self.__cache_lock = threading.Lock()
+        # Intermediate images that are kept in memory until their files are needed, by image name, from the oldest to
+        # the newest. Guarded by __cache_lock. Writes of deferred images hold __deferred_write_lock, so that a caller
+        # that finds an image in __deferred waits until its files are complete.
+        self.__deferred: OrderedDict[str, _DeferredWrite] = OrderedDict()
+        self.__deferred_bytes = 0
+        self.__deferred_write_lock = threading.Lock()
 
         self.__output_folder = output_folder if isinstance(output_folder, Path) else Path(output_folder)
         self.__thumbnails_folder = self.__output_folder / "thumbnails"
@@ -91,6 +154,9 @@ class DiskImageFileStorage(ImageFileStorageBase):
         self.__invoker = invoker
         self.__recover_staged_deletes()
 
+    def stop(self, invoker: Invoker) -> None:
+        self.flush_deferred()
+
     @property
     def image_root(self) -> Path:
         return self.__output_folder.resolve()
@@ -104,14 +170,23 @@ class DiskImageFileStorage(ImageFileStorageBase):
             self.__cache.pop(path.resolve(), None)
 
     def get(self, image_name: str, image_subfolder: str = "") -> PILImageType:
+        deferred = self.__get_deferred(image_name)
+        if deferred is not None:
+            return deferred.image
+
         try:
-            image_path = self.get_path(image_name, image_subfolder=image_subfolder)
+            image_path = self.__resolve_path(image_name, image_subfolder=image_subfolder)
 
             cache_item = self.__get_cache(image_path)
             if cache_item:
                 return cache_item
 
-            image = Image.open(image_path)
+            try:
+                image = Image.open(image_path)
+            except FileNotFoundError:
+                image, _thumbnail_size = _read_raw_image(image_path.with_suffix(_RAW_IMAGE_SUFFIX))
+                self.__set_cache(image_path, image)
+                return image
             # Image.open() is lazy: it reads the header but defers pixel decoding (and holds the
             # file handle open) until the first .load()/.copy()/.convert(). The opened object is
             # cached and the SAME object is handed to every caller, so in multi-GPU parallel mode
@@ -133,14 +208,50 @@ class DiskImageFileStorage(ImageFileStorageBase):
         graph: Optional[str] = None,
         thumbnail_size: int = 256,
         image_subfolder: str = "",
+        defer_write: bool = False,
+        raw: bool = False,
+    ) -> None:
+        if defer_write and self.__defer_write(
+            _DeferredWrite(
+                image=image,
+                image_name=image_name,
+                metadata=metadata,
+                workflow=workflow,
+                graph=graph,
+                thumbnail_size=thumbnail_size,
+                image_subfolder=image_subfolder,
+                size_bytes=image.width * image.height * len(image.getbands()),
+                raw=raw,
+            )
+        ):
+            return
+        self.__write(image, image_name, metadata, workflow, graph, thumbnail_size, image_subfolder, raw)
+
+    def flush_deferred(self) -> None:
+        with self.__cache_lock:
+            image_names = list(self.__deferred)
+        for image_name in image_names:
+            self.__write_deferred(image_name)
+
+    def __write(
+        self,
+        image: PILImageType,
+        image_name: str,
+        metadata: Optional[str],
+        workflow: Optional[str],
+        graph: Optional[str],
+        thumbnail_size: int,
+        image_subfolder: str,
+        raw: bool = False,
     ) -> None:
         image_path: Optional[Path] = None
         thumbnail_path: Optional[Path] = None
+        raw_path: Optional[Path] = None
         image_existed = False
         thumbnail_existed = False
         try:
             self.__validate_storage_folders()
-            image_path = self.get_path(image_name, image_subfolder=image_subfolder)
+            image_path = self.__resolve_path(image_name, image_subfolder=image_subfolder)
             image_existed = image_path.exists()
 
             # Ensure subfolder directories exist
@@ -159,7 +270,16 @@ class DiskImageFileStorage(ImageFileStorageBase):
                 info_dict["invokeai_graph"] = graph
                 pnginfo.add_text("invokeai_graph", graph)
 
-            thumbnail_path = self.get_path(image_name, thumbnail=True, image_subfolder=image_subfolder)
+            # A raw image does not replace an existing PNG, which get() would read first.
+            if raw and not image_existed and image.mode in _RAW_IMAGE_MODES:
+                # The thumbnail is made when the image is converted to PNG, see __convert_raw().
+                raw_path = image_path.with_suffix(_RAW_IMAGE_SUFFIX)
+                _write_raw_image(raw_path, image, info_dict, thumbnail_size)
+                image.info = info_dict
+                self.__set_cache(image_path, image)
+                return
+
+            thumbnail_path = self.__resolve_path(image_name, thumbnail=True, image_subfolder=image_subfolder)
             thumbnail_existed = thumbnail_path.exists()
 
             # Build the thumbnail before replacing image.info with Invoke metadata. PIL stores
@@ -169,18 +289,36 @@ class DiskImageFileStorage(ImageFileStorageBase):
 
             # When saving the image, the image object's info field is not populated. We need to set it
             image.info = info_dict
-            compress_level = self.__invoker.services.configuration.pil_compress_level
-            save_options = {"compress_level": compress_level}
-            if compress_level == 1 and _should_use_png_rle(image):
-                save_options["compress_type"] = zlib.Z_RLE
-            image.save(
-                image_path,
-                "PNG",
-                pnginfo=pnginfo,
-                **save_options,
-            )
+            config = self.__invoker.services.configuration
+            compress_level = config.pil_compress_level
+            compress_type = zlib.Z_RLE if compress_level == 1 and _should_use_png_rle(image) else None
+            threads = 1
+            if image.width * image.height >= _PNG_PARALLEL_MIN_PIXELS and can_write_png_in_parallel(image):
+                threads = get_png_compress_thread_count(config.png_compress_threads)
+            if threads > 1:
+                with open(image_path, "wb") as file:
+                    write_png_in_parallel(
+                        image,
+                        file,
+                        text=info_dict,
+                        compress_level=compress_level,
+                        compress_type=compress_type if compress_type is not None else zlib.Z_DEFAULT_STRATEGY,
+                        threads=threads,
+                    )
+            else:
+                save_options = {"compress_level": compress_level}
+                if compress_type is not None:
+                    save_options["compress_type"] = compress_type
+                image.save(
+                    image_path,
+                    "PNG",
+                    pnginfo=pnginfo,
+                    **save_options,
+                )
 
             thumbnail_image.save(thumbnail_path)
+            # Drop a raw file that this image replaces.
+            image_path.with_suffix(_RAW_IMAGE_SUFFIX).unlink(missing_ok=True)
 
             self.__set_cache(image_path, image)
             self.__set_cache(thumbnail_path, thumbnail_image)
@@ -188,7 +326,7 @@ class DiskImageFileStorage(ImageFileStorageBase):
             # A thumbnail failure must not leave a full-size image with no thumbnail. The
             # names are normally new, but preserve any pre-existing files when save() is
             # used to overwrite an existing image.
-            for path, existed in ((image_path, image_existed), (thumbnail_path, thumbnail_existed)):
+            for path, existed in ((image_path, image_existed), (thumbnail_path, thumbnail_existed), (raw_path, False)):
                 if path is not None and not existed:
                     try:
                         path.unlink(missing_ok=True)
@@ -202,10 +340,13 @@ class DiskImageFileStorage(ImageFileStorageBase):
         self.commit_delete(token)
 
     def stage_delete(self, image_name: str, image_subfolder: str = "") -> _StagedDelete:
-        candidates = [
-            self.get_path(image_name, image_subfolder=image_subfolder),
-            self.get_path(image_name, thumbnail=True, image_subfolder=image_subfolder),
-        ]
+        candidates = self.__get_file_paths(image_name, image_subfolder)
+        # An image that was never written only has to be dropped from memory. It is kept in the token, so that the
+        # delete can be rolled back.
+        with self.__deferred_write_lock, self.__cache_lock:
+            deferred = self.__deferred.pop(image_name, None)
+            if deferred is not None:
+                self.__deferred_bytes -= deferred.size_bytes
         staging_dir = Path(tempfile.mkdtemp(prefix=".delete_", dir=self.__output_folder))
         staged: list[tuple[Path, Path]] = []
         try:
@@ -220,8 +361,9 @@ class DiskImageFileStorage(ImageFileStorageBase):
                     destination = staging_dir / str(index)
                     source.replace(destination)
                     staged.append((source, destination))
-            return _StagedDelete(directory=staging_dir, files=staged)
+            return _StagedDelete(directory=staging_dir, files=staged, deferred=deferred)
         except Exception as e:
+            self.__restore_deferred(deferred)
             for source, destination in reversed(staged):
                 if destination.exists():
                     source.parent.mkdir(parents=True, exist_ok=True)
@@ -245,11 +387,52 @@ class DiskImageFileStorage(ImageFileStorageBase):
                 if destination.exists():
                     source.parent.mkdir(parents=True, exist_ok=True)
                     destination.replace(source)
+            self.__restore_deferred(token.deferred)
             shutil.rmtree(token.directory, ignore_errors=True)
         except Exception as e:
             raise ImageFileDeleteException from e
 
     def get_path(self, image_name: str, thumbnail: bool = False, image_subfolder: str = "") -> Path:
+        path = self.__resolve_path(image_name, thumbnail=thumbnail, image_subfolder=image_subfolder)
+        # Callers of get_path() use the file directly (e.g. to serve or move it), so it must exist as a PNG.
+        self.__write_deferred(image_name, allow_raw=False)
+        self.__convert_raw(image_name, image_subfolder)
+        return path
+
+    def __get_file_paths(self, image_name: str, image_subfolder: str) -> list[Path]:
+        """Gets the paths of all files that an image may have: the PNG, the thumbnail and the raw file."""
+        image_path = self.__resolve_path(image_name, image_subfolder=image_subfolder)
+        return [
+            image_path,
+            self.__resolve_path(image_name, thumbnail=True, image_subfolder=image_subfolder),
+            image_path.with_suffix(_RAW_IMAGE_SUFFIX),
+        ]
+
+    def __convert_raw(self, image_name: str, image_subfolder: str) -> None:
+        """Replaces the raw file of an image, if it has one, with a PNG and a thumbnail."""
+        image_path = self.__resolve_path(image_name, image_subfolder=image_subfolder)
+        raw_path = image_path.with_suffix(_RAW_IMAGE_SUFFIX)
+        if not raw_path.exists():
+            return
+        with self.__deferred_write_lock:
+            try:
+                image, thumbnail_size = _read_raw_image(raw_path)
+            except FileNotFoundError:
+                # Another thread converted or deleted the image while we waited.
+                return
+            # get() finds the image in the cache while the PNG is incomplete.
+            self.__set_cache(image_path, image)
+            self.__write(
+                image,
+                image_name,
+                image.info.get("invokeai_metadata"),
+                image.info.get("invokeai_workflow"),
+                image.info.get("invokeai_graph"),
+                thumbnail_size,
+                image_subfolder,
+            )
+
+    def __resolve_path(self, image_name: str, thumbnail: bool = False, image_subfolder: str = "") -> Path:
         base_folder = self.__thumbnails_folder if thumbnail else self.__output_folder
         filename = get_thumbnail_name(image_name) if thumbnail else image_name
 
@@ -296,6 +479,9 @@ class DiskImageFileStorage(ImageFileStorageBase):
         return path.exists()
 
     def get_workflow(self, image_name: str, image_subfolder: str = "") -> str | None:
+        deferred = self.__get_deferred(image_name)
+        if deferred is not None:
+            return deferred.workflow
         image = self.get(image_name, image_subfolder=image_subfolder)
         workflow = image.info.get("invokeai_workflow", None)
         if isinstance(workflow, str):
@@ -303,6 +489,9 @@ class DiskImageFileStorage(ImageFileStorageBase):
         return None
 
     def get_graph(self, image_name: str, image_subfolder: str = "") -> str | None:
+        deferred = self.__get_deferred(image_name)
+        if deferred is not None:
+            return deferred.graph
         image = self.get(image_name, image_subfolder=image_subfolder)
         graph = image.info.get("invokeai_graph", None)
         if isinstance(graph, str):
@@ -328,10 +517,7 @@ class DiskImageFileStorage(ImageFileStorageBase):
                     data = json.load(manifest)
                 image_name = data["image_name"]
                 image_subfolder = data.get("image_subfolder", "")
-                candidates = [
-                    self.get_path(image_name, image_subfolder=image_subfolder),
-                    self.get_path(image_name, thumbnail=True, image_subfolder=image_subfolder),
-                ]
+                candidates = self.__get_file_paths(image_name, image_subfolder)
                 token = _StagedDelete(
                     directory=staging_dir,
                     files=[(source, staging_dir / str(index)) for index, source in enumerate(candidates)],
@@ -346,6 +532,70 @@ class DiskImageFileStorage(ImageFileStorageBase):
                 else:
                     logger.error(f"Failed to recover staged image deletion {staging_dir}: {error}")
 
+    def __get_deferred(self, image_name: str) -> Optional[_DeferredWrite]:
+        with self.__cache_lock:
+            return self.__deferred.get(image_name)
+
+    def __defer_write(self, deferred: _DeferredWrite) -> bool:
+        """Keeps an image in memory instead of writing it. Returns False if it must be written right away."""
+        max_bytes = self.__invoker.services.configuration.deferred_intermediate_images_mb * 2**20
+        if deferred.size_bytes > max_bytes:
+            return False
+        # Validate the name and subfolder now, rather than when the image is written.
+        self.__resolve_path(deferred.image_name, image_subfolder=deferred.image_subfolder)
+        with self.__cache_lock:
+            previous = self.__deferred.pop(deferred.image_name, None)
+            if previous is not None:
+                self.__deferred_bytes -= previous.size_bytes
+            self.__deferred[deferred.image_name] = deferred
+            self.__deferred_bytes += deferred.size_bytes
+            over_budget: list[str] = []
+            bytes_over_budget = self.__deferred_bytes - max_bytes
+            for image_name, older in self.__deferred.items():
+                if bytes_over_budget <= 0:
+                    break
+                over_budget.append(image_name)
+                bytes_over_budget -= older.size_bytes
+        # Spill the oldest images to disk, to stay within the memory budget.
+        for image_name in over_budget:
+            self.__write_deferred(image_name)
+        return True
+
+    def __restore_deferred(self, deferred: Optional[_DeferredWrite]) -> None:
+        if deferred is None:
+            return
+        with self.__cache_lock:
+            self.__deferred[deferred.image_name] = deferred
+            self.__deferred_bytes += deferred.size_bytes
+
+    def __write_deferred(self, image_name: str, allow_raw: bool = True) -> None:
+        if self.__get_deferred(image_name) is None:
+            return
+        with self.__deferred_write_lock:
+            # The image stays in __deferred while it is written, so that get() still finds it.
+            deferred = self.__get_deferred(image_name)
+            if deferred is None:
+                # Another thread wrote or deleted the image while we waited.
+                return
+            try:
+                self.__write(
+                    deferred.image,
+                    deferred.image_name,
+                    deferred.metadata,
+                    deferred.workflow,
+                    deferred.graph,
+                    deferred.thumbnail_size,
+                    deferred.image_subfolder,
+                    deferred.raw and allow_raw,
+                )
+            except ImageFileSaveException as e:
+                # The image has a record, but it cannot be written. Keeping it in memory would only delay the error.
+                InvokeAILogger.get_logger().error(f"Failed to write intermediate image {image_name}: {e.__cause__}")
+            finally:
+                with self.__cache_lock:
+                    if self.__deferred.pop(image_name, None) is not None:
+                        self.__deferred_bytes -= deferred.size_bytes
+
     def __get_cache(self, image_name: Path) -> Optional[PILImageType]:
         with self.__cache_lock:
             return None if image_name not in self.__cache else self.__cache[image_name]
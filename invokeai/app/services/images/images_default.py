@@ -62,6 +62,8 @@ class ImageService(ImageServiceABC):
         image_subfolder = strategy.get_subfolder(image_name, image_category, is_intermediate or False)
 
         (width, height) = image.size
+        raw_categories = self.__invoker.services.configuration.raw_intermediate_image_categories
+        store_raw = bool(is_intermediate) and image_category.value in raw_categories
 
         try:
             # TODO: Consider using a transaction here to ensure consistency between storage and database
@@ -96,6 +98,9 @@ class ImageService(ImageServiceABC):
                 workflow=workflow,
                 graph=graph,
                 image_subfolder=image_subfolder,
+                # Intermediate images are usually only read by the next node of the session.
+                defer_write=bool(is_intermediate),
+                raw=store_raw,
             )
             image_dto = self.get_dto(image_name)
 
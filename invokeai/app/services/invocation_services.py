@@ -38,6 +38,7 @@ if TYPE_CHECKING:
     )
     from invokeai.app.services.model_relationships.model_relationships_base import ModelRelationshipsServiceABC
     from invokeai.app.services.names.names_base import NameServiceBase
+    from invokeai.app.services.preprocessor_cache.preprocessor_cache_base import PreprocessorCacheBase
     from invokeai.app.services.session_processor.session_processor_base import SessionProcessorBase
     from invokeai.app.services.session_queue.session_queue_base import SessionQueueBase
     from invokeai.app.services.urls.urls_base import UrlServiceBase
@@ -93,6 +94,7 @@ class InvocationServices:
         board_video_records: "BoardVideoRecordStorageBase",
         gallery: "GalleryServiceABC",
         image_moves: "ImageMoveService | None" = None,
+        preprocessor_cache: "PreprocessorCacheBase | None" = None,
     ):
         self.board_images = board_images
         self.board_image_records = board_image_records
@@ -132,3 +134,4 @@ class InvocationServices:
         self.video_records = video_records
         self.board_video_records = board_video_records
         self.gallery = gallery
+        self.preprocessor_cache = preprocessor_cache
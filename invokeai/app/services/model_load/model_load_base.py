@@ -30,6 +30,16 @@ class ModelLoadServiceBase(ABC):
             events so they can be routed to that user's UI (defaults to the system user).
         """
 
+    @abstractmethod
+    def prefetch_model(self, model_config: AnyModelConfig, submodel_type: Optional[SubModelType] = None) -> bool:
+        """
+        Load a model into the RAM cache ahead of time, if it fits into the cache without evicting other models.
+
+        :param model_config: Model configuration record (as returned by ModelRecordBase.get_model())
+        :param submodel_type: For main (pipeline models), the submodel to fetch.
+        :return: True if the model was loaded, False if it was already cached or did not fit.
+        """
+
     @property
     @abstractmethod
     def ram_cache(self) -> ModelCache:
@@ -18,7 +18,11 @@ from invokeai.backend.model_manager.load import (
     ModelLoaderRegistry,
     ModelLoaderRegistryBase,
 )
-from invokeai.backend.model_manager.load.model_cache.model_cache import MODEL_LOAD_LOCK, ModelCache
+from invokeai.backend.model_manager.load.model_cache.model_cache import (
+    MODEL_LOAD_LOCK,
+    ModelCache,
+    get_model_cache_key,
+)
 from invokeai.backend.model_manager.load.model_loaders.generic_diffusers import GenericDiffusersLoader
 from invokeai.backend.model_manager.taxonomy import AnyModel, SubModelType
 from invokeai.backend.util.devices import TorchDevice
@@ -104,6 +108,26 @@ class ModelLoadService(ModelLoadServiceBase):
 
         return loaded_model
 
+    def prefetch_model(self, model_config: AnyModelConfig, submodel_type: Optional[SubModelType] = None) -> bool:
+        implementation, model_config, submodel_type = self._registry.get_implementation(model_config, submodel_type)  # type: ignore
+        ram_cache = self.ram_cache
+        if ram_cache.contains(get_model_cache_key(model_config.key, submodel_type)):
+            return False
+
+        model_path = (self._app_config.models_path / model_config.path).resolve()
+        if not model_path.exists():
+            return False
+        loader = implementation(app_config=self._app_config, logger=self._logger, ram_cache=ram_cache)
+        # Only use RAM that is currently free: a prefetch must never evict a model that the running session may still
+        # need.
+        if loader.get_size_fs(model_config, model_path, submodel_type) > ram_cache.ram_available():
+            return False
+
+        self._logger.debug(f"Prefetching {model_config.name} ({submodel_type.value if submodel_type else 'model'})")
+        # The returned LoadedModel is dropped right away. The model stays in the cache, unlocked, until it is used.
+        loader.load_model(model_config, submodel_type)
+        return True
+
     def load_model_from_path(
         self, model_path: Path, loader: Optional[Callable[[Path], AnyModel]] = None
     ) -> LoadedModelWithoutConfig:
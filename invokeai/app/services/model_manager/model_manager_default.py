@@ -16,10 +16,13 @@ from invokeai.app.services.model_load.model_load_base import ModelLoadServiceBas
 from invokeai.app.services.model_load.model_load_default import ModelLoadService
 from invokeai.app.services.model_manager.model_manager_base import ModelManagerServiceBase
 from invokeai.app.services.model_records.model_records_base import ModelRecordServiceBase
+from invokeai.backend.model_manager.load.model_cache.cache_trace import CacheTraceRecorder
+from invokeai.backend.model_manager.load.model_cache.eviction_policy import build_eviction_policy
 from invokeai.backend.model_manager.load.model_cache.model_cache import ModelCache
 from invokeai.backend.model_manager.load.model_cache.ram_budget import RamBudget
 from invokeai.backend.model_manager.load.model_cache.shared_cpu_weights import SharedCpuWeightsStore
 from invokeai.backend.model_manager.load.model_loader_registry import ModelLoaderRegistry
+from invokeai.backend.quantization.gguf.dequantize_cache import configure_dequantization_cache
 from invokeai.backend.util.devices import TorchDevice
 from invokeai.backend.util.logging import InvokeAILogger
 
@@ -94,6 +97,12 @@ class ModelManagerService(ModelManagerServiceBase):
         # decide what to evict (see RamBudget).
         shared_store = SharedCpuWeightsStore()
 
+        # One trace file is shared by every per-device cache. Each event records the cache's device.
+        trace_path = app_config.model_cache_trace_path
+        trace_recorder = CacheTraceRecorder(trace_path) if trace_path else None
+        if trace_recorder is not None:
+            logger.info(f"Recording model cache operations to {trace_path}")
+
         def build_cache(device: torch.device) -> ModelCache:
             return ModelCache(
                 execution_device_working_mem_gb=app_config.device_working_mem_gb,
@@ -107,6 +116,8 @@ class ModelManagerService(ModelManagerServiceBase):
                 logger=logger,
                 keep_alive_minutes=app_config.model_cache_keep_alive_min,
                 shared_cpu_weights=shared_store,
+                eviction_policy=build_eviction_policy(app_config.model_cache_eviction_policy),
+                trace_recorder=trace_recorder,
             )
 
         # The default cache for callers without a pinned device (API threads, single-device installs).
@@ -153,6 +164,10 @@ class ModelManagerService(ModelManagerServiceBase):
             f"across {len(distinct_caches)} device cache(s)."
         )
 
+        configure_dequantization_cache(app_config.gguf_dequantize_cache_gb)
+        if app_config.gguf_dequantize_cache_gb > 0:
+            logger.info(f"GGUF dequantization cache: {app_config.gguf_dequantize_cache_gb:.2f} GB per device.")
+
         loader = ModelLoadService(
             app_config=app_config,
             ram_cache=ram_cache,
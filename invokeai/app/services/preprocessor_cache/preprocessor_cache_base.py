@@ -0,0 +1,41 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from PIL.Image import Image
+
+
+class PreprocessorCacheBase(ABC):
+    """
+    Base class for preprocessor output caches.
+
+    Control image preprocessors (edge detectors, depth estimators, pose detectors, etc.) are expensive, and are often
+    run again on identical pixels: a canvas layer is re-rasterized to a new image, or an unrelated parameter of a
+    downstream node changes. The invocation cache does not help in these cases, because its key includes the name of
+    the input image. This cache is keyed by the content of the input image instead, plus the processor and its
+    parameters, and is shared across sessions.
+
+    Implementations should respect the `preprocessor_cache_mb` configuration value, and skip all cache logic if the
+    value is set to 0.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Image]:
+        """Retrieves a processor output from the cache"""
+        pass
+
+    @abstractmethod
+    def save(self, key: str, image: Image) -> None:
+        """Stores a processor output in the cache"""
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Clears the cache"""
+        pass
+
+    @staticmethod
+    @abstractmethod
+    def create_key(image: Image, processor: str) -> str:
+        """Gets the key for the output of `processor` on `image`. `processor` identifies the processor and all of its
+        parameters that affect the output, including the model."""
+        pass
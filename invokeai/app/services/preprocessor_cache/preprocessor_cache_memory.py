@@ -0,0 +1,61 @@
+import hashlib
+from collections import OrderedDict
+from threading import Lock
+from typing import Optional
+
+from PIL.Image import Image
+
+from invokeai.app.services.preprocessor_cache.preprocessor_cache_base import PreprocessorCacheBase
+
+
+def _image_size_bytes(image: Image) -> int:
+    return image.width * image.height * len(image.getbands())
+
+
+class MemoryPreprocessorCache(PreprocessorCacheBase):
+    """An in-memory, least-recently-used preprocessor output cache, limited by the total size of the cached images."""
+
+    _cache: OrderedDict[str, Image]
+    _max_cache_size_bytes: int
+    _cache_size_bytes: int
+    _lock: Lock
+
+    def __init__(self, max_cache_size_mb: float = 0) -> None:
+        self._cache = OrderedDict()
+        self._max_cache_size_bytes = int(max_cache_size_mb * 2**20)
+        self._cache_size_bytes = 0
+        self._lock = Lock()
+
+    def get(self, key: str) -> Optional[Image]:
+        with self._lock:
+            if self._max_cache_size_bytes == 0:
+                return None
+            image = self._cache.get(key, None)
+            if image is None:
+                return None
+            self._cache.move_to_end(key)
+            # Callers own the returned image, and may modify it.
+            return image.copy()
+
+    def save(self, key: str, image: Image) -> None:
+        size = _image_size_bytes(image)
+        with self._lock:
+            if size > self._max_cache_size_bytes or key in self._cache:
+                return
+            while self._cache and self._cache_size_bytes + size > self._max_cache_size_bytes:
+                _, evicted = self._cache.popitem(last=False)
+                self._cache_size_bytes -= _image_size_bytes(evicted)
+            self._cache[key] = image.copy()
+            self._cache_size_bytes += size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self._cache_size_bytes = 0
+
+    @staticmethod
+    def create_key(image: Image, processor: str) -> str:
+        content_hash = hashlib.sha256()
+        content_hash.update(f"{image.mode}:{image.width}x{image.height}:{processor}:".encode())
+        content_hash.update(image.tobytes())
+        return content_hash.hexdigest()
@@ -0,0 +1,120 @@
+import threading
+from collections import defaultdict
+from typing import Callable, Iterator, Optional
+
+from pydantic import BaseModel
+
+from invokeai.app.invocations.model import ModelIdentifierField
+from invokeai.app.services.invocation_services import InvocationServices
+from invokeai.app.services.model_records.model_records_base import UnknownModelException
+from invokeai.app.services.session_queue.session_queue_common import SessionQueueItem
+from invokeai.backend.model_manager.load.model_cache.model_cache import CacheEntrySnapshot
+from invokeai.backend.model_manager.taxonomy import ModelType, SubModelType
+
+
+def iter_model_identifiers(queue_item: SessionQueueItem) -> Iterator[ModelIdentifierField]:
+    """Yield the model identifiers referenced by the nodes of a queue item's graph, in node order."""
+
+    def walk(value: object) -> Iterator[ModelIdentifierField]:
+        if isinstance(value, ModelIdentifierField):
+            yield value
+        elif isinstance(value, BaseModel):
+            for field_name in type(value).model_fields:
+                yield from walk(getattr(value, field_name, None))
+        elif isinstance(value, (list, tuple)):
+            for item in value:
+                yield from walk(item)
+
+    for node in queue_item.session.graph.nodes.values():
+        yield from walk(node)
+
+
+class ModelPrefetcher:
+    """Loads the models of upcoming queue items into the RAM cache while the current item runs.
+
+    When a queue item starts, the prefetcher looks at the next `lookahead` pending items and loads the models that
+    their graphs reference on a background thread, so that the next item does not have to wait for them to be read
+    from disk. Models are only prefetched into RAM that is free: the prefetcher never evicts a cached model.
+
+    Graphs reference main models without a submodel (the submodels are chosen when the model loader node runs). For
+    those, the prefetcher loads the submodels that were used the last time that the model ran, which it learns from
+    the RAM cache's hit and miss callbacks.
+    """
+
+    def __init__(self, services: InvocationServices, lookahead: int) -> None:
+        self._services = services
+        self._lookahead = lookahead
+        self._wake_event = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._submodels_lock = threading.Lock()
+        # model key -> submodels of that model that have been requested from the RAM cache.
+        self._used_submodels: dict[str, set[SubModelType]] = defaultdict(set)
+        self._unsubscribe_callbacks: list[Callable[[], None]] = []
+
+    def start(self) -> None:
+        ram_cache = self._services.model_manager.load.ram_cache
+        self._unsubscribe_callbacks = [
+            ram_cache.on_cache_hit(self._on_cache_access),
+            ram_cache.on_cache_miss(self._on_cache_access),
+        ]
+        self._stop_event.clear()
+        self._thread = threading.Thread(name="model_prefetcher", target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self._wake_event.set()
+        for unsubscribe in self._unsubscribe_callbacks:
+            unsubscribe()
+        self._unsubscribe_callbacks = []
+
+    def request_prefetch(self) -> None:
+        """Prefetch the models of the next pending queue items. Returns immediately."""
+        self._wake_event.set()
+
+    def prefetch(self) -> None:
+        """Prefetch the models of the next pending queue items on the calling thread."""
+        for queue_item in self._services.session_queue.get_pending(self._lookahead):
+            for identifier in iter_model_identifiers(queue_item):
+                for submodel_type in self._get_submodels_to_prefetch(identifier):
+                    if self._stop_event.is_set():
+                        return
+                    self._prefetch_model(identifier.key, submodel_type)
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            self._wake_event.wait()
+            self._wake_event.clear()
+            if self._stop_event.is_set():
+                break
+            try:
+                self.prefetch()
+            except Exception as e:
+                # Prefetching is an optimization. A failure here must never affect the session processor.
+                self._services.logger.warning(f"Model prefetch failed: {e}")
+
+    def _get_submodels_to_prefetch(self, identifier: ModelIdentifierField) -> list[Optional[SubModelType]]:
+        if identifier.submodel_type is not None or identifier.type is not ModelType.Main:
+            return [identifier.submodel_type]
+        with self._submodels_lock:
+            return sorted(self._used_submodels.get(identifier.key, set()))
+
+    def _prefetch_model(self, model_key: str, submodel_type: Optional[SubModelType]) -> None:
+        try:
+            config = self._services.model_manager.store.get_model(model_key)
+        except UnknownModelException:
+            return
+        self._services.model_manager.load.prefetch_model(config, submodel_type)
+
+    def _on_cache_access(self, model_key: str, cache_snapshot: dict[str, CacheEntrySnapshot]) -> None:
+        # Called with the RAM cache's lock held, so this must stay cheap.
+        key, _, submodel = model_key.partition(":")
+        if not submodel:
+            return
+        try:
+            submodel_type = SubModelType(submodel)
+        except ValueError:
+            return
+        with self._submodels_lock:
+            self._used_submodels[key].add(submodel_type)
@@ -21,6 +21,7 @@ from invokeai.app.services.events.events_common import (
 )
 from invokeai.app.services.invocation_stats.invocation_stats_common import GESStatsNotFoundError
 from invokeai.app.services.invoker import Invoker
+from invokeai.app.services.session_processor.model_prefetcher import ModelPrefetcher
 from invokeai.app.services.session_processor.session_processor_base import (
     InvocationServices,
     OnAfterRunNode,
@@ -394,6 +395,7 @@ class DefaultSessionRunner(SessionRunnerBase):
         """Called after a session is run.
 
         - Stop the profiler if profiling is enabled.
+        - Write the files of the intermediate images that are still only in memory.
         - Update the queue item's session object in the database.
         - If not already canceled or failed, complete the queue item.
         - Log and reset performance statistics.
@@ -412,6 +414,9 @@ class DefaultSessionRunner(SessionRunnerBase):
                 graph_execution_state_id=queue_item.session.id, output_path=stats_path
             )
 
+        # Before the queue item is completed, so that its images are on disk when clients are told about it.
+        self._services.image_files.flush_deferred()
+
         try:
             # Update the queue item with the completed session. If the queue item has been removed from the queue,
             # we'll get a SessionQueueItemNotFoundError and we can ignore it. This can happen if the queue is cleared
@@ -560,6 +565,7 @@ class DefaultSessionProcessor(SessionProcessorBase):
         self._thread_limit = thread_limit
         self._polling_interval = polling_interval
         self._workers: list[_SessionWorker] = []
+        self._model_prefetcher: Optional[ModelPrefetcher] = None
 
     def _resolve_devices(self) -> list[Optional[torch.device]]:
         """Determine the per-worker devices from config.
@@ -670,8 +676,22 @@ class DefaultSessionProcessor(SessionProcessorBase):
             )
             worker.thread.start()
 
+        # Model prefetching loads the next items' models into the RAM cache of the device that will run them. With
+        # multiple workers, it is not known which device will pick up an item, so prefetching is only done with one.
+        prefetch_lookahead = self._invoker.services.configuration.model_prefetch_lookahead
+        if prefetch_lookahead > 0 and len(self._workers) == 1:
+            self._model_prefetcher = ModelPrefetcher(services=invoker.services, lookahead=prefetch_lookahead)
+            self._model_prefetcher.start()
+        elif prefetch_lookahead > 0:
+            self._invoker.services.logger.warning(
+                "Model prefetching is disabled because multiple generation devices are configured."
+            )
+
     def stop(self, *args, **kwargs) -> None:
         self._stop_event.set()
+        if self._model_prefetcher is not None:
+            self._model_prefetcher.stop()
+            self._model_prefetcher = None
         # Cancel any in-progress generation so that long-running nodes (e.g. denoising) stop at
         # the next step boundary instead of running to completion. Without this, a generation
         # thread may still be executing CUDA operations when Python teardown begins, which can
@@ -710,6 +730,8 @@ class DefaultSessionProcessor(SessionProcessorBase):
 
     async def _on_batch_enqueued(self, event: FastAPIEvent[BatchEnqueuedEvent]) -> None:
         self._poll_now()
+        if self._model_prefetcher is not None:
+            self._model_prefetcher.request_prefetch()
 
     async def _on_user_access_changed(self, event: FastAPIEvent[UserAccessChangedEvent]) -> None:
         # If the owner of the currently running queue item was deactivated or deleted,
@@ -994,6 +1016,10 @@ class DefaultSessionProcessor(SessionProcessorBase):
                         f"on {worker.label}"
                     )
 
+                    # Now that this item has left the pending list, load the models of the items that follow it.
+                    if self._model_prefetcher is not None:
+                        self._model_prefetcher.request_prefetch()
+
                     # Run the graph. Hold this GPU's exclusive-use lock for the whole session so no
                     # other worker can borrow it for text-encoder offload while we're running on it
                     # (a borrow + concurrent native session on one GPU would corrupt the shared
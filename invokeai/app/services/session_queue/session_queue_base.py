@@ -18,6 +18,7 @@ from invokeai.app.services.session_queue.session_queue_common import (
     ItemIdsResult,
     NodeFieldValue,
     PruneResult,
+    RawSessionQueueItem,
     RetryItemsResult,
     SessionQueueCountsByDestination,
     SessionQueueItem,
@@ -59,6 +60,11 @@ class SessionQueueBase(ABC):
         """Gets the next session queue item (does not dequeue it)"""
         pass
 
+    @abstractmethod
+    def get_pending(self, limit: int) -> list[SessionQueueItem]:
+        """Gets up to `limit` pending session queue items, in FIFO dequeue order (does not dequeue them)"""
+        pass
+
     @abstractmethod
     def clear(self, queue_id: str, user_id: Optional[str] = None) -> ClearResult:
         """Deletes all session queue items. If user_id is provided, only clears items owned by that user."""
@@ -214,6 +220,16 @@ class SessionQueueBase(ABC):
         """Gets all queue items that match the given parameters"""
         pass
 
+    @abstractmethod
+    def list_all_raw_queue_items(
+        self,
+        queue_id: str,
+        destination: Optional[str] = None,
+    ) -> list[RawSessionQueueItem]:
+        """Gets all queue items that match the given parameters, without parsing their sessions, workflows and field
+        values. Use this to serialize the items."""
+        pass
+
     @abstractmethod
     def get_queue_item_ids(
         self,
@@ -234,6 +250,12 @@ class SessionQueueBase(ABC):
         """Gets a session queue item by ID for a given queue"""
         pass
 
+    @abstractmethod
+    def get_raw_queue_item(self, item_id: int) -> RawSessionQueueItem:
+        """Gets a session queue item by ID, without parsing its session, workflow and field values. Use this to
+        serialize the item."""
+        pass
+
     @abstractmethod
     def set_queue_item_session(self, item_id: int, session: GraphExecutionState) -> SessionQueueItem:
         """Sets the session for a session queue item. Use this to update the session state."""
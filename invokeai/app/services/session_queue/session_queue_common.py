@@ -1,7 +1,8 @@
 import datetime
 import json
+from functools import cached_property
 from itertools import chain, product
-from typing import Generator, Literal, Optional, TypeAlias, Union
+from typing import Any, Generator, Literal, Optional, TypeAlias, Union
 
 from pydantic import (
     AliasChoices,
@@ -313,6 +314,83 @@ class SessionQueueItem(BaseModel):
     )
 
 
+# The fields of a queue item that are stored as JSON, in the order in which RawSessionQueueItem serializes them.
+_RAW_JSON_FIELDS = ("field_values", "session", "workflow")
+_EMPTY_SESSION = GraphExecutionState(id="", graph=Graph())
+
+
+class RawSessionQueueItem:
+    """A session queue item whose field values, session and workflow are kept as the JSON stored in the database.
+
+    Parsing a session validates every node against the union of all invocations, which dominates the cost of loading
+    a queue item. The queue item routes only serialize the item again, so they splice the stored JSON into their
+    responses with `model_dump_json()`. The JSON is only parsed when `session` or `to_queue_item()` is used.
+    """
+
+    model_fields = SessionQueueItem.model_fields
+
+    def __init__(self, queue_item_dict: dict) -> None:
+        queue_item_dict = dict(queue_item_dict)
+        self._json: dict[str, Optional[str]] = {name: queue_item_dict.pop(name, None) for name in _RAW_JSON_FIELDS}
+        # The other fields are validated as usual, on an item with a placeholder session that is never exposed.
+        self._item = SessionQueueItem(**queue_item_dict, session=_EMPTY_SESSION)
+
+    @property
+    def item_id(self) -> int:
+        return self._item.item_id
+
+    @property
+    def queue_id(self) -> str:
+        return self._item.queue_id
+
+    @property
+    def user_id(self) -> str:
+        return self._item.user_id
+
+    @cached_property
+    def session(self) -> GraphExecutionState:
+        return get_session(self._json)
+
+    def to_queue_item(self) -> SessionQueueItem:
+        """Parses the stored JSON into a full queue item."""
+        return self._item.model_copy(
+            update={
+                "field_values": get_field_values(self._json),
+                "session": self.session,
+                "workflow": get_workflow(self._json),
+            }
+        )
+
+    def model_copy(self, update: dict[str, Any]) -> "RawSessionQueueItem":
+        """Returns a copy with the given fields replaced, like BaseModel.model_copy(). Replacements of the fields that
+        are stored as JSON are serialized as they would be stored."""
+        copy = object.__new__(RawSessionQueueItem)
+        copy._json = dict(self._json)
+        for name in _RAW_JSON_FIELDS:
+            if name not in update:
+                continue
+            value = update[name]
+            if value is None:
+                copy._json[name] = None
+            elif isinstance(value, BaseModel):
+                copy._json[name] = value.model_dump_json(warnings=False, exclude_none=True)
+            else:
+                copy._json[name] = json.dumps(value, default=to_jsonable_python)
+        copy._item = self._item.model_copy(
+            update={name: value for name, value in update.items() if name not in _RAW_JSON_FIELDS}
+        )
+        return copy
+
+    def model_dump_json(self, exclude_none: bool = False) -> str:
+        """Serializes the item like SessionQueueItem.model_dump_json(), with the stored JSON spliced in as is."""
+        members = [self._item.model_dump_json(exclude=set(_RAW_JSON_FIELDS), exclude_none=exclude_none)[1:-1]]
+        for name in _RAW_JSON_FIELDS:
+            value = self._json[name]
+            if value is not None or not exclude_none:
+                members.append(f'"{name}":{value if value is not None else "null"}')
+        return "{" + ",".join(member for member in members if member) + "}"
+
+
 class SessionQueueItemSummary(BaseModel):
     """Queue item fields needed to render the queue list."""
 
@@ -27,6 +27,7 @@ from invokeai.app.services.session_queue.session_queue_common import (
     ItemIdsResult,
     NodeFieldValue,
     PruneResult,
+    RawSessionQueueItem,
     RetryItemsResult,
     SessionQueueCountsByDestination,
     SessionQueueItem,
@@ -449,6 +450,27 @@ class SqliteSessionQueue(SessionQueueBase):
             return None
         return SessionQueueItem.queue_item_from_dict(dict(result))
 
+    def get_pending(self, limit: int) -> list[SessionQueueItem]:
+        with self._db.transaction() as cursor:
+            cursor.execute(
+                """--sql
+                SELECT
+                    sq.*,
+                    u.display_name as user_display_name,
+                    u.email as user_email
+                FROM session_queue sq
+                LEFT JOIN users u ON sq.user_id = u.user_id
+                WHERE sq.status = 'pending'
+                ORDER BY
+                    sq.priority DESC,
+                    sq.item_id ASC
+                LIMIT ?
+                """,
+                (limit,),
+            )
+            results = cast(list[sqlite3.Row], cursor.fetchall())
+        return [SessionQueueItem.queue_item_from_dict(dict(result)) for result in results]
+
     def get_current(self, queue_id: str) -> Optional[SessionQueueItem]:
         with self._db.transaction() as cursor:
             cursor.execute(
@@ -1142,6 +1164,12 @@ class SqliteSessionQueue(SessionQueueBase):
         return CancelAllExceptCurrentResult(canceled=count)
 
     def get_queue_item(self, item_id: int) -> SessionQueueItem:
+        return SessionQueueItem.queue_item_from_dict(self._get_queue_item_dict(item_id))
+
+    def get_raw_queue_item(self, item_id: int) -> RawSessionQueueItem:
+        return RawSessionQueueItem(self._get_queue_item_dict(item_id))
+
+    def _get_queue_item_dict(self, item_id: int) -> dict:
         with self._db.transaction() as cursor:
             cursor.execute(
                 """--sql
@@ -1158,7 +1186,7 @@ class SqliteSessionQueue(SessionQueueBase):
             result = cast(Union[sqlite3.Row, None], cursor.fetchone())
         if result is None:
             raise SessionQueueItemNotFoundError(f"No queue item with id {item_id}")
-        return SessionQueueItem.queue_item_from_dict(dict(result))
+        return dict(result)
 
     def save_queue_item_session(self, item_id: int, session: GraphExecutionState) -> None:
         with self._db.transaction() as cursor:
@@ -1351,6 +1379,19 @@ class SqliteSessionQueue(SessionQueueBase):
         destination: Optional[str] = None,
     ) -> list[SessionQueueItem]:
         """Gets all queue items that match the given parameters"""
+        return [
+            SessionQueueItem.queue_item_from_dict(item_dict)
+            for item_dict in self._list_all_queue_item_dicts(queue_id, destination)
+        ]
+
+    def list_all_raw_queue_items(
+        self,
+        queue_id: str,
+        destination: Optional[str] = None,
+    ) -> list[RawSessionQueueItem]:
+        return [RawSessionQueueItem(item_dict) for item_dict in self._list_all_queue_item_dicts(queue_id, destination)]
+
+    def _list_all_queue_item_dicts(self, queue_id: str, destination: Optional[str]) -> list[dict]:
         with self._db.transaction() as cursor:
             query = """--sql
                 SELECT
@@ -1377,8 +1418,7 @@ class SqliteSessionQueue(SessionQueueBase):
                 """
             cursor.execute(query, params)
             results = cast(list[sqlite3.Row], cursor.fetchall())
-        items = [SessionQueueItem.queue_item_from_dict(dict(result)) for result in results]
-        return items
+        return [dict(result) for result in results]
 
     def get_queue_item_ids(
         self,
@@ -293,6 +293,40 @@ class ImagesInterface(InvocationContextInterface):
             image = image.copy()
         return image
 
+    def run_cached_processor(self, image: Image, process: Callable[[Image], Image]) -> Image:
+        """Runs an image processor, such as a ControlNet preprocessor, reusing its output if it was already run on
+        identical pixels with identical parameters.
+
+        Outputs are cached by the content of the input image, the type of the invocation and all of its fields, except
+        those that do not affect the output (the input image name, board, metadata, etc.). The cache is shared across
+        sessions, so it still hits if the same pixels are saved again as a new image, e.g. when a canvas layer is
+        re-rasterized. The processor must be deterministic. The cache is skipped if the invocation's `use_cache` is
+        False.
+
+        Args:
+            image: The input image.
+            process: Runs the processor on the input image.
+
+        Returns:
+            The output of the processor. This is a copy, which the caller may modify.
+        """
+        cache = self._services.preprocessor_cache
+        invocation = self._data.invocation
+        if cache is None or not invocation.use_cache:
+            return process(image)
+
+        processor = invocation.model_dump_json(
+            exclude={"id", "image", "board", "metadata", "is_intermediate", "use_cache"}, warnings=False
+        )
+        key = cache.create_key(image, processor)
+        output = cache.get(key)
+        if output is not None:
+            self._services.logger.debug(f'Preprocessor cache hit for type "{invocation.get_type()}": {invocation.id}')
+            return output
+        output = process(image)
+        cache.save(key, output)
+        return output
+
     def get_metadata(self, image_name: str) -> Optional[MetadataField]:
         """Gets an image's metadata, if it has any.
 
@@ -0,0 +1,109 @@
+from functools import lru_cache
+from typing import Callable, Optional
+
+import numpy as np
+import torch
+from PIL import Image
+
+from invokeai.backend.image_util.color_conversion import (
+    hsl_from_srgb,
+    linear_srgb_from_srgb,
+    okhsl_from_srgb,
+    okhsv_from_srgb,
+    oklab_from_linear_srgb,
+    oklch_from_oklab,
+)
+
+
+@lru_cache(maxsize=None)
+def _linear_srgb_lut(device: torch.device, dtype: torch.dtype) -> torch.Tensor:
+    """A lookup table from 8-bit sRGB values to linear-light sRGB. Shape: (256,)."""
+    srgb = (torch.arange(256, dtype=dtype) / 255.0).view(1, 1, 256).expand(3, 1, 256)
+    return linear_srgb_from_srgb(srgb)[0, 0].to(device=device)
+
+
+def srgb_tensor_from_pil(image: Image.Image) -> torch.Tensor:
+    """Get an 8-bit sRGB tensor from an RGB PIL image, on the CPU. Shape: (3, H, W)."""
+    if image.mode != "RGB":
+        raise ValueError(f"Expected an RGB image, got {image.mode}")
+    return torch.from_numpy(np.array(image)).permute(2, 0, 1).contiguous()
+
+
+class ColorImage:
+    """An 8-bit sRGB image held as a tensor on a device, with lazily-computed and cached color space conversions.
+
+    Each conversion is computed at most once per image, so a node that needs several representations of the same image
+    (e.g. Oklab for one step and Okhsl for another) does not repeat the shared steps, and nothing is converted back to
+    PIL in between.
+
+    Conversions from 8-bit input use lookup tables:
+    - The sRGB transfer function is a cached 256-entry table per device.
+    - The Okhsl and Okhsv conversions, whose gamut solvers dominate the cost of a blend, are computed once per distinct
+      color in the image and then gathered back to the pixels. Typical images have far fewer distinct colors than
+      pixels. A full 256^3 table would take ~200MB per conversion, so the table covers only the image's own colors.
+
+    All conversions return float tensors of shape (3, H, W) on the image's device, in the conventions of
+    `invokeai.backend.image_util.color_conversion`.
+    """
+
+    def __init__(self, srgb_uint8: torch.Tensor, device: torch.device, dtype: torch.dtype = torch.float32):
+        if srgb_uint8.dtype != torch.uint8 or srgb_uint8.ndim != 3 or srgb_uint8.shape[0] != 3:
+            raise ValueError("srgb_uint8 must be a 3xHxW uint8 tensor")
+        self.srgb_uint8 = srgb_uint8.to(device=device)
+        self.device = device
+        self.dtype = dtype
+        self._cache: dict[tuple[str, int], torch.Tensor] = {}
+        self._palette: Optional[torch.Tensor] = None
+        self._palette_index: Optional[torch.Tensor] = None
+
+    @classmethod
+    def from_pil(cls, image: Image.Image, device: torch.device, dtype: torch.dtype = torch.float32) -> "ColorImage":
+        return cls(srgb_tensor_from_pil(image.convert("RGB")), device=device, dtype=dtype)
+
+    @property
+    def height(self) -> int:
+        return self.srgb_uint8.shape[1]
+
+    @property
+    def width(self) -> int:
+        return self.srgb_uint8.shape[2]
+
+    def _cached(self, key: str, convert: Callable[[], torch.Tensor], steps: int = 0) -> torch.Tensor:
+        # Callers may modify the returned tensors in place, so they get a copy of the cached conversion.
+        if (key, steps) not in self._cache:
+            self._cache[(key, steps)] = convert()
+        return self._cache[(key, steps)].clone()
+
+    def _per_color(self, convert: Callable[[torch.Tensor], torch.Tensor]) -> torch.Tensor:
+        """Apply a 3xHxW -> 3xHxW sRGB conversion once per distinct color in the image."""
+        if self._palette is None or self._palette_index is None:
+            channels = self.srgb_uint8.to(dtype=torch.int32)
+            keys = (channels[0] << 16) | (channels[1] << 8) | channels[2]
+            unique_keys, self._palette_index = torch.unique(keys.flatten(), return_inverse=True)
+            palette = torch.stack([(unique_keys >> 16) & 0xFF, (unique_keys >> 8) & 0xFF, unique_keys & 0xFF])
+            # Shape: (3, 1, num_colors), so that the palette is itself a valid color tensor.
+            self._palette = (palette.to(dtype=self.dtype) / 255.0).unsqueeze(1)
+        return convert(self._palette)[:, 0, self._palette_index].view(3, self.height, self.width)
+
+    def srgb(self) -> torch.Tensor:
+        return self._cached("srgb", lambda: self.srgb_uint8.to(dtype=self.dtype) / 255.0)
+
+    def linear_srgb(self) -> torch.Tensor:
+        return self._cached(
+            "linear_srgb", lambda: _linear_srgb_lut(self.device, self.dtype)[self.srgb_uint8.to(dtype=torch.long)]
+        )
+
+    def hsl(self) -> torch.Tensor:
+        return self._cached("hsl", lambda: hsl_from_srgb(self.srgb()))
+
+    def oklab(self) -> torch.Tensor:
+        return self._cached("oklab", lambda: oklab_from_linear_srgb(self.linear_srgb()))
+
+    def oklch(self) -> torch.Tensor:
+        return self._cached("oklch", lambda: oklch_from_oklab(self.oklab()))
+
+    def okhsl(self, steps: int = 1) -> torch.Tensor:
+        return self._cached("okhsl", lambda: self._per_color(lambda t: okhsl_from_srgb(t, steps=steps)), steps)
+
+    def okhsv(self, steps: int = 1) -> torch.Tensor:
+        return self._cached("okhsv", lambda: self._per_color(lambda t: okhsv_from_srgb(t, steps=steps)), steps)
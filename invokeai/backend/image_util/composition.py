@@ -39,14 +39,14 @@ def equivalent_achromatic_lightness(lch_tensor: torch.Tensor):
     f_by = torch.add(k[0] * torch.abs(torch.sin(torch.div(h_minus_90, 2.0))), k[1])
     f_r_0 = torch.add(k[2] * torch.abs(torch.cos(lch_tensor[2, :, :])), k[3])
 
-    f_r = torch.zeros(lch_tensor[0, :, :].shape)
+    f_r = torch.zeros_like(lch_tensor[0, :, :])
     mask_hi = torch.ge(lch_tensor[2, :, :], -1 * (PI / 2.0))
     mask_lo = torch.le(lch_tensor[2, :, :], PI / 2.0)
     mask = torch.logical_and(mask_hi, mask_lo)
     f_r[mask] = f_r_0[mask]
 
-    l_max = torch.ones(lch_tensor[0, :, :].shape)
-    l_min = torch.zeros(lch_tensor[0, :, :].shape)
+    l_max = torch.ones_like(lch_tensor[0, :, :])
+    l_min = torch.zeros_like(lch_tensor[0, :, :])
     l_adjustment = torch.tensordot(torch.add(f_by, f_r), lch_tensor[1, :, :], dims=([0, 1], [0, 1]))
     l_max = torch.add(l_max, l_adjustment)
     l_min = torch.add(l_min, l_adjustment)
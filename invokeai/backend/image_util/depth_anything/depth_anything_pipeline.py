@@ -21,6 +21,14 @@ class DepthAnythingPipeline(RawModel):
         assert isinstance(depth_map, Image.Image)
         return depth_map
 
+    def generate_depths(self, images: list[Image.Image]) -> list[Image.Image]:
+        """Generate the depth maps of several images in a single batch. The images must all be the same size."""
+        outputs = self._pipeline(images, batch_size=len(images))
+        assert isinstance(outputs, list)
+        depth_maps = [output["depth"] for output in outputs]
+        assert all(isinstance(depth_map, Image.Image) for depth_map in depth_maps)
+        return depth_maps
+
     def to(self, device: Optional[torch.device] = None, dtype: Optional[torch.dtype] = None):
         if device is not None and device.type not in {"cpu", "cuda", "xpu"}:
             device = None
@@ -7,8 +7,8 @@ import onnxruntime as ort
 import torch
 from PIL import Image
 
-from invokeai.backend.image_util.dw_openpose.onnxdet import inference_detector
-from invokeai.backend.image_util.dw_openpose.onnxpose import inference_pose
+from invokeai.backend.image_util.dw_openpose.onnxdet import inference_detector_batch
+from invokeai.backend.image_util.dw_openpose.onnxpose import inference_pose_batch
 from invokeai.backend.image_util.dw_openpose.utils import NDArrayInt, draw_bodypose, draw_facepose, draw_handpose
 from invokeai.backend.image_util.util import np_to_pil
 from invokeai.backend.util.devices import TorchDevice
@@ -50,9 +50,18 @@ class DWOpenposeDetector:
     def pose_estimation(self, np_image: np.ndarray):
         """Does the pose estimation on the given image and returns the keypoints and scores."""
 
-        det_result = inference_detector(self.session_det, np_image)
-        keypoints, scores = inference_pose(self.session_pose, det_result, np_image)
+        return self.pose_estimation_batch([np_image])[0]
 
+    def pose_estimation_batch(self, np_images: list[np.ndarray]):
+        """Does the pose estimation on each of the given images and returns their keypoints and scores. The images are
+        run through each model in a single batch, if the model supports it."""
+
+        det_results = inference_detector_batch(self.session_det, np_images)
+        poses = inference_pose_batch(self.session_pose, det_results, np_images)
+        return [self._to_openpose_keypoints(keypoints, scores) for keypoints, scores in poses]
+
+    @staticmethod
+    def _to_openpose_keypoints(keypoints: np.ndarray, scores: np.ndarray):
         keypoints_info = np.concatenate((keypoints, scores[..., None]), axis=-1)
         # compute neck joint
         neck = np.mean(keypoints_info[:, [5, 6]], axis=1)
@@ -78,40 +87,68 @@ class DWOpenposeDetector:
         """Detects the pose in the given image and returns an solid black image with pose drawn on top, suitable for
         use with a ControlNet."""
 
-        np_image = np.array(image)
-        H, W, C = np_image.shape
+        return self.run_batch([image], draw_face=draw_face, draw_body=draw_body, draw_hands=draw_hands)[0]
+
+    def run_batch(
+        self,
+        images: list[Image.Image],
+        draw_face: bool = False,
+        draw_body: bool = True,
+        draw_hands: bool = False,
+    ) -> list[Image.Image]:
+        """Detects the poses in each of the given images, as in `run()`. The images are run through each model in a
+        single batch, if the model supports it."""
+
+        np_images = [np.array(image) for image in images]
 
         with torch.no_grad():
-            candidate, subset = self.pose_estimation(np_image)
-            nums, keys, locs = candidate.shape
-            candidate[..., 0] /= float(W)
-            candidate[..., 1] /= float(H)
-            body = candidate[:, :18].copy()
-            body = body.reshape(nums * 18, locs)
-            score = subset[:, :18]
-            for i in range(len(score)):
-                for j in range(len(score[i])):
-                    if score[i][j] > 0.3:
-                        score[i][j] = int(18 * i + j)
-                    else:
-                        score[i][j] = -1
-
-            un_visible = subset < 0.3
-            candidate[un_visible] = -1
-
-            # foot = candidate[:, 18:24]
-
-            faces = candidate[:, 24:92]
-
-            hands = candidate[:, 92:113]
-            hands = np.vstack([hands, candidate[:, 113:]])
-
-            bodies = {"candidate": body, "subset": score}
-            pose = {"bodies": bodies, "hands": hands, "faces": faces}
-
-            return DWOpenposeDetector.draw_pose(
-                pose, H, W, draw_face=draw_face, draw_hands=draw_hands, draw_body=draw_body
+            poses = self.pose_estimation_batch(np_images)
+
+        return [
+            self._draw_estimated_pose(
+                candidate, subset, np_image, draw_face=draw_face, draw_body=draw_body, draw_hands=draw_hands
             )
+            for (candidate, subset), np_image in zip(poses, np_images, strict=True)
+        ]
+
+    @staticmethod
+    def _draw_estimated_pose(
+        candidate: np.ndarray,
+        subset: np.ndarray,
+        np_image: np.ndarray,
+        draw_face: bool,
+        draw_body: bool,
+        draw_hands: bool,
+    ) -> Image.Image:
+        H, W, C = np_image.shape
+
+        nums, keys, locs = candidate.shape
+        candidate[..., 0] /= float(W)
+        candidate[..., 1] /= float(H)
+        body = candidate[:, :18].copy()
+        body = body.reshape(nums * 18, locs)
+        score = subset[:, :18]
+        for i in range(len(score)):
+            for j in range(len(score[i])):
+                if score[i][j] > 0.3:
+                    score[i][j] = int(18 * i + j)
+                else:
+                    score[i][j] = -1
+
+        un_visible = subset < 0.3
+        candidate[un_visible] = -1
+
+        # foot = candidate[:, 18:24]
+
+        faces = candidate[:, 24:92]
+
+        hands = candidate[:, 92:113]
+        hands = np.vstack([hands, candidate[:, 113:]])
+
+        bodies = {"candidate": body, "subset": score}
+        pose = {"bodies": bodies, "hands": hands, "faces": faces}
+
+        return DWOpenposeDetector.draw_pose(pose, H, W, draw_face=draw_face, draw_hands=draw_hands, draw_body=draw_body)
 
     @staticmethod
     def draw_pose(
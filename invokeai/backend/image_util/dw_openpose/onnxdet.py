@@ -98,14 +98,37 @@ def preprocess(img, input_size, swap=(2, 0, 1)):
     return padded_img, r
 
 
+def supports_batching(session) -> bool:
+    """Whether the session's model accepts a batch of more than one input, i.e. its batch dimension is dynamic."""
+    return not isinstance(session.get_inputs()[0].shape[0], int)
+
+
 def inference_detector(session, oriImg):
+    return inference_detector_batch(session, [oriImg])[0]
+
+
+def inference_detector_batch(session, oriImgs):
+    """Detect the people in each image. If the model supports batching, all images are run in a single batch."""
     input_shape = (640, 640)
-    img, ratio = preprocess(oriImg, input_shape)
+    preprocessed = [preprocess(oriImg, input_shape) for oriImg in oriImgs]
+    input_name = session.get_inputs()[0].name
+
+    if supports_batching(session):
+        output = session.run(None, {input_name: np.stack([img for img, _ in preprocessed])})
+        all_predictions = demo_postprocess(output[0], input_shape)
+    else:
+        all_predictions = [
+            demo_postprocess(session.run(None, {input_name: img[None, :, :, :]})[0], input_shape)[0]
+            for img, _ in preprocessed
+        ]
+
+    return [
+        _postprocess_detections(predictions, ratio)
+        for predictions, (_, ratio) in zip(all_predictions, preprocessed, strict=True)
+    ]
 
-    ort_inputs = {session.get_inputs()[0].name: img[None, :, :, :]}
-    output = session.run(None, ort_inputs)
-    predictions = demo_postprocess(output[0], input_shape)[0]
 
+def _postprocess_detections(predictions, ratio):
     boxes = predictions[:, :4]
     scores = predictions[:, 4:5] * predictions[:, 5:]
 
@@ -6,6 +6,8 @@ import cv2
 import numpy as np
 import onnxruntime as ort
 
+from invokeai.backend.image_util.dw_openpose.onnxdet import supports_batching
+
 
 def preprocess(
     img: np.ndarray, out_bbox, input_size: Tuple[int, int] = (192, 256)
@@ -62,6 +64,13 @@ def inference(sess: ort.InferenceSession, img: np.ndarray) -> np.ndarray:
     Returns:
         outputs (np.ndarray): Output of RTMPose model.
     """
+    if supports_batching(sess) and len(img) > 1:
+        # Run all the crops in a single batch, then split the outputs into the same per-crop structure as below.
+        sess_input = {sess.get_inputs()[0].name: np.stack([i.transpose(2, 0, 1) for i in img])}
+        sess_output = [out.name for out in sess.get_outputs()]
+        outputs = sess.run(sess_output, sess_input)
+        return [[output[i : i + 1] for output in outputs] for i in range(len(img))]
+
     all_out = []
     # build input
     for i in range(len(img)):
@@ -352,10 +361,23 @@ def decode(simcc_x: np.ndarray, simcc_y: np.ndarray, simcc_split_ratio) -> Tuple
 
 
 def inference_pose(session, out_bbox, oriImg):
+    return inference_pose_batch(session, [out_bbox], [oriImg])[0]
+
+
+def inference_pose_batch(session, out_bboxes, oriImgs):
+    """Estimate the poses of the detected people in each image. If the model supports batching, the people in all of
+    the images are run in a single batch."""
     h, w = session.get_inputs()[0].shape[2:]
     model_input_size = (w, h)
-    resized_img, center, scale = preprocess(oriImg, out_bbox, model_input_size)
-    outputs = inference(session, resized_img)
-    keypoints, scores = postprocess(outputs, model_input_size, center, scale)
-
-    return keypoints, scores
+    preprocessed = [
+        preprocess(oriImg, out_bbox, model_input_size) for out_bbox, oriImg in zip(out_bboxes, oriImgs, strict=True)
+    ]
+    outputs = inference(session, [resized_img for resized_imgs, _, _ in preprocessed for resized_img in resized_imgs])
+
+    results = []
+    start = 0
+    for resized_imgs, center, scale in preprocessed:
+        end = start + len(resized_imgs)
+        results.append(postprocess(outputs[start:end], model_input_size, center, scale))
+        start = end
+    return results
@@ -22,6 +22,15 @@ class GroundingDinoPipeline(RawModel):
         results = [DetectionResult.model_validate(result) for result in results]
         return results
 
+    def detect_batch(
+        self, images: list[Image.Image], candidate_labels: list[str], threshold: float = 0.1
+    ) -> list[list[DetectionResult]]:
+        """Detect the candidate labels in several images in a single batch. The images must all be the same size."""
+        inputs = [{"image": image, "candidate_labels": candidate_labels} for image in images]
+        batch_results = self._pipeline(inputs, threshold=threshold, batch_size=len(images))
+        assert batch_results is not None
+        return [[DetectionResult.model_validate(result) for result in results] for results in batch_results]
+
     def to(self, device: Optional[torch.device] = None, dtype: Optional[torch.dtype] = None):
         # HACK(ryand): The GroundingDinoPipeline does not work on MPS devices. We only allow it to be moved to CPU or
         # CUDA.
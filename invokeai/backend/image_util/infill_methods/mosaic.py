@@ -1,25 +1,32 @@
-from typing import Tuple
+from typing import Optional, Tuple
 
 import numpy as np
 from PIL import Image
 
+# The number of colors that are drawn from the image to fill the tiles with.
+_MOSAIC_PALETTE_SIZE = 256
+
 
 def infill_mosaic(
     image: Image.Image,
     tile_shape: Tuple[int, int] = (64, 64),
     min_color: Tuple[int, int, int, int] = (0, 0, 0, 0),
     max_color: Tuple[int, int, int, int] = (255, 255, 255, 0),
+    seed: Optional[int] = None,
 ) -> Image.Image:
     """
     image:PIL - A PIL Image
     tile_shape: Tuple[int,int] - Tile width & Tile Height
     min_color: Tuple[int,int,int] - RGB values for the lowest color to clip to (0-255)
     max_color: Tuple[int,int,int] - RGB values for the highest color to clip to (0-255)
+    seed: Optional[int] - The seed for the random color selection (omit for random)
     """
 
     np_image = np.array(image)  # Convert image to np array
     alpha = np_image[:, :, 3]  # Get the mask from the alpha channel of the image
     non_transparent_pixels = np_image[alpha != 0, :3]  # List of non-transparent pixels
+    if len(non_transparent_pixels) == 0:
+        raise ValueError("The image has no non-transparent pixels to draw mosaic colors from.")
 
     # Create color tiles to paste in the empty areas of the image
     tile_width, tile_height = tile_shape
@@ -31,29 +38,21 @@ def infill_mosaic(
     non_transparent_pixels[:, 1] = np.clip(non_transparent_pixels[:, 1], g_min, g_max)
     non_transparent_pixels[:, 2] = np.clip(non_transparent_pixels[:, 2], b_min, b_max)
 
-    tiles = []
-    for _ in range(256):
-        color = non_transparent_pixels[np.random.randint(len(non_transparent_pixels))]
-        tile = np.zeros((tile_height, tile_width, 3), dtype=np.uint8)
-        tile[:, :] = color
-        tiles.append(tile)
-
-    # Fill the transparent area with tiles
-    filled_image = np.zeros((image.height, image.width, 3), dtype=np.uint8)
-
-    for x in range(image.width):
-        for y in range(image.height):
-            tile = tiles[np.random.randint(len(tiles))]
-            try:
-                filled_image[
-                    y - (y % tile_height) : y - (y % tile_height) + tile_height,
-                    x - (x % tile_width) : x - (x % tile_width) + tile_width,
-                ] = tile
-            except ValueError:
-                # Need to handle edge cases - literally
-                pass
-
-    filled_image = Image.fromarray(filled_image)  # Convert the filled tiles image to PIL
+    # Draw a palette of colors from the image, then pick a random palette color for every tile, including the partial
+    # tiles at the right and bottom edges.
+    rng = np.random.default_rng(seed)
+    palette = non_transparent_pixels[rng.integers(len(non_transparent_pixels), size=_MOSAIC_PALETTE_SIZE)]
+    num_tiles_y = -(-image.height // tile_height)
+    num_tiles_x = -(-image.width // tile_width)
+    tile_colors = palette[rng.integers(len(palette), size=(num_tiles_y, num_tiles_x))]
+
+    # Fill the tiles by broadcasting each tile's color into a view of the image as a grid of tiles:
+    # (num_tiles_y * tile_height, num_tiles_x * tile_width, 3) -> (num_tiles_y, tile_height, num_tiles_x, tile_width, 3)
+    filled_image = np.empty((num_tiles_y * tile_height, num_tiles_x * tile_width, 3), dtype=np.uint8)
+    filled_image.reshape(num_tiles_y, tile_height, num_tiles_x, tile_width, 3)[:] = tile_colors[:, None, :, None, :]
+
+    # Convert the filled tiles image to PIL, cropping the tiles at the edges to the image
+    filled_image = Image.fromarray(np.ascontiguousarray(filled_image[: image.height, : image.width]))
     image = Image.composite(
         image, filled_image, image.split()[-1]
     )  # Composite the original image on top of the filled tiles
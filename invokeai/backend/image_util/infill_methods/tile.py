@@ -5,7 +5,7 @@ import numpy as np
 from PIL import Image
 
 
-def create_tile_pool(img_array: np.ndarray, tile_size: tuple[int, int]) -> list[np.ndarray]:
+def create_tile_pool(img_array: np.ndarray, tile_size: tuple[int, int]) -> np.ndarray:
     """
     Create a pool of tiles from non-transparent areas of the image by systematically walking through the image.
 
@@ -14,22 +14,24 @@ def create_tile_pool(img_array: np.ndarray, tile_size: tuple[int, int]) -> list[
         tile_size: tuple (tile_width, tile_height) specifying the size of each tile.
 
     Returns:
-        A list of numpy arrays, each representing a tile.
+        A numpy array of shape (num_tiles, tile_height, tile_width, channels), in row-major order of the tiles' positions.
     """
-    tiles: list[np.ndarray] = []
-    rows, cols = img_array.shape[:2]
+    rows, cols, channels = img_array.shape
     tile_width, tile_height = tile_size
+    num_tiles_y = rows // tile_height
+    num_tiles_x = cols // tile_width
 
-    for y in range(0, rows - tile_height + 1, tile_height):
-        for x in range(0, cols - tile_width + 1, tile_width):
-            tile = img_array[y : y + tile_height, x : x + tile_width]
-            # Check if the image has an alpha channel and the tile is completely opaque
-            if img_array.shape[2] == 4 and np.all(tile[:, :, 3] == 255):
-                tiles.append(tile)
-            elif img_array.shape[2] == 3:  # If no alpha channel, append the tile
-                tiles.append(tile)
+    # Split the image into a grid of whole tiles without copying it:
+    # (H, W, C) -> (num_tiles_y, tile_height, num_tiles_x, tile_width, C) -> (num_tiles_y, num_tiles_x, ...)
+    grid = img_array[: num_tiles_y * tile_height, : num_tiles_x * tile_width]
+    grid = grid.reshape(num_tiles_y, tile_height, num_tiles_x, tile_width, channels).swapaxes(1, 2)
+    tiles = grid.reshape(num_tiles_y * num_tiles_x, tile_height, tile_width, channels)
 
-    if not tiles:
+    # If the image has an alpha channel, only completely opaque tiles are used.
+    if channels == 4:
+        tiles = tiles[np.all(tiles[..., 3] == 255, axis=(1, 2))]
+
+    if len(tiles) == 0:
         raise ValueError(
             "Not enough opaque pixels to generate any tiles. Use a smaller tile size or a different image."
         )
@@ -38,14 +40,14 @@ def create_tile_pool(img_array: np.ndarray, tile_size: tuple[int, int]) -> list[
 
 
 def create_filled_image(
-    img_array: np.ndarray, tile_pool: list[np.ndarray], tile_size: tuple[int, int], seed: int
+    img_array: np.ndarray, tile_pool: np.ndarray, tile_size: tuple[int, int], seed: int
 ) -> np.ndarray:
     """
     Create an image of the same dimensions as the original, filled entirely with tiles from the pool.
 
     Args:
         img_array: numpy array of the original image.
-        tile_pool: A list of numpy arrays, each representing a tile.
+        tile_pool: A numpy array of tiles, of shape (num_tiles, tile_height, tile_width, channels).
         tile_size: tuple (tile_width, tile_height) specifying the size of each tile.
 
     Returns:
@@ -54,29 +56,22 @@ def create_filled_image(
 
     rows, cols, _ = img_array.shape
     tile_width, tile_height = tile_size
+    num_tiles_y = -(-rows // tile_height)
+    num_tiles_x = -(-cols // tile_width)
 
-    # Prep an empty RGB image
-    filled_img_array = np.zeros((rows, cols, 3), dtype=img_array.dtype)
-
-    # Make the random tile selection reproducible
+    # Pick a random tile from the pool for every position, in row-major order. This draws the same tiles as picking
+    # them one at a time, so the result for a given seed is unchanged.
     rng = np.random.default_rng(seed)
+    tile_indices = rng.integers(len(tile_pool), size=(num_tiles_y, num_tiles_x))
 
-    for y in range(0, rows, tile_height):
-        for x in range(0, cols, tile_width):
-            # Pick a random tile from the pool
-            tile = tile_pool[rng.integers(len(tile_pool))]
-
-            # Calculate the space available (may be less than tile size near the edges)
-            space_y = min(tile_height, rows - y)
-            space_x = min(tile_width, cols - x)
-
-            # Crop the tile if necessary to fit into the available space
-            cropped_tile = tile[:space_y, :space_x, :3]
-
-            # Fill the available space with the (possibly cropped) tile
-            filled_img_array[y : y + space_y, x : x + space_x, :3] = cropped_tile
+    # Write the picked tiles straight into the image, through a view of it as a grid of tiles:
+    # (num_tiles_y * tile_height, num_tiles_x * tile_width, 3) -> (num_tiles_y, num_tiles_x, tile_height, tile_width, 3)
+    filled_img_array = np.empty((num_tiles_y * tile_height, num_tiles_x * tile_width, 3), dtype=img_array.dtype)
+    grid = filled_img_array.reshape(num_tiles_y, tile_height, num_tiles_x, tile_width, 3).swapaxes(1, 2)
+    np.take(tile_pool[..., :3], tile_indices, axis=0, out=grid, mode="clip")
 
-    return filled_img_array
+    # Crop the tiles at the right and bottom edges to the image.
+    return np.ascontiguousarray(filled_img_array[:rows, :cols])
 
 
 @dataclass
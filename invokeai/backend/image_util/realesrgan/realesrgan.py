@@ -7,10 +7,10 @@ import numpy as np
 import numpy.typing as npt
 import torch
 from cv2.typing import MatLike
-from tqdm import tqdm
 
 from invokeai.backend.image_util.basicsr.rrdbnet_arch import RRDBNet
 from invokeai.backend.model_manager.taxonomy import AnyModel
+from invokeai.backend.tiles.batched_tiles import run_tiles_batched
 from invokeai.backend.util.devices import TorchDevice
 
 """
@@ -23,6 +23,7 @@ The adaptation here has a few changes:
 - Remove `dni_weight` logic, which was only used when multiple models were used
 - Remove logic to fetch models from network
 - Add types, rename a few things
+- Run equal-sized tiles in batches, keeping the image on the CPU while tiling
 """
 
 
@@ -45,6 +46,7 @@ class RealESRGAN:
         tile_pad (int): The pad size for each tile, to remove border artifacts. Default: 10.
         pre_pad (int): Pad the input images to avoid border artifacts. Default: 10.
         half (float): Whether to use half precision during inference. Default: False.
+        tile_batch_size (int): The maximum number of equal-sized tiles to run through the network at once. Default: 1.
     """
 
     output: torch.Tensor
@@ -58,6 +60,7 @@ class RealESRGAN:
         tile_pad: int = 10,
         pre_pad: int = 10,
         half: bool = False,
+        tile_batch_size: int = 1,
     ) -> None:
         self.scale = scale
         self.tile_size = tile
@@ -65,6 +68,7 @@ class RealESRGAN:
         self.pre_pad = pre_pad
         self.mod_scale: Optional[int] = None
         self.half = half
+        self.tile_batch_size = tile_batch_size
         self.device = TorchDevice.choose_torch_device()
 
         # prefer to use params_ema
@@ -81,11 +85,12 @@ class RealESRGAN:
             self.model = self.model.half()
 
     def pre_process(self, img: MatLike) -> None:
-        """Pre-process, such as pre-pad and mod pad, so that the images can be divisible"""
+        """Pre-process, such as pre-pad and mod pad, so that the images can be divisible
+
+        When tiling, the image is kept on the CPU, and only the tiles are moved to the device.
+        """
         img_tensor: torch.Tensor = torch.from_numpy(np.transpose(img, (2, 0, 1))).float()
-        self.img = img_tensor.unsqueeze(0).to(self.device)
-        if self.half:
-            self.img = self.img.half()
+        self.img = img_tensor.unsqueeze(0)
 
         # pre_pad
         if self.pre_pad != 0:
@@ -104,6 +109,11 @@ class RealESRGAN:
                 self.mod_pad_w = self.mod_scale - w % self.mod_scale
             self.img = torch.nn.functional.pad(self.img, (0, self.mod_pad_w, 0, self.mod_pad_h), "reflect")
 
+        if self.tile_size <= 0:
+            self.img = self.img.to(self.device)
+        if self.half:
+            self.img = self.img.half()
+
     def process(self) -> None:
         # model inference
         self.output = self.model(self.img)
@@ -112,6 +122,8 @@ class RealESRGAN:
         """It will first crop input images to tiles, and then process each tile.
         Finally, all the processed tiles are merged into one images.
 
+        Equal-sized tiles are processed in batches of up to `tile_batch_size` tiles.
+
         Modified from: https://github.com/ata4/esrgan-launcher
         """
         batch, channel, height, width = self.img.shape
@@ -124,9 +136,10 @@ class RealESRGAN:
         tiles_x = math.ceil(width / self.tile_size)
         tiles_y = math.ceil(height / self.tile_size)
 
-        # loop over all tiles
-        total_steps = tiles_y * tiles_x
-        for i in tqdm(range(total_steps), desc="Upscaling"):
+        # input tile areas on total image, without and with padding, as (start_y, end_y, start_x, end_x)
+        input_areas: list[tuple[int, int, int, int]] = []
+        input_areas_pad: list[tuple[int, int, int, int]] = []
+        for i in range(tiles_y * tiles_x):
             y = i // tiles_x
             x = i % tiles_x
             # extract tile from input image
@@ -137,46 +150,54 @@ class RealESRGAN:
             input_end_x = min(ofs_x + self.tile_size, width)
             input_start_y = ofs_y
             input_end_y = min(ofs_y + self.tile_size, height)
+            input_areas.append((input_start_y, input_end_y, input_start_x, input_end_x))
 
             # input tile area on total image with padding
             input_start_x_pad = max(input_start_x - self.tile_pad, 0)
             input_end_x_pad = min(input_end_x + self.tile_pad, width)
             input_start_y_pad = max(input_start_y - self.tile_pad, 0)
             input_end_y_pad = min(input_end_y + self.tile_pad, height)
-
-            # input tile dimensions
-            input_tile_width = input_end_x - input_start_x
-            input_tile_height = input_end_y - input_start_y
-            input_tile = self.img[
-                :,
-                :,
-                input_start_y_pad:input_end_y_pad,
-                input_start_x_pad:input_end_x_pad,
-            ]
-
-            # upscale tile
-            with torch.no_grad():
-                output_tile = self.model(input_tile)
-
-            # output tile area on total image
-            output_start_x = input_start_x * self.scale
-            output_end_x = input_end_x * self.scale
-            output_start_y = input_start_y * self.scale
-            output_end_y = input_end_y * self.scale
-
-            # output tile area without padding
-            output_start_x_tile = (input_start_x - input_start_x_pad) * self.scale
-            output_end_x_tile = output_start_x_tile + input_tile_width * self.scale
-            output_start_y_tile = (input_start_y - input_start_y_pad) * self.scale
-            output_end_y_tile = output_start_y_tile + input_tile_height * self.scale
-
-            # put tile into output image
-            self.output[:, :, output_start_y:output_end_y, output_start_x:output_end_x] = output_tile[
-                :,
-                :,
-                output_start_y_tile:output_end_y_tile,
-                output_start_x_tile:output_end_x_tile,
-            ]
+            input_areas_pad.append((input_start_y_pad, input_end_y_pad, input_start_x_pad, input_end_x_pad))
+
+        def get_input_tile(i: int) -> torch.Tensor:
+            start_y, end_y, start_x, end_x = input_areas_pad[i]
+            # (1, C, H, W) -> (C, H, W)
+            return self.img[0, :, start_y:end_y, start_x:end_x]
+
+        def put_output_tiles(indices: list[int], output_tiles: torch.Tensor) -> None:
+            output_tiles = output_tiles.to(device=self.output.device, dtype=self.output.dtype)
+            for i, output_tile in zip(indices, output_tiles, strict=True):
+                input_start_y, input_end_y, input_start_x, input_end_x = input_areas[i]
+                input_start_y_pad, _, input_start_x_pad, _ = input_areas_pad[i]
+
+                # output tile area on total image
+                output_start_x = input_start_x * self.scale
+                output_end_x = input_end_x * self.scale
+                output_start_y = input_start_y * self.scale
+                output_end_y = input_end_y * self.scale
+
+                # output tile area without padding
+                output_start_x_tile = (input_start_x - input_start_x_pad) * self.scale
+                output_end_x_tile = output_start_x_tile + (input_end_x - input_start_x) * self.scale
+                output_start_y_tile = (input_start_y - input_start_y_pad) * self.scale
+                output_end_y_tile = output_start_y_tile + (input_end_y - input_start_y) * self.scale
+
+                # put tile into output image
+                self.output[0, :, output_start_y:output_end_y, output_start_x:output_end_x] = output_tile[
+                    :,
+                    output_start_y_tile:output_end_y_tile,
+                    output_start_x_tile:output_end_x_tile,
+                ]
+
+        run_tiles_batched(
+            tile_sizes=[(end_y - start_y, end_x - start_x) for start_y, end_y, start_x, end_x in input_areas_pad],
+            get_input_tile=get_input_tile,
+            run_model=self.model,
+            put_output_tiles=put_output_tiles,
+            device=self.device,
+            dtype=self.img.dtype,
+            batch_size=self.tile_batch_size,
+        )
 
     def post_process(self) -> torch.Tensor:
         # remove extra pad
@@ -50,6 +50,44 @@ class SegmentAnything2Pipeline(RawModel):
         Returns:
             torch.Tensor: The segmentation masks. dtype: torch.bool. shape: [num_masks, channels, height, width].
         """
+        return self._segment(image=image, inputs=inputs, image_embeddings=None)
+
+    def segment_batch(
+        self,
+        images: list[Image.Image],
+        inputs: list[SAMInput],
+    ) -> list[torch.Tensor]:
+        """Segment several images using the same inputs for each image.
+
+        The image encoder, which accounts for nearly all of the cost of segmentation, runs once on the whole batch. The
+        prompt encoder and mask decoder then run on each image.
+
+        Args:
+            images: The images to segment.
+            inputs: A list of SAMInput objects containing bounding boxes and/or point lists, used for every image.
+
+        Returns:
+            list[torch.Tensor]: The segmentation masks of each image, as returned by `segment()`.
+        """
+        pixel_values = self._sam2_processor(images=images, return_tensors="pt")["pixel_values"]
+        image_embeddings = self._sam2_model.get_image_embeddings(pixel_values.to(self._sam2_model.device))
+        # SAM2 returns the embeddings of each level of its feature pyramid.
+        return [
+            self._segment(
+                image=image,
+                inputs=inputs,
+                image_embeddings=[level_embeddings[i : i + 1] for level_embeddings in image_embeddings],
+            )
+            for i, image in enumerate(images)
+        ]
+
+    def _segment(
+        self,
+        image: Image.Image,
+        inputs: list[SAMInput],
+        image_embeddings: list[torch.Tensor] | None,
+    ) -> torch.Tensor:
+        """Segment the image using the provided inputs, and the image's embeddings if they have already been computed."""
 
         input_boxes: list[list[float]] = []
         input_points: list[list[list[float]]] = []
@@ -93,6 +131,10 @@ class SegmentAnything2Pipeline(RawModel):
             input_labels=batched_input_labels,
             return_tensors="pt",
         ).to(self._sam2_model.device)
+        if image_embeddings is not None:
+            # The image has already been encoded, so the image encoder is skipped.
+            processed_inputs.pop("pixel_values")
+            processed_inputs["image_embeddings"] = image_embeddings
 
         # Generate masks using the SAM2 model
         outputs = self._sam2_model(**processed_inputs)
@@ -101,7 +143,6 @@ class SegmentAnything2Pipeline(RawModel):
         masks = self._sam2_processor.post_process_masks(
             masks=outputs.pred_masks,
             original_sizes=processed_inputs.original_sizes,
-            reshaped_input_sizes=processed_inputs.reshaped_input_sizes,
         )
 
         # There should be only one batch.
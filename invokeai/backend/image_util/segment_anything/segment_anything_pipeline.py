@@ -42,6 +42,39 @@ class SegmentAnythingPipeline(RawModel):
         Returns:
             torch.Tensor: The segmentation masks. dtype: torch.bool. shape: [num_masks, channels, height, width].
         """
+        return self._segment(image=image, inputs=inputs, image_embeddings=None)
+
+    def segment_batch(
+        self,
+        images: list[Image.Image],
+        inputs: list[SAMInput],
+    ) -> list[torch.Tensor]:
+        """Segment several images using the same inputs for each image.
+
+        The image encoder, which accounts for nearly all of the cost of segmentation, runs once on the whole batch. The
+        prompt encoder and mask decoder then run on each image.
+
+        Args:
+            images: The images to segment.
+            inputs: A list of SAMInput objects containing bounding boxes and/or point lists, used for every image.
+
+        Returns:
+            list[torch.Tensor]: The segmentation masks of each image, as returned by `segment()`.
+        """
+        pixel_values = self._sam_processor(images=images, return_tensors="pt")["pixel_values"]
+        image_embeddings = self._sam_model.get_image_embeddings(pixel_values.to(self._sam_model.device))
+        return [
+            self._segment(image=image, inputs=inputs, image_embeddings=image_embeddings[i : i + 1])
+            for i, image in enumerate(images)
+        ]
+
+    def _segment(
+        self,
+        image: Image.Image,
+        inputs: list[SAMInput],
+        image_embeddings: torch.Tensor | None,
+    ) -> torch.Tensor:
+        """Segment the image using the provided inputs, and the image's embeddings if they have already been computed."""
 
         input_boxes: list[list[float]] = []
         input_points: list[list[list[float]]] = []
@@ -85,6 +118,10 @@ class SegmentAnythingPipeline(RawModel):
             input_labels=batched_input_labels,
             return_tensors="pt",
         ).to(self._sam_model.device)
+        if image_embeddings is not None:
+            # The image has already been encoded, so the image encoder is skipped.
+            processed_inputs.pop("pixel_values")
+            processed_inputs["image_embeddings"] = image_embeddings
         outputs = self._sam_model(**processed_inputs)
         masks = self._sam_processor.post_process_masks(
             masks=outputs.pred_masks,
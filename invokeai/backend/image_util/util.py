@@ -1,10 +1,14 @@
 from math import ceil, floor, sqrt
-from typing import Optional
+from typing import Callable, Optional, TypeVar
 
 import cv2
 import numpy as np
 from PIL import Image
 
+from invokeai.app.services.session_processor.session_processor_common import CanceledException
+
+T = TypeVar("T")
+
 
 class InitImageResizer:
     """Simple class to create resized copies of an Image while preserving the aspect ratio."""
@@ -74,6 +78,36 @@ def make_grid(image_list, rows=None, cols=None):
     return grid_img
 
 
+def batch_images_by_size(images: list[Image.Image], batch_size: int) -> list[list[int]]:
+    """Group the indices of equal-sized images into batches of up to `batch_size` images, keeping the image order
+    within each size. Models that process a batch of images generally need the images in a batch to be the same size.
+    """
+    indices_by_size: dict[tuple[int, int], list[int]] = {}
+    for i, image in enumerate(images):
+        indices_by_size.setdefault(image.size, []).append(i)
+
+    batches: list[list[int]] = []
+    for indices in indices_by_size.values():
+        batches.extend(indices[start : start + batch_size] for start in range(0, len(indices), batch_size))
+    return batches
+
+
+def run_in_batches_by_size(
+    images: list[Image.Image],
+    batch_size: int,
+    run_batch: Callable[[list[Image.Image]], list[T]],
+    is_canceled: Optional[Callable[[], bool]] = None,
+) -> list[T]:
+    """Run `run_batch` on batches of equal-sized images, as grouped by `batch_images_by_size()`, and return its outputs
+    in the order of `images`. If `is_canceled` returns True, a CanceledException is raised before the next batch."""
+    outputs: dict[int, T] = {}
+    for batch in batch_images_by_size(images, batch_size):
+        if is_canceled is not None and is_canceled():
+            raise CanceledException
+        outputs.update(zip(batch, run_batch([images[i] for i in batch]), strict=True))
+    return [outputs[i] for i in range(len(images))]
+
+
 def pil_to_np(image: Image.Image) -> np.ndarray:
     """Converts a PIL image to a numpy array."""
     return np.array(image, dtype=np.uint8)
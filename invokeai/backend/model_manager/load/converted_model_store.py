@@ -0,0 +1,168 @@
+"""An on-disk store of converted single-file checkpoints."""
+
+import hashlib
+import json
+import os
+import shutil
+import uuid
+from logging import Logger
+from pathlib import Path
+from typing import Optional
+
+import torch
+from safetensors.torch import load_file, save_file
+
+from invokeai.backend.model_manager.load.memory_snapshot import GB
+from invokeai.backend.util.calc_tensor_size import calc_tensor_size
+
+INDEX_FILE_NAME = "model.safetensors.index.json"
+
+# Prefix of the directories that entries are written to before they are moved into place.
+_TMP_DIR_PREFIX = ".tmp-"
+
+
+class ConvertedModelStore:
+    """Stores the state dicts of converted models as sharded safetensors, so that a cold load can skip conversion.
+
+    Loading a single-file checkpoint typically means reading the file, renaming its keys to the diffusers layout,
+    dequantizing scaled-FP8 weights and casting every tensor to the compute dtype. The result of that work depends only
+    on the file, the target dtype and the conversion code, so it is cached here under a key derived from those three.
+
+    Each entry is a directory holding the shards and a `model.safetensors.index.json` (the same layout as a sharded
+    diffusers/transformers checkpoint). Entries are written to a temporary directory and renamed into place, so a
+    crash mid-write never leaves a partial entry behind. When the store grows past its size limit, the least-recently
+    loaded entries are deleted.
+    """
+
+    def __init__(self, path: Path, max_size_bytes: int, logger: Logger, max_shard_size_bytes: int = 2 * GB):
+        self._path = path
+        self._max_size_bytes = max_size_bytes
+        self._max_shard_size_bytes = max_shard_size_bytes
+        self._logger = logger
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @staticmethod
+    def make_key(model_hash: str, dtype: torch.dtype, loader_version: str) -> str:
+        """Build the key of a converted state dict.
+
+        Args:
+            model_hash: The hash of the source checkpoint.
+            dtype: The dtype that the state dict was cast to.
+            loader_version: Identifies the conversion code. Must change whenever the conversion output changes.
+        """
+        return hashlib.sha256(f"{model_hash}|{dtype}|{loader_version}".encode()).hexdigest()[:32]
+
+    def get_size(self, key: str) -> Optional[int]:
+        """Get the size in bytes of a stored state dict, or None if there is no entry for `key`."""
+        index = self._read_index(key)
+        if index is None:
+            return None
+        return index["metadata"]["total_size"]
+
+    def load(self, key: str) -> Optional[dict[str, torch.Tensor]]:
+        """Load a stored state dict, or return None if there is no (valid) entry for `key`."""
+        index = self._read_index(key)
+        if index is None:
+            return None
+
+        entry_path = self._path / key
+        try:
+            sd: dict[str, torch.Tensor] = {}
+            for shard in sorted(set(index["weight_map"].values())):
+                sd.update(load_file(entry_path / shard))
+            if sd.keys() != index["weight_map"].keys():
+                raise ValueError("The shards do not match the index.")
+        except Exception as e:
+            self._logger.warning(f"Discarding unreadable converted model {entry_path}: {e}")
+            shutil.rmtree(entry_path, ignore_errors=True)
+            return None
+
+        # The modification time of the index records when the entry was last used (see _trim).
+        (entry_path / INDEX_FILE_NAME).touch()
+        return sd
+
+    def save(self, key: str, sd: dict[str, torch.Tensor]) -> None:
+        """Store a converted state dict. Failures (e.g. a full disk) are logged, but do not raise."""
+        total_size = sum(calc_tensor_size(t) for t in sd.values())
+        if total_size > self._max_size_bytes:
+            self._logger.debug(
+                f"Not storing converted model {key}: its size ({total_size / GB:.2f}GB) exceeds the store size limit."
+            )
+            return
+
+        entry_path = self._path / key
+        tmp_path = self._path / f"{_TMP_DIR_PREFIX}{uuid.uuid4().hex}"
+        try:
+            tmp_path.mkdir(parents=True)
+            weight_map: dict[str, str] = {}
+            shards = self._split_into_shards(sd)
+            for i, shard in enumerate(shards):
+                shard_name = f"model-{i + 1:05d}-of-{len(shards):05d}.safetensors"
+                save_file(shard, tmp_path / shard_name)
+                weight_map.update(dict.fromkeys(shard.keys(), shard_name))
+            with open(tmp_path / INDEX_FILE_NAME, "w") as f:
+                json.dump({"metadata": {"total_size": total_size}, "weight_map": weight_map}, f)
+
+            if entry_path.exists():
+                # Another load stored the same entry first.
+                shutil.rmtree(tmp_path)
+            else:
+                os.replace(tmp_path, entry_path)
+        except Exception as e:
+            self._logger.warning(f"Failed to store converted model {key}: {e}")
+            shutil.rmtree(tmp_path, ignore_errors=True)
+            return
+
+        self._trim()
+
+    def _read_index(self, key: str) -> Optional[dict]:
+        try:
+            with open(self._path / key / INDEX_FILE_NAME) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _split_into_shards(self, sd: dict[str, torch.Tensor]) -> list[dict[str, torch.Tensor]]:
+        shards: list[dict[str, torch.Tensor]] = [{}]
+        shard_size = 0
+        seen_storages: set[int] = set()
+        for name, tensor in sd.items():
+            tensor = tensor.contiguous()
+            storage_ptr = tensor.untyped_storage().data_ptr()
+            if storage_ptr in seen_storages:
+                # safetensors refuses to save tensors that share memory (e.g. reshaped views of the same weight).
+                tensor = tensor.clone()
+            seen_storages.add(storage_ptr)
+
+            size = calc_tensor_size(tensor)
+            if shards[-1] and shard_size + size > self._max_shard_size_bytes:
+                shards.append({})
+                shard_size = 0
+            shards[-1][name] = tensor
+            shard_size += size
+        return shards
+
+    def _trim(self) -> None:
+        """Delete the least-recently used entries until the store fits within its size limit."""
+        entries: list[tuple[float, int, Path]] = []
+        for entry_path in self._path.iterdir():
+            if entry_path.name.startswith(_TMP_DIR_PREFIX):
+                continue
+            index_path = entry_path / INDEX_FILE_NAME
+            try:
+                with open(index_path) as f:
+                    size = json.load(f)["metadata"]["total_size"]
+                entries.append((index_path.stat().st_mtime, size, entry_path))
+            except (OSError, ValueError, KeyError):
+                continue
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, entry_path in sorted(entries, key=lambda e: e[0]):
+            if total_size <= self._max_size_bytes:
+                break
+            self._logger.debug(f"Removing converted model {entry_path.name} to stay within the store size limit.")
+            shutil.rmtree(entry_path, ignore_errors=True)
+            total_size -= size
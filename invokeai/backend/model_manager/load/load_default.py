@@ -4,15 +4,17 @@
 import copy
 import itertools
 import re
+import time
 from logging import Logger
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 import torch
 
 from invokeai.app.services.config import InvokeAIAppConfig
 from invokeai.backend.model_manager.configs.base import Diffusers_Config_Base
 from invokeai.backend.model_manager.configs.factory import AnyModelConfig
+from invokeai.backend.model_manager.load.converted_model_store import ConvertedModelStore
 from invokeai.backend.model_manager.load.load_base import LoadedModel, ModelLoaderBase
 from invokeai.backend.model_manager.load.memory_snapshot import GB, MemorySnapshot
 from invokeai.backend.model_manager.load.model_cache.cache_record import CacheRecord
@@ -163,6 +165,11 @@ _FP8_DEFAULT_SKIP_PATTERNS: tuple[str, ...] = (
 class ModelLoader(ModelLoaderBase):
     """Default implementation of ModelLoaderBase."""
 
+    # Identifies the conversion that a loader performs in `_load_converted_state_dict()`. Bump it whenever the
+    # converted state dict changes, so that entries stored by the previous version are not used.
+    _converted_state_dict_version: int = 1
+    _converted_model_store: Optional[ConvertedModelStore] = None
+
     def __init__(
         self,
         app_config: InvokeAIAppConfig,
@@ -175,6 +182,10 @@ class ModelLoader(ModelLoaderBase):
         self._ram_cache = ram_cache
         self._torch_dtype = TorchDevice.choose_torch_dtype()
         self._torch_device = TorchDevice.choose_torch_device()
+        if app_config.converted_model_cache_gb > 0:
+            self._converted_model_store = ConvertedModelStore(
+                app_config.convert_cache_path, int(app_config.converted_model_cache_gb * GB), logger
+            )
 
     def load_model(self, model_config: AnyModelConfig, submodel_type: Optional[SubModelType] = None) -> LoadedModel:
         """
@@ -263,7 +274,10 @@ class ModelLoader(ModelLoaderBase):
             # disk — this avoids both the redundant disk read and the large transient second copy
             # that would otherwise spike RAM (and, on a RAM-constrained box, drive the system into
             # swap). Any failure falls back to a normal load, so it can never change the result.
+            load_start = time.perf_counter()
             loaded_model = self._try_adopt_shared_weights(cache_key)
+            # The time it took to build the model, excluding make_room(). Used by cost-aware eviction policies.
+            load_seconds = time.perf_counter() - load_start
 
             shell_to_register: Optional[torch.nn.Module] = None
             if loaded_model is None:
@@ -276,8 +290,10 @@ class ModelLoader(ModelLoaderBase):
                 ram_before = MemorySnapshot.capture().process_ram if log_mem else 0
                 self._ram_cache.make_room(self.get_size_fs(config, Path(config.path), submodel_type))
                 ram_after_room = MemorySnapshot.capture().process_ram if log_mem else 0
+                load_start = time.perf_counter()
                 with skip_torch_weight_init():
                     loaded_model = put_in_eval_mode(self._load_model(config, submodel_type))
+                load_seconds += time.perf_counter() - load_start
                 if log_mem:
                     ram_peak = MemorySnapshot.capture().process_ram
                     self._logger.info(
@@ -301,6 +317,7 @@ class ModelLoader(ModelLoaderBase):
                 cache_key,
                 model=loaded_model,
                 execution_device=execution_device,
+                load_seconds=load_seconds,
             )
             # Retrieve immediately: the new record carries the cache's post-admission grace until
             # it is locked, and keeping put() and get() adjacent means no failure in between can
@@ -342,6 +359,32 @@ class ModelLoader(ModelLoaderBase):
             variant=config.repo_variant if isinstance(config, Diffusers_Config_Base) else None,
         )
 
+    def _load_converted_state_dict(
+        self, config: AnyModelConfig, dtype: torch.dtype, convert: Callable[[], dict[str, torch.Tensor]]
+    ) -> dict[str, torch.Tensor]:
+        """Get the converted state dict of a single-file checkpoint.
+
+        `convert` reads the checkpoint and returns its state dict, converted to the layout of the model class and
+        cast to `dtype`. It is responsible for calling `make_room()` on the RAM cache. If the converted-model store is
+        enabled, the result is stored, and `convert` is skipped on later loads of the same checkpoint.
+        """
+        store = self._converted_model_store
+        if store is None:
+            return convert()
+
+        key = store.make_key(config.hash, dtype, f"{type(self).__name__}-v{self._converted_state_dict_version}")
+        stored_size = store.get_size(key)
+        if stored_size is not None:
+            self._ram_cache.make_room(stored_size)
+            sd = store.load(key)
+            if sd is not None:
+                self._logger.info(f"Loaded converted state dict of '{config.name}' from {store.path / key}")
+                return sd
+
+        sd = convert()
+        store.save(key, sd)
+        return sd
+
     def _should_use_fp8(self, config: AnyModelConfig, submodel_type: Optional[SubModelType] = None) -> bool:
         """Check if FP8 layerwise casting should be applied to a model."""
         # Z-Image has dtype mismatch issues with diffusers' layerwise casting
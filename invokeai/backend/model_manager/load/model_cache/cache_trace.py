@@ -0,0 +1,179 @@
+"""Recording of model cache operations, for offline replay with different cache budgets.
+
+A trace is a JSON lines file. Each line is one event with at least an `op` and a `t` (seconds since the recorder was
+created). The ops are:
+
+- `start`: written once by the recorder, with the process RAM at the time (`process_ram`).
+- `cache`: a ModelCache started recording (`device`, `ram_bytes`, `working_mem_bytes`).
+- `hit` / `miss`: a model was requested from the RAM cache (`key`, and `bytes` for hits).
+- `put`: a model was added to the RAM cache (`key`, `bytes`, `load_seconds`).
+- `lock`: a model was locked for use (`key`, `bytes`, the requested `working_mem_bytes`, and, for models that run on
+  the cache's execution device, `vram_total_bytes`: the VRAM usable by the cache plus its working memory).
+- `unlock`: a model was unlocked (`key`).
+- `evict`: a model was dropped from the RAM cache (`key`, `bytes`).
+- `offload`: some or all of a model's weights were moved from VRAM to RAM (`key`, `bytes`).
+
+All events written by a ModelCache also carry the cache's `device`, since one trace file can hold the events of
+several per-device caches.
+"""
+
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+from invokeai.backend.model_manager.load.memory_snapshot import GB, MemorySnapshot
+from invokeai.backend.model_manager.load.model_cache.eviction_policy import EvictionPolicy
+from invokeai.backend.model_manager.load.model_cache.eviction_replay import (
+    DEFAULT_RAM_TO_VRAM_BYTES_PER_SECOND,
+    ReplayResult,
+    SimulatedModelCache,
+)
+
+TRACE_FORMAT_VERSION = 1
+
+
+class CacheTraceRecorder:
+    """Appends model cache events to a trace file. Thread-safe, so one recorder can be shared by several caches."""
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._path = path
+        self._lock = threading.Lock()
+        self._start_time = time.monotonic()
+        # Line-buffered, so that the trace is complete up to the last event if the process is killed.
+        self._file = open(path, "a", buffering=1, encoding="utf-8")
+        snapshot = MemorySnapshot.capture(run_garbage_collector=False)
+        self.record("start", version=TRACE_FORMAT_VERSION, process_ram=snapshot.process_ram)
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def record(self, op: str, **fields: Any) -> None:
+        event = {"t": round(time.monotonic() - self._start_time, 4), "op": op, **fields}
+        line = json.dumps(event, separators=(",", ":"))
+        with self._lock:
+            if not self._file.closed:
+                self._file.write(line + "\n")
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+def read_trace(path: Path) -> Iterator[dict[str, Any]]:
+    """Read the events of a trace file. A truncated last line (e.g. from a killed process) is skipped."""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+
+def trace_devices(events: list[dict[str, Any]]) -> list[str]:
+    """Get the devices of the caches that recorded events in a trace, in the order in which they started recording."""
+    return [e["device"] for e in events if e["op"] == "cache"]
+
+
+def get_recorded_budget(events: list[dict[str, Any]], device: str) -> tuple[Optional[int], Optional[int], int]:
+    """Get the (RAM bytes, VRAM total bytes, default working memory bytes) that a cache was recorded with.
+
+    The VRAM total is None if no model was locked on the cache's execution device.
+    """
+    ram_bytes: Optional[int] = None
+    working_mem_bytes = 0
+    vram_total_bytes: Optional[int] = None
+    for event in events:
+        if event.get("device") != device:
+            continue
+        if event["op"] == "cache":
+            ram_bytes = event["ram_bytes"]
+            working_mem_bytes = event["working_mem_bytes"]
+        elif event["op"] == "lock" and event.get("vram_total_bytes") is not None:
+            vram_total_bytes = max(vram_total_bytes or 0, event["vram_total_bytes"])
+    return ram_bytes, vram_total_bytes, working_mem_bytes
+
+
+def replay_trace(
+    events: list[dict[str, Any]],
+    device: str,
+    ram_bytes: int,
+    policy: EvictionPolicy,
+    vram_total_bytes: int = 0,
+    working_mem_bytes: int = 0,
+    disk_bytes_per_second: float = 1 * GB,
+    ram_to_vram_bytes_per_second: float = DEFAULT_RAM_TO_VRAM_BYTES_PER_SECOND,
+) -> ReplayResult:
+    """Replay the events that one cache recorded against a simulated cache with a different budget.
+
+    Misses and hits are replayed as requests, puts that did not follow a miss (prefetches) as admissions, and locks as
+    moves into VRAM. Evictions and offloads are outcomes of the recorded budget, so they are not replayed.
+
+    Args:
+        events: The events of the trace.
+        device: The execution device of the cache to replay.
+        ram_bytes: The simulated RAM cache size.
+        policy: The simulated eviction policy.
+        vram_total_bytes: The simulated VRAM, including the working memory. 0 disables VRAM.
+        working_mem_bytes: The simulated default working memory.
+        disk_bytes_per_second: The load speed assumed for models whose load was never timed in the trace.
+        ram_to_vram_bytes_per_second: The speed of moving weights from RAM to VRAM.
+    """
+    events = [e for e in events if e.get("device") == device]
+
+    # A model's size and load time are known from its puts, even for the requests that came before them.
+    sizes: dict[str, int] = {}
+    load_seconds: dict[str, list[float]] = {}
+    for event in events:
+        if "key" in event and event.get("bytes"):
+            sizes.setdefault(event["key"], event["bytes"])
+        if event["op"] == "put" and event.get("load_seconds"):
+            load_seconds.setdefault(event["key"], []).append(event["load_seconds"])
+
+    def get_load_seconds(key: str) -> float:
+        timings = load_seconds.get(key)
+        if timings:
+            return sum(timings) / len(timings)
+        return sizes[key] / disk_bytes_per_second
+
+    cache = SimulatedModelCache(
+        ram_bytes=ram_bytes,
+        policy=policy,
+        vram_bytes=vram_total_bytes,
+        working_mem_bytes=working_mem_bytes,
+        ram_to_vram_bytes_per_second=ram_to_vram_bytes_per_second,
+    )
+    missed: set[str] = set()
+    loaded: set[str] = set()
+    for event in events:
+        op = event["op"]
+        key = event.get("key")
+        if key is None or key not in sizes:
+            continue
+        if op == "miss":
+            cache.request(key, sizes[key], get_load_seconds(key))
+            missed.add(key)
+        elif op == "put":
+            if key in missed:
+                # The model was loaded after a miss. The request that follows the put is part of the same load.
+                missed.discard(key)
+                loaded.add(key)
+            else:
+                cache.admit(key, sizes[key], get_load_seconds(key))
+        elif op == "hit":
+            if key in loaded:
+                loaded.discard(key)
+            else:
+                cache.request(key, sizes[key], get_load_seconds(key))
+        elif op == "lock":
+            cache.lock(
+                key,
+                working_mem_bytes=event.get("working_mem_bytes"),
+                use_vram=event.get("vram_total_bytes") is not None,
+            )
+        elif op == "unlock":
+            cache.unlock(key)
+    return cache.result
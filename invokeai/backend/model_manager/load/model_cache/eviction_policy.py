@@ -0,0 +1,136 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from invokeai.backend.model_manager.load.memory_snapshot import GB
+
+
+class EvictionPolicy(ABC):
+    """Decides the order in which the model cache evicts unlocked models from RAM.
+
+    The cache reports admissions, hits and removals to the policy, and asks it to order its entries when it has to make
+    room. The cache still skips locked entries, and stops evicting as soon as there is enough room.
+    """
+
+    @abstractmethod
+    def on_admit(self, key: str, size_bytes: int, load_seconds: Optional[float]) -> None:
+        """Called when a model is added to the cache.
+
+        Args:
+            key: The cache key of the model.
+            size_bytes: The size of the model in RAM.
+            load_seconds: How long it took to load the model, or None if the load was not timed.
+        """
+
+    @abstractmethod
+    def on_hit(self, key: str) -> None:
+        """Called when a cached model is requested."""
+
+    @abstractmethod
+    def on_evict(self, key: str) -> None:
+        """Called when a model is evicted to make room, before on_remove()."""
+
+    @abstractmethod
+    def on_remove(self, key: str) -> None:
+        """Called when a model is removed from the cache, for any reason."""
+
+    @abstractmethod
+    def eviction_order(self, keys: list[str]) -> list[str]:
+        """Order cache keys from the first to the last to evict.
+
+        Args:
+            keys: The keys of the cached models, from the least to the most recently used.
+        """
+
+
+class LRUEvictionPolicy(EvictionPolicy):
+    """Evicts the least recently used models first."""
+
+    def on_admit(self, key: str, size_bytes: int, load_seconds: Optional[float]) -> None:
+        pass
+
+    def on_hit(self, key: str) -> None:
+        pass
+
+    def on_evict(self, key: str) -> None:
+        pass
+
+    def on_remove(self, key: str) -> None:
+        pass
+
+    def eviction_order(self, keys: list[str]) -> list[str]:
+        return list(keys)
+
+
+class GreedyDualSizeEvictionPolicy(EvictionPolicy):
+    """A cost-aware eviction policy (GreedyDual-Size-Frequency).
+
+    Each model is given a priority of `L + hits * load_seconds / size`, and the model with the lowest priority is
+    evicted first. Models that are used often, and that are slow to load relative to the RAM they take up (e.g. a
+    single-file checkpoint that has to be converted on load), are kept over models that are cheap to reload. `L`, the
+    cache's "inflation" value, is raised to the priority of each evicted model, so that models that were used often in
+    the past, but not recently, age out.
+
+    Load times are remembered across evictions, so a reloaded model keeps its measured cost. Models whose load was not
+    timed are assumed to load at the average speed of the models that were.
+    """
+
+    # The load speed assumed until a load has been timed.
+    _DEFAULT_BYTES_PER_SECOND = 1 * GB
+
+    def __init__(self) -> None:
+        self._inflation = 0.0
+        self._priorities: dict[str, float] = {}
+        self._hits: dict[str, int] = {}
+        self._sizes: dict[str, int] = {}
+        self._load_seconds: dict[str, float] = {}
+        self._timed_bytes = 0
+        self._timed_seconds = 0.0
+
+    def on_admit(self, key: str, size_bytes: int, load_seconds: Optional[float]) -> None:
+        if load_seconds is not None and load_seconds > 0:
+            self._load_seconds[key] = load_seconds
+            self._timed_bytes += size_bytes
+            self._timed_seconds += load_seconds
+        self._sizes[key] = size_bytes
+        # The loader that admitted the model requests it right away, which counts as its first hit. A prefetched model
+        # that is never requested keeps the lowest possible priority.
+        self._hits[key] = 0
+        self._priorities[key] = self._calc_priority(key)
+
+    def on_hit(self, key: str) -> None:
+        if key not in self._sizes:
+            return
+        self._hits[key] += 1
+        self._priorities[key] = self._calc_priority(key)
+
+    def on_evict(self, key: str) -> None:
+        self._inflation = max(self._inflation, self._priorities.get(key, self._inflation))
+
+    def on_remove(self, key: str) -> None:
+        self._priorities.pop(key, None)
+        self._hits.pop(key, None)
+        self._sizes.pop(key, None)
+
+    def eviction_order(self, keys: list[str]) -> list[str]:
+        # sorted() is stable, so models with equal priorities are evicted in LRU order.
+        return sorted(keys, key=lambda k: self._priorities.get(k, self._inflation))
+
+    def _calc_priority(self, key: str) -> float:
+        size_bytes = max(self._sizes[key], 1)
+        load_seconds = self._load_seconds.get(key)
+        if load_seconds is None:
+            bytes_per_second = (
+                self._timed_bytes / self._timed_seconds if self._timed_seconds > 0 else self._DEFAULT_BYTES_PER_SECOND
+            )
+            load_seconds = size_bytes / bytes_per_second
+        # Scaled to seconds per GB, to keep the priorities in a readable range.
+        return self._inflation + self._hits[key] * load_seconds / (size_bytes / GB)
+
+
+def build_eviction_policy(name: str) -> EvictionPolicy:
+    """Create an eviction policy from its name in the app config (`model_cache_eviction_policy`)."""
+    if name == "lru":
+        return LRUEvictionPolicy()
+    if name == "cost_aware":
+        return GreedyDualSizeEvictionPolicy()
+    raise ValueError(f"Unknown model cache eviction policy: {name}")
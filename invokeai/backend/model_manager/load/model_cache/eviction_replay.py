@@ -0,0 +1,177 @@
+"""Offline replay of model cache requests, to compare eviction policies and cache budgets."""
+
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+from invokeai.backend.model_manager.load.memory_snapshot import GB
+from invokeai.backend.model_manager.load.model_cache.eviction_policy import EvictionPolicy
+
+# The assumed speed of moving weights from RAM to VRAM, when it is not specified.
+DEFAULT_RAM_TO_VRAM_BYTES_PER_SECOND = 12 * GB
+
+
+@dataclass(frozen=True)
+class CacheRequest:
+    """A request for a model from the RAM cache."""
+
+    key: str
+    size_bytes: int
+    # How long it takes to load the model on a cache miss.
+    load_seconds: float
+
+
+@dataclass
+class ReplayResult:
+    requests: int = 0
+    hits: int = 0
+    # The total time spent loading models on cache misses.
+    load_seconds: float = 0.0
+    evictions: int = 0
+    # Bytes read from disk into RAM.
+    bytes_loaded: int = 0
+    # Bytes moved from RAM to VRAM, and the estimated time that took.
+    bytes_to_vram: int = 0
+    vram_seconds: float = 0.0
+    # Bytes moved from VRAM back to RAM to make room for other models.
+    bytes_offloaded: int = 0
+
+    @property
+    def misses(self) -> int:
+        return self.requests - self.hits
+
+    @property
+    def hit_ratio(self) -> float:
+        return self.hits / self.requests if self.requests else 0.0
+
+    @property
+    def stall_seconds(self) -> float:
+        """The estimated time spent waiting for models to be loaded into RAM and moved into VRAM."""
+        return self.load_seconds + self.vram_seconds
+
+
+@dataclass
+class _SimulatedEntry:
+    size_bytes: int
+    vram_bytes: int = 0
+    locks: int = 0
+
+
+class SimulatedModelCache:
+    """A simulation of ModelCache's RAM and VRAM management, without any models.
+
+    RAM follows ModelCache: a miss makes room by evicting unlocked models in the eviction policy's order, and a model
+    that is larger than the cache is loaded but not cached. VRAM follows ModelCache's smallest-first offload of unlocked
+    models; a model that does not fit is partially loaded. Moving weights between RAM and VRAM is assumed to take no
+    time beyond the bandwidth cost.
+    """
+
+    def __init__(
+        self,
+        ram_bytes: int,
+        policy: EvictionPolicy,
+        vram_bytes: int = 0,
+        working_mem_bytes: int = 0,
+        ram_to_vram_bytes_per_second: float = DEFAULT_RAM_TO_VRAM_BYTES_PER_SECOND,
+    ):
+        """
+        :param ram_bytes: The RAM available to the cache.
+        :param policy: The eviction policy.
+        :param vram_bytes: The total VRAM available to the cache, including the working memory. 0 disables VRAM.
+        :param working_mem_bytes: The default working memory to keep free in VRAM.
+        :param ram_to_vram_bytes_per_second: The speed of moving weights from RAM to VRAM.
+        """
+        self.result = ReplayResult()
+        self._ram_bytes = ram_bytes
+        self._policy = policy
+        self._vram_bytes = vram_bytes
+        self._working_mem_bytes = working_mem_bytes
+        self._ram_to_vram_bytes_per_second = ram_to_vram_bytes_per_second
+        self._entries: dict[str, _SimulatedEntry] = {}
+        # Cache keys, from the least to the most recently used.
+        self._stack: list[str] = []
+
+    def request(self, key: str, size_bytes: int, load_seconds: float) -> bool:
+        """Request a model from the RAM cache, loading it on a miss. Returns True on a cache hit."""
+        self.result.requests += 1
+        if key in self._entries:
+            self.result.hits += 1
+            self._stack.remove(key)
+            self._stack.append(key)
+            self._policy.on_hit(key)
+            return True
+
+        self.admit(key, size_bytes, load_seconds)
+        if key in self._entries:
+            # The loader requests the model right after adding it to the cache.
+            self._policy.on_hit(key)
+        return False
+
+    def admit(self, key: str, size_bytes: int, load_seconds: float) -> None:
+        """Load a model into the RAM cache, without counting a request (e.g. a prefetch)."""
+        if key in self._entries:
+            return
+        self.result.load_seconds += load_seconds
+        self.result.bytes_loaded += size_bytes
+        if size_bytes > self._ram_bytes:
+            return
+
+        bytes_free = self._ram_bytes - sum(e.size_bytes for e in self._entries.values())
+        for evict_key in self._policy.eviction_order(self._stack):
+            if bytes_free >= size_bytes:
+                break
+            if self._entries[evict_key].locks > 0:
+                continue
+            self._policy.on_evict(evict_key)
+            self._policy.on_remove(evict_key)
+            bytes_free += self._entries.pop(evict_key).size_bytes
+            self._stack.remove(evict_key)
+            self.result.evictions += 1
+
+        self._entries[key] = _SimulatedEntry(size_bytes)
+        self._stack.append(key)
+        self._policy.on_admit(key, size_bytes, load_seconds)
+
+    def lock(self, key: str, working_mem_bytes: Optional[int] = None, use_vram: bool = True) -> None:
+        """Lock a model for use, moving as much of it into VRAM as fits."""
+        entry = self._entries.get(key)
+        if entry is None:
+            # The model was not cached (e.g. it is larger than the RAM cache).
+            return
+        entry.locks += 1
+        if not use_vram or self._vram_bytes <= 0:
+            return
+
+        working_mem_bytes = max(working_mem_bytes or self._working_mem_bytes, self._working_mem_bytes)
+        vram_needed = entry.size_bytes - entry.vram_bytes
+        vram_available = self._vram_bytes - working_mem_bytes - sum(e.vram_bytes for e in self._entries.values())
+        offload_candidates = sorted(
+            (e for e in self._entries.values() if e.locks == 0 and e.vram_bytes > 0), key=lambda e: e.size_bytes
+        )
+        for candidate in offload_candidates:
+            if vram_available >= vram_needed:
+                break
+            self.result.bytes_offloaded += candidate.vram_bytes
+            vram_available += candidate.vram_bytes
+            candidate.vram_bytes = 0
+
+        bytes_to_vram = max(0, min(vram_needed, vram_available))
+        entry.vram_bytes += bytes_to_vram
+        self.result.bytes_to_vram += bytes_to_vram
+        self.result.vram_seconds += bytes_to_vram / self._ram_to_vram_bytes_per_second
+
+    def unlock(self, key: str) -> None:
+        entry = self._entries.get(key)
+        if entry is not None and entry.locks > 0:
+            entry.locks -= 1
+
+
+def replay(requests: Iterable[CacheRequest], capacity_bytes: int, policy: EvictionPolicy) -> ReplayResult:
+    """Replay a sequence of cache requests against a simulated RAM cache that uses `policy` to choose evictions.
+
+    Every request moves the model to the most recently used position, and a miss loads the model and then requests it.
+    Models are never locked, since only one model is requested at a time, and VRAM is not simulated.
+    """
+    cache = SimulatedModelCache(ram_bytes=capacity_bytes, policy=policy)
+    for request in requests:
+        cache.request(request.key, request.size_bytes, request.load_seconds)
+    return cache.result
@@ -16,12 +16,14 @@ import torch
 from invokeai.backend.model_manager.load.memory_snapshot import MemorySnapshot
 from invokeai.backend.model_manager.load.model_cache.cache_record import CacheRecord
 from invokeai.backend.model_manager.load.model_cache.cache_stats import CacheStats
+from invokeai.backend.model_manager.load.model_cache.cache_trace import CacheTraceRecorder
 from invokeai.backend.model_manager.load.model_cache.cached_model.cached_model_only_full_load import (
     CachedModelOnlyFullLoad,
 )
 from invokeai.backend.model_manager.load.model_cache.cached_model.cached_model_with_partial_load import (
     CachedModelWithPartialLoad,
 )
+from invokeai.backend.model_manager.load.model_cache.eviction_policy import EvictionPolicy, LRUEvictionPolicy
 from invokeai.backend.model_manager.load.model_cache.ram_budget import RamBudget
 from invokeai.backend.model_manager.load.model_cache.shared_cpu_weights import (
     SHARED_CPU_WEIGHTS,
@@ -32,6 +34,7 @@ from invokeai.backend.model_manager.load.model_cache.torch_module_autocast.torch
 )
 from invokeai.backend.model_manager.load.model_util import calc_model_size_by_data
 from invokeai.backend.model_manager.taxonomy import AnyModel, SubModelType
+from invokeai.backend.quantization.gguf.dequantize_cache import get_dequantization_cache
 from invokeai.backend.util.devices import TorchDevice
 from invokeai.backend.util.level_zero import xpu_device_is_integrated
 from invokeai.backend.util.logging import InvokeAILogger
@@ -299,7 +302,8 @@ class ModelCache:
 
     Models are moved between the storage_device and the execution_device as necessary. Cache size limits are enforced
     on both the storage_device and the execution_device. The execution_device cache uses a smallest-first offload
-    policy. The storage_device cache uses a least-recently-used (LRU) offload policy.
+    policy. The storage_device cache uses a pluggable eviction policy (see EvictionPolicy), which is least-recently-used
+    (LRU) by default.
 
     Note: Neither of these offload policies has really been compared against alternatives. It's likely that different
     policies would be better, although the optimal policies are likely heavily dependent on usage patterns and HW
@@ -330,6 +334,8 @@ class ModelCache:
         keep_alive_minutes: float = 0,
         shared_cpu_weights: SharedCpuWeightsStore | None = SHARED_CPU_WEIGHTS,
         ram_budget: RamBudget | None = None,
+        eviction_policy: EvictionPolicy | None = None,
+        trace_recorder: CacheTraceRecorder | None = None,
     ):
         """Initialize the model RAM cache.
 
@@ -356,6 +362,10 @@ class ModelCache:
         :param ram_budget: Optional shared RamBudget used as the single global RAM authority across all per-device
             caches. When provided, eviction decisions are made against the deduplicated, system-wide RAM total rather
             than this cache's local (double-counted) sum. When None, the cache uses its own local RAM accounting.
+        :param eviction_policy: Decides which unlocked models are evicted first when RAM is needed. Defaults to
+            LRUEvictionPolicy.
+        :param trace_recorder: If set, cache operations are recorded to this trace, for offline replay (see
+            cache_trace.py).
         """
         self._shared_cpu_weights = shared_cpu_weights
         self._ram_budget = ram_budget
@@ -378,7 +388,9 @@ class ModelCache:
         self._stats: Optional[CacheStats] = None
 
         self._cached_models: Dict[str, CacheRecord] = {}
+        # Cache keys, from the least to the most recently used.
         self._cache_stack: List[str] = []
+        self._eviction_policy = eviction_policy or LRUEvictionPolicy()
 
         self._ram_cache_size_bytes = self._calc_ram_available_to_model_cache()
 
@@ -408,6 +420,17 @@ class ModelCache:
         if ram_budget is not None:
             ram_budget.register_cache(self)
 
+        self._trace_recorder = trace_recorder
+        self._trace(
+            "cache",
+            ram_bytes=self._ram_cache_size_bytes,
+            working_mem_bytes=int(self._execution_device_working_mem_gb * GB),
+        )
+
+    def _trace(self, op: str, **fields: Any) -> None:
+        if self._trace_recorder is not None:
+            self._trace_recorder.record(op, device=str(self._execution_device), **fields)
+
     def on_cache_hit(self, cb: CacheHitCallback) -> Callable[[], None]:
         self._on_cache_hit_callbacks.add(cb)
 
@@ -581,7 +604,12 @@ class ModelCache:
     @synchronized
     @record_activity
     def put(
-        self, key: str, model: AnyModel, execution_device: Optional[torch.device] = None, prefetch: bool = False
+        self,
+        key: str,
+        model: AnyModel,
+        execution_device: Optional[torch.device] = None,
+        prefetch: bool = False,
+        load_seconds: Optional[float] = None,
     ) -> None:
         """Add a model to the cache.
 
@@ -594,6 +622,7 @@ class ModelCache:
                 single-file pipeline load) and no loader will retrieve it after this call. It is
                 admitted without the post-admission grace, so budget reconciles may evict it
                 immediately.
+            load_seconds: How long it took to load the model. Used by cost-aware eviction policies.
         """
         if key in self._cached_models:
             self._logger.debug(
@@ -697,6 +726,8 @@ class ModelCache:
         )
         self._cached_models[key] = cache_record
         self._cache_stack.append(key)
+        self._eviction_policy.on_admit(key, wrapped_model.total_bytes(), load_seconds)
+        self._trace("put", key=key, bytes=wrapped_model.total_bytes(), load_seconds=load_seconds)
         # Account this model's RAM in the global budget. Shared weights are tracked once by the
         # SharedCpuWeightsStore; only non-deduplicated models are added to the budget's non-shared
         # total (a non-shared model resident on N devices correctly counts N times).
@@ -736,6 +767,16 @@ class ModelCache:
         self._warned_once.add(key)
         self._logger.warning(message)
 
+    @synchronized
+    def contains(self, key: str) -> bool:
+        """Check whether a model is in the cache, without counting a cache hit or changing the eviction order."""
+        return key in self._cached_models
+
+    @synchronized
+    def ram_available(self) -> int:
+        """Get the amount of RAM that the cache can fill without evicting any models."""
+        return self._get_ram_available()
+
     def cached_model_keys(self) -> set[str]:
         """Return the base model keys of every model currently resident in this cache.
 
@@ -906,6 +947,7 @@ class ModelCache:
         else:
             for cb in self._on_cache_miss_callbacks:
                 cb(model_key=key, cache_snapshot=self._get_cache_snapshot())
+            self._trace("miss", key=key)
             if self.stats:
                 self.stats.misses += 1
             self._logger.debug(f"Cache miss: {key}")
@@ -930,6 +972,8 @@ class ModelCache:
         # This moves the entry to the top (right end) of the stack.
         self._cache_stack = [k for k in self._cache_stack if k != key]
         self._cache_stack.append(key)
+        self._eviction_policy.on_hit(key)
+        self._trace("hit", key=key, bytes=cache_entry.cached_model.total_bytes())
 
         self._logger.debug(f"Cache hit: {key} (Type: {cache_entry.cached_model.model.__class__.__name__})")
         for cb in self._on_cache_hit_callbacks:
@@ -982,6 +1026,23 @@ class ModelCache:
         # "Loaded model ... onto <device> device" line emitted for GPU loads below. Case 2 would fire for every
         # lock of every model and says nothing about a per-model choice, so keep it at DEBUG and drop the wording.
         model_compute_device = cache_entry.cached_model.compute_device
+        if self._trace_recorder is not None:
+            vram_total_bytes = None
+            if model_compute_device.type != "cpu":
+                # With no extra working memory requested, this is the default working memory plus the VRAM that the
+                # cache can use for models.
+                vram_total_bytes = (
+                    self._get_vram_in_use()
+                    + self._get_vram_available(None)
+                    + int(self._execution_device_working_mem_gb * GB)
+                )
+            self._trace(
+                "lock",
+                key=cache_entry.key,
+                bytes=cache_entry.cached_model.total_bytes(),
+                working_mem_bytes=working_mem_bytes,
+                vram_total_bytes=vram_total_bytes,
+            )
         if model_compute_device.type == "cpu":
             if self._execution_device.type != "cpu":
                 self._logger.info(
@@ -1023,6 +1084,7 @@ class ModelCache:
             )
         # cache_entry = self._cached_models[key]
         cache_entry.unlock()
+        self._trace("unlock", key=cache_entry.key)
         self._logger.debug(
             f"Unlocked model {cache_entry.key} (Type: {cache_entry.cached_model.model.__class__.__name__})"
         )
@@ -1173,7 +1235,7 @@ class ModelCache:
     ) -> int:
         try:
             if isinstance(cache_entry.cached_model, CachedModelWithPartialLoad):
-                return cache_entry.cached_model.partial_unload_from_vram(
+                vram_bytes_freed = cache_entry.cached_model.partial_unload_from_vram(
                     vram_bytes_to_free,
                     keep_required_weights_in_vram=(
                         cache_entry.is_locked
@@ -1182,9 +1244,12 @@ class ModelCache:
                     ),
                 )
             elif isinstance(cache_entry.cached_model, CachedModelOnlyFullLoad):  # type: ignore
-                return cache_entry.cached_model.full_unload_from_vram()
+                vram_bytes_freed = cache_entry.cached_model.full_unload_from_vram()
             else:
                 raise ValueError(f"Unsupported cached model type: {type(cache_entry.cached_model)}")
+            if vram_bytes_freed > 0:
+                self._trace("offload", key=cache_entry.key, bytes=vram_bytes_freed)
+            return vram_bytes_freed
         except Exception:
             # If an exception occurs, the model could be left in a bad state, so we delete it from the cache entirely.
             self._delete_cache_entry(cache_entry)
@@ -1413,6 +1478,10 @@ class ModelCache:
             f"Offloading unlocked models with goal of making room for {vram_bytes_required / MB:.2f}MB of VRAM."
         )
         vram_bytes_freed = 0
+        # Cached dequantized GGUF weights are not tracked as part of any model, so they are released before any model
+        # is offloaded. They are re-built on demand.
+        if vram_bytes_required > self._get_vram_available(working_mem_bytes):
+            vram_bytes_freed += get_dequantization_cache().clear_device(self._execution_device)
         # TODO(ryand): Give more thought to the offloading policy used here.
         cache_entries_increasing_size = sorted(self._cached_models.values(), key=lambda x: x.cached_model.total_bytes())
         for cache_entry in cache_entries_increasing_size:
@@ -1529,9 +1598,8 @@ class ModelCache:
         ram_bytes_to_free = max(0, bytes_needed - ram_bytes_available)
 
         ram_bytes_freed = 0
-        pos = 0
         models_cleared = 0
-        while pos < len(self._cache_stack):
+        for model_key in self._eviction_policy.eviction_order(self._cache_stack):
             # Stop once there is enough room. With a shared RamBudget, re-check the global,
             # deduplicated availability each iteration: evicting a model that other devices still
             # hold frees no RAM (its shared weights stay live until the last reference is released),
@@ -1543,7 +1611,6 @@ class ModelCache:
             elif ram_bytes_freed >= ram_bytes_to_free:
                 break
 
-            model_key = self._cache_stack[pos]
             cache_entry = self._cached_models[model_key]
 
             if not cache_entry.is_locked:
@@ -1551,11 +1618,10 @@ class ModelCache:
                 self._logger.debug(
                     f"Dropping {model_key} from RAM cache to free {(cache_entry.cached_model.total_bytes() / MB):.2f}MB."
                 )
+                self._eviction_policy.on_evict(model_key)
                 self._delete_cache_entry(cache_entry)
                 del cache_entry
                 models_cleared += 1
-            else:
-                pos += 1
 
         if self._ram_budget is not None and bytes_needed > self._get_ram_available():
             # This cache's own evictable entries are exhausted, but the global budget is still
@@ -1602,6 +1668,8 @@ class ModelCache:
                     cache_snapshot=self._get_cache_snapshot(),
                 )
             gc.collect()
+            # Release the dequantized copies of the dropped models' GGUF weights (if any).
+            get_dequantization_cache().purge_collected()
 
         TorchDevice.empty_cache()
         self._logger.debug(f"Dropped {models_cleared} models to free {ram_bytes_freed / MB:.2f}MB of RAM.")
@@ -1629,16 +1697,17 @@ class ModelCache:
             return None
         try:
             models_cleared = 0
-            pos = 0
-            while pos < len(self._cache_stack) and not is_satisfied():
-                cache_entry = self._cached_models[self._cache_stack[pos]]
+            for model_key in self._eviction_policy.eviction_order(self._cache_stack):
+                if is_satisfied():
+                    break
+                cache_entry = self._cached_models[model_key]
                 if cache_entry.is_locked or cache_entry.awaiting_first_use:
-                    pos += 1
                     continue
                 self._logger.debug(
                     f"Dropping {cache_entry.key} from RAM cache on behalf of a peer device cache "
                     f"({(cache_entry.cached_model.total_bytes() / MB):.2f}MB)."
                 )
+                self._eviction_policy.on_evict(model_key)
                 self._delete_cache_entry(cache_entry)
                 models_cleared += 1
             return models_cleared
@@ -1702,16 +1771,17 @@ class ModelCache:
                 return
             models_cleared = 0
             try:
-                pos = 0
-                while pos < len(self._cache_stack) and self._ram_budget.available() < 0:
-                    cache_entry = self._cached_models[self._cache_stack[pos]]
+                for model_key in self._eviction_policy.eviction_order(self._cache_stack):
+                    if self._ram_budget.available() >= 0:
+                        break
+                    cache_entry = self._cached_models[model_key]
                     if cache_entry.is_locked or cache_entry.awaiting_first_use:
-                        pos += 1
                         continue
                     self._logger.debug(
                         f"Dropping {cache_entry.key} from RAM cache to reconcile the shared RAM budget "
                         f"({(cache_entry.cached_model.total_bytes() / MB):.2f}MB)."
                     )
+                    self._eviction_policy.on_evict(model_key)
                     self._delete_cache_entry(cache_entry)
                     models_cleared += 1
             finally:
@@ -1736,8 +1806,10 @@ class ModelCache:
         # double-release (release_shared_weights is itself idempotent, but a re-added entry under the
         # same key must not be released by a stale delete).
         if was_present:
+            self._eviction_policy.on_remove(cache_entry.key)
             uses_shared = cache_entry.cached_model.uses_shared_weights
             total_bytes = cache_entry.cached_model.total_bytes()
+            self._trace("evict", key=cache_entry.key, bytes=total_bytes)
             cache_entry.cached_model.release_shared_weights()
             # Drop the matching non-shared contribution from the global budget (shared weights are
             # released via the store above). Captured before release_shared_weights() flips the flag.
@@ -712,16 +712,22 @@ class FluxCheckpointModel(ModelLoader):
         with accelerate.init_empty_weights():
             model = Flux(get_flux_transformers_params(config.variant))
 
+        # We need to cast to bfloat16 due to it being the only currently supported dtype for inference
+        sd = self._load_converted_state_dict(
+            config, torch.bfloat16, lambda: self._load_and_convert_state_dict(model_path)
+        )
+        model.load_state_dict(sd, assign=True)
+        return model
+
+    def _load_and_convert_state_dict(self, model_path: Path) -> dict[str, torch.Tensor]:
         sd = load_file(model_path)
         if "model.diffusion_model.double_blocks.0.img_attn.norm.key_norm.scale" in sd:
             sd = convert_bundle_to_flux_transformer_checkpoint(sd)
         new_sd_size = sum([ten.nelement() * torch.bfloat16.itemsize for ten in sd.values()])
         self._ram_cache.make_room(new_sd_size)
         for k in sd.keys():
-            # We need to cast to bfloat16 due to it being the only currently supported dtype for inference
             sd[k] = sd[k].to(torch.bfloat16)
-        model.load_state_dict(sd, assign=True)
-        return model
+        return sd
 
 
 @ModelLoaderRegistry.register(base=BaseModelType.Flux, type=ModelType.Main, format=ModelFormat.GGUFQuantized)
@@ -966,28 +972,9 @@ class Flux2CheckpointModel(ModelLoader):
             )
         model_path = Path(config.path)
 
-        # Load state dict
-        sd = load_file(model_path)
-
-        # Handle FP8 quantized weights (ComfyUI-style or scaled FP8)
-        # These store weights as: layer.weight (FP8) + layer.weight_scale (FP32 scalar)
-        sd = self._dequantize_fp8_weights(sd)
-
-        # Check if keys have ComfyUI-style prefix and strip if needed
-        prefix_to_strip = None
-        for prefix in ["model.diffusion_model.", "diffusion_model."]:
-            if any(k.startswith(prefix) for k in sd.keys() if isinstance(k, str)):
-                prefix_to_strip = prefix
-                break
-
-        if prefix_to_strip:
-            sd = {
-                (k[len(prefix_to_strip) :] if isinstance(k, str) and k.startswith(prefix_to_strip) else k): v
-                for k, v in sd.items()
-            }
-
-        # Convert BFL format state dict to diffusers format
-        converted_sd = convert_flux2_bfl_to_diffusers(sd)
+        converted_sd = self._load_converted_state_dict(
+            config, torch.bfloat16, lambda: self._load_and_convert_state_dict(model_path)
+        )
 
         # Detect architecture from checkpoint keys
         double_block_indices = [
@@ -1063,15 +1050,40 @@ class Flux2CheckpointModel(ModelLoader):
                         out_features2, in_features2, dtype=torch.bfloat16
                     )
 
-        # Convert to bfloat16 and load
-        for k in converted_sd.keys():
-            converted_sd[k] = converted_sd[k].to(torch.bfloat16)
-
         # Load the state dict - guidance weights were already initialized above if missing
         model.load_state_dict(converted_sd, assign=True)
 
         return model
 
+    def _load_and_convert_state_dict(self, model_path: Path) -> dict[str, torch.Tensor]:
+        # Load state dict
+        sd = load_file(model_path)
+
+        # Handle FP8 quantized weights (ComfyUI-style or scaled FP8)
+        # These store weights as: layer.weight (FP8) + layer.weight_scale (FP32 scalar)
+        sd = self._dequantize_fp8_weights(sd)
+
+        # Check if keys have ComfyUI-style prefix and strip if needed
+        prefix_to_strip = None
+        for prefix in ["model.diffusion_model.", "diffusion_model."]:
+            if any(k.startswith(prefix) for k in sd.keys() if isinstance(k, str)):
+                prefix_to_strip = prefix
+                break
+
+        if prefix_to_strip:
+            sd = {
+                (k[len(prefix_to_strip) :] if isinstance(k, str) and k.startswith(prefix_to_strip) else k): v
+                for k, v in sd.items()
+            }
+
+        # Convert BFL format state dict to diffusers format
+        converted_sd = convert_flux2_bfl_to_diffusers(sd)
+
+        # Convert to bfloat16
+        for k in converted_sd.keys():
+            converted_sd[k] = converted_sd[k].to(torch.bfloat16)
+        return converted_sd
+
     def _dequantize_fp8_weights(self, sd: dict) -> dict:
         """Dequantize FP8 quantized weights in the state dict.
 
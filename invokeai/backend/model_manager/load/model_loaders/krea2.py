@@ -341,7 +341,6 @@ class Krea2CheckpointModel(ModelLoader):
 
     def _load_from_singlefile(self, config: AnyModelConfig) -> AnyModel:
         from diffusers import Krea2Transformer2DModel
-        from safetensors.torch import load_file
 
         if not isinstance(config, Main_Checkpoint_Krea2_Config):
             raise TypeError(f"Expected Main_Checkpoint_Krea2_Config, got {type(config).__name__}.")
@@ -350,6 +349,22 @@ class Krea2CheckpointModel(ModelLoader):
         target_device = TorchDevice.choose_torch_device()
         model_dtype = TorchDevice.choose_bfloat16_safe_dtype(target_device)
 
+        sd = self._load_converted_state_dict(
+            config, model_dtype, lambda: self._load_and_convert_state_dict(model_path, model_dtype)
+        )
+
+        with accelerate.init_empty_weights():
+            model = Krea2Transformer2DModel(**KREA2_TRANSFORMER_CONFIG)
+
+        model.load_state_dict(sd, assign=True, strict=False)
+        _reject_incomplete_load(model, what="Krea-2 single-file checkpoint")
+        # Honor the fp8-storage setting (re-quantizes the dequantized weights to fp8-resident on CUDA).
+        model = self._apply_fp8_layerwise_casting(model, config, SubModelType.Transformer)
+        return model
+
+    def _load_and_convert_state_dict(self, model_path: Path, model_dtype: "torch.dtype") -> dict[str, "torch.Tensor"]:
+        from safetensors.torch import load_file
+
         sd = load_file(model_path)
         sd = _strip_comfyui_prefix(sd)
         # ComfyUI 'scaled fp8' checkpoints: fold the per-tensor weight_scale into the weights. The
@@ -360,19 +375,11 @@ class Krea2CheckpointModel(ModelLoader):
         if _is_native_krea2_format(sd):
             sd = _convert_krea2_native_to_diffusers(sd)
 
-        with accelerate.init_empty_weights():
-            model = Krea2Transformer2DModel(**KREA2_TRANSFORMER_CONFIG)
-
         new_sd_size = sum(ten.nelement() * model_dtype.itemsize for ten in sd.values())
         self._ram_cache.make_room(new_sd_size)
         for k in sd.keys():
             sd[k] = sd[k].to(model_dtype)
-
-        model.load_state_dict(sd, assign=True, strict=False)
-        _reject_incomplete_load(model, what="Krea-2 single-file checkpoint")
-        # Honor the fp8-storage setting (re-quantizes the dequantized weights to fp8-resident on CUDA).
-        model = self._apply_fp8_layerwise_casting(model, config, SubModelType.Transformer)
-        return model
+        return sd
 
 
 @ModelLoaderRegistry.register(base=BaseModelType.Krea2, type=ModelType.Main, format=ModelFormat.GGUFQuantized)
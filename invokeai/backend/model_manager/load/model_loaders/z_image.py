@@ -386,7 +386,6 @@ class ZImageCheckpointModel(ModelLoader):
         config: AnyModelConfig,
     ) -> AnyModel:
         from diffusers import ZImageTransformer2DModel
-        from safetensors.torch import load_file
 
         if not isinstance(config, Main_Checkpoint_ZImage_Config):
             raise TypeError(
@@ -395,6 +394,41 @@ class ZImageCheckpointModel(ModelLoader):
             )
         model_path = Path(config.path)
 
+        # Determine safe dtype based on target device capabilities
+        target_device = TorchDevice.choose_torch_device()
+        model_dtype = TorchDevice.choose_bfloat16_safe_dtype(target_device)
+
+        sd = self._load_converted_state_dict(
+            config, model_dtype, lambda: self._load_and_convert_state_dict(model_path, model_dtype)
+        )
+
+        # Create an empty model with the default Z-Image config
+        # Z-Image-Turbo uses these default parameters from diffusers
+        with accelerate.init_empty_weights():
+            model = ZImageTransformer2DModel(
+                all_patch_size=(2,),
+                all_f_patch_size=(1,),
+                in_channels=16,
+                dim=3840,
+                n_layers=30,
+                n_refiner_layers=2,
+                n_heads=30,
+                n_kv_heads=30,
+                norm_eps=1e-05,
+                qk_norm=True,
+                cap_feat_dim=2560,
+                rope_theta=256.0,
+                t_scale=1000.0,
+                axes_dims=[32, 48, 48],
+                axes_lens=[1024, 512, 512],
+            )
+
+        model.load_state_dict(sd, assign=True)
+        return model
+
+    def _load_and_convert_state_dict(self, model_path: Path, model_dtype: torch.dtype) -> dict[str, torch.Tensor]:
+        from safetensors.torch import load_file
+
         # Load the state dict from safetensors/checkpoint file
         sd = load_file(model_path)
 
@@ -423,31 +457,6 @@ class ZImageCheckpointModel(ModelLoader):
             # Convert from original format to diffusers format
             sd = _convert_z_image_gguf_to_diffusers(sd)
 
-        # Create an empty model with the default Z-Image config
-        # Z-Image-Turbo uses these default parameters from diffusers
-        with accelerate.init_empty_weights():
-            model = ZImageTransformer2DModel(
-                all_patch_size=(2,),
-                all_f_patch_size=(1,),
-                in_channels=16,
-                dim=3840,
-                n_layers=30,
-                n_refiner_layers=2,
-                n_heads=30,
-                n_kv_heads=30,
-                norm_eps=1e-05,
-                qk_norm=True,
-                cap_feat_dim=2560,
-                rope_theta=256.0,
-                t_scale=1000.0,
-                axes_dims=[32, 48, 48],
-                axes_lens=[1024, 512, 512],
-            )
-
-        # Determine safe dtype based on target device capabilities
-        target_device = TorchDevice.choose_torch_device()
-        model_dtype = TorchDevice.choose_bfloat16_safe_dtype(target_device)
-
         # Filter out keys that don't belong to the ZImageTransformer2DModel.
         # Merged checkpoints (e.g. LoRA-baked models) may bundle text encoder weights
         # (text_encoders.*) or other non-transformer keys alongside the transformer weights.
@@ -481,8 +490,7 @@ class ZImageCheckpointModel(ModelLoader):
         for k in sd.keys():
             sd[k] = sd[k].to(model_dtype)
 
-        model.load_state_dict(sd, assign=True)
-        return model
+        return sd
 
 
 @ModelLoaderRegistry.register(base=BaseModelType.ZImage, type=ModelType.Main, format=ModelFormat.GGUFQuantized)
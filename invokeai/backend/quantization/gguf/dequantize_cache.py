@@ -0,0 +1,241 @@
+import threading
+import weakref
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Optional
+
+import torch
+
+from invokeai.backend.util.calc_tensor_size import calc_tensor_size
+
+# A cache key: (id of the quantized source tensor, compute dtype of the dequantized tensor).
+_CacheKey = tuple[int, torch.dtype]
+
+
+@dataclass
+class _CacheEntry:
+    # A weak reference to the quantized source tensor. Used to detect that a key (which is derived from `id()`) has
+    # been re-used by a different tensor after the original was garbage collected.
+    source_ref: "weakref.ReferenceType[torch.Tensor]"
+    # The source tensor's in-place version counter at the time that it was dequantized.
+    source_version: int
+    dequantized: torch.Tensor
+    # The dequantized tensor's version counter when it was cached. Used to detect in-place writes to the cached tensor.
+    dequantized_version: int
+    size_bytes: int
+
+
+@dataclass
+class _RequestCount:
+    source_ref: "weakref.ReferenceType[torch.Tensor]"
+    count: int
+
+
+class GGMLDequantizationCache:
+    """A bounded cache of dequantized GGML weights.
+
+    Dequantizing a GGML tensor on every op call is the dominant per-step cost of running GGUF models on slow devices.
+    This cache holds on to the dequantized copies of the most frequently used weights so that they can be re-used
+    across denoising steps.
+
+    Each execution device has its own byte budget. Within a device, entries are evicted in least-recently-used order.
+    Because a denoising step touches every layer of a model in the same order, plain LRU would thrash whenever the
+    model does not fit in the budget (every lookup would miss). To avoid this, a new entry is only admitted over an
+    existing one if it has been requested more often than the entry that it would evict. Request counts are halved
+    once per "sweep" (once the number of requests on a device reaches the number of tensors being tracked on it), so
+    the weights of a model that is no longer running lose their priority within a few steps.
+    """
+
+    def __init__(self, max_bytes_per_device: int = 0):
+        self._max_bytes_per_device = max_bytes_per_device
+        self._lock = threading.Lock()
+        # device -> (key -> entry), in LRU order (oldest first).
+        self._entries: dict[str, OrderedDict[_CacheKey, _CacheEntry]] = {}
+        self._bytes: dict[str, int] = {}
+        # device -> (key -> recent request count) for every live source tensor that has been requested on the device.
+        self._request_counts: dict[str, dict[_CacheKey, _RequestCount]] = {}
+        # device -> number of requests since the request counts were last decayed.
+        self._requests_since_decay: dict[str, int] = {}
+        # Ids of source tensors that have been garbage collected. Populated from weakref callbacks, which may run at
+        # any time (including while self._lock is held), so they only append here and the cleanup happens later.
+        self._dead_ids: deque[int] = deque()
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_bytes_per_device > 0
+
+    def set_max_bytes_per_device(self, max_bytes_per_device: int) -> None:
+        """Change the per-device budget. Shrinking the budget evicts entries immediately."""
+        with self._lock:
+            self._max_bytes_per_device = max_bytes_per_device
+            for device in list(self._entries.keys()):
+                self._evict_to_fit(device, 0)
+
+    def total_bytes(self, device: Optional[torch.device] = None) -> int:
+        """Get the number of bytes held by the cache, either on a single device or in total."""
+        with self._lock:
+            self._purge_dead_ids()
+            if device is not None:
+                return self._bytes.get(str(device), 0)
+            return sum(self._bytes.values())
+
+    def get(self, source: torch.Tensor, compute_dtype: torch.dtype) -> Optional[torch.Tensor]:
+        """Get the cached dequantized tensor for the quantized `source` tensor, or None on a miss."""
+        device = str(source.device)
+        key = (id(source), compute_dtype)
+        with self._lock:
+            self._purge_dead_ids()
+            self._count_request(device, key, source)
+
+            device_entries = self._entries.get(device)
+            entry = device_entries.get(key) if device_entries is not None else None
+            if entry is None:
+                return None
+            if (
+                entry.source_ref() is source
+                and entry.source_version == source._version
+                and entry.dequantized_version == entry.dequantized._version
+            ):
+                device_entries.move_to_end(key)  # pyright: ignore[reportOptionalMemberAccess]
+                return entry.dequantized
+
+            # The entry is stale: the id was re-used, or the source or cached tensor was modified in-place.
+            self._remove(device, key)
+            return None
+
+    def put(self, source: torch.Tensor, compute_dtype: torch.dtype, dequantized: torch.Tensor) -> None:
+        """Offer a dequantized tensor to the cache. It is only stored if the admission policy accepts it.
+
+        `dequantized` must not be an inference tensor (inference tensors do not have a version counter).
+        """
+        if dequantized.untyped_storage().data_ptr() == source.untyped_storage().data_ptr():
+            # The "dequantized" tensor is the source itself (e.g. an F16 tensor with an F16 compute dtype). There is
+            # nothing to save by caching it, and a strong reference to the source would keep it alive.
+            return
+
+        device = str(source.device)
+        key = (id(source), compute_dtype)
+        size_bytes = calc_tensor_size(dequantized)
+        with self._lock:
+            if size_bytes > self._max_bytes_per_device:
+                return
+            self._purge_dead_ids()
+
+            device_entries = self._entries.setdefault(device, OrderedDict())
+            if key in device_entries:
+                self._remove(device, key)
+
+            if not self._can_admit(device, key, size_bytes):
+                return
+            self._evict_to_fit(device, size_bytes)
+
+            device_entries[key] = _CacheEntry(
+                source_ref=weakref.ref(source),
+                source_version=source._version,
+                dequantized=dequantized,
+                dequantized_version=dequantized._version,
+                size_bytes=size_bytes,
+            )
+            self._bytes[device] = self._bytes.get(device, 0) + size_bytes
+
+    def clear_device(self, device: torch.device) -> int:
+        """Drop all entries held on `device`. Returns the number of bytes released."""
+        with self._lock:
+            device_key = str(device)
+            bytes_freed = self._bytes.pop(device_key, 0)
+            self._entries.pop(device_key, None)
+            return bytes_freed
+
+    def purge_collected(self) -> None:
+        """Drop the entries of source tensors that have been garbage collected.
+
+        This also happens lazily on every `get()`/`put()`, but the model cache calls it after it releases a model so
+        that the memory held by the model's dequantized weights is released right away.
+        """
+        with self._lock:
+            self._purge_dead_ids()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes.clear()
+            self._request_counts.clear()
+            self._requests_since_decay.clear()
+            self._dead_ids.clear()
+
+    def _count_request(self, device: str, key: _CacheKey, source: torch.Tensor) -> None:
+        device_counts = self._request_counts.setdefault(device, {})
+        counted = device_counts.get(key)
+        if counted is not None and counted.source_ref() is source:
+            counted.count += 1
+        else:
+            device_counts[key] = _RequestCount(source_ref=weakref.ref(source, self._make_finalizer(key[0])), count=1)
+
+        requests = self._requests_since_decay.get(device, 0) + 1
+        if requests >= len(device_counts):
+            for request_count in device_counts.values():
+                request_count.count //= 2
+            requests = 0
+        self._requests_since_decay[device] = requests
+
+    def _request_count(self, device: str, key: _CacheKey) -> int:
+        counted = self._request_counts.get(device, {}).get(key)
+        return counted.count if counted is not None else 0
+
+    def _make_finalizer(self, source_id: int):
+        dead_ids = self._dead_ids
+
+        def _on_source_collected(_ref: "weakref.ReferenceType[torch.Tensor]") -> None:
+            dead_ids.append(source_id)
+
+        return _on_source_collected
+
+    def _can_admit(self, device: str, key: _CacheKey, size_bytes: int) -> bool:
+        """Check whether a new entry may displace the entries needed to make room for it."""
+        available = self._max_bytes_per_device - self._bytes.get(device, 0)
+        if size_bytes <= available:
+            return True
+
+        new_count = self._request_count(device, key)
+        for victim_key, victim in self._entries[device].items():
+            if self._request_count(device, victim_key) >= new_count:
+                return False
+            available += victim.size_bytes
+            if size_bytes <= available:
+                return True
+        return False
+
+    def _evict_to_fit(self, device: str, size_bytes: int) -> None:
+        device_entries = self._entries.get(device)
+        while device_entries and self._bytes.get(device, 0) + size_bytes > self._max_bytes_per_device:
+            oldest_key = next(iter(device_entries))
+            self._remove(device, oldest_key)
+
+    def _remove(self, device: str, key: _CacheKey) -> None:
+        entry = self._entries[device].pop(key)
+        self._bytes[device] -= entry.size_bytes
+
+    def _purge_dead_ids(self) -> None:
+        while self._dead_ids:
+            source_id = self._dead_ids.popleft()
+            for device, device_entries in self._entries.items():
+                for key in [k for k, e in device_entries.items() if k[0] == source_id and e.source_ref() is None]:
+                    self._remove(device, key)
+            for device_counts in self._request_counts.values():
+                for key in [k for k, c in device_counts.items() if k[0] == source_id and c.source_ref() is None]:
+                    del device_counts[key]
+
+
+# The process-wide cache used by GGMLTensor. Disabled (zero budget) until configured.
+_dequantization_cache = GGMLDequantizationCache()
+
+
+def get_dequantization_cache() -> GGMLDequantizationCache:
+    return _dequantization_cache
+
+
+def configure_dequantization_cache(max_gb_per_device: float) -> None:
+    """Set the per-device budget of the process-wide GGML dequantization cache. A budget of 0 disables it."""
+    _dequantization_cache.set_max_bytes_per_device(int(max_gb_per_device * 2**30))
+    if not _dequantization_cache.enabled:
+        _dequantization_cache.clear()
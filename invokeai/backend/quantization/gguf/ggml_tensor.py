@@ -3,12 +3,23 @@ from typing import overload
 import gguf
 import torch
 
+from invokeai.backend.quantization.gguf.dequantize_cache import get_dequantization_cache
 from invokeai.backend.quantization.gguf.utils import (
     DEQUANTIZE_FUNCTIONS,
     TORCH_COMPATIBLE_QTYPES,
     dequantize,
 )
 
+# Ops in GGML_TENSOR_OP_TABLE that return an alias of their (dequantized) input. Views created inside
+# __torch_dispatch__ do not share a version counter with their base, so in-place writes through them cannot be detected
+# by the dequantization cache. When the cache is enabled, their results are copied instead.
+_ALIASING_OPS = {
+    torch.ops.aten.t.default,  # pyright: ignore
+    torch.ops.aten.slice.Tensor,  # pyright: ignore
+    torch.ops.aten.view.default,  # pyright: ignore
+    torch.ops.aten.expand.default,  # pyright: ignore
+}
+
 
 def dequantize_and_run(func, args, kwargs):
     """A helper function for running math ops on GGMLTensor inputs.
@@ -36,9 +47,12 @@ def dequantize_and_run(func, args, kwargs):
             if compute_dtype is not None and target_device is not None:
                 break
 
+    # In-place ops must not be applied to a (possibly shared) cached dequantized tensor.
+    is_inplace = func._schema.is_mutable
+
     def process_tensor(t):
         if hasattr(t, "get_dequantized_tensor"):
-            result = t.get_dequantized_tensor()
+            result = t._dequantize() if is_inplace and isinstance(t, GGMLTensor) else t.get_dequantized_tensor()
             # Ensure the dequantized tensor is on the target device
             if target_device is not None and result.device != target_device:
                 result = result.to(target_device)
@@ -50,7 +64,11 @@ def dequantize_and_run(func, args, kwargs):
 
     dequantized_args = [process_tensor(a) for a in args]
     dequantized_kwargs = {k: process_tensor(v) for k, v in kwargs.items()}
-    return func(*dequantized_args, **dequantized_kwargs)
+    result = func(*dequantized_args, **dequantized_kwargs)
+    if func in _ALIASING_OPS and get_dequantization_cache().enabled:
+        # Don't hand out aliases of a cached dequantized tensor.
+        return result.clone()
+    return result
 
 
 def apply_to_quantized_tensor(func, args, kwargs):
@@ -172,9 +190,25 @@ class GGMLTensor(torch.Tensor):
     def get_dequantized_tensor(self):
         """Return the dequantized tensor.
 
-        Args:
-            dtype: The dtype of the dequantized tensor.
+        If the GGML dequantization cache is enabled, a previously dequantized copy of this tensor may be returned. The
+        caller must not modify the returned tensor in-place.
         """
+        cache = get_dequantization_cache()
+        if not cache.enabled or self.quantized_data.is_inference():
+            # Inference tensors do not have a version counter, so in-place changes to them could not be detected.
+            return self._dequantize()
+
+        dequantized = cache.get(self.quantized_data, self.compute_dtype)
+        if dequantized is None:
+            # Dequantize outside of inference mode so that the cached tensor has a version counter. This lets the
+            # cache detect in-place writes to the cached tensor.
+            with torch.inference_mode(False), torch.no_grad():
+                dequantized = self._dequantize()
+            cache.put(self.quantized_data, self.compute_dtype, dequantized)
+        return dequantized
+
+    def _dequantize(self) -> torch.Tensor:
+        """Dequantize the tensor, bypassing the dequantization cache."""
         if self._ggml_quantization_type in TORCH_COMPATIBLE_QTYPES:
             return self.quantized_data.to(self.compute_dtype)
         elif self._ggml_quantization_type in DEQUANTIZE_FUNCTIONS:
@@ -1,5 +1,6 @@
 # Largely based on https://github.com/city96/ComfyUI-GGUF
 
+from functools import lru_cache
 from typing import Callable, Optional, Union
 
 import gguf
@@ -13,6 +14,21 @@ QK_K = 256
 K_SCALE_SIZE = 12
 
 
+@lru_cache(maxsize=None)
+def _bit_shifts(
+    values: tuple[int, ...], shape: tuple[int, ...], device: torch.device, dtype: torch.dtype = torch.uint8
+) -> torch.Tensor:
+    """Get a (cached) tensor of bit-shift amounts used to unpack the quantized values of many blocks at once.
+
+    The dequantize kernels process all blocks of a tensor in a single batch of ops. Building these small constant
+    tensors on every call (with a host-to-device copy for each one on GPU) is a noticeable part of the per-call
+    overhead, so they are built once per device. They are built outside of inference mode so that they can be used in
+    either mode.
+    """
+    with torch.inference_mode(False):
+        return torch.tensor(values, device=device, dtype=dtype).reshape(shape)
+
+
 def get_scale_min(scales: torch.Tensor):
     n_blocks = scales.shape[0]
     scales = scales.view(torch.uint8)
@@ -46,10 +62,8 @@ def dequantize_blocks_Q5_1(
     m = m.view(torch.float16).to(dtype)
     qh = to_uint32(qh)
 
-    qh = qh.reshape((n_blocks, 1)) >> torch.arange(32, device=d.device, dtype=torch.int32).reshape(1, 32)
-    ql = qs.reshape((n_blocks, -1, 1, block_size // 2)) >> torch.tensor(
-        [0, 4], device=d.device, dtype=torch.uint8
-    ).reshape(1, 1, 2, 1)
+    qh = qh.reshape((n_blocks, 1)) >> _bit_shifts(tuple(range(32)), (1, 32), d.device, torch.int32)
+    ql = qs.reshape((n_blocks, -1, 1, block_size // 2)) >> _bit_shifts((0, 4), (1, 1, 2, 1), d.device)
     qh = (qh & 1).to(torch.uint8)
     ql = (ql & 0x0F).reshape((n_blocks, -1))
 
@@ -66,10 +80,8 @@ def dequantize_blocks_Q5_0(
     d = d.view(torch.float16).to(dtype)
     qh = to_uint32(qh)
 
-    qh = qh.reshape(n_blocks, 1) >> torch.arange(32, device=d.device, dtype=torch.int32).reshape(1, 32)
-    ql = qs.reshape(n_blocks, -1, 1, block_size // 2) >> torch.tensor(
-        [0, 4], device=d.device, dtype=torch.uint8
-    ).reshape(1, 1, 2, 1)
+    qh = qh.reshape(n_blocks, 1) >> _bit_shifts(tuple(range(32)), (1, 32), d.device, torch.int32)
+    ql = qs.reshape(n_blocks, -1, 1, block_size // 2) >> _bit_shifts((0, 4), (1, 1, 2, 1), d.device)
 
     qh = (qh & 1).to(torch.uint8)
     ql = (ql & 0x0F).reshape(n_blocks, -1)
@@ -87,9 +99,7 @@ def dequantize_blocks_Q4_1(
     d = d.view(torch.float16).to(dtype)
     m = m.view(torch.float16).to(dtype)
 
-    qs = qs.reshape((n_blocks, -1, 1, block_size // 2)) >> torch.tensor(
-        [0, 4], device=d.device, dtype=torch.uint8
-    ).reshape(1, 1, 2, 1)
+    qs = qs.reshape((n_blocks, -1, 1, block_size // 2)) >> _bit_shifts((0, 4), (1, 1, 2, 1), d.device)
     qs = (qs & 0x0F).reshape(n_blocks, -1)
 
     return (d * qs) + m
@@ -103,9 +113,7 @@ def dequantize_blocks_Q4_0(
     d, qs = split_block_dims(blocks, 2)
     d = d.view(torch.float16).to(dtype)
 
-    qs = qs.reshape((n_blocks, -1, 1, block_size // 2)) >> torch.tensor(
-        [0, 4], device=d.device, dtype=torch.uint8
-    ).reshape((1, 1, 2, 1))
+    qs = qs.reshape((n_blocks, -1, 1, block_size // 2)) >> _bit_shifts((0, 4), (1, 1, 2, 1), d.device)
     qs = (qs & 0x0F).reshape((n_blocks, -1)).to(torch.int8) - 8
     return d * qs
 
@@ -132,13 +140,9 @@ def dequantize_blocks_Q6_K(
     d = d.view(torch.float16).to(dtype)
     d = (d * scales).reshape((n_blocks, QK_K // 16, 1))
 
-    ql = ql.reshape((n_blocks, -1, 1, 64)) >> torch.tensor([0, 4], device=d.device, dtype=torch.uint8).reshape(
-        (1, 1, 2, 1)
-    )
+    ql = ql.reshape((n_blocks, -1, 1, 64)) >> _bit_shifts((0, 4), (1, 1, 2, 1), d.device)
     ql = (ql & 0x0F).reshape((n_blocks, -1, 32))
-    qh = qh.reshape((n_blocks, -1, 1, 32)) >> torch.tensor([0, 2, 4, 6], device=d.device, dtype=torch.uint8).reshape(
-        (1, 1, 4, 1)
-    )
+    qh = qh.reshape((n_blocks, -1, 1, 32)) >> _bit_shifts((0, 2, 4, 6), (1, 1, 4, 1), d.device)
     qh = (qh & 0x03).reshape((n_blocks, -1, 32))
     q = (ql | (qh << 4)).to(torch.int8) - 32
     q = q.reshape((n_blocks, QK_K // 16, -1))
@@ -161,12 +165,8 @@ def dequantize_blocks_Q5_K(
     d = (d * sc).reshape((n_blocks, -1, 1))
     dm = (dmin * m).reshape((n_blocks, -1, 1))
 
-    ql = qs.reshape((n_blocks, -1, 1, 32)) >> torch.tensor([0, 4], device=d.device, dtype=torch.uint8).reshape(
-        (1, 1, 2, 1)
-    )
-    qh = qh.reshape((n_blocks, -1, 1, 32)) >> torch.tensor(list(range(8)), device=d.device, dtype=torch.uint8).reshape(
-        (1, 1, 8, 1)
-    )
+    ql = qs.reshape((n_blocks, -1, 1, 32)) >> _bit_shifts((0, 4), (1, 1, 2, 1), d.device)
+    qh = qh.reshape((n_blocks, -1, 1, 32)) >> _bit_shifts((0, 1, 2, 3, 4, 5, 6, 7), (1, 1, 8, 1), d.device)
     ql = (ql & 0x0F).reshape((n_blocks, -1, 32))
     qh = (qh & 0x01).reshape((n_blocks, -1, 32))
     q = ql | (qh << 4)
@@ -188,9 +188,7 @@ def dequantize_blocks_Q4_K(
     d = (d * sc).reshape((n_blocks, -1, 1))
     dm = (dmin * m).reshape((n_blocks, -1, 1))
 
-    qs = qs.reshape((n_blocks, -1, 1, 32)) >> torch.tensor([0, 4], device=d.device, dtype=torch.uint8).reshape(
-        (1, 1, 2, 1)
-    )
+    qs = qs.reshape((n_blocks, -1, 1, 32)) >> _bit_shifts((0, 4), (1, 1, 2, 1), d.device)
     qs = (qs & 0x0F).reshape((n_blocks, -1, 32))
 
     return (d * qs - dm).reshape((n_blocks, QK_K))
@@ -205,25 +203,17 @@ def dequantize_blocks_Q3_K(
     d = d.view(torch.float16).to(dtype)
 
     lscales, hscales = scales[:, :8], scales[:, 8:]
-    lscales = lscales.reshape((n_blocks, 1, 8)) >> torch.tensor([0, 4], device=d.device, dtype=torch.uint8).reshape(
-        (1, 2, 1)
-    )
+    lscales = lscales.reshape((n_blocks, 1, 8)) >> _bit_shifts((0, 4), (1, 2, 1), d.device)
     lscales = lscales.reshape((n_blocks, 16))
-    hscales = hscales.reshape((n_blocks, 1, 4)) >> torch.tensor(
-        [0, 2, 4, 6], device=d.device, dtype=torch.uint8
-    ).reshape((1, 4, 1))
+    hscales = hscales.reshape((n_blocks, 1, 4)) >> _bit_shifts((0, 2, 4, 6), (1, 4, 1), d.device)
     hscales = hscales.reshape((n_blocks, 16))
     scales = (lscales & 0x0F) | ((hscales & 0x03) << 4)
     scales = scales.to(torch.int8) - 32
 
     dl = (d * scales).reshape((n_blocks, 16, 1))
 
-    ql = qs.reshape((n_blocks, -1, 1, 32)) >> torch.tensor([0, 2, 4, 6], device=d.device, dtype=torch.uint8).reshape(
-        (1, 1, 4, 1)
-    )
-    qh = hmask.reshape(n_blocks, -1, 1, 32) >> torch.tensor(list(range(8)), device=d.device, dtype=torch.uint8).reshape(
-        (1, 1, 8, 1)
-    )
+    ql = qs.reshape((n_blocks, -1, 1, 32)) >> _bit_shifts((0, 2, 4, 6), (1, 1, 4, 1), d.device)
+    qh = hmask.reshape(n_blocks, -1, 1, 32) >> _bit_shifts((0, 1, 2, 3, 4, 5, 6, 7), (1, 1, 8, 1), d.device)
     ql = ql.reshape((n_blocks, 16, QK_K // 16)) & 3
     qh = (qh.reshape((n_blocks, 16, QK_K // 16)) & 1) ^ 1
     q = ql.to(torch.int8) - (qh << 2).to(torch.int8)
@@ -244,7 +234,7 @@ def dequantize_blocks_Q2_K(
     dl = (d * (scales & 0xF)).reshape((n_blocks, QK_K // 16, 1))
     ml = (dmin * (scales >> 4)).reshape((n_blocks, QK_K // 16, 1))
 
-    shift = torch.tensor([0, 2, 4, 6], device=d.device, dtype=torch.uint8).reshape((1, 1, 4, 1))
+    shift = _bit_shifts((0, 2, 4, 6), (1, 1, 4, 1), d.device)
 
     qs = (qs.reshape((n_blocks, -1, 1, 32)) >> shift) & 3
     qs = qs.reshape((n_blocks, QK_K // 16, 16))
@@ -1,8 +1,13 @@
 from contextlib import contextmanager
+from fractions import Fraction
+from typing import Callable, Optional
 
+import torch
 from diffusers.models.autoencoders.autoencoder_kl import AutoencoderKL
 from diffusers.models.autoencoders.autoencoder_tiny import AutoencoderTiny
 
+from invokeai.app.services.session_processor.session_processor_common import CanceledException
+
 
 @contextmanager
 def patch_vae_tiling_params(
@@ -33,3 +38,179 @@ def patch_vae_tiling_params(
         vae.tile_sample_min_size = orig_tile_sample_min_size
         vae.tile_latent_min_size = orig_tile_latent_min_size
         vae.tile_overlap_factor = orig_tile_overlap_factor
+
+
+# The fraction of the compute device's total memory that a tiled VAE decode or encode may plan to use as working
+# memory. The rest is left for the VAE weights, other models that the cache keeps resident, and allocator overhead.
+_VAE_WORKING_MEMORY_FRACTION = 0.7
+
+
+def vae_working_memory_budget(device: torch.device) -> Optional[int]:
+    """Get the working memory available to a VAE decode or encode on the given device, in bytes.
+
+    Returns None if the device does not have a fixed memory size to plan against (CPU, MPS).
+    """
+    if device.type == "cuda":
+        total_memory = torch.cuda.get_device_properties(device).total_memory
+    elif device.type == "xpu":
+        total_memory = torch.xpu.get_device_properties(device).total_memory
+    else:
+        return None
+    return int(total_memory * _VAE_WORKING_MEMORY_FRACTION)
+
+
+def plan_vae_tile_size(
+    input_height: int,
+    input_width: int,
+    estimate_working_memory: Callable[[int, int], int],
+    working_memory_budget: Optional[int],
+    alignment: int = 8,
+    min_tile_size: int = 32,
+    force_tiling: bool = False,
+    default_tile_size: int = 64,
+) -> Optional[int]:
+    """Plan the tile size for a tiled VAE decode or encode.
+
+    Args:
+        input_height (int): The height of the VAE's input (latents for a decode, pixels for an encode).
+        input_width (int): The width of the VAE's input.
+        estimate_working_memory (Callable[[int, int], int]): Estimates the working memory of running the VAE on an
+            input of the given (height, width), in bytes. Typically wraps one of the `estimate_vae_working_memory_*`
+            functions.
+        working_memory_budget (Optional[int]): The working memory available, in bytes. None if there is no limit.
+        alignment (int): The tile size is a multiple of this.
+        min_tile_size (int): The smallest tile size to use, even if its estimated working memory does not fit in the
+            budget.
+        force_tiling (bool): Tile even if the whole input fits in the budget.
+        default_tile_size (int): The tile size to use if tiling is forced and there is no budget.
+
+    Returns:
+        The largest square tile size whose estimated working memory fits in the budget, or None if the input should
+        not be tiled.
+    """
+    if working_memory_budget is None:
+        return default_tile_size if force_tiling else None
+    if not force_tiling and estimate_working_memory(input_height, input_width) <= working_memory_budget:
+        return None
+
+    tile_size = max(min_tile_size, max(input_height, input_width) // alignment * alignment)
+    while tile_size > min_tile_size and estimate_working_memory(tile_size, tile_size) > working_memory_budget:
+        tile_size -= alignment
+    return max(tile_size, min_tile_size)
+
+
+def _tile_ranges(length: int, tile_size: int, overlap: int, alignment: int) -> list[tuple[int, int]]:
+    """Split an axis into overlapping tile ranges, with starts aligned to `alignment`. The last tile ends at `length`,
+    and may be up to `alignment - 1` larger than `tile_size`."""
+    if length <= tile_size:
+        return [(0, length)]
+    stride = max(alignment, (tile_size - overlap) // alignment * alignment)
+    last_start = (length - tile_size) // alignment * alignment
+    starts = list(range(0, last_start, stride)) + [last_start]
+    return [(start, start + tile_size) for start in starts[:-1]] + [(last_start, length)]
+
+
+def _ramp(length: int, ramp_length: int, ramp_start: bool, ramp_end: bool) -> torch.Tensor:
+    """A 1D blending weight that rises linearly over `ramp_length` at the start and falls at the end. All weights are
+    positive."""
+    weight = torch.ones(length)
+    ramp_length = min(ramp_length, length)
+    ramp = torch.arange(1, ramp_length + 1, dtype=torch.float32) / (ramp_length + 1)
+    if ramp_start and ramp_length > 0:
+        weight[:ramp_length] = torch.minimum(weight[:ramp_length], ramp)
+    if ramp_end and ramp_length > 0:
+        weight[-ramp_length:] = torch.minimum(weight[-ramp_length:], ramp.flip(0))
+    return weight
+
+
+def run_vae_tiled(
+    x: torch.Tensor,
+    run_vae: Callable[[torch.Tensor], torch.Tensor],
+    tile_size: int,
+    overlap: int,
+    alignment: int = 1,
+    output_device: torch.device = torch.device("cpu"),
+    is_canceled: Optional[Callable[[], bool]] = None,
+    step_callback: Optional[Callable[[int, int], None]] = None,
+) -> torch.Tensor:
+    """Run a VAE decode or encode over overlapping tiles of its input, one tile at a time, and blend the outputs.
+
+    The tiles overlap by at least `overlap` along both spatial axes. In the overlap, the outputs of neighbouring tiles
+    are blended with linear weights, which hides the seams. Only one tile is run on the VAE's device at a time, and the
+    full-size output is accumulated on `output_device`, so the peak working memory on the VAE's device depends only on
+    the tile size.
+
+    The VAE may be any model that maps (..., H, W) -> (..., H * s, W * s) for a fixed spatial scale s, e.g. s = 8 for a
+    decode and s = 1/8 for an encode. The leading dimensions (batch, channels, frames) may differ between the input and
+    the output.
+
+    Args:
+        x (torch.Tensor): The input, e.g. latents for a decode. Shape: (..., H, W).
+        run_vae (Callable[[torch.Tensor], torch.Tensor]): Runs the VAE on one input tile. The tile is a view of `x`,
+            on the device of `x`.
+        tile_size (int): The tile size, in input pixels.
+        overlap (int): The minimum overlap between neighbouring tiles, in input pixels.
+        alignment (int): Tile starts are multiples of this. For an encode, use the VAE's downscaling factor so that
+            every tile maps to a whole number of latent pixels.
+        output_device (torch.device): The device on which to accumulate the output.
+        is_canceled (Optional[Callable[[], bool]]): Checked before each tile. Raises `CanceledException` if it returns
+            True.
+        step_callback (Optional[Callable[[int, int], None]]): Called with the number of processed tiles and the total
+            number of tiles, starting with 0.
+
+    Returns:
+        The blended output, on `output_device`, in the dtype of the VAE's output.
+    """
+    height, width = x.shape[-2:]
+    y_ranges = _tile_ranges(height, tile_size, overlap, alignment)
+    x_ranges = _tile_ranges(width, tile_size, overlap, alignment)
+    total_tiles = len(y_ranges) * len(x_ranges)
+
+    output: Optional[torch.Tensor] = None
+    weight_sum: Optional[torch.Tensor] = None
+    scale = Fraction(1)
+    if step_callback is not None:
+        step_callback(0, total_tiles)
+
+    for i, (y_start, y_end) in enumerate(y_ranges):
+        for j, (x_start, x_end) in enumerate(x_ranges):
+            if is_canceled is not None and is_canceled():
+                raise CanceledException
+
+            tile_output = run_vae(x[..., y_start:y_end, x_start:x_end])
+
+            if output is None:
+                # Infer the output shape and spatial scale from the first tile.
+                scale = Fraction(tile_output.shape[-1], x_end - x_start)
+                output_shape = (*tile_output.shape[:-2], int(height * scale), int(width * scale))
+                output = torch.zeros(output_shape, dtype=torch.float32, device=output_device)
+                weight_sum = torch.zeros(output_shape[-2:], dtype=torch.float32, device=output_device)
+            assert weight_sum is not None
+
+            out_bounds = [bound * scale for bound in (y_start, y_end, x_start, x_end)]
+            out_y_start, out_y_end, out_x_start, out_x_end = (int(bound) for bound in out_bounds)
+            if any(bound.denominator != 1 for bound in out_bounds) or tile_output.shape[-2:] != (
+                out_y_end - out_y_start,
+                out_x_end - out_x_start,
+            ):
+                raise ValueError(
+                    f"The VAE output for the tile at ({y_start}, {x_start}) has shape {tuple(tile_output.shape)}, "
+                    f"which does not match a spatial scale of {scale}. Use an alignment that is a multiple of the "
+                    "VAE's downscaling factor."
+                )
+
+            out_overlap = int(overlap * scale)
+            weight = torch.outer(
+                _ramp(out_y_end - out_y_start, out_overlap, ramp_start=i > 0, ramp_end=i < len(y_ranges) - 1),
+                _ramp(out_x_end - out_x_start, out_overlap, ramp_start=j > 0, ramp_end=j < len(x_ranges) - 1),
+            ).to(device=output_device)
+            output[..., out_y_start:out_y_end, out_x_start:out_x_end] += (
+                tile_output.to(device=output_device, dtype=torch.float32) * weight
+            )
+            weight_sum[out_y_start:out_y_end, out_x_start:out_x_end] += weight
+
+            if step_callback is not None:
+                step_callback(i * len(x_ranges) + j + 1, total_tiles)
+
+    assert output is not None and weight_sum is not None
+    return (output / weight_sum).to(dtype=tile_output.dtype)
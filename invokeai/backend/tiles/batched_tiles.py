@@ -0,0 +1,135 @@
+from typing import Callable, Optional
+
+import torch
+from tqdm import tqdm
+
+from invokeai.app.services.session_processor.session_processor_common import CanceledException
+
+# Rough working memory of an image-to-image (upscaling) model, in bytes per output pixel per element byte. ESRGAN-style
+# models keep a few 64-channel feature maps at the output resolution alive during their final upsampling convolutions,
+# which dominates their peak memory. This has not been calibrated across the many architectures that spandrel
+# supports, so it errs on the side of being conservative. Experimentally-tunable.
+_UPSCALE_WORKING_MEMORY_SCALING_CONSTANT = 200
+
+
+def estimate_upscale_tile_working_memory(tile_height: int, tile_width: int, scale: int, element_size: int) -> int:
+    """Estimate the working memory required to run an image-to-image model on one tile, in bytes.
+
+    Args:
+        tile_height (int): The height of the input tile in px.
+        tile_width (int): The width of the input tile in px.
+        scale (int): The scale of the model (e.g. 1x, 2x, 4x, etc.).
+        element_size (int): The size of the model's dtype in bytes.
+    """
+    output_pixels = tile_height * scale * tile_width * scale
+    return output_pixels * element_size * _UPSCALE_WORKING_MEMORY_SCALING_CONSTANT
+
+
+def calc_tile_batch_size(
+    tile_height: int,
+    tile_width: int,
+    scale: int,
+    element_size: int,
+    working_memory_budget: int,
+    max_batch_size: int,
+) -> int:
+    """Calculate how many tiles of the given size can be run through an image-to-image model at once.
+
+    The batch size is the largest that keeps the estimated working memory of the batch within
+    `working_memory_budget`, up to `max_batch_size`. It is always at least 1, because a single tile has to be run
+    regardless of the budget.
+    """
+    per_tile = estimate_upscale_tile_working_memory(tile_height, tile_width, scale, element_size)
+    return max(1, min(max_batch_size, working_memory_budget // max(per_tile, 1)))
+
+
+def _make_batches(tile_sizes: list[tuple[int, int]], batch_size: int) -> list[list[int]]:
+    """Group the indices of equal-sized tiles into batches of up to `batch_size` tiles, keeping the tile order within
+    each size."""
+    indices_by_size: dict[tuple[int, int], list[int]] = {}
+    for i, size in enumerate(tile_sizes):
+        indices_by_size.setdefault(size, []).append(i)
+
+    batches: list[list[int]] = []
+    for indices in indices_by_size.values():
+        batches.extend(indices[start : start + batch_size] for start in range(0, len(indices), batch_size))
+    return batches
+
+
+def run_tiles_batched(
+    tile_sizes: list[tuple[int, int]],
+    get_input_tile: Callable[[int], torch.Tensor],
+    run_model: Callable[[torch.Tensor], torch.Tensor],
+    put_output_tiles: Callable[[list[int], torch.Tensor], None],
+    device: torch.device,
+    dtype: torch.dtype,
+    batch_size: int,
+    is_canceled: Optional[Callable[[], bool]] = None,
+    step_callback: Optional[Callable[[int, int], None]] = None,
+) -> None:
+    """Run a model over a set of image tiles, in batches of equal-sized tiles.
+
+    While the model runs on one batch, the next batch is prepared on the CPU and, on CUDA devices, copied to the device
+    on a separate stream from pinned memory, so that the host-to-device transfer overlaps with the forward pass.
+
+    Batches group tiles by size, so `put_output_tiles` is not necessarily called in tile order. Callers must write the
+    outputs of different tiles to disjoint regions, or otherwise not depend on the order.
+
+    Args:
+        tile_sizes (list[tuple[int, int]]): The (height, width) of each input tile.
+        get_input_tile (Callable[[int], torch.Tensor]): Returns the input tile at the given index, on the CPU.
+            Shape: (C, H, W).
+        run_model (Callable[[torch.Tensor], torch.Tensor]): Runs the model on a batch of tiles on `device`.
+            Shape: (N, C, H, W) -> (N, C', H', W').
+        put_output_tiles (Callable[[list[int], torch.Tensor], None]): Called with the tile indices of a batch and the
+            model's output for the batch, on `device`.
+        device (torch.device): The device to run the model on.
+        dtype (torch.dtype): The dtype of the model's input.
+        batch_size (int): The maximum number of tiles per batch.
+        is_canceled (Optional[Callable[[], bool]]): Checked before each batch. Raises `CanceledException` if it returns
+            True.
+        step_callback (Optional[Callable[[int, int], None]]): Called with the number of processed tiles and the total
+            number of tiles, starting with 0.
+    """
+    batches = _make_batches(tile_sizes, max(1, batch_size))
+    total_tiles = len(tile_sizes)
+    copy_stream = torch.cuda.Stream(device) if device.type == "cuda" else None
+
+    def upload(indices: list[int]) -> torch.Tensor:
+        batch = torch.stack([get_input_tile(i) for i in indices]).to(dtype=dtype)
+        if copy_stream is None:
+            return batch.to(device=device)
+        batch = batch.pin_memory()
+        with torch.cuda.stream(copy_stream):
+            return batch.to(device=device, non_blocking=True)
+
+    if step_callback is not None:
+        step_callback(0, total_tiles)
+
+    processed_tiles = 0
+    next_batch = upload(batches[0]) if batches else None
+    with tqdm(total=total_tiles, desc="Upscaling Tiles") as pbar:
+        for batch_index, indices in enumerate(batches):
+            # Exit early if the invocation has been canceled.
+            if is_canceled is not None and is_canceled():
+                raise CanceledException
+
+            assert next_batch is not None
+            batch = next_batch
+            if copy_stream is not None:
+                # The batch was copied on the copy stream. Make the compute stream wait for the copy, and tell the
+                # allocator that the compute stream uses the batch.
+                compute_stream = torch.cuda.current_stream(device)
+                compute_stream.wait_stream(copy_stream)
+                batch.record_stream(compute_stream)
+
+            # On CUDA, the forward pass is queued asynchronously, so the next batch is cropped and uploaded while it
+            # runs.
+            output = run_model(batch)
+            next_batch = upload(batches[batch_index + 1]) if batch_index + 1 < len(batches) else None
+            put_output_tiles(indices, output)
+
+            processed_tiles += len(indices)
+            pbar.update(len(indices))
+            if step_callback is not None:
+                step_callback(processed_tiles, total_tiles)
@@ -0,0 +1,223 @@
+import struct
+import zlib
+from pathlib import Path
+from typing import BinaryIO, Callable, Literal, Optional, Union
+
+import numpy as np
+
+from invokeai.backend.tiles.utils import Tile, calc_seam_mask
+
+# Called with the range [start, end) of destination rows that no later tile row will modify.
+RowsCompleteCallback = Callable[[int, int], None]
+
+# The number of rows that are blended at once, to bound the size of the float32 temporaries.
+_BLEND_CHUNK_ROWS = 64
+
+
+def _group_tiles_into_rows(tiles: list[Tile]) -> list[list[int]]:
+    """Group tile indices into rows, ordered top-to-bottom, and left-to-right within each row."""
+    order = sorted(range(len(tiles)), key=lambda i: (tiles[i].coords.top, tiles[i].coords.left))
+    rows: list[list[int]] = []
+    for i in order:
+        first_tile_in_row = tiles[rows[-1][0]] if rows else None
+        if (
+            first_tile_in_row is None
+            or tiles[i].coords.top != first_tile_in_row.coords.top
+            or tiles[i].coords.bottom != first_tile_in_row.coords.bottom
+        ):
+            rows.append([])
+        rows[-1].append(i)
+    return rows
+
+
+def _linear_blend(dst: np.ndarray, src: np.ndarray, gradient: np.ndarray) -> None:
+    """Blend `src` into `dst` in place, as `src * gradient + dst * (1 - gradient)`."""
+    dst[:] = src * gradient + dst * (1.0 - gradient)
+
+
+def _seam_blend(dst: np.ndarray, src: np.ndarray, blend_amount: int, x_seam: bool) -> None:
+    """Blend `src` into `dst` in place along a seam of least energy, like `seam_blend()`."""
+    mask = calc_seam_mask(dst, src, blend_amount, x_seam).astype(np.float32)[..., np.newaxis]
+    for start in range(0, dst.shape[0], _BLEND_CHUNK_ROWS):
+        end = start + _BLEND_CHUNK_ROWS
+        dst[start:end] = dst[start:end] * mask[start:end] + src[start:end] * (1.0 - mask[start:end])
+
+
+def merge_tiles_streaming(
+    dst_image: np.ndarray,
+    tiles: list[Tile],
+    get_tile_image: Callable[[int], np.ndarray],
+    blend_mode: Literal["Linear", "Seam"],
+    blend_amount: int,
+    on_rows_complete: Optional[RowsCompleteCallback] = None,
+) -> None:
+    """Merge a set of image tiles into `dst_image`, one row of tiles at a time.
+
+    This produces the same result as `merge_tiles_with_linear_blending()` and `merge_tiles_with_seam_blending()` (up to
+    rounding), with bounded memory use:
+    - Tile images are requested with `get_tile_image` when their row is merged, so only one row of tiles has to be in
+      memory at a time.
+    - Blending is done in float32, only over the overlaps, and in chunks of rows. For linear blending, the strips of all
+      tiles share the same precomputed gradient.
+    - `dst_image` can be a memory-mapped array, and `on_rows_complete` can stream the finished rows to an encoder (see
+      `PngRowWriter`).
+
+    Args:
+        dst_image (np.ndarray): The destination image. Shape: (H, W, C).
+        tiles (list[Tile]): The tiles to merge.
+        get_tile_image (Callable[[int], np.ndarray]): Returns the image of the tile at the given index in `tiles`.
+            Shape: (tile H, tile W, C).
+        blend_mode (Literal["Linear", "Seam"]): How to blend adjacent tiles.
+        blend_amount (int): The amount of blending (in px) between adjacent overlapping tiles. Must be <= the overlap
+            between adjacent tiles.
+        on_rows_complete (Optional[RowsCompleteCallback]): Called with the range of `dst_image` rows that are final,
+            after each row of tiles. The ranges are contiguous and cover the whole image.
+    """
+    if blend_mode not in ("Linear", "Seam"):
+        raise ValueError(f"Unsupported blend mode: '{blend_mode}'.")
+
+    # The gradient is centered in the middle of each overlap. Shape: (blend_amount,).
+    gradient = np.linspace(start=0.0, stop=1.0, num=blend_amount, dtype=np.float32)
+    horizontal_gradient = gradient.reshape((1, blend_amount, 1))
+    vertical_gradient = gradient.reshape((blend_amount, 1, 1))
+
+    tile_rows = _group_tiles_into_rows(tiles)
+    rows_completed = 0
+    row_image: Optional[np.ndarray] = None
+    for row_index, tile_row in enumerate(tile_rows):
+        first_tile_in_row = tiles[tile_row[0]]
+        top = first_tile_in_row.coords.top
+        bottom = first_tile_in_row.coords.bottom
+        if row_image is None or row_image.shape[0] != bottom - top:
+            row_image = np.zeros((bottom - top, dst_image.shape[1], dst_image.shape[2]), dtype=dst_image.dtype)
+
+        # Blend the tiles in the row horizontally.
+        for tile_index in tile_row:
+            tile = tiles[tile_index]
+            tile_image = get_tile_image(tile_index)
+            left, right = tile.coords.left, tile.coords.right
+            overlap = tile.overlap.left
+            if tile_image.shape[:2] != (bottom - top, right - left):
+                raise ValueError(f"Tile image shape {tile_image.shape} does not match tile {tile.coords}.")
+            if overlap == 0:
+                row_image[:, left:right] = tile_image
+                continue
+
+            assert overlap >= blend_amount
+            if blend_mode == "Linear":
+                # Left of the blend strip, the tiles that were already pasted are kept.
+                blend_start = overlap // 2 - blend_amount // 2
+                blend_end = blend_start + blend_amount
+                _linear_blend(
+                    row_image[:, left + blend_start : left + blend_end],
+                    tile_image[:, blend_start:blend_end],
+                    horizontal_gradient,
+                )
+                row_image[:, left + blend_end : right] = tile_image[:, blend_end:]
+            else:
+                _seam_blend(row_image[:, left : left + overlap], tile_image[:, :overlap], blend_amount, x_seam=False)
+                row_image[:, left + overlap : right] = tile_image[:, overlap:]
+
+        # Blend the row into the dst_image vertically. We assume that the entire row has the same vertical overlaps as
+        # the first_tile_in_row.
+        overlap = first_tile_in_row.overlap.top
+        if overlap == 0:
+            dst_image[top:bottom] = row_image
+        else:
+            assert overlap >= blend_amount
+            if blend_mode == "Linear":
+                blend_start = overlap // 2 - blend_amount // 2
+                blend_end = blend_start + blend_amount
+                _linear_blend(
+                    dst_image[top + blend_start : top + blend_end],
+                    row_image[blend_start:blend_end],
+                    vertical_gradient,
+                )
+                dst_image[top + blend_end : bottom] = row_image[blend_end:]
+            else:
+                _seam_blend(dst_image[top : top + overlap], row_image[:overlap], blend_amount, x_seam=True)
+                dst_image[top + overlap : bottom] = row_image[overlap:]
+
+        # The next row of tiles only modifies the rows from its top down.
+        is_last_row = row_index == len(tile_rows) - 1
+        next_top = dst_image.shape[0] if is_last_row else tiles[tile_rows[row_index + 1][0]].coords.top
+        if next_top > rows_completed:
+            if on_rows_complete is not None:
+                on_rows_complete(rows_completed, next_top)
+            rows_completed = next_top
+
+
+class PngRowWriter:
+    """Encodes an 8-bit PNG file from successive rows of pixels, so that the whole image never has to be encoded at once.
+
+    Usage:
+        with PngRowWriter(path, width, height, channels=3) as writer:
+            writer.write_rows(rows)  # Shape: (N, width, channels), uint8.
+    """
+
+    _COLOR_TYPES = {1: 0, 2: 4, 3: 2, 4: 6}
+
+    def __init__(
+        self, file: Union[Path, BinaryIO], width: int, height: int, channels: int, compress_level: int = 1
+    ) -> None:
+        if channels not in self._COLOR_TYPES:
+            raise ValueError(f"Unsupported number of channels: {channels}")
+        self._owns_file = isinstance(file, Path)
+        self._file: BinaryIO = open(file, "wb") if isinstance(file, Path) else file
+        self._width = width
+        self._height = height
+        self._channels = channels
+        self._rows_written = 0
+        self._compressor = zlib.compressobj(compress_level)
+
+        self._file.write(b"\x89PNG\r\n\x1a\n")
+        # 8 bits per channel, deflate compression, adaptive filtering, no interlacing.
+        self._write_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, self._COLOR_TYPES[channels], 0, 0, 0))
+
+    def write_rows(self, rows: np.ndarray) -> None:
+        if rows.dtype != np.uint8 or rows.shape[1:] != (self._width, self._channels):
+            raise ValueError(f"Expected uint8 rows of shape (N, {self._width}, {self._channels}), got {rows.shape}.")
+        if self._rows_written + rows.shape[0] > self._height:
+            raise ValueError("More rows were written than the image height.")
+
+        # Apply the PNG "Sub" filter to every row: each byte is stored as the difference to the same channel of the
+        # pixel to its left. This compresses much better than unfiltered rows for typical images.
+        flat_rows = rows.reshape((rows.shape[0], -1))
+        filtered = np.empty((rows.shape[0], flat_rows.shape[1] + 1), dtype=np.uint8)
+        filtered[:, 0] = 1
+        filtered[:, 1 : 1 + self._channels] = flat_rows[:, : self._channels]
+        np.subtract(
+            flat_rows[:, self._channels :], flat_rows[:, : -self._channels], out=filtered[:, 1 + self._channels :]
+        )
+
+        data = self._compressor.compress(filtered.tobytes())
+        if data:
+            self._write_chunk(b"IDAT", data)
+        self._rows_written += rows.shape[0]
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        try:
+            if self._rows_written != self._height:
+                raise ValueError(f"Only {self._rows_written} of {self._height} rows were written.")
+            self._write_chunk(b"IDAT", self._compressor.flush())
+            self._write_chunk(b"IEND", b"")
+        finally:
+            if self._owns_file:
+                self._file.close()
+
+    def __enter__(self) -> "PngRowWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.close()
+        elif self._owns_file:
+            self._file.close()
+
+    def _write_chunk(self, chunk_type: bytes, data: bytes) -> None:
+        self._file.write(struct.pack(">I", len(data)))
+        self._file.write(chunk_type)
+        self._file.write(data)
+        self._file.write(struct.pack(">I", zlib.crc32(data, zlib.crc32(chunk_type))))
@@ -60,6 +60,34 @@ def seam_blend(ia1: np.ndarray, ia2: np.ndarray, blend_amount: int, x_seam: bool
         x_seam (bool): If the images should be blended on the x axis or not.
         blend_amount (int): The size of the blur to use on the seam. Half of this value will be used to avoid the edges of the image.
     """
+    mask = calc_seam_mask(ia1, ia2, blend_amount, x_seam)
+
+    # copy ia2 over ia1 while applying the seam mask
+    mask = np.expand_dims(mask, -1)
+    blended_image = ia1 * mask + ia2 * (1.0 - mask)
+
+    # for visual debugging
+    # i1 = Image.fromarray(ia1.astype("uint8"))
+    # i2 = Image.fromarray(ia2.astype("uint8"))
+    # b_image = Image.fromarray(blended_image.astype("uint8"))
+    # print(f"{ia1.shape}, {ia2.shape}, {mask.shape}, {blended_image.shape}")
+    # print(f"{i1.size}, {i2.size}, {m_image.size}, {b_image.size}")
+
+    return blended_image
+
+
+def calc_seam_mask(ia1: np.ndarray, ia2: np.ndarray, blend_amount: int, x_seam: bool) -> np.ndarray:
+    """Calculate the mask that seam_blend() applies to blend two overlapping tile sections.
+
+    Args:
+        ia1 (np.array): Image array 1 Shape: (H, W, C).
+        ia2 (np.array): Image array 2 Shape: (H, W, C).
+        x_seam (bool): If the images should be blended on the x axis or not.
+        blend_amount (int): The size of the blur to use on the seam.
+
+    Returns:
+        np.ndarray: The weight of ia1 in the blend. Range: [0.0, 1.0], Shape: (H, W).
+    """
     assert ia1.shape == ia2.shape
     assert ia2.size == ia2.size
 
@@ -138,15 +166,4 @@ def seam_blend(ia1: np.ndarray, ia2: np.ndarray, blend_amount: int, x_seam: bool
     # from PIL import Image
     # m_image = Image.fromarray((mask * 255.0).astype("uint8"))
 
-    # copy ia2 over ia1 while applying the seam mask
-    mask = np.expand_dims(mask, -1)
-    blended_image = ia1 * mask + ia2 * (1.0 - mask)
-
-    # for visual debugging
-    # i1 = Image.fromarray(ia1.astype("uint8"))
-    # i2 = Image.fromarray(ia2.astype("uint8"))
-    # b_image = Image.fromarray(blended_image.astype("uint8"))
-    # print(f"{ia1.shape}, {ia2.shape}, {mask.shape}, {blended_image.shape}")
-    # print(f"{i1.size}, {i2.size}, {m_image.size}, {b_image.size}")
-
-    return blended_image
+    return mask
@@ -77,7 +77,7 @@ def estimate_vae_working_memory_cogview4(
 
 
 def estimate_vae_working_memory_flux(
-    operation: Literal["encode", "decode"], image_tensor: torch.Tensor, vae: AutoEncoder
+    operation: Literal["encode", "decode"], image_tensor: torch.Tensor, vae: AutoEncoder | AutoencoderKL
 ) -> int:
     """Estimate the working memory required by the invocation in bytes."""
 
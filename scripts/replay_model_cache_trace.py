@@ -0,0 +1,103 @@
+"""Replay a model cache trace against simulated caches with different budgets.
+
+Record a trace by setting `model_cache_trace_file` in invokeai.yaml, run a typical workload, then compare budgets and
+eviction policies with e.g.:
+
+    python scripts/replay_model_cache_trace.py model_cache_trace.jsonl --ram-gb 12 16 24 --policy lru cost_aware
+
+By default, the budget that the trace was recorded with is replayed.
+"""
+
+import argparse
+import itertools
+from pathlib import Path
+from typing import Optional, get_args
+
+from invokeai.app.services.config.config_default import MODEL_CACHE_EVICTION_POLICY
+from invokeai.backend.model_manager.load.memory_snapshot import GB
+from invokeai.backend.model_manager.load.model_cache.cache_trace import (
+    get_recorded_budget,
+    read_trace,
+    replay_trace,
+    trace_devices,
+)
+from invokeai.backend.model_manager.load.model_cache.eviction_policy import build_eviction_policy
+
+
+def _gb(num_bytes: Optional[int]) -> str:
+    return "-" if num_bytes is None else f"{num_bytes / GB:.2f}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a model cache trace against simulated cache budgets.")
+    parser.add_argument("trace_file", type=Path, help="The trace file, as written with `model_cache_trace_file`.")
+    parser.add_argument("--device", help="The execution device of the cache to replay. Defaults to the first one.")
+    parser.add_argument("--ram-gb", type=float, nargs="+", help="RAM cache sizes to simulate, in GB.")
+    parser.add_argument(
+        "--vram-gb", type=float, nargs="+", help="VRAM sizes to simulate, in GB, including the working memory."
+    )
+    parser.add_argument("--working-mem-gb", type=float, help="The default working memory to simulate, in GB.")
+    parser.add_argument(
+        "--policy",
+        nargs="+",
+        default=["lru"],
+        choices=get_args(MODEL_CACHE_EVICTION_POLICY),
+        help="Eviction policies to simulate.",
+    )
+    parser.add_argument(
+        "--disk-gbps",
+        type=float,
+        default=1.0,
+        help="Load speed assumed for models whose load was not timed in the trace, in GB/s.",
+    )
+    parser.add_argument(
+        "--ram-to-vram-gbps", type=float, default=12.0, help="Speed of moving weights from RAM to VRAM, in GB/s."
+    )
+    args = parser.parse_args()
+
+    events = list(read_trace(args.trace_file))
+    devices = trace_devices(events)
+    if not devices:
+        raise SystemExit(f"No model cache events in {args.trace_file}")
+    device = args.device or devices[0]
+    if device not in devices:
+        raise SystemExit(f"No events for device {device}. The trace has events for: {', '.join(devices)}")
+
+    recorded_ram_bytes, recorded_vram_bytes, recorded_working_mem_bytes = get_recorded_budget(events, device)
+    ram_budgets = [int(gb * GB) for gb in args.ram_gb] if args.ram_gb else [recorded_ram_bytes or 0]
+    vram_budgets = [int(gb * GB) for gb in args.vram_gb] if args.vram_gb else [recorded_vram_bytes or 0]
+    working_mem_bytes = int(args.working_mem_gb * GB) if args.working_mem_gb is not None else recorded_working_mem_bytes
+
+    print(
+        f"Device {device}, recorded with {_gb(recorded_ram_bytes)} GB RAM, {_gb(recorded_vram_bytes)} GB VRAM and"
+        f" {_gb(recorded_working_mem_bytes)} GB working memory."
+    )
+    header = ("policy", "ram_gb", "vram_gb", "requests", "hit_ratio", "disk_gb", "to_vram_gb", "offload_gb", "stall_s")
+    print("".join(f"{h:>12}" for h in header))
+    for policy, ram_bytes, vram_bytes in itertools.product(args.policy, ram_budgets, vram_budgets):
+        result = replay_trace(
+            events,
+            device,
+            ram_bytes=ram_bytes,
+            policy=build_eviction_policy(policy),
+            vram_total_bytes=vram_bytes,
+            working_mem_bytes=working_mem_bytes,
+            disk_bytes_per_second=args.disk_gbps * GB,
+            ram_to_vram_bytes_per_second=args.ram_to_vram_gbps * GB,
+        )
+        row = (
+            policy,
+            _gb(ram_bytes),
+            _gb(vram_bytes),
+            str(result.requests),
+            f"{result.hit_ratio:.3f}",
+            _gb(result.bytes_loaded),
+            _gb(result.bytes_to_vram),
+            _gb(result.bytes_offloaded),
+            f"{result.stall_seconds:.1f}",
+        )
+        print("".join(f"{c:>12}" for c in row))
+
+
+if __name__ == "__main__":
+    main()
@@ -12,6 +12,7 @@ import pytest
 import torch
 from diffusers.models.autoencoders.autoencoder_kl import AutoencoderKL
 
+from invokeai.app.invocations import flux_vae_decode
 from invokeai.app.invocations.flux_vae_decode import FluxVaeDecodeInvocation
 
 
@@ -66,3 +67,30 @@ def test_decode_treats_an_explicit_none_shift_factor_as_no_shift() -> None:
 
     passed = vae_info.model.decode.call_args.args[0]
     assert torch.allclose(passed, latents / 0.3611)
+
+
+def test_decode_is_tiled_when_a_full_decode_does_not_fit(monkeypatch: pytest.MonkeyPatch) -> None:
+    vae_info = _loaded_vae(None)
+    vae_info.model.decode.side_effect = lambda x, return_dict: (
+        torch.nn.functional.interpolate(x[:, :3].clamp(-1, 1), scale_factor=8, mode="nearest"),
+    )
+    reserved: list[int] = []
+
+    @contextmanager
+    def _on_device(working_mem_bytes=None):
+        reserved.append(working_mem_bytes)
+        yield (None, vae_info.model)
+
+    vae_info.model_on_device = _on_device
+    latents = torch.zeros(1, 16, 96, 96)
+    full_decode_working_memory = 96 * 8 * 96 * 8 * 4 * 2200
+    monkeypatch.setattr(flux_vae_decode, "vae_working_memory_budget", lambda device: full_decode_working_memory // 4)
+
+    image = FluxVaeDecodeInvocation._vae_decode(
+        FluxVaeDecodeInvocation.model_construct(), vae_info=vae_info, latents=latents
+    )
+
+    assert image.size == (768, 768)
+    assert vae_info.model.decode.call_count > 1
+    assert all(call.args[0].shape[-1] <= 48 for call in vae_info.model.decode.call_args_list)
+    assert reserved == [48 * 8 * 48 * 8 * 4 * 2200]
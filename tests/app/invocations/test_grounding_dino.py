@@ -0,0 +1,59 @@
+from contextlib import nullcontext
+from unittest.mock import MagicMock
+
+import numpy as np
+from PIL import Image
+
+from invokeai.app.invocations.fields import ImageField
+from invokeai.app.invocations.grounding_dino import GroundingDinoCollectionInvocation
+from invokeai.backend.image_util.grounding_dino.detection_result import BoundingBox, DetectionResult
+from invokeai.backend.image_util.grounding_dino.grounding_dino_pipeline import GroundingDinoPipeline
+
+
+def _detection(xmin: int, ymin: int, xmax: int, ymax: int) -> DetectionResult:
+    return DetectionResult(score=0.9, label="cat.", box=BoundingBox(xmin=xmin, ymin=ymin, xmax=xmax, ymax=ymax))
+
+
+def test_grounding_dino_collection_outputs_box_masks_in_image_order():
+    images = {"a": Image.new("RGB", (16, 8)), "b": Image.new("RGB", (8, 8)), "c": Image.new("RGB", (16, 8))}
+    detections = {
+        "a": [_detection(1, 2, 5, 6)],
+        "b": [],
+        # Boxes may extend past the edges of the image.
+        "c": [_detection(-2, -1, 3, 4), _detection(10, 5, 20, 12)],
+    }
+    detector = GroundingDinoPipeline.__new__(GroundingDinoPipeline)
+    detector.detect_batch = MagicMock(  # type: ignore
+        side_effect=lambda images, candidate_labels, threshold: [detections[image.info["name"]] for image in images]
+    )
+    for name, image in images.items():
+        image.info["name"] = name
+
+    context = MagicMock()
+    context.images.get_pil.side_effect = lambda image_name, mode: images[image_name]
+    context.models.load_remote_model.return_value = nullcontext(detector)
+    context.util.is_canceled.return_value = False
+    saved: list[Image.Image] = []
+    context.images.save.side_effect = lambda image: saved.append(image) or MagicMock(image_name=f"mask-{len(saved)}")
+
+    invocation = GroundingDinoCollectionInvocation(
+        id="1",
+        model="grounding-dino-tiny",
+        prompt="cat",
+        images=[ImageField(image_name=name) for name in images],
+        batch_size=4,
+    )
+    output = invocation.invoke(context)
+
+    # Only images of the same size are batched together, and the prompt is normalized to end with a period.
+    assert [len(call.kwargs["images"]) for call in detector.detect_batch.call_args_list] == [2, 1]
+    assert detector.detect_batch.call_args.kwargs["candidate_labels"] == ["cat."]
+    assert [image.image_name for image in output.collection] == ["mask-1", "mask-2", "mask-3"]
+
+    expected = [np.zeros((8, 16), dtype=np.uint8), np.zeros((8, 8), dtype=np.uint8), np.zeros((8, 16), dtype=np.uint8)]
+    expected[0][2:6, 1:5] = 255
+    expected[2][0:4, 0:3] = 255
+    expected[2][5:12, 10:20] = 255
+    for mask, expected_mask in zip(saved, expected, strict=True):
+        assert mask.mode == "L"
+        np.testing.assert_array_equal(np.array(mask), expected_mask)
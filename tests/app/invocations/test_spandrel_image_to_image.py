@@ -1,3 +1,5 @@
+import numpy as np
+import pytest
 import torch
 from PIL import Image
 
@@ -33,3 +35,42 @@ def test_upscale_image_does_not_crop_full_image_for_untiled_input(monkeypatch):
     assert result.size == image.size
     assert result.mode == image.mode
     assert result.tobytes() == image.tobytes()
+
+
+@pytest.mark.parametrize("tile_batch_size", [2, 4, 16])
+def test_upscale_image_batched_tiles_match_one_tile_at_a_time(monkeypatch, tile_batch_size: int):
+    # Tiles overlap by a different amount along each axis, and the image is not a multiple of the tile size.
+    image = Image.fromarray(np.random.default_rng(0).integers(0, 256, (100, 90, 3), dtype=np.uint8))
+    batch_sizes: list[int] = []
+
+    class UpscaleModel:
+        scale = 2
+        dtype = torch.float32
+
+        @staticmethod
+        def run(image_tensor: torch.Tensor) -> torch.Tensor:
+            batch_sizes.append(image_tensor.shape[0])
+            # A convolution, so that the output of each tile depends on its neighbouring pixels and the tile edges.
+            blurred = torch.nn.functional.avg_pool2d(image_tensor, kernel_size=3, stride=1, padding=1)
+            return torch.nn.functional.interpolate(blurred, scale_factor=2, mode="nearest")
+
+    monkeypatch.setattr(TorchDevice, "choose_torch_device", staticmethod(lambda: torch.device("cpu")))
+
+    def upscale(batch_size: int) -> Image.Image:
+        return SpandrelImageToImageInvocation.upscale_image(
+            image,
+            tile_size=32,
+            spandrel_model=UpscaleModel(),
+            is_canceled=lambda: False,
+            step_callback=lambda *_: None,
+            tile_batch_size=batch_size,
+        )
+
+    expected = upscale(1)
+    assert set(batch_sizes) == {1}
+
+    batch_sizes.clear()
+    result = upscale(tile_batch_size)
+
+    assert max(batch_sizes) == min(tile_batch_size, sum(batch_sizes))
+    assert result.tobytes() == expected.tobytes()
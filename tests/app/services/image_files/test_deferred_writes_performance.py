@@ -0,0 +1,54 @@
+"""Manual benchmark of deferred intermediate image writes.
+
+This test is marked slow and is excluded from normal pytest and CI runs. It runs a chain of image operations that each
+save their result as an intermediate image and read the previous one back, with and without deferred writes. Run this
+benchmark with:
+
+    pytest -m slow -s tests/app/services/image_files/test_deferred_writes_performance.py
+"""
+
+import json
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from PIL import Image, ImageFilter
+
+from invokeai.app.services.image_files.image_files_disk import DiskImageFileStorage
+
+CHAIN_LENGTH = 10
+IMAGE_SIZE = (1024, 1024)
+
+
+def _run_chain(tmp_path: Path, defer_write: bool) -> float:
+    storage = DiskImageFileStorage(tmp_path)
+    mock_invoker = MagicMock()
+    mock_invoker.services.configuration.pil_compress_level = 1
+    mock_invoker.services.configuration.deferred_intermediate_images_mb = 512
+    storage._DiskImageFileStorage__invoker = mock_invoker  # type: ignore
+
+    start = time.perf_counter()
+    image = Image.radial_gradient("L").resize(IMAGE_SIZE).convert("RGB")
+    for i in range(CHAIN_LENGTH):
+        image = image.filter(ImageFilter.BoxBlur(1)) if i % 2 else image.rotate(90)
+        storage.save(image=image, image_name=f"{i}.png", defer_write=defer_write)
+        image = storage.get(f"{i}.png").copy()
+    return time.perf_counter() - start
+
+
+@pytest.mark.slow
+def test_deferred_writes_speed_up_image_chains(tmp_path: Path):
+    immediate_seconds = _run_chain(tmp_path / "immediate", defer_write=False)
+    deferred_seconds = _run_chain(tmp_path / "deferred", defer_write=True)
+
+    print(
+        json.dumps(
+            {
+                "chain_length": CHAIN_LENGTH,
+                "immediate_seconds": round(immediate_seconds, 3),
+                "deferred_seconds": round(deferred_seconds, 3),
+            }
+        )
+    )
+    assert deferred_seconds < immediate_seconds
@@ -7,9 +7,10 @@ from unittest.mock import MagicMock, patch
 import pytest
 from PIL import Image
 
-from invokeai.app.services.image_files.image_files_common import ImageFileSaveException
+from invokeai.app.services.image_files.image_files_common import ImageFileNotFoundException, ImageFileSaveException
 from invokeai.app.services.image_files.image_files_disk import DiskImageFileStorage, _should_use_png_rle
 from invokeai.app.services.image_records.image_records_common import ImageRecordNotFoundException
+from invokeai.app.util.png_writer import write_png_in_parallel
 from invokeai.app.util.thumbnails import get_thumbnail_name
 
 
@@ -201,6 +202,36 @@ def test_palette_transparency_survives_thumbnail_save(tmp_path: Path):
         image.close()
 
 
+@pytest.mark.parametrize("png_compress_threads", [1, 2])
+def test_large_png_save_with_parallel_compression(tmp_path: Path, png_compress_threads: int):
+    storage = DiskImageFileStorage(tmp_path)
+    mock_invoker = MagicMock()
+    mock_invoker.services.configuration.pil_compress_level = 1
+    mock_invoker.services.configuration.png_compress_threads = png_compress_threads
+    storage._DiskImageFileStorage__invoker = mock_invoker  # type: ignore
+    image = Image.radial_gradient("L").resize((2048, 2048)).convert("RGB")
+    expected_bytes = image.tobytes()
+    metadata = '{"seed": 1}'
+
+    try:
+        with patch(
+            "invokeai.app.services.image_files.image_files_disk.write_png_in_parallel",
+            wraps=write_png_in_parallel,
+        ) as parallel_writer:
+            storage.save(image=image, image_name="large.png", metadata=metadata, workflow='{"name": "wörkflow"}')
+        assert parallel_writer.called == (png_compress_threads > 1)
+
+        image_path = storage.get_path("large.png")
+        storage.evict_cache_paths([image_path])
+        with Image.open(image_path) as loaded:
+            loaded.load()
+            assert loaded.tobytes() == expected_bytes
+            assert loaded.info["invokeai_metadata"] == metadata
+            assert loaded.info["invokeai_workflow"] == '{"name": "wörkflow"}'
+    finally:
+        image.close()
+
+
 def test_save_removes_partial_files_when_thumbnail_save_fails(tmp_path: Path):
     storage = DiskImageFileStorage(tmp_path)
     mock_invoker = MagicMock()
@@ -379,3 +410,148 @@ class TestSaveDeleteRoundTrip:
         restarted.start(invoker)
 
         assert not list(disk_storage.image_root.glob(".delete_*"))
+
+
+class TestDeferredWrites:
+    """Intermediate images that are kept in memory until their files are needed."""
+
+    @pytest.fixture
+    def storage(self, disk_storage: DiskImageFileStorage) -> DiskImageFileStorage:
+        mock_invoker = disk_storage._DiskImageFileStorage__invoker  # type: ignore
+        # Room for two 256x256 RGB images.
+        mock_invoker.services.configuration.deferred_intermediate_images_mb = 2 * 256 * 256 * 3 / 2**20
+        return disk_storage
+
+    def test_deferred_image_is_read_from_memory(self, storage: DiskImageFileStorage, tmp_path: Path):
+        image = Image.new("RGB", (256, 256), "red")
+
+        storage.save(image=image, image_name="deferred.png", workflow='{"nodes":[]}', defer_write=True)
+
+        assert not (tmp_path / "deferred.png").exists()
+        assert storage.get("deferred.png") is image
+        assert storage.get_workflow("deferred.png") == '{"nodes":[]}'
+
+    def test_get_path_writes_deferred_image(self, storage: DiskImageFileStorage):
+        storage.save(image=Image.new("RGB", (256, 256)), image_name="deferred.png", defer_write=True)
+
+        assert storage.get_path("deferred.png", thumbnail=True).exists()
+        assert storage.get_path("deferred.png").exists()
+
+    def test_oldest_images_are_written_when_over_budget(self, storage: DiskImageFileStorage, tmp_path: Path):
+        for i in range(3):
+            storage.save(image=Image.new("RGB", (256, 256)), image_name=f"{i}.png", defer_write=True)
+
+        assert (tmp_path / "0.png").exists()
+        assert not (tmp_path / "1.png").exists()
+        assert not (tmp_path / "2.png").exists()
+
+    def test_images_larger_than_budget_are_written_right_away(self, storage: DiskImageFileStorage, tmp_path: Path):
+        storage.save(image=Image.new("RGB", (512, 512)), image_name="large.png", defer_write=True)
+
+        assert (tmp_path / "large.png").exists()
+
+    def test_flush_writes_all_deferred_images(self, storage: DiskImageFileStorage, tmp_path: Path):
+        for i in range(2):
+            storage.save(image=Image.new("RGB", (256, 256)), image_name=f"{i}.png", defer_write=True)
+
+        storage.flush_deferred()
+
+        assert (tmp_path / "0.png").exists()
+        assert (tmp_path / "1.png").exists()
+        assert (tmp_path / "thumbnails" / get_thumbnail_name("1.png")).exists()
+
+    def test_deleted_deferred_image_is_never_written(self, storage: DiskImageFileStorage, tmp_path: Path):
+        storage.save(image=Image.new("RGB", (256, 256)), image_name="deleted.png", defer_write=True)
+
+        storage.delete("deleted.png")
+        storage.flush_deferred()
+
+        assert not (tmp_path / "deleted.png").exists()
+        with pytest.raises(ImageFileNotFoundException):
+            storage.get("deleted.png")
+
+    def test_staged_delete_of_deferred_image_can_be_rolled_back(self, storage: DiskImageFileStorage):
+        image = Image.new("RGB", (256, 256))
+        storage.save(image=image, image_name="rollback.png", defer_write=True)
+
+        token = storage.stage_delete("rollback.png")
+        storage.rollback_delete(token)
+
+        assert storage.get("rollback.png") is image
+        assert storage.get_path("rollback.png").exists()
+
+
+class TestRawImages:
+    """Intermediate images that are stored in the raw format until their files are needed."""
+
+    def test_raw_image_is_written_without_png_or_thumbnail(self, disk_storage: DiskImageFileStorage, tmp_path: Path):
+        image = Image.new("RGB", (64, 32), "red")
+
+        disk_storage.save(image=image, image_name="raw.png", metadata='{"seed":1}', workflow='{"nodes":[]}', raw=True)
+
+        assert (tmp_path / "raw.raw").exists()
+        assert not (tmp_path / "raw.png").exists()
+        assert not (tmp_path / "thumbnails" / get_thumbnail_name("raw.png")).exists()
+
+    @pytest.mark.parametrize("mode", ["1", "L", "LA", "RGB", "RGBA", "I;16"])
+    def test_raw_image_round_trip(self, tmp_path: Path, mode: str):
+        disk_storage = DiskImageFileStorage(tmp_path)
+        disk_storage._DiskImageFileStorage__invoker = MagicMock()  # type: ignore
+        image = _make_round_trip_image(mode)
+        expected_bytes = image.tobytes()
+
+        disk_storage.save(image=image, image_name="raw.png", workflow='{"name":"wörkflow"}', graph="{}", raw=True)
+        disk_storage.evict_cache_paths([tmp_path / "raw.png"])
+        loaded = disk_storage.get("raw.png")
+
+        assert loaded.mode == mode
+        assert loaded.size == image.size
+        assert loaded.tobytes() == expected_bytes
+        assert disk_storage.get_workflow("raw.png") == '{"name":"wörkflow"}'
+        assert disk_storage.get_graph("raw.png") == "{}"
+
+    def test_get_path_converts_raw_image_to_png(self, disk_storage: DiskImageFileStorage, tmp_path: Path):
+        image = Image.radial_gradient("L").convert("RGB")
+        disk_storage.save(image=image, image_name="raw.png", metadata='{"seed":1}', image_subfolder="sub", raw=True)
+
+        image_path = disk_storage.get_path("raw.png", image_subfolder="sub")
+
+        assert not (tmp_path / "sub" / "raw.raw").exists()
+        assert disk_storage.get_path("raw.png", thumbnail=True, image_subfolder="sub").exists()
+        with Image.open(image_path) as loaded:
+            loaded.load()
+            assert loaded.format == "PNG"
+            assert loaded.tobytes() == image.tobytes()
+            assert loaded.info["invokeai_metadata"] == '{"seed":1}'
+
+    def test_palette_images_are_written_as_png(self, disk_storage: DiskImageFileStorage, tmp_path: Path):
+        disk_storage.save(image=Image.new("P", (32, 32)), image_name="palette.png", raw=True)
+
+        assert (tmp_path / "palette.png").exists()
+        assert not (tmp_path / "palette.raw").exists()
+
+    def test_delete_removes_raw_image(self, disk_storage: DiskImageFileStorage, tmp_path: Path):
+        disk_storage.save(image=Image.new("RGB", (32, 32)), image_name="raw.png", raw=True)
+
+        token = disk_storage.stage_delete("raw.png")
+        assert not (tmp_path / "raw.raw").exists()
+        disk_storage.rollback_delete(token)
+        assert (tmp_path / "raw.raw").exists()
+
+        disk_storage.delete("raw.png")
+        assert not (tmp_path / "raw.raw").exists()
+        with pytest.raises(ImageFileNotFoundException):
+            disk_storage.get("raw.png")
+
+    def test_deferred_raw_image_is_flushed_as_raw(self, disk_storage: DiskImageFileStorage, tmp_path: Path):
+        disk_storage._DiskImageFileStorage__invoker.services.configuration.deferred_intermediate_images_mb = 1  # type: ignore
+        disk_storage.save(image=Image.new("RGB", (32, 32)), image_name="flushed.png", defer_write=True, raw=True)
+        disk_storage.save(image=Image.new("RGB", (32, 32)), image_name="requested.png", defer_write=True, raw=True)
+
+        requested_path = disk_storage.get_path("requested.png")
+        disk_storage.flush_deferred()
+
+        assert (tmp_path / "flushed.raw").exists()
+        assert not (tmp_path / "flushed.png").exists()
+        assert requested_path.exists()
+        assert not (tmp_path / "requested.raw").exists()
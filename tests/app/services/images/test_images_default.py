@@ -212,6 +212,35 @@ class TestCreateSubfolderForwarding:
         assert subfolder == "intermediate"
 
 
+class TestCreateRawIntermediates:
+    """Verify that create() asks for raw storage only for intermediates of the configured categories."""
+
+    @pytest.mark.parametrize(
+        "image_category,is_intermediate,expected_raw",
+        [
+            (ImageCategory.GENERAL, True, True),
+            (ImageCategory.GENERAL, False, False),
+            (ImageCategory.CONTROL, True, False),
+        ],
+        ids=["configured-intermediate", "not-intermediate", "other-category"],
+    )
+    def test_create_forwards_raw(
+        self, image_service: ImageService, image_category: ImageCategory, is_intermediate: bool, expected_raw: bool
+    ):
+        invoker = image_service._ImageService__invoker  # type: ignore
+        invoker.services.configuration.image_subfolder_strategy = "flat"
+        invoker.services.configuration.raw_intermediate_image_categories = ["general", "mask"]
+
+        image_service.create(
+            image=Image.new("RGB", (64, 64)),
+            image_origin=ResourceOrigin.INTERNAL,
+            image_category=image_category,
+            is_intermediate=is_intermediate,
+        )
+
+        assert invoker.services.image_files.save.call_args.kwargs["raw"] is expected_raw
+
+
 class TestReadOperationsForwardSubfolder:
     """Verify that read operations look up the record and forward image_subfolder."""
 
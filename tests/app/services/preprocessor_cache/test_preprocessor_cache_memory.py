@@ -0,0 +1,66 @@
+from PIL import Image
+
+from invokeai.app.services.preprocessor_cache.preprocessor_cache_memory import MemoryPreprocessorCache
+
+# A 32x32 RGB image is 3KB.
+IMAGE_SIZE_MB = 32 * 32 * 3 / 2**20
+
+
+def _image(color: tuple[int, int, int]) -> Image.Image:
+    return Image.new("RGB", (32, 32), color)
+
+
+def test_key_depends_on_content_and_processor():
+    key = MemoryPreprocessorCache.create_key(_image((1, 2, 3)), "canny")
+
+    assert MemoryPreprocessorCache.create_key(_image((1, 2, 3)), "canny") == key
+    assert MemoryPreprocessorCache.create_key(_image((1, 2, 4)), "canny") != key
+    assert MemoryPreprocessorCache.create_key(_image((1, 2, 3)), "hed") != key
+    assert MemoryPreprocessorCache.create_key(_image((1, 2, 3)).convert("RGBA"), "canny") != key
+
+
+def test_get_returns_a_copy():
+    cache = MemoryPreprocessorCache(max_cache_size_mb=1)
+    cache.save("key", _image((10, 20, 30)))
+
+    output = cache.get("key")
+    assert output is not None
+    output.putpixel((0, 0), (0, 0, 0))
+
+    cached = cache.get("key")
+    assert cached is not None
+    assert cached.getpixel((0, 0)) == (10, 20, 30)
+
+
+def test_evicts_least_recently_used():
+    cache = MemoryPreprocessorCache(max_cache_size_mb=2.5 * IMAGE_SIZE_MB)
+    cache.save("a", _image((1, 1, 1)))
+    cache.save("b", _image((2, 2, 2)))
+    assert cache.get("a") is not None
+    cache.save("c", _image((3, 3, 3)))
+
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
+
+
+def test_skips_images_larger_than_the_cache():
+    cache = MemoryPreprocessorCache(max_cache_size_mb=0.5 * IMAGE_SIZE_MB)
+    cache.save("a", _image((1, 1, 1)))
+
+    assert cache.get("a") is None
+
+
+def test_disabled_when_size_is_zero():
+    cache = MemoryPreprocessorCache(max_cache_size_mb=0)
+    cache.save("a", _image((1, 1, 1)))
+
+    assert cache.get("a") is None
+
+
+def test_clear():
+    cache = MemoryPreprocessorCache(max_cache_size_mb=1)
+    cache.save("a", _image((1, 1, 1)))
+    cache.clear()
+
+    assert cache.get("a") is None
@@ -0,0 +1,89 @@
+"""Tests for the model prefetcher, which loads the models of pending queue items into the RAM cache."""
+
+from types import SimpleNamespace
+from typing import Optional
+from unittest.mock import MagicMock
+
+from invokeai.app.invocations.model import LoRALoaderInvocation, MainModelLoaderInvocation, ModelIdentifierField
+from invokeai.app.services.model_records.model_records_base import UnknownModelException
+from invokeai.app.services.session_processor.model_prefetcher import ModelPrefetcher, iter_model_identifiers
+from invokeai.app.services.shared.graph import Graph
+from invokeai.backend.model_manager.taxonomy import BaseModelType, ModelType, SubModelType
+
+
+def _identifier(key: str, type: ModelType, submodel_type: Optional[SubModelType] = None) -> ModelIdentifierField:
+    return ModelIdentifierField(
+        key=key,
+        hash="blake3:abc",
+        name=key,
+        base=BaseModelType.StableDiffusion1,
+        type=type,
+        submodel_type=submodel_type,
+    )
+
+
+def _queue_item(*nodes) -> SimpleNamespace:
+    graph = Graph()
+    for node in nodes:
+        graph.add_node(node)
+    return SimpleNamespace(session=SimpleNamespace(graph=graph))
+
+
+def _prefetcher(pending: list, known_keys: set[str]) -> ModelPrefetcher:
+    def get_model(key: str):
+        if key not in known_keys:
+            raise UnknownModelException(key)
+        return SimpleNamespace(key=key)
+
+    services = MagicMock()
+    services.session_queue.get_pending.return_value = pending
+    services.model_manager.store.get_model.side_effect = get_model
+    return ModelPrefetcher(services=services, lookahead=2)
+
+
+def _prefetched(prefetcher: ModelPrefetcher) -> list[tuple[str, Optional[SubModelType]]]:
+    prefetch_model = prefetcher._services.model_manager.load.prefetch_model
+    return [(call.args[0].key, call.args[1]) for call in prefetch_model.call_args_list]
+
+
+def test_iter_model_identifiers_finds_identifiers_in_all_nodes():
+    main = _identifier("main", ModelType.Main)
+    lora = _identifier("lora", ModelType.LoRA)
+    queue_item = _queue_item(MainModelLoaderInvocation(id="1", model=main), LoRALoaderInvocation(id="2", lora=lora))
+
+    assert [i.key for i in iter_model_identifiers(queue_item)] == ["main", "lora"]
+
+
+def test_standalone_models_are_prefetched():
+    queue_item = _queue_item(LoRALoaderInvocation(id="1", lora=_identifier("lora", ModelType.LoRA)))
+    prefetcher = _prefetcher([queue_item], known_keys={"lora"})
+
+    prefetcher.prefetch()
+
+    prefetcher._services.session_queue.get_pending.assert_called_once_with(2)
+    assert _prefetched(prefetcher) == [("lora", None)]
+
+
+def test_main_model_submodels_are_learned_from_cache_accesses():
+    queue_item = _queue_item(MainModelLoaderInvocation(id="1", model=_identifier("main", ModelType.Main)))
+    prefetcher = _prefetcher([queue_item], known_keys={"main"})
+
+    # The submodels of a main model are unknown until the model has run once.
+    prefetcher.prefetch()
+    assert _prefetched(prefetcher) == []
+
+    prefetcher._on_cache_access("main:unet", {})
+    prefetcher._on_cache_access("main:vae", {})
+    prefetcher._on_cache_access("other", {})
+    prefetcher.prefetch()
+
+    assert sorted(_prefetched(prefetcher)) == [("main", SubModelType.UNet), ("main", SubModelType.VAE)]
+
+
+def test_unknown_models_are_skipped():
+    queue_item = _queue_item(LoRALoaderInvocation(id="1", lora=_identifier("deleted", ModelType.LoRA)))
+    prefetcher = _prefetcher([queue_item], known_keys=set())
+
+    prefetcher.prefetch()
+
+    assert _prefetched(prefetcher) == []
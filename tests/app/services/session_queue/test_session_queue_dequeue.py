@@ -126,6 +126,21 @@ def test_fifo_returns_none_when_empty(session_queue_fifo: SqliteSessionQueue) ->
     assert session_queue_fifo.dequeue() is None
 
 
+def test_get_pending_returns_items_in_dequeue_order(session_queue_fifo: SqliteSessionQueue) -> None:
+    """get_pending lists the next pending items in dequeue order, without dequeuing them."""
+    queue_id = "default"
+    first = _insert_queue_item(session_queue_fifo, queue_id, "user_a")
+    second = _insert_queue_item(session_queue_fifo, queue_id, "user_a")
+    urgent = _insert_queue_item(session_queue_fifo, queue_id, "user_a", priority=10)
+    _insert_queue_item(session_queue_fifo, queue_id, "user_a")
+
+    assert [item.item_id for item in session_queue_fifo.get_pending(3)] == [urgent, first, second]
+
+    dequeued = session_queue_fifo.dequeue()
+    assert dequeued is not None and dequeued.item_id == urgent
+    assert [item.item_id for item in session_queue_fifo.get_pending(2)] == [first, second]
+
+
 # ---------------------------------------------------------------------------
 # Round-robin tests
 # ---------------------------------------------------------------------------
@@ -1,8 +1,12 @@
 from unittest.mock import MagicMock
 
 import pytest
+from PIL import Image
 
+from invokeai.app.invocations.canny import CannyEdgeDetectionInvocation
+from invokeai.app.invocations.fields import ImageField
 from invokeai.app.services.board_records.board_records_common import BoardVisibility
+from invokeai.app.services.preprocessor_cache.preprocessor_cache_memory import MemoryPreprocessorCache
 from invokeai.app.services.shared.invocation_context import ImagesInterface
 
 
@@ -135,3 +139,49 @@ def test_image_save_allows_active_queue_user_without_board() -> None:
     images.save(MagicMock())
 
     services.images.create.assert_called_once()
+
+
+def _make_processor_interface(invocation: CannyEdgeDetectionInvocation) -> ImagesInterface:
+    services = MagicMock()
+    services.preprocessor_cache = MemoryPreprocessorCache(max_cache_size_mb=1)
+    data = MagicMock()
+    data.invocation = invocation
+    return ImagesInterface(services, data, MagicMock())
+
+
+def test_run_cached_processor_reuses_output_for_identical_pixels() -> None:
+    images = _make_processor_interface(CannyEdgeDetectionInvocation(id="1", image=ImageField(image_name="a")))
+    process = MagicMock(side_effect=lambda image: image.convert("L"))
+
+    first = images.run_cached_processor(Image.new("RGB", (8, 8), (1, 2, 3)), process)
+    # Identical pixels from a different image and a different node.
+    images._data.invocation = CannyEdgeDetectionInvocation(id="2", image=ImageField(image_name="b"))
+    second = images.run_cached_processor(Image.new("RGB", (8, 8), (1, 2, 3)), process)
+
+    process.assert_called_once()
+    assert first.tobytes() == second.tobytes()
+
+    images.run_cached_processor(Image.new("RGB", (8, 8), (1, 2, 4)), process)
+    assert process.call_count == 2
+
+
+def test_run_cached_processor_reruns_when_parameters_change() -> None:
+    images = _make_processor_interface(CannyEdgeDetectionInvocation(id="1", image=ImageField(image_name="a")))
+    process = MagicMock(side_effect=lambda image: image.convert("L"))
+
+    images.run_cached_processor(Image.new("RGB", (8, 8)), process)
+    images._data.invocation = CannyEdgeDetectionInvocation(id="1", image=ImageField(image_name="a"), low_threshold=50)
+    images.run_cached_processor(Image.new("RGB", (8, 8)), process)
+
+    assert process.call_count == 2
+
+
+def test_run_cached_processor_skips_cache_when_use_cache_is_false() -> None:
+    invocation = CannyEdgeDetectionInvocation(id="1", image=ImageField(image_name="a"), use_cache=False)
+    images = _make_processor_interface(invocation)
+    process = MagicMock(side_effect=lambda image: image.convert("L"))
+
+    images.run_cached_processor(Image.new("RGB", (8, 8)), process)
+    images.run_cached_processor(Image.new("RGB", (8, 8)), process)
+
+    assert process.call_count == 2
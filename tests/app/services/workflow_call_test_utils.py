@@ -797,6 +797,11 @@ class _DummyBoardImages:
         return []
 
 
+class _DummyImageFiles:
+    def flush_deferred(self) -> None:
+        pass
+
+
 class _DummyImages:
     def get_dto(self, image_name: str):
         return SimpleNamespace(image_name=image_name, width=64, height=64)
@@ -815,6 +820,7 @@ def _build_runner(monkeypatch: pytest.MonkeyPatch) -> DefaultSessionRunner:
             (),
             {
                 "performance_statistics": _DummyStats(),
+                "image_files": _DummyImageFiles(),
                 "events": _DummyEvents(),
                 "logger": _DummyLogger(),
                 "configuration": _DummyConfig(),
@@ -847,6 +853,7 @@ def _build_workflow_runner(monkeypatch: pytest.MonkeyPatch, session_queue=None):
             (),
             {
                 "performance_statistics": _DummyStats(),
+                "image_files": _DummyImageFiles(),
                 "events": events,
                 "logger": _DummyLogger(),
                 "configuration": _DummyConfig(),
@@ -1214,6 +1221,7 @@ def test_run_node_does_not_swallow_sigint_in_subprocess() -> None:
                 (),
                 {
                     "performance_statistics": DummyStats(),
+                    "image_files": _DummyImageFiles(),
                     "events": DummyEvents(),
                     "logger": DummyLogger(),
                     "configuration": DummyConfig(),
@@ -1252,6 +1260,7 @@ def test_on_after_run_session_does_not_complete_incomplete_session(monkeypatch:
             (),
             {
                 "performance_statistics": _DummyStats(),
+                "image_files": _DummyImageFiles(),
                 "events": _DummyEvents(),
                 "logger": _DummyLogger(),
                 "configuration": _DummyConfig(),
@@ -1369,6 +1378,7 @@ def test_run_persists_waiting_session_without_completing_queue_item(monkeypatch:
             (),
             {
                 "performance_statistics": _DummyStats(),
+                "image_files": _DummyImageFiles(),
                 "events": _DummyEvents(),
                 "logger": _DummyLogger(),
                 "configuration": _DummyConfig(),
@@ -0,0 +1,82 @@
+import io
+import zlib
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from invokeai.app.util.png_writer import (
+    _adler32_combine,
+    can_write_png_in_parallel,
+    get_png_compress_thread_count,
+    write_png_in_parallel,
+)
+
+
+def _make_image(mode: str, size: tuple[int, int]) -> Image.Image:
+    """A gradient with some noisy rows, so that the rows pick different filters."""
+    pixels = np.array(Image.radial_gradient("L").resize(size).convert(mode))
+    rng = np.random.default_rng(0)
+    pixels[::7] = rng.integers(0, 256, pixels[::7].shape, dtype=np.uint8)
+    return Image.fromarray(pixels, mode)
+
+
+def _write(image: Image.Image, **kwargs) -> Image.Image:
+    output = io.BytesIO()
+    write_png_in_parallel(image, output, **kwargs)
+    output.seek(0)
+    written = Image.open(output)
+    written.load()
+    return written
+
+
+@pytest.mark.parametrize("mode", ["L", "LA", "RGB", "RGBA"])
+@pytest.mark.parametrize("size", [(1, 1), (3, 500), (700, 1300)])
+def test_round_trip(mode: str, size: tuple[int, int]):
+    image = _make_image(mode, size)
+    written = _write(image, compress_level=1, threads=3)
+    assert written.mode == mode
+    assert written.size == size
+    assert np.array_equal(np.array(written), np.array(image))
+
+
+@pytest.mark.parametrize("compress_level", [0, 1, 6, 9])
+@pytest.mark.parametrize("compress_type", [zlib.Z_DEFAULT_STRATEGY, zlib.Z_RLE])
+def test_round_trip_compression_settings(compress_level: int, compress_type: int):
+    image = _make_image("RGB", (600, 1000))
+    written = _write(image, compress_level=compress_level, compress_type=compress_type, threads=2)
+    assert np.array_equal(np.array(written), np.array(image))
+
+
+def test_output_does_not_depend_on_thread_count():
+    image = _make_image("RGB", (600, 1000))
+    outputs = []
+    for threads in (1, 4):
+        output = io.BytesIO()
+        write_png_in_parallel(image, output, threads=threads)
+        outputs.append(output.getvalue())
+    assert outputs[0] == outputs[1]
+
+
+def test_text_chunks_are_read_by_pil():
+    text = {"invokeai_metadata": '{"seed": 1}', "invokeai_workflow": '{"name": "ünïcødé ✓"}'}
+    written = _write(_make_image("RGB", (16, 16)), text=text)
+    assert written.info == text
+
+
+def test_unsupported_mode_is_rejected():
+    image = Image.new("I;16", (8, 8))
+    assert not can_write_png_in_parallel(image)
+    with pytest.raises(ValueError):
+        write_png_in_parallel(image, io.BytesIO())
+
+
+def test_adler32_combine():
+    first, second = b"hello " * 1000, b"world" * 20000
+    combined = _adler32_combine(zlib.adler32(first), zlib.adler32(second), len(second))
+    assert combined == zlib.adler32(first + second)
+
+
+def test_png_compress_thread_count():
+    assert get_png_compress_thread_count(3) == 3
+    assert 1 <= get_png_compress_thread_count(0) <= 8
@@ -0,0 +1,62 @@
+"""Manual benchmark of the parallel PNG writer.
+
+This test is marked slow and is excluded from normal pytest and CI runs. It saves an 8192x8192 RGB image with PIL and
+with the parallel PNG writer, at compression levels 1 and 6, and reports the encode times and file sizes. The speedup
+depends on the number of CPU cores. Run this benchmark with:
+
+    pytest -m slow -s tests/app/util/test_png_writer_benchmark.py
+"""
+
+import io
+import json
+import time
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from invokeai.app.util.png_writer import get_png_compress_thread_count, write_png_in_parallel
+
+IMAGE_SIZE = 8192
+
+
+def _make_image() -> Image.Image:
+    # A smooth gradient with a little noise compresses like a generated image, rather than like random data.
+    gradient = np.array(Image.radial_gradient("L").resize((IMAGE_SIZE, IMAGE_SIZE)).convert("RGB"), dtype=np.int16)
+    noise = np.random.default_rng(0).integers(-3, 4, gradient.shape, dtype=np.int16)
+    return Image.fromarray((gradient + noise).clip(0, 255).astype(np.uint8))
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("compress_level", [1, 6])
+def test_parallel_png_writer_speed(compress_level: int):
+    image = _make_image()
+    threads = get_png_compress_thread_count(0)
+
+    start = time.perf_counter()
+    pil_output = io.BytesIO()
+    image.save(pil_output, "PNG", compress_level=compress_level)
+    pil_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    parallel_output = io.BytesIO()
+    write_png_in_parallel(image, parallel_output, compress_level=compress_level, threads=threads)
+    parallel_seconds = time.perf_counter() - start
+
+    print(
+        json.dumps(
+            {
+                "compress_level": compress_level,
+                "threads": threads,
+                "pil_seconds": round(pil_seconds, 3),
+                "parallel_seconds": round(parallel_seconds, 3),
+                "pil_bytes": pil_output.tell(),
+                "parallel_bytes": parallel_output.tell(),
+            }
+        )
+    )
+    parallel_output.seek(0)
+    with Image.open(parallel_output) as written:
+        assert written.tobytes() == image.tobytes()
+    if threads > 1:
+        assert parallel_seconds < pil_seconds
@@ -0,0 +1,291 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+import torch
+from PIL import Image
+from transformers import (
+    BertConfig,
+    BertTokenizer,
+    DepthAnythingConfig,
+    DepthAnythingForDepthEstimation,
+    Dinov2Config,
+    DPTImageProcessor,
+    GroundingDinoConfig,
+    GroundingDinoForObjectDetection,
+    GroundingDinoImageProcessor,
+    GroundingDinoProcessor,
+    Sam2ImageProcessor,
+    SamConfig,
+    SamImageProcessor,
+    SamMaskDecoderConfig,
+    SamModel,
+    SamProcessor,
+    SamPromptEncoderConfig,
+    SamVisionConfig,
+    SwinConfig,
+)
+from transformers.models.sam2 import Sam2Config, Sam2HieraDetConfig, Sam2Model, Sam2VisionConfig
+from transformers.models.sam2.processing_sam2 import Sam2Processor
+from transformers.pipelines import DepthEstimationPipeline, ZeroShotObjectDetectionPipeline
+
+from invokeai.app.services.session_processor.session_processor_common import CanceledException
+from invokeai.backend.image_util.depth_anything.depth_anything_pipeline import DepthAnythingPipeline
+from invokeai.backend.image_util.dw_openpose import DWOpenposeDetector
+from invokeai.backend.image_util.grounding_dino.grounding_dino_pipeline import GroundingDinoPipeline
+from invokeai.backend.image_util.segment_anything.segment_anything_2_pipeline import SegmentAnything2Pipeline
+from invokeai.backend.image_util.segment_anything.segment_anything_pipeline import SegmentAnythingPipeline
+from invokeai.backend.image_util.segment_anything.shared import BoundingBox, SAMInput, SAMPoint, SAMPointLabel
+from invokeai.backend.image_util.util import batch_images_by_size, run_in_batches_by_size
+
+# The annotators are tested with tiny, randomly-initialized models, which produce meaningless but deterministic outputs.
+
+
+def _random_images(sizes: list[tuple[int, int]]) -> list[Image.Image]:
+    rng = np.random.default_rng(0)
+    return [Image.fromarray(rng.integers(0, 256, (h, w, 3), dtype=np.uint8)) for w, h in sizes]
+
+
+def test_batch_images_by_size():
+    images = _random_images([(8, 8), (8, 8), (8, 4), (8, 8), (4, 8), (8, 4), (8, 8)])
+
+    assert batch_images_by_size(images, batch_size=3) == [[0, 1, 3], [6], [2, 5], [4]]
+    assert batch_images_by_size(images, batch_size=1) == [[i] for i in [0, 1, 3, 6, 2, 5, 4]]
+
+
+def test_depth_anything_generate_depths_matches_generate_depth():
+    torch.manual_seed(0)
+    backbone_config = Dinov2Config(
+        hidden_size=32,
+        num_hidden_layers=4,
+        num_attention_heads=2,
+        intermediate_size=64,
+        image_size=56,
+        patch_size=14,
+        out_features=["stage1", "stage2", "stage3", "stage4"],
+        reshape_hidden_states=False,
+    )
+    config = DepthAnythingConfig(
+        backbone_config=backbone_config,
+        fusion_hidden_size=16,
+        neck_hidden_sizes=[8, 16, 32, 32],
+        head_hidden_size=8,
+        reassemble_hidden_size=32,
+        patch_size=14,
+    )
+    image_processor = DPTImageProcessor(size={"height": 56, "width": 56}, keep_aspect_ratio=True, ensure_multiple_of=14)
+    pipeline = DepthAnythingPipeline(
+        DepthEstimationPipeline(model=DepthAnythingForDepthEstimation(config).eval(), image_processor=image_processor)
+    )
+    images = _random_images([(60, 40)] * 3)
+
+    depth_maps = pipeline.generate_depths(images)
+
+    for image, depth_map in zip(images, depth_maps, strict=True):
+        expected = np.array(pipeline.generate_depth(image), dtype=np.int16)
+        assert depth_map.size == image.size
+        # Batching may change the rounding of the depth map.
+        assert np.abs(np.array(depth_map, dtype=np.int16) - expected).max() <= 1
+
+
+def test_grounding_dino_detect_batch_matches_detect(tmp_path):
+    torch.manual_seed(0)
+    vocab_path = tmp_path / "vocab.txt"
+    vocab_path.write_text("\n".join(["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]", "a", "cat", "."]))
+    tokenizer = BertTokenizer(str(vocab_path))
+    config = GroundingDinoConfig(
+        backbone_config=SwinConfig(
+            embed_dim=8,
+            depths=[1, 1, 1, 1],
+            num_heads=[1, 1, 1, 1],
+            window_size=4,
+            out_features=["stage2", "stage3", "stage4"],
+        ),
+        text_config=BertConfig(
+            vocab_size=8, hidden_size=32, num_hidden_layers=1, num_attention_heads=2, intermediate_size=32
+        ),
+        d_model=32,
+        encoder_layers=1,
+        decoder_layers=2,
+        encoder_attention_heads=2,
+        decoder_attention_heads=2,
+        encoder_ffn_dim=32,
+        decoder_ffn_dim=32,
+        num_queries=10,
+        encoder_n_points=1,
+        decoder_n_points=1,
+    )
+    processor = GroundingDinoProcessor(
+        GroundingDinoImageProcessor(size={"shortest_edge": 64, "longest_edge": 96}), tokenizer
+    )
+    pipeline = GroundingDinoPipeline(
+        ZeroShotObjectDetectionPipeline(
+            model=GroundingDinoForObjectDetection(config).eval(),
+            image_processor=processor.image_processor,
+            tokenizer=tokenizer,
+            processor=processor,
+        )
+    )
+    images = _random_images([(80, 60)] * 3)
+
+    batch_detections = pipeline.detect_batch(images, candidate_labels=["a cat."], threshold=0.0)
+
+    assert len(batch_detections) == len(images)
+    for image, detections in zip(images, batch_detections, strict=True):
+        expected = pipeline.detect(image, candidate_labels=["a cat."], threshold=0.0)
+        assert [d.box for d in detections] == [d.box for d in expected]
+        assert [d.score for d in detections] == pytest.approx([d.score for d in expected], abs=1e-4)
+
+
+def _tiny_sam_pipeline() -> SegmentAnythingPipeline:
+    vision_config = SamVisionConfig(
+        hidden_size=16,
+        num_hidden_layers=1,
+        num_attention_heads=2,
+        mlp_dim=32,
+        output_channels=32,
+        global_attn_indexes=[0],
+        window_size=0,
+        num_pos_feats=16,
+    )
+    config = SamConfig(
+        vision_config=vision_config.to_dict(),
+        prompt_encoder_config=SamPromptEncoderConfig(hidden_size=32, mask_input_channels=4).to_dict(),
+        mask_decoder_config=SamMaskDecoderConfig(
+            hidden_size=32, mlp_dim=64, num_hidden_layers=1, num_attention_heads=2, iou_head_hidden_dim=32
+        ).to_dict(),
+    )
+    return SegmentAnythingPipeline(SamModel(config).eval(), SamProcessor(SamImageProcessor()))
+
+
+def _tiny_sam_2_pipeline() -> SegmentAnything2Pipeline:
+    backbone_config = Sam2HieraDetConfig(
+        hidden_size=8,
+        blocks_per_stage=[1, 1, 2, 1],
+        embed_dim_per_stage=[8, 16, 32, 64],
+        num_attention_heads_per_stage=[1, 1, 1, 1],
+        global_attention_blocks=[3],
+    )
+    config = Sam2Config(
+        vision_config=Sam2VisionConfig(
+            backbone_config=backbone_config, backbone_channel_list=[64, 32, 16, 8], fpn_hidden_size=32
+        ),
+        prompt_encoder_config={"hidden_size": 32},
+        mask_decoder_config={
+            "hidden_size": 32,
+            "mlp_dim": 64,
+            "num_hidden_layers": 1,
+            "num_attention_heads": 2,
+            "iou_head_hidden_dim": 32,
+        },
+    )
+    return SegmentAnything2Pipeline(Sam2Model(config).eval(), Sam2Processor(Sam2ImageProcessor()))
+
+
+@pytest.mark.parametrize("make_pipeline", [_tiny_sam_pipeline, _tiny_sam_2_pipeline])
+def test_segment_anything_segment_batch_matches_segment(make_pipeline):
+    torch.manual_seed(0)
+    pipeline = make_pipeline()
+    # The image encoder's inputs are always the same size, so images of different sizes can be batched together.
+    images = _random_images([(80, 60), (80, 60), (40, 50)])
+    inputs = [
+        SAMInput(
+            bounding_box=BoundingBox(x_min=1, y_min=2, x_max=30, y_max=40),
+            points=[SAMPoint(x=5, y=5, label=SAMPointLabel.positive)],
+        )
+    ]
+
+    with torch.no_grad():
+        batch_masks = pipeline.segment_batch(images, inputs)
+        expected_masks = [pipeline.segment(image, inputs) for image in images]
+
+    for image, masks, expected in zip(images, batch_masks, expected_masks, strict=True):
+        assert masks.shape[-2:] == (image.height, image.width)
+        assert torch.equal(masks, expected)
+
+
+class _FakeOnnxSession:
+    """Stands in for an ONNX inference session, computing deterministic outputs from the mean of each input."""
+
+    def __init__(self, input_shape: list, output_shapes: dict[str, tuple[int, ...]], dynamic_batch: bool):
+        self._input_shape = ["batch" if dynamic_batch else 1, *input_shape]
+        self._output_shapes = output_shapes
+        self.batch_sizes: list[int] = []
+
+    def get_inputs(self):
+        return [SimpleNamespace(name="input", shape=self._input_shape)]
+
+    def get_outputs(self):
+        return [SimpleNamespace(name=name) for name in self._output_shapes]
+
+    def run(self, output_names, inputs):
+        x = np.asarray(inputs["input"])
+        assert x.shape[1:] == tuple(self._input_shape[1:])
+        assert isinstance(self._input_shape[0], str) or x.shape[0] == 1
+        self.batch_sizes.append(x.shape[0])
+        return [self._output(name, x) for name in self._output_shapes]
+
+    def _output(self, name: str, x: np.ndarray) -> np.ndarray:
+        means = x.reshape(x.shape[0], -1).mean(axis=1)
+        output = np.zeros((x.shape[0], *self._output_shapes[name]), dtype=np.float32)
+        for i, mean in enumerate(means):
+            if name == "dets":
+                # One confident person detection near the top-left of the image, at a position that depends on it.
+                output[i, 0] = [10 + mean % 5, 10 + mean % 3, 2, 2, 0.9, 0.9]
+            else:
+                # A response for every keypoint at a position that depends on the input.
+                position = int(abs(mean) * 100) % output.shape[2]
+                output[i, :, position] = 1.0
+        return output
+
+
+def _fake_dw_openpose_sessions(dynamic_batch: bool) -> tuple[_FakeOnnxSession, _FakeOnnxSession]:
+    session_det = _FakeOnnxSession([3, 640, 640], {"dets": (8400, 6)}, dynamic_batch)
+    session_pose = _FakeOnnxSession(
+        [3, 384, 288], {"simcc_x": (133, 288 * 2), "simcc_y": (133, 384 * 2)}, dynamic_batch
+    )
+    return session_det, session_pose
+
+
+@pytest.mark.parametrize("dynamic_batch", [True, False])
+def test_dw_openpose_run_batch_matches_run(dynamic_batch: bool):
+    images = _random_images([(320, 240), (320, 240), (200, 300)])
+    session_det, session_pose = _fake_dw_openpose_sessions(dynamic_batch)
+    detector = DWOpenposeDetector(session_det=session_det, session_pose=session_pose)  # type: ignore
+
+    poses = detector.run_batch(images, draw_face=True, draw_hands=True)
+
+    # Models with a dynamic batch dimension are run once for all images, others once per image.
+    assert session_det.batch_sizes == ([3] if dynamic_batch else [1, 1, 1])
+    assert session_pose.batch_sizes == ([3] if dynamic_batch else [1, 1, 1])
+
+    single_session_det, single_session_pose = _fake_dw_openpose_sessions(dynamic_batch=False)
+    single_detector = DWOpenposeDetector(session_det=single_session_det, session_pose=single_session_pose)  # type: ignore
+    for image, pose in zip(images, poses, strict=True):
+        expected = single_detector.run(image, draw_face=True, draw_hands=True)
+        assert pose.size == image.size
+        assert pose.tobytes() == expected.tobytes()
+
+
+def test_run_in_batches_by_size_returns_outputs_in_image_order():
+    images = _random_images([(8, 8), (8, 4), (8, 8), (8, 4), (8, 8)])
+    batches: list[list[tuple[int, int]]] = []
+
+    def run_batch(batch: list[Image.Image]) -> list[bytes]:
+        batches.append([image.size for image in batch])
+        return [image.tobytes() for image in batch]
+
+    outputs = run_in_batches_by_size(images, batch_size=2, run_batch=run_batch)
+
+    assert batches == [[(8, 8), (8, 8)], [(8, 8)], [(8, 4), (8, 4)]]
+    assert outputs == [image.tobytes() for image in images]
+
+
+def test_run_in_batches_by_size_raises_when_canceled():
+    def run_batch(batch: list[Image.Image]) -> list[None]:
+        raise AssertionError("No batch should run after cancellation.")
+
+    with pytest.raises(CanceledException):
+        run_in_batches_by_size(
+            _random_images([(8, 8)] * 3), batch_size=2, run_batch=run_batch, is_canceled=lambda: True
+        )
@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+import torch
+from PIL import Image
+
+from invokeai.backend.image_util.color_conversion import (
+    hsl_from_srgb,
+    linear_srgb_from_srgb,
+    okhsl_from_srgb,
+    okhsv_from_srgb,
+    oklab_from_linear_srgb,
+    oklch_from_oklab,
+)
+from invokeai.backend.image_util.color_pipeline import ColorImage, srgb_tensor_from_pil
+
+
+@pytest.fixture
+def image() -> Image.Image:
+    # Few distinct colors, as in flat or gradient regions, and some noise for many distinct colors.
+    np_image = np.random.default_rng(0).integers(0, 256, (24, 32, 3), dtype=np.uint8)
+    np_image[:12] = np_image[0, 0]
+    return Image.fromarray(np_image)
+
+
+def test_srgb_tensor_from_pil(image: Image.Image):
+    srgb_uint8 = srgb_tensor_from_pil(image)
+
+    assert srgb_uint8.shape == (3, 24, 32)
+    assert srgb_uint8.dtype == torch.uint8
+    assert torch.equal(srgb_uint8.permute(1, 2, 0), torch.from_numpy(np.array(image)))
+    with pytest.raises(ValueError):
+        srgb_tensor_from_pil(image.convert("L"))
+
+
+def test_color_image_matches_color_conversion(image: Image.Image):
+    color_image = ColorImage.from_pil(image, torch.device("cpu"))
+    srgb = torch.from_numpy(np.array(image)).permute(2, 0, 1).to(torch.float32) / 255.0
+    linear_srgb = linear_srgb_from_srgb(srgb)
+
+    assert torch.equal(color_image.srgb(), srgb)
+    assert torch.equal(color_image.linear_srgb(), linear_srgb)
+    assert torch.equal(color_image.oklab(), oklab_from_linear_srgb(linear_srgb))
+    assert torch.equal(color_image.oklch(), oklch_from_oklab(oklab_from_linear_srgb(linear_srgb)))
+    assert torch.equal(color_image.hsl(), hsl_from_srgb(srgb))
+    for steps in (1, 3):
+        torch.testing.assert_close(color_image.okhsl(steps=steps), okhsl_from_srgb(srgb, steps=steps))
+        torch.testing.assert_close(color_image.okhsv(steps=steps), okhsv_from_srgb(srgb, steps=steps))
+
+
+def test_color_image_returns_copies_of_cached_conversions(image: Image.Image):
+    color_image = ColorImage.from_pil(image, torch.device("cpu"))
+
+    okhsl = color_image.okhsl()
+    okhsl[0] = -1.0
+
+    assert (color_image.okhsl()[0] >= 0.0).all()
+
+
+def test_color_image_rejects_non_uint8_input():
+    with pytest.raises(ValueError):
+        ColorImage(torch.zeros((3, 4, 4)), torch.device("cpu"))
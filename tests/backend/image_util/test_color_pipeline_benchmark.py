@@ -0,0 +1,54 @@
+"""Manual benchmark of the Okhsl and Okhsv conversions of the color pipeline.
+
+This test is marked slow and is excluded from normal pytest and CI runs. It converts a 2048x2048 gradient image, as
+the Image Layer Blend node does for both of its layers, with `ColorImage` and with the per-pixel conversion functions.
+Run this benchmark with:
+
+    pytest -m slow -s tests/backend/image_util/test_color_pipeline_benchmark.py
+"""
+
+import json
+import time
+
+import numpy as np
+import pytest
+import torch
+from PIL import Image
+
+from invokeai.backend.image_util.color_conversion import okhsl_from_srgb, okhsv_from_srgb
+from invokeai.backend.image_util.color_pipeline import ColorImage
+from invokeai.backend.util.devices import TorchDevice
+
+IMAGE_SIZE = 2048
+
+
+def _time(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    if torch.cuda.is_available():
+        torch.cuda.synchronize()
+    return round(time.perf_counter() - start, 3)
+
+
+@pytest.mark.slow
+def test_color_pipeline_speedup():
+    x = np.linspace(0.0, 1.0, IMAGE_SIZE)
+    np_image = np.stack([np.outer(x, x), np.outer(1.0 - x, x), np.outer(x, 1.0 - x)], axis=-1)
+    image = Image.fromarray((np_image * 255).astype(np.uint8))
+    device = TorchDevice.choose_torch_device()
+    srgb = torch.from_numpy(np.array(image)).permute(2, 0, 1).to(torch.float32) / 255.0
+
+    results = {
+        "okhsl": {
+            "per_pixel_seconds": _time(lambda: okhsl_from_srgb(srgb.to(device), steps=3)),
+            "pipeline_seconds": _time(lambda: ColorImage.from_pil(image, device).okhsl(steps=3)),
+        },
+        "okhsv": {
+            "per_pixel_seconds": _time(lambda: okhsv_from_srgb(srgb.to(device), steps=3)),
+            "pipeline_seconds": _time(lambda: ColorImage.from_pil(image, device).okhsv(steps=3)),
+        },
+    }
+    print(json.dumps({"image_size": IMAGE_SIZE, "device": str(device), **results}))
+
+    for result in results.values():
+        assert result["pipeline_seconds"] < result["per_pixel_seconds"]
@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+from PIL import Image
+
+from invokeai.backend.image_util.infill_methods.mosaic import infill_mosaic
+from invokeai.backend.image_util.infill_methods.tile import create_filled_image, create_tile_pool, infill_tile
+
+
+def _make_image(height: int, width: int) -> Image.Image:
+    """An RGBA image whose right half is transparent."""
+    np_image = np.random.default_rng(0).integers(0, 256, (height, width, 4), dtype=np.uint8)
+    np_image[..., 3] = 255
+    np_image[:, width // 2 :, 3] = 0
+    return Image.fromarray(np_image, "RGBA")
+
+
+def test_create_tile_pool_keeps_opaque_tiles_in_order():
+    np_image = np.array(_make_image(20, 30))
+
+    tile_pool = create_tile_pool(np_image, (7, 6))
+
+    # 3 rows of 2 opaque tiles: the third column of tiles overlaps the transparent half.
+    expected = [np_image[y : y + 6, x : x + 7] for y in (0, 6, 12) for x in (0, 7)]
+    np.testing.assert_array_equal(tile_pool, np.stack(expected))
+
+
+def test_create_tile_pool_raises_without_opaque_tiles():
+    np_image = np.zeros((8, 8, 4), dtype=np.uint8)
+
+    with pytest.raises(ValueError, match="Not enough opaque pixels"):
+        create_tile_pool(np_image, (4, 4))
+
+
+def test_create_filled_image_matches_tile_by_tile_fill():
+    np_image = np.array(_make_image(45, 50))
+    tile_pool = create_tile_pool(np_image, (8, 8))
+
+    filled = create_filled_image(np_image, tile_pool, (8, 8), seed=123)
+
+    rng = np.random.default_rng(123)
+    for y in range(0, 45, 8):
+        for x in range(0, 50, 8):
+            tile = tile_pool[rng.integers(len(tile_pool))]
+            np.testing.assert_array_equal(filled[y : y + 8, x : x + 8], tile[: min(8, 45 - y), : min(8, 50 - x), :3])
+
+
+def test_infill_tile_keeps_opaque_pixels():
+    image = _make_image(45, 50)
+
+    output = infill_tile(image, seed=1, tile_size=8)
+
+    np.testing.assert_array_equal(np.array(output.infilled)[:, :25], np.array(image)[:, :25, :3])
+
+
+def test_infill_mosaic_fills_every_tile_with_an_image_color():
+    image = _make_image(45, 50)
+    np_image = np.array(image)
+
+    infilled = np.array(infill_mosaic(image, tile_shape=(8, 6), seed=0))
+
+    np.testing.assert_array_equal(infilled[:, :25], np_image[:, :25, :3])
+    image_colors = {tuple(c) for c in np_image[:, :25, :3].reshape(-1, 3)}
+    # Every tile that is fully transparent, including the partial tiles at the edges, has a single color from the image.
+    for y in range(0, 45, 6):
+        for x in range(32, 50, 8):
+            tile = infilled[y : y + 6, x : x + 8].reshape(-1, 3)
+            assert (tile == tile[0]).all()
+            assert tuple(tile[0]) in image_colors
+
+
+def test_infill_mosaic_is_reproducible_with_a_seed():
+    image = _make_image(45, 50)
+
+    first = infill_mosaic(image, tile_shape=(8, 8), seed=7)
+    second = infill_mosaic(image, tile_shape=(8, 8), seed=7)
+    other = infill_mosaic(image, tile_shape=(8, 8), seed=8)
+
+    assert first.tobytes() == second.tobytes()
+    assert first.tobytes() != other.tobytes()
+
+
+def test_infill_mosaic_clips_colors():
+    image = _make_image(45, 50)
+
+    infilled = np.array(infill_mosaic(image, tile_shape=(8, 8), min_color=(100, 0, 0, 0), max_color=(150, 255, 20, 0)))
+
+    assert infilled[:, 25:, 0].min() >= 100
+    assert infilled[:, 25:, 0].max() <= 150
+    assert infilled[:, 25:, 2].max() <= 20
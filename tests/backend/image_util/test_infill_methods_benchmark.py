@@ -0,0 +1,91 @@
+"""Manual benchmark of the tile and mosaic infill methods.
+
+This test is marked slow and is excluded from normal pytest and CI runs. It infills a 4096x4096 image whose right half is
+transparent with the vectorized tile and mosaic infills, and with the per-tile and per-pixel loops that they replaced.
+The mosaic loop alone takes over a minute. Run this benchmark with:
+
+    pytest -m slow -s tests/backend/image_util/test_infill_methods_benchmark.py
+"""
+
+import json
+import time
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from invokeai.backend.image_util.infill_methods.mosaic import infill_mosaic
+from invokeai.backend.image_util.infill_methods.tile import create_filled_image, create_tile_pool
+
+IMAGE_SIZE = 4096
+
+
+def _loop_create_filled_image(
+    img_array: np.ndarray, tile_pool: np.ndarray, tile_size: tuple[int, int], seed: int
+) -> np.ndarray:
+    """The previous tile-by-tile implementation of `create_filled_image()`."""
+    rows, cols, _ = img_array.shape
+    tile_width, tile_height = tile_size
+    filled_img_array = np.zeros((rows, cols, 3), dtype=img_array.dtype)
+    rng = np.random.default_rng(seed)
+    for y in range(0, rows, tile_height):
+        for x in range(0, cols, tile_width):
+            tile = tile_pool[rng.integers(len(tile_pool))]
+            space_y = min(tile_height, rows - y)
+            space_x = min(tile_width, cols - x)
+            filled_img_array[y : y + space_y, x : x + space_x, :3] = tile[:space_y, :space_x, :3]
+    return filled_img_array
+
+
+def _loop_infill_mosaic(image: Image.Image, tile_shape: tuple[int, int]) -> Image.Image:
+    """The previous pixel-by-pixel implementation of `infill_mosaic()`, without color clipping."""
+    np_image = np.array(image)
+    non_transparent_pixels = np_image[np_image[:, :, 3] != 0, :3]
+    tile_width, tile_height = tile_shape
+    tiles = []
+    for _ in range(256):
+        tile = np.zeros((tile_height, tile_width, 3), dtype=np.uint8)
+        tile[:, :] = non_transparent_pixels[np.random.randint(len(non_transparent_pixels))]
+        tiles.append(tile)
+    filled_image = np.zeros((image.height, image.width, 3), dtype=np.uint8)
+    for x in range(image.width):
+        for y in range(image.height):
+            tile = tiles[np.random.randint(len(tiles))]
+            try:
+                filled_image[
+                    y - (y % tile_height) : y - (y % tile_height) + tile_height,
+                    x - (x % tile_width) : x - (x % tile_width) + tile_width,
+                ] = tile
+            except ValueError:
+                pass
+    return Image.composite(image, Image.fromarray(filled_image), image.split()[-1])
+
+
+def _time(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return round(time.perf_counter() - start, 3)
+
+
+@pytest.mark.slow
+def test_vectorized_infill_speedup():
+    np_image = np.random.default_rng(0).integers(0, 256, (IMAGE_SIZE, IMAGE_SIZE, 4), dtype=np.uint8)
+    np_image[..., 3] = 255
+    np_image[:, IMAGE_SIZE // 2 :, 3] = 0
+    image = Image.fromarray(np_image, "RGBA")
+    tile_pool = create_tile_pool(np_image, (32, 32))
+
+    results = {
+        "tile_fill": {
+            "loop_seconds": _time(lambda: _loop_create_filled_image(np_image, tile_pool, (32, 32), seed=0)),
+            "vectorized_seconds": _time(lambda: create_filled_image(np_image, tile_pool, (32, 32), seed=0)),
+        },
+        "mosaic": {
+            "loop_seconds": _time(lambda: _loop_infill_mosaic(image, (64, 64))),
+            "vectorized_seconds": _time(lambda: infill_mosaic(image, (64, 64), max_color=(255, 255, 255, 0), seed=0)),
+        },
+    }
+    print(json.dumps({"image_size": IMAGE_SIZE, **results}))
+
+    for result in results.values():
+        assert result["vectorized_seconds"] < result["loop_seconds"]
@@ -0,0 +1,27 @@
+import numpy as np
+import pytest
+import torch
+
+from invokeai.backend.image_util.basicsr.rrdbnet_arch import RRDBNet
+from invokeai.backend.image_util.realesrgan.realesrgan import RealESRGAN
+from invokeai.backend.util.devices import TorchDevice
+
+
+@pytest.mark.parametrize("scale", [2, 4])
+def test_tile_process_batched_matches_one_tile_at_a_time(monkeypatch, scale: int):
+    monkeypatch.setattr(TorchDevice, "choose_torch_device", staticmethod(lambda: torch.device("cpu")))
+    torch.manual_seed(0)
+    model = RRDBNet(num_in_ch=3, num_out_ch=3, num_feat=8, num_block=1, num_grow_ch=4, scale=scale)
+    loadnet = {"params": model.state_dict()}
+    # Not a multiple of the tile size, so that the tiles at the right and bottom edges are smaller.
+    image = np.random.default_rng(0).integers(0, 256, (50, 70, 3), dtype=np.uint8)
+
+    def upscale(tile_batch_size: int) -> np.ndarray:
+        upscaler = RealESRGAN(scale=scale, loadnet=loadnet, model=model, tile=16, tile_batch_size=tile_batch_size)
+        return upscaler.upscale(image)
+
+    expected = upscale(1)
+    result = upscale(8)
+
+    assert result.shape == (50 * scale, 70 * scale, 3)
+    assert np.abs(result.astype(np.int16) - expected).max() <= 1
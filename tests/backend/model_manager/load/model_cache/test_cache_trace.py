@@ -0,0 +1,151 @@
+import logging
+from unittest.mock import MagicMock
+
+import pytest
+import torch
+
+from invokeai.backend.model_manager.load.memory_snapshot import GB
+from invokeai.backend.model_manager.load.model_cache.cache_trace import (
+    CacheTraceRecorder,
+    get_recorded_budget,
+    read_trace,
+    replay_trace,
+    trace_devices,
+)
+from invokeai.backend.model_manager.load.model_cache.eviction_policy import LRUEvictionPolicy
+from invokeai.backend.model_manager.load.model_cache.eviction_replay import SimulatedModelCache
+from invokeai.backend.model_manager.load.model_cache.model_cache import ModelCache
+
+# The size of a torch.nn.Linear(32, 32, bias=False) model.
+MODEL_BYTES = 32 * 32 * 4
+
+
+@pytest.fixture
+def mock_logger():
+    logger = MagicMock()
+    logger.getEffectiveLevel.return_value = logging.INFO
+    return logger
+
+
+def _build_cache(num_models: int, recorder: CacheTraceRecorder, logger: MagicMock) -> ModelCache:
+    return ModelCache(
+        execution_device_working_mem_gb=1.0,
+        enable_partial_loading=False,
+        keep_ram_copy_of_weights=True,
+        max_ram_cache_size_gb=num_models * MODEL_BYTES / GB,
+        execution_device="cpu",
+        storage_device="cpu",
+        logger=logger,
+        trace_recorder=recorder,
+    )
+
+
+def _load(cache: ModelCache, key: str) -> None:
+    """Request a model like the model loader does: load it on a miss, then lock and unlock it."""
+    try:
+        cache_record = cache.get(key)
+    except IndexError:
+        cache.put(key, torch.nn.Linear(32, 32, bias=False), load_seconds=2.0)
+        cache_record = cache.get(key)
+    cache.lock(cache_record, None)
+    cache.unlock(cache_record)
+
+
+def test_model_cache_records_trace(tmp_path, mock_logger):
+    recorder = CacheTraceRecorder(tmp_path / "trace.jsonl")
+    cache = _build_cache(1, recorder, mock_logger)
+    try:
+        _load(cache, "a")
+        _load(cache, "a")
+        _load(cache, "b")
+    finally:
+        cache.shutdown()
+        recorder.close()
+
+    events = list(read_trace(tmp_path / "trace.jsonl"))
+    # fmt: off
+    assert [(e["op"], e.get("key")) for e in events] == [
+        ("start", None), ("cache", None),
+        ("miss", "a"), ("put", "a"), ("hit", "a"), ("lock", "a"), ("unlock", "a"),
+        ("hit", "a"), ("lock", "a"), ("unlock", "a"),
+        ("miss", "b"), ("evict", "a"), ("put", "b"), ("hit", "b"), ("lock", "b"), ("unlock", "b"),
+    ]
+    # fmt: on
+    assert all(e["device"] == "cpu" for e in events[1:])
+    assert [e["t"] for e in events] == sorted(e["t"] for e in events)
+    assert trace_devices(events) == ["cpu"]
+    # Models that run on the CPU do not use VRAM.
+    assert get_recorded_budget(events, "cpu") == (MODEL_BYTES, None, GB)
+
+
+def test_read_trace_skips_truncated_line(tmp_path):
+    recorder = CacheTraceRecorder(tmp_path / "trace.jsonl")
+    recorder.record("miss", key="a", device="cpu")
+    recorder.close()
+    with open(tmp_path / "trace.jsonl", "a") as f:
+        f.write('{"t":1.0,"op":"mi')
+
+    assert [e["op"] for e in read_trace(tmp_path / "trace.jsonl")] == ["start", "miss"]
+
+
+def test_replay_trace_with_larger_ram_budget(tmp_path, mock_logger):
+    recorder = CacheTraceRecorder(tmp_path / "trace.jsonl")
+    cache = _build_cache(2, recorder, mock_logger)
+    try:
+        for _ in range(5):
+            for key in ("a", "b", "c"):
+                _load(cache, key)
+    finally:
+        cache.shutdown()
+        recorder.close()
+    events = list(read_trace(tmp_path / "trace.jsonl"))
+
+    # Three models that are used in turn thrash a cache that only fits two of them.
+    recorded = replay_trace(events, "cpu", ram_bytes=2 * MODEL_BYTES, policy=LRUEvictionPolicy())
+    assert recorded.requests == 15
+    assert recorded.hits == 0
+    assert recorded.load_seconds == pytest.approx(15 * 2.0)
+
+    larger = replay_trace(events, "cpu", ram_bytes=3 * MODEL_BYTES, policy=LRUEvictionPolicy())
+    assert larger.hits == 12
+    assert larger.bytes_loaded == 3 * MODEL_BYTES
+    assert larger.stall_seconds == pytest.approx(3 * 2.0)
+
+
+def test_replay_trace_admits_prefetched_models():
+    events = [
+        {"op": "cache", "device": "cuda", "ram_bytes": 4 * GB, "working_mem_bytes": 0},
+        {"op": "put", "device": "cuda", "key": "a", "bytes": GB, "load_seconds": 1.0},
+        {"op": "hit", "device": "cuda", "key": "a", "bytes": GB},
+    ]
+
+    result = replay_trace(events, "cuda", ram_bytes=4 * GB, policy=LRUEvictionPolicy())
+
+    assert result.requests == 1
+    assert result.hits == 1
+    assert result.load_seconds == pytest.approx(1.0)
+
+
+def test_simulated_cache_offloads_unlocked_models_from_vram():
+    cache = SimulatedModelCache(
+        ram_bytes=8 * GB,
+        policy=LRUEvictionPolicy(),
+        vram_bytes=5 * GB,
+        working_mem_bytes=1 * GB,
+        ram_to_vram_bytes_per_second=1 * GB,
+    )
+    cache.request("small", 1 * GB, load_seconds=1.0)
+    cache.request("large", 2 * GB, load_seconds=1.0)
+    cache.lock("small")
+    cache.unlock("small")
+    cache.lock("large")
+    cache.unlock("large")
+    assert cache.result.bytes_offloaded == 0
+
+    # There is no room for "medium" next to both models, so the smaller one is offloaded.
+    cache.request("medium", int(1.5 * GB), load_seconds=1.0)
+    cache.lock("medium")
+
+    assert cache.result.bytes_offloaded == 1 * GB
+    assert cache.result.bytes_to_vram == int(4.5 * GB)
+    assert cache.result.stall_seconds == pytest.approx(3.0 + 4.5)
@@ -0,0 +1,95 @@
+import logging
+from unittest.mock import MagicMock
+
+import pytest
+import torch
+
+from invokeai.backend.model_manager.load.memory_snapshot import GB
+from invokeai.backend.model_manager.load.model_cache.eviction_policy import (
+    GreedyDualSizeEvictionPolicy,
+    LRUEvictionPolicy,
+    build_eviction_policy,
+)
+from invokeai.backend.model_manager.load.model_cache.eviction_replay import CacheRequest, replay
+from invokeai.backend.model_manager.load.model_cache.model_cache import ModelCache
+
+# The size of a torch.nn.Linear(32, 32, bias=False) model.
+MODEL_BYTES = 32 * 32 * 4
+
+
+def test_lru_policy_keeps_recency_order():
+    assert LRUEvictionPolicy().eviction_order(["a", "b", "c"]) == ["a", "b", "c"]
+
+
+def test_cost_aware_policy_evicts_models_that_are_cheap_to_reload_first():
+    policy = GreedyDualSizeEvictionPolicy()
+    policy.on_admit("slow", size_bytes=GB, load_seconds=30.0)
+    policy.on_admit("fast", size_bytes=GB, load_seconds=1.0)
+    policy.on_hit("slow")
+    policy.on_hit("fast")
+
+    assert policy.eviction_order(["slow", "fast"]) == ["fast", "slow"]
+
+
+def test_cost_aware_policy_evicts_rarely_used_models_first():
+    policy = GreedyDualSizeEvictionPolicy()
+    policy.on_admit("rare", size_bytes=GB, load_seconds=1.0)
+    policy.on_admit("frequent", size_bytes=GB, load_seconds=1.0)
+    policy.on_hit("rare")
+    for _ in range(3):
+        policy.on_hit("frequent")
+
+    assert policy.eviction_order(["frequent", "rare"]) == ["rare", "frequent"]
+
+
+def test_cost_aware_policy_ages_out_models_that_are_no_longer_used():
+    """A model that was used a lot in the past must eventually make room for the models that are used now."""
+    capacity_bytes = 2 * GB
+    old = [CacheRequest("old", GB, 1.0)] * 10
+    # Two models that are used in turn, and that do not fit into the cache next to the old one.
+    new = [CacheRequest("new_1", GB, 1.0), CacheRequest("new_2", GB, 1.0)] * 100
+
+    result = replay(old + new, capacity_bytes, GreedyDualSizeEvictionPolicy())
+
+    # If the old model never aged out, every request for the new models would be a miss. Once it has aged out, all
+    # requests for the new models are hits.
+    assert result.misses < 20
+
+
+def test_unknown_policy_name_raises():
+    with pytest.raises(ValueError, match="not_a_policy"):
+        build_eviction_policy("not_a_policy")
+
+
+@pytest.fixture
+def mock_logger():
+    logger = MagicMock()
+    logger.getEffectiveLevel.return_value = logging.INFO
+    return logger
+
+
+def test_model_cache_evicts_in_policy_order(mock_logger):
+    cache = ModelCache(
+        execution_device_working_mem_gb=1.0,
+        enable_partial_loading=False,
+        keep_ram_copy_of_weights=True,
+        max_ram_cache_size_gb=2 * MODEL_BYTES / GB,
+        execution_device="cpu",
+        storage_device="cpu",
+        logger=mock_logger,
+        eviction_policy=GreedyDualSizeEvictionPolicy(),
+    )
+    try:
+        cache.put("slow", torch.nn.Linear(32, 32, bias=False), load_seconds=30.0)
+        cache.get("slow")
+        cache.put("fast", torch.nn.Linear(32, 32, bias=False), load_seconds=1.0)
+        cache.get("fast")
+
+        # "slow" is the least recently used model, but it is the most expensive one to reload.
+        cache.put("new", torch.nn.Linear(32, 32, bias=False), load_seconds=1.0)
+
+        assert cache.contains("slow")
+        assert not cache.contains("fast")
+        assert cache.contains("new")
+    finally:
+        cache.shutdown()
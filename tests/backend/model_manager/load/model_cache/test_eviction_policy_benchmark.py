@@ -0,0 +1,63 @@
+"""Manual trace-replay benchmark of the model cache eviction policies.
+
+This test is marked slow and is excluded from normal pytest and CI runs. It replays a synthetic trace of model cache
+requests against a simulated RAM cache with each eviction policy, and reports the time that would be spent reloading
+models. Run this benchmark with:
+
+    pytest -m slow -s tests/backend/model_manager/load/model_cache/test_eviction_policy_benchmark.py
+"""
+
+import json
+import random
+
+import pytest
+
+from invokeai.backend.model_manager.load.memory_snapshot import GB
+from invokeai.backend.model_manager.load.model_cache.eviction_policy import build_eviction_policy
+from invokeai.backend.model_manager.load.model_cache.eviction_replay import CacheRequest, replay
+
+# (key, size in GB, load time in seconds), in the order in which a session requests them. The FLUX transformer is a
+# single-file checkpoint that is converted on load, so it is much slower to load per GB than the other models.
+FLUX = [
+    ("t5:text_encoder_2", 9.5, 12.0),
+    ("flux:clip", 0.25, 0.4),
+    ("flux:transformer", 12.0, 60.0),
+    ("flux:vae", 0.16, 0.3),
+]
+SDXL = [
+    ("sdxl:text_encoder", 0.25, 0.4),
+    ("sdxl:text_encoder_2", 1.4, 1.8),
+    ("sdxl:unet", 5.0, 6.0),
+    ("sdxl:vae", 0.16, 0.3),
+]
+LORAS = [(f"lora_{i}", 0.2, 0.3) for i in range(8)]
+
+
+def _build_trace(num_sessions: int, seed: int) -> list[CacheRequest]:
+    """A user who mostly generates with FLUX, with occasional SDXL sessions, each with a random LoRA."""
+    rng = random.Random(seed)
+    trace: list[CacheRequest] = []
+    for _ in range(num_sessions):
+        pipeline = FLUX if rng.random() < 0.7 else SDXL
+        # The LoRA is requested after the text encoders, when it is patched into the denoiser.
+        models = [*pipeline[:2], rng.choice(LORAS), *pipeline[2:]]
+        trace.extend(CacheRequest(key, int(size_gb * GB), load_seconds) for key, size_gb, load_seconds in models)
+    return trace
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("capacity_gb", [24, 28])
+def test_eviction_policy_replay(capacity_gb: int):
+    trace = _build_trace(num_sessions=500, seed=42)
+
+    results = {}
+    for policy_name in ("lru", "cost_aware"):
+        result = replay(trace, int(capacity_gb * GB), build_eviction_policy(policy_name))
+        results[policy_name] = {
+            "hit_ratio": round(result.hit_ratio, 3),
+            "load_seconds": round(result.load_seconds, 1),
+            "evictions": result.evictions,
+        }
+    print(json.dumps({"capacity_gb": capacity_gb, **results}))
+
+    assert results["cost_aware"]["load_seconds"] < results["lru"]["load_seconds"]
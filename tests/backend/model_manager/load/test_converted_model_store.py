@@ -0,0 +1,136 @@
+import logging
+import os
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import torch
+
+from invokeai.backend.model_manager.load.converted_model_store import INDEX_FILE_NAME, ConvertedModelStore
+from invokeai.backend.model_manager.load.load_default import ModelLoader
+
+logger = logging.getLogger(__name__)
+
+
+def _state_dict() -> dict[str, torch.Tensor]:
+    return {"a.weight": torch.randn(4, 4), "b.weight": torch.randn(8), "c.bias": torch.randn(2)}
+
+
+def test_save_and_load_round_trip(tmp_path):
+    store = ConvertedModelStore(tmp_path, max_size_bytes=2**20, logger=logger)
+    sd = _state_dict()
+    key = store.make_key("blake3:abc", torch.float32, "Loader-v1")
+
+    assert store.get_size(key) is None
+    assert store.load(key) is None
+
+    store.save(key, sd)
+
+    assert store.get_size(key) == sum(t.nelement() * t.element_size() for t in sd.values())
+    loaded = store.load(key)
+    assert loaded is not None
+    assert loaded.keys() == sd.keys()
+    assert all(torch.equal(loaded[k], sd[k]) for k in sd)
+
+
+def test_key_depends_on_hash_dtype_and_loader_version():
+    key = ConvertedModelStore.make_key("blake3:abc", torch.bfloat16, "Loader-v1")
+
+    assert key == ConvertedModelStore.make_key("blake3:abc", torch.bfloat16, "Loader-v1")
+    assert key != ConvertedModelStore.make_key("blake3:abd", torch.bfloat16, "Loader-v1")
+    assert key != ConvertedModelStore.make_key("blake3:abc", torch.float16, "Loader-v1")
+    assert key != ConvertedModelStore.make_key("blake3:abc", torch.bfloat16, "Loader-v2")
+
+
+def test_state_dict_is_sharded(tmp_path):
+    # Each tensor is 64 bytes, so every shard holds at most two of them.
+    store = ConvertedModelStore(tmp_path, max_size_bytes=2**20, logger=logger, max_shard_size_bytes=128)
+    sd = {f"layer{i}.weight": torch.randn(16) for i in range(5)}
+    key = store.make_key("blake3:abc", torch.float32, "Loader-v1")
+
+    store.save(key, sd)
+
+    assert len(list((tmp_path / key).glob("*.safetensors"))) == 3
+    loaded = store.load(key)
+    assert loaded is not None
+    assert all(torch.equal(loaded[k], sd[k]) for k in sd)
+
+
+def test_tensors_sharing_memory_can_be_saved(tmp_path):
+    store = ConvertedModelStore(tmp_path, max_size_bytes=2**20, logger=logger)
+    weight = torch.randn(6, 4)
+    sd = {"table": weight, "table_reshaped": weight.view(4, 6)}
+    key = store.make_key("blake3:abc", torch.float32, "Loader-v1")
+
+    store.save(key, sd)
+
+    loaded = store.load(key)
+    assert loaded is not None
+    assert torch.equal(loaded["table_reshaped"], weight.view(4, 6))
+
+
+def test_least_recently_used_entries_are_removed_to_fit_size_limit(tmp_path):
+    sd = _state_dict()
+    entry_size = sum(t.nelement() * t.element_size() for t in sd.values())
+    store = ConvertedModelStore(tmp_path, max_size_bytes=2 * entry_size, logger=logger)
+    keys = [store.make_key(f"blake3:{i}", torch.float32, "Loader-v1") for i in range(3)]
+
+    store.save(keys[0], sd)
+    store.save(keys[1], sd)
+    # Make the first entry the most recently used one.
+    os.utime(tmp_path / keys[1] / INDEX_FILE_NAME, (0, 0))
+    assert store.load(keys[0]) is not None
+    store.save(keys[2], sd)
+
+    assert store.get_size(keys[0]) is not None
+    assert store.get_size(keys[1]) is None
+    assert store.get_size(keys[2]) is not None
+
+
+def test_state_dict_larger_than_size_limit_is_not_saved(tmp_path):
+    store = ConvertedModelStore(tmp_path, max_size_bytes=16, logger=logger)
+    key = store.make_key("blake3:abc", torch.float32, "Loader-v1")
+
+    store.save(key, _state_dict())
+
+    assert store.get_size(key) is None
+
+
+def test_corrupt_entry_is_discarded(tmp_path):
+    store = ConvertedModelStore(tmp_path, max_size_bytes=2**20, logger=logger)
+    key = store.make_key("blake3:abc", torch.float32, "Loader-v1")
+    store.save(key, _state_dict())
+    for shard in (tmp_path / key).glob("*.safetensors"):
+        shard.write_bytes(b"not a safetensors file")
+
+    assert store.load(key) is None
+    assert not (tmp_path / key).exists()
+
+
+def test_loader_skips_conversion_when_state_dict_is_stored(tmp_path):
+    loader = object.__new__(ModelLoader)
+    loader._converted_model_store = ConvertedModelStore(tmp_path, max_size_bytes=2**20, logger=logger)
+    loader._ram_cache = SimpleNamespace(make_room=MagicMock())
+    loader._logger = logger
+    config = SimpleNamespace(hash="blake3:abc", name="model")
+    sd = _state_dict()
+    convert = MagicMock(return_value=sd)
+
+    first = loader._load_converted_state_dict(config, torch.float32, convert)
+    second = loader._load_converted_state_dict(config, torch.float32, convert)
+
+    convert.assert_called_once()
+    assert first is sd
+    assert all(torch.equal(second[k], sd[k]) for k in sd)
+    # RAM is reserved for the stored state dict before it is read.
+    loader._ram_cache.make_room.assert_called_once()
+
+
+def test_loader_converts_on_every_load_when_store_is_disabled():
+    loader = object.__new__(ModelLoader)
+    config = SimpleNamespace(hash="blake3:abc", name="model")
+    convert = MagicMock(return_value=_state_dict())
+
+    loader._load_converted_state_dict(config, torch.float32, convert)
+    loader._load_converted_state_dict(config, torch.float32, convert)
+
+    assert convert.call_count == 2
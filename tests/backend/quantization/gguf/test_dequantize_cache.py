@@ -0,0 +1,167 @@
+import gc
+from typing import Iterator
+
+import gguf
+import pytest
+import torch
+
+from invokeai.backend.quantization.gguf.dequantize_cache import (
+    GGMLDequantizationCache,
+    configure_dequantization_cache,
+    get_dequantization_cache,
+)
+from invokeai.backend.quantization.gguf.ggml_tensor import GGMLTensor
+from tests.backend.quantization.gguf.test_ggml_tensor import quantize_tensor
+
+# The size of a dequantized 32x64 float32 tensor.
+TENSOR_BYTES = 32 * 64 * 4
+
+
+@pytest.fixture
+def enabled_cache() -> Iterator[GGMLDequantizationCache]:
+    configure_dequantization_cache(1.0)
+    try:
+        yield get_dequantization_cache()
+    finally:
+        configure_dequantization_cache(0)
+
+
+def test_get_dequantized_tensor_is_cached(enabled_cache: GGMLDequantizationCache):
+    x = torch.randn(32, 64)
+    x_quantized = quantize_tensor(x, gguf.GGMLQuantizationType.Q8_0)
+
+    first = x_quantized.get_dequantized_tensor()
+    second = x_quantized.get_dequantized_tensor()
+
+    assert second is first
+    assert enabled_cache.total_bytes(torch.device("cpu")) == TENSOR_BYTES
+    assert torch.allclose(first, x, atol=1e-1)
+
+
+def test_get_dequantized_tensor_not_cached_when_disabled():
+    x_quantized = quantize_tensor(torch.randn(32, 64), gguf.GGMLQuantizationType.Q8_0)
+
+    assert not get_dequantization_cache().enabled
+    assert x_quantized.get_dequantized_tensor() is not x_quantized.get_dequantized_tensor()
+
+
+def test_cache_key_includes_compute_dtype(enabled_cache: GGMLDequantizationCache):
+    x_quantized = quantize_tensor(torch.randn(32, 64), gguf.GGMLQuantizationType.Q8_0)
+    x_quantized_bf16 = GGMLTensor(
+        x_quantized.quantized_data, gguf.GGMLQuantizationType.Q8_0, x_quantized.tensor_shape, torch.bfloat16
+    )
+
+    assert x_quantized.get_dequantized_tensor().dtype == torch.float32
+    assert x_quantized_bf16.get_dequantized_tensor().dtype == torch.bfloat16
+
+
+def test_torch_compatible_tensor_with_matching_dtype_is_not_cached(enabled_cache: GGMLDequantizationCache):
+    x_quantized = quantize_tensor(torch.randn(32, 64), gguf.GGMLQuantizationType.F32)
+
+    assert x_quantized.get_dequantized_tensor() is x_quantized.quantized_data
+    assert enabled_cache.total_bytes() == 0
+
+
+def test_shrinking_budget_evicts_entries(enabled_cache: GGMLDequantizationCache):
+    tensors = [quantize_tensor(torch.randn(32, 64), gguf.GGMLQuantizationType.Q8_0) for _ in range(3)]
+    for t in tensors:
+        t.get_dequantized_tensor()
+    assert enabled_cache.total_bytes() == 3 * TENSOR_BYTES
+
+    enabled_cache.set_max_bytes_per_device(TENSOR_BYTES)
+
+    assert enabled_cache.total_bytes() == TENSOR_BYTES
+    # The most recently used entry is the one that is kept.
+    assert enabled_cache.get(tensors[2].quantized_data, torch.float32) is not None
+    assert enabled_cache.get(tensors[0].quantized_data, torch.float32) is None
+
+
+def test_modified_source_is_stale(enabled_cache: GGMLDequantizationCache):
+    x_quantized = quantize_tensor(torch.randn(32, 64), gguf.GGMLQuantizationType.Q8_0)
+    first = x_quantized.get_dequantized_tensor()
+
+    x_quantized.quantized_data.zero_()
+
+    second = x_quantized.get_dequantized_tensor()
+    assert second is not first
+    assert torch.count_nonzero(second) == 0
+
+
+def test_write_through_view_does_not_modify_cached_tensor(enabled_cache: GGMLDequantizationCache):
+    x = torch.randn(32, 64)
+    x_quantized = quantize_tensor(x, gguf.GGMLQuantizationType.Q8_0)
+
+    # `view` is one of the ops that is run on the (cached) dequantized tensor, and returns an alias of it.
+    alias = x_quantized.view(32, 64)
+    alias.fill_(100.0)
+
+    assert torch.allclose(x_quantized.get_dequantized_tensor(), x, atol=1e-1)
+
+
+def test_in_place_write_to_cached_tensor_is_detected(enabled_cache: GGMLDequantizationCache):
+    x = torch.randn(32, 64)
+    x_quantized = quantize_tensor(x, gguf.GGMLQuantizationType.Q8_0)
+
+    x_quantized.get_dequantized_tensor().fill_(100.0)
+
+    assert torch.allclose(x_quantized.get_dequantized_tensor(), x, atol=1e-1)
+
+
+def test_index_put_does_not_modify_cached_tensor(enabled_cache: GGMLDequantizationCache):
+    x = torch.randn(32, 64)
+    x_quantized = quantize_tensor(x, gguf.GGMLQuantizationType.Q8_0)
+    cached = x_quantized.get_dequantized_tensor()
+    cached_before = cached.clone()
+
+    x_quantized[torch.tensor([0])] = torch.full((1, 64), 100.0)
+
+    assert x_quantized.get_dequantized_tensor() is cached
+    assert torch.equal(cached, cached_before)
+
+
+def test_collected_source_is_purged(enabled_cache: GGMLDequantizationCache):
+    x_quantized = quantize_tensor(torch.randn(32, 64), gguf.GGMLQuantizationType.Q8_0)
+    x_quantized.get_dequantized_tensor()
+    assert enabled_cache.total_bytes() == TENSOR_BYTES
+
+    del x_quantized
+    gc.collect()
+
+    assert enabled_cache.total_bytes() == 0
+
+
+def test_cyclic_access_keeps_a_stable_subset():
+    """When the working set does not fit, repeated sweeps over it should hit on the entries that are resident rather
+    than evicting every entry before it is re-used."""
+    cache = GGMLDequantizationCache(max_bytes_per_device=2 * TENSOR_BYTES)
+    sources = [torch.zeros(16) for _ in range(4)]
+
+    hits = 0
+    for _ in range(5):
+        for source in sources:
+            if cache.get(source, torch.float32) is not None:
+                hits += 1
+            else:
+                cache.put(source, torch.float32, torch.zeros(32, 64))
+
+    assert hits > 0
+    assert cache.total_bytes() <= 2 * TENSOR_BYTES
+
+
+def test_unused_entries_lose_priority():
+    """Entries that are no longer requested (e.g. from a model that is not running any more) must eventually make room
+    for the entries of the model that is running."""
+    cache = GGMLDequantizationCache(max_bytes_per_device=2 * TENSOR_BYTES)
+    old_sources = [torch.zeros(16) for _ in range(2)]
+    for _ in range(10):
+        for source in old_sources:
+            if cache.get(source, torch.float32) is None:
+                cache.put(source, torch.float32, torch.zeros(32, 64))
+
+    new_sources = [torch.zeros(16) for _ in range(2)]
+    for _ in range(10):
+        for source in new_sources:
+            if cache.get(source, torch.float32) is None:
+                cache.put(source, torch.float32, torch.zeros(32, 64))
+
+    assert all(cache.get(source, torch.float32) is not None for source in new_sources)
@@ -0,0 +1,102 @@
+"""Manual GGUF per-step latency benchmarks.
+
+These tests are marked slow and are excluded from normal pytest and CI runs. They build a stack of GGUF-quantized
+linear layers shaped like a FLUX transformer block and time a "denoising step" (one forward pass through the stack) on
+CPU, with the GGML dequantization cache disabled and enabled. Run this benchmark with:
+
+    pytest -m slow -s tests/backend/quantization/gguf/test_dequantize_cache_performance.py
+"""
+
+import json
+import time
+
+import gguf
+import numpy as np
+import pytest
+import torch
+
+from invokeai.backend.quantization.gguf.dequantize_cache import configure_dequantization_cache
+from invokeai.backend.quantization.gguf.ggml_tensor import GGMLTensor
+
+HIDDEN_SIZE = 3072
+MLP_SIZE = 4 * HIDDEN_SIZE
+NUM_BLOCKS = 4
+TOKENS = 256
+STEPS = 5
+
+
+def _random_q4_k_tensor(shape: tuple[int, int], generator: np.random.Generator) -> GGMLTensor:
+    """Build a Q4_K tensor with random quants. gguf-py cannot quantize to the K-quant types, so the blocks are filled
+    in directly: random scales/quants, with small valid fp16 super-block scales so that the output stays finite."""
+    block_size, type_size = gguf.GGML_QUANT_SIZES[gguf.GGMLQuantizationType.Q4_K]
+    n_blocks = shape[0] * shape[1] // block_size
+    blocks = generator.integers(0, 256, size=(n_blocks, type_size), dtype=np.uint8)
+    scales = np.full((n_blocks, 2), 1e-3, dtype=np.float16)
+    blocks[:, :4] = scales.view(np.uint8)
+    return GGMLTensor(
+        torch.from_numpy(blocks.reshape(shape[0], -1)),
+        ggml_quantization_type=gguf.GGMLQuantizationType.Q4_K,
+        tensor_shape=torch.Size(shape),
+        compute_dtype=torch.float32,
+    )
+
+
+def _q8_0_tensor(shape: tuple[int, int], generator: np.random.Generator) -> GGMLTensor:
+    data = generator.standard_normal(shape, dtype=np.float32) * 0.02
+    return GGMLTensor(
+        torch.from_numpy(gguf.quantize(data, gguf.GGMLQuantizationType.Q8_0)),
+        ggml_quantization_type=gguf.GGMLQuantizationType.Q8_0,
+        tensor_shape=torch.Size(shape),
+        compute_dtype=torch.float32,
+    )
+
+
+def _build_weights(qtype: gguf.GGMLQuantizationType) -> list[GGMLTensor]:
+    generator = np.random.default_rng(123)
+    make = _random_q4_k_tensor if qtype == gguf.GGMLQuantizationType.Q4_K else _q8_0_tensor
+    weights: list[GGMLTensor] = []
+    for _ in range(NUM_BLOCKS):
+        weights.append(make((MLP_SIZE, HIDDEN_SIZE), generator))
+        weights.append(make((HIDDEN_SIZE, MLP_SIZE), generator))
+    return weights
+
+
+def _run_step(weights: list[GGMLTensor], x: torch.Tensor) -> torch.Tensor:
+    for up, down in zip(weights[::2], weights[1::2], strict=True):
+        x = torch.nn.functional.linear(torch.nn.functional.gelu(torch.nn.functional.linear(x, up)), down)
+    return x
+
+
+def _time_steps(weights: list[GGMLTensor], x: torch.Tensor) -> list[float]:
+    step_seconds: list[float] = []
+    for _ in range(STEPS):
+        start = time.perf_counter()
+        _run_step(weights, x)
+        step_seconds.append(time.perf_counter() - start)
+    return step_seconds
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("qtype", [gguf.GGMLQuantizationType.Q4_K, gguf.GGMLQuantizationType.Q8_0])
+def test_gguf_per_step_latency(qtype: gguf.GGMLQuantizationType):
+    weights = _build_weights(qtype)
+    x = torch.randn(1, TOKENS, HIDDEN_SIZE)
+
+    with torch.no_grad():
+        uncached = _time_steps(weights, x)
+        configure_dequantization_cache(4.0)
+        try:
+            cached = _time_steps(weights, x)
+        finally:
+            configure_dequantization_cache(0)
+
+    result = {
+        "qtype": qtype.name,
+        "uncached_step_seconds": round(sum(uncached) / len(uncached), 4),
+        # The first cached step pays for dequantization, so it is reported separately.
+        "cached_first_step_seconds": round(cached[0], 4),
+        "cached_step_seconds": round(sum(cached[1:]) / len(cached[1:]), 4),
+    }
+    print(json.dumps(result))
+
+    assert result["cached_step_seconds"] < result["uncached_step_seconds"]
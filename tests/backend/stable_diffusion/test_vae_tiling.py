@@ -1,6 +1,14 @@
+import pytest
+import torch
 from diffusers.models.autoencoders.autoencoder_kl import AutoencoderKL
 
-from invokeai.backend.stable_diffusion.vae_tiling import patch_vae_tiling_params
+from invokeai.app.services.session_processor.session_processor_common import CanceledException
+from invokeai.backend.stable_diffusion.vae_tiling import (
+    _tile_ranges,
+    patch_vae_tiling_params,
+    plan_vae_tile_size,
+    run_vae_tiled,
+)
 
 
 def test_patch_vae_tiling_params():
@@ -11,3 +19,75 @@ def test_patch_vae_tiling_params():
 
     with patch_vae_tiling_params(vae, 1, 2, 3):
         pass
+
+
+def test_tile_ranges():
+    assert _tile_ranges(40, tile_size=64, overlap=16, alignment=1) == [(0, 40)]
+    assert _tile_ranges(100, tile_size=64, overlap=16, alignment=1) == [(0, 64), (36, 100)]
+    assert _tile_ranges(150, tile_size=64, overlap=16, alignment=1) == [(0, 64), (48, 112), (86, 150)]
+    # The last tile's start is aligned, so it grows by up to `alignment - 1`.
+    assert _tile_ranges(100, tile_size=64, overlap=16, alignment=8) == [(0, 64), (32, 100)]
+
+
+def test_plan_vae_tile_size():
+    def estimate(height: int, width: int) -> int:
+        return height * width
+
+    assert plan_vae_tile_size(100, 100, estimate, working_memory_budget=100 * 100) is None
+    assert plan_vae_tile_size(100, 100, estimate, working_memory_budget=None) is None
+    assert plan_vae_tile_size(100, 100, estimate, working_memory_budget=50 * 50) == 48
+    assert plan_vae_tile_size(100, 100, estimate, working_memory_budget=1) == 32
+    assert plan_vae_tile_size(100, 100, estimate, working_memory_budget=100 * 100, force_tiling=True) == 96
+    assert plan_vae_tile_size(100, 100, estimate, working_memory_budget=None, force_tiling=True) == 64
+
+
+def _fake_decode(latents: torch.Tensor) -> torch.Tensor:
+    """A stand-in for a VAE decoder: a local (3x3) operation followed by an 8x upscale to 3 channels."""
+    blurred = torch.nn.functional.avg_pool2d(latents[:, :3], kernel_size=3, stride=1, padding=1)
+    return torch.nn.functional.interpolate(blurred, scale_factor=8, mode="nearest")
+
+
+def test_run_vae_tiled_decode_matches_full_decode_away_from_seams():
+    latents = torch.rand((1, 4, 50, 70))
+    steps: list[tuple[int, int]] = []
+
+    tiled = run_vae_tiled(latents, _fake_decode, tile_size=32, overlap=8, step_callback=lambda *s: steps.append(s))
+    full = _fake_decode(latents)
+
+    assert tiled.shape == full.shape == (1, 3, 400, 560)
+    assert steps[0] == (0, 6) and steps[-1] == (6, 6)
+    # Tiles see zero padding at their inner edges, so the output differs slightly from the full decode where tiles
+    # overlap. The first tile alone covers the top left corner.
+    assert (tiled - full).abs().max() < 0.5
+    torch.testing.assert_close(tiled[..., :128, :128], full[..., :128, :128])
+
+
+def test_run_vae_tiled_is_exact_for_pointwise_models():
+    latents = torch.rand((1, 3, 50, 70))
+
+    def decode(x: torch.Tensor) -> torch.Tensor:
+        return torch.nn.functional.interpolate(x * 2.0, scale_factor=8, mode="nearest")
+
+    torch.testing.assert_close(run_vae_tiled(latents, decode, tile_size=24, overlap=8), decode(latents))
+
+
+def test_run_vae_tiled_encode():
+    image = torch.rand((1, 3, 100, 140))
+
+    def encode(x: torch.Tensor) -> torch.Tensor:
+        return torch.nn.functional.avg_pool2d(x, kernel_size=8)
+
+    encoded = run_vae_tiled(image[..., :96, :136], encode, tile_size=64, overlap=16, alignment=8)
+    torch.testing.assert_close(encoded, encode(image[..., :96, :136]))
+
+    # Unaligned tiles of an encode do not map to a whole number of latent pixels.
+    with pytest.raises(ValueError):
+        run_vae_tiled(image, encode, tile_size=60, overlap=12, alignment=1)
+
+
+def test_run_vae_tiled_raises_when_canceled():
+    def decode(x: torch.Tensor) -> torch.Tensor:
+        raise AssertionError("No tile should run after cancellation.")
+
+    with pytest.raises(CanceledException):
+        run_vae_tiled(torch.zeros((1, 4, 64, 64)), decode, tile_size=32, overlap=8, is_canceled=lambda: True)
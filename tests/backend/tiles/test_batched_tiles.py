@@ -0,0 +1,77 @@
+import pytest
+import torch
+
+from invokeai.app.services.session_processor.session_processor_common import CanceledException
+from invokeai.backend.tiles.batched_tiles import (
+    _make_batches,
+    calc_tile_batch_size,
+    estimate_upscale_tile_working_memory,
+    run_tiles_batched,
+)
+
+
+def test_make_batches_groups_equal_sized_tiles():
+    tile_sizes = [(4, 4), (4, 4), (4, 2), (4, 4), (2, 4), (4, 2), (4, 4)]
+
+    assert _make_batches(tile_sizes, batch_size=3) == [[0, 1, 3], [6], [2, 5], [4]]
+    assert _make_batches(tile_sizes, batch_size=1) == [[i] for i in [0, 1, 3, 6, 2, 5, 4]]
+
+
+def test_calc_tile_batch_size():
+    per_tile = estimate_upscale_tile_working_memory(tile_height=64, tile_width=64, scale=4, element_size=2)
+
+    assert calc_tile_batch_size(64, 64, 4, 2, working_memory_budget=3 * per_tile, max_batch_size=8) == 3
+    assert calc_tile_batch_size(64, 64, 4, 2, working_memory_budget=100 * per_tile, max_batch_size=8) == 8
+    # A single tile is always run, even if it does not fit in the budget.
+    assert calc_tile_batch_size(64, 64, 4, 2, working_memory_budget=per_tile // 2, max_batch_size=8) == 1
+
+
+def test_run_tiles_batched_matches_one_tile_at_a_time():
+    tile_sizes = [(8, 8)] * 5 + [(8, 4)] * 2
+    input_tiles = [torch.rand((3, h, w)) for h, w in tile_sizes]
+    batch_sizes: list[int] = []
+
+    def run_model(batch: torch.Tensor) -> torch.Tensor:
+        batch_sizes.append(batch.shape[0])
+        return torch.nn.functional.interpolate(batch, scale_factor=2, mode="nearest") * 0.5
+
+    outputs: dict[int, torch.Tensor] = {}
+
+    def put_output_tiles(indices: list[int], output_tiles: torch.Tensor) -> None:
+        for i, output_tile in zip(indices, output_tiles, strict=True):
+            outputs[i] = output_tile
+
+    steps: list[tuple[int, int]] = []
+    run_tiles_batched(
+        tile_sizes=tile_sizes,
+        get_input_tile=lambda i: input_tiles[i],
+        run_model=run_model,
+        put_output_tiles=put_output_tiles,
+        device=torch.device("cpu"),
+        dtype=torch.float32,
+        batch_size=2,
+        step_callback=lambda step, total: steps.append((step, total)),
+    )
+
+    assert batch_sizes == [2, 2, 1, 2]
+    assert steps == [(0, 7), (2, 7), (4, 7), (5, 7), (7, 7)]
+    for i, input_tile in enumerate(input_tiles):
+        expected = run_model(input_tile.unsqueeze(0))[0]
+        torch.testing.assert_close(outputs[i], expected)
+
+
+def test_run_tiles_batched_raises_when_canceled():
+    def run_model(batch: torch.Tensor) -> torch.Tensor:
+        raise AssertionError("No batch should run after cancellation.")
+
+    with pytest.raises(CanceledException):
+        run_tiles_batched(
+            tile_sizes=[(4, 4)] * 3,
+            get_input_tile=lambda i: torch.zeros((3, 4, 4)),
+            run_model=run_model,
+            put_output_tiles=lambda indices, outputs: None,
+            device=torch.device("cpu"),
+            dtype=torch.float32,
+            batch_size=2,
+            is_canceled=lambda: True,
+        )
@@ -0,0 +1,111 @@
+import numpy as np
+import pytest
+from PIL import Image
+
+from invokeai.backend.tiles.streaming_merge import PngRowWriter, merge_tiles_streaming
+from invokeai.backend.tiles.tiles import (
+    calc_tiles_with_overlap,
+    merge_tiles_with_linear_blending,
+    merge_tiles_with_seam_blending,
+)
+
+
+def _make_tile_images(tiles, seed: int = 0) -> list[np.ndarray]:
+    rng = np.random.default_rng(seed)
+    return [
+        rng.integers(0, 256, (t.coords.bottom - t.coords.top, t.coords.right - t.coords.left, 3), dtype=np.uint8)
+        for t in tiles
+    ]
+
+
+@pytest.mark.parametrize("blend_mode", ["Linear", "Seam"])
+def test_merge_tiles_streaming_matches_full_merge(blend_mode: str):
+    tiles = calc_tiles_with_overlap(image_height=320, image_width=448, tile_height=128, tile_width=128, overlap=32)
+    tile_images = _make_tile_images(tiles)
+
+    expected = np.zeros((320, 448, 3), dtype=np.uint8)
+    merge_full = merge_tiles_with_linear_blending if blend_mode == "Linear" else merge_tiles_with_seam_blending
+    merge_full(dst_image=expected, tiles=tiles, tile_images=tile_images, blend_amount=16)
+
+    dst_image = np.zeros((320, 448, 3), dtype=np.uint8)
+    merge_tiles_streaming(
+        dst_image=dst_image,
+        tiles=tiles,
+        get_tile_image=lambda i: tile_images[i],
+        blend_mode=blend_mode,
+        blend_amount=16,
+    )
+
+    # Blending is done in float32 instead of float64, which can round differently.
+    assert np.abs(dst_image.astype(np.int16) - expected).max() <= 1
+
+
+def test_merge_tiles_streaming_reports_final_rows_before_loading_later_tiles():
+    # Three rows of two tiles.
+    tiles = calc_tiles_with_overlap(image_height=320, image_width=224, tile_height=128, tile_width=128, overlap=32)
+    tile_images = _make_tile_images(tiles)
+    log: list[tuple] = []
+
+    def get_tile_image(i: int) -> np.ndarray:
+        log.append(("load", tiles[i].coords.top))
+        return tile_images[i]
+
+    merge_tiles_streaming(
+        dst_image=np.zeros((320, 224, 3), dtype=np.uint8),
+        tiles=tiles,
+        get_tile_image=get_tile_image,
+        blend_mode="Linear",
+        blend_amount=16,
+        on_rows_complete=lambda start, end: log.append(("complete", start, end)),
+    )
+
+    # Each row of tiles is loaded after the rows above it have been reported as final.
+    assert log == [
+        ("load", 0),
+        ("load", 0),
+        ("complete", 0, 96),
+        ("load", 96),
+        ("load", 96),
+        ("complete", 96, 192),
+        ("load", 192),
+        ("load", 192),
+        ("complete", 192, 320),
+    ]
+
+
+def test_merge_tiles_streaming_to_png(tmp_path):
+    tiles = calc_tiles_with_overlap(image_height=320, image_width=448, tile_height=128, tile_width=128, overlap=32)
+    tile_images = _make_tile_images(tiles)
+    dst_image = np.lib.format.open_memmap(tmp_path / "dst.npy", mode="w+", dtype=np.uint8, shape=(320, 448, 3))
+
+    with PngRowWriter(tmp_path / "merged.png", width=448, height=320, channels=3) as writer:
+        merge_tiles_streaming(
+            dst_image=dst_image,
+            tiles=tiles,
+            get_tile_image=lambda i: tile_images[i],
+            blend_mode="Seam",
+            blend_amount=16,
+            on_rows_complete=lambda start, end: writer.write_rows(dst_image[start:end]),
+        )
+
+    with Image.open(tmp_path / "merged.png") as image:
+        np.testing.assert_array_equal(np.array(image), dst_image)
+
+
+@pytest.mark.parametrize(("channels", "mode"), [(1, "L"), (2, "LA"), (3, "RGB"), (4, "RGBA")])
+def test_png_row_writer_round_trip(tmp_path, channels: int, mode: str):
+    pixels = np.random.default_rng(0).integers(0, 256, (37, 23, channels), dtype=np.uint8)
+
+    with PngRowWriter(tmp_path / "image.png", width=23, height=37, channels=channels) as writer:
+        writer.write_rows(pixels[:10])
+        writer.write_rows(pixels[10:])
+
+    with Image.open(tmp_path / "image.png") as image:
+        assert image.mode == mode
+        np.testing.assert_array_equal(np.array(image).reshape(pixels.shape), pixels)
+
+
+def test_png_row_writer_raises_on_missing_rows(tmp_path):
+    with pytest.raises(ValueError, match="Only 1 of 2 rows"):
+        with PngRowWriter(tmp_path / "image.png", width=4, height=2, channels=3) as writer:
+            writer.write_rows(np.zeros((1, 4, 3), dtype=np.uint8))
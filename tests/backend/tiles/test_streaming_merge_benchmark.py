@@ -0,0 +1,71 @@
+"""Manual benchmark of the peak memory of tile merging.
+
+This test is marked slow and is excluded from normal pytest and CI runs. It merges the tiles of a 4096x4096 image with
+the full-image merge functions and with the streaming merge, and reports the peak memory allocated on top of the
+destination image. Run this benchmark with:
+
+    pytest -m slow -s tests/backend/tiles/test_streaming_merge_benchmark.py
+"""
+
+import json
+import time
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from invokeai.backend.tiles.streaming_merge import merge_tiles_streaming
+from invokeai.backend.tiles.tiles import (
+    calc_tiles_with_overlap,
+    merge_tiles_with_linear_blending,
+    merge_tiles_with_seam_blending,
+)
+
+IMAGE_SIZE = 4096
+
+
+def _make_tile_image(tile, index: int) -> np.ndarray:
+    shape = (tile.coords.bottom - tile.coords.top, tile.coords.right - tile.coords.left, 3)
+    return np.random.default_rng(index).integers(0, 256, shape, dtype=np.uint8)
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("blend_mode", ["Linear", "Seam"])
+def test_streaming_merge_peak_memory(blend_mode: str):
+    tiles = calc_tiles_with_overlap(
+        image_height=IMAGE_SIZE, image_width=IMAGE_SIZE, tile_height=1024, tile_width=1024, overlap=128
+    )
+    results = {}
+
+    # The full merge needs every tile image up front, like MergeTilesToImageInvocation did.
+    dst_image = np.zeros((IMAGE_SIZE, IMAGE_SIZE, 3), dtype=np.uint8)
+    tracemalloc.start()
+    start = time.perf_counter()
+    tile_images = [_make_tile_image(tile, i) for i, tile in enumerate(tiles)]
+    merge_full = merge_tiles_with_linear_blending if blend_mode == "Linear" else merge_tiles_with_seam_blending
+    merge_full(dst_image=dst_image, tiles=tiles, tile_images=tile_images, blend_amount=64)
+    results["full"] = {"seconds": round(time.perf_counter() - start, 2), "peak_mb": tracemalloc.get_traced_memory()[1]}
+    tracemalloc.stop()
+    del tile_images
+
+    dst_image = np.zeros((IMAGE_SIZE, IMAGE_SIZE, 3), dtype=np.uint8)
+    tracemalloc.start()
+    start = time.perf_counter()
+    merge_tiles_streaming(
+        dst_image=dst_image,
+        tiles=tiles,
+        get_tile_image=lambda i: _make_tile_image(tiles[i], i),
+        blend_mode=blend_mode,
+        blend_amount=64,
+    )
+    results["streaming"] = {
+        "seconds": round(time.perf_counter() - start, 2),
+        "peak_mb": tracemalloc.get_traced_memory()[1],
+    }
+    tracemalloc.stop()
+
+    for result in results.values():
+        result["peak_mb"] = round(result["peak_mb"] / 2**20)
+    print(json.dumps({"blend_mode": blend_mode, "image_size": IMAGE_SIZE, **results}))
+
+    assert results["streaming"]["peak_mb"] < results["full"]["peak_mb"]